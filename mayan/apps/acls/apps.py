@@ -1,3 +1,6 @@
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save
+)
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
@@ -9,6 +12,11 @@ from mayan.apps.views.html_widgets import ObjectLinkWidget
 
 from .classes import ModelPermission
 from .events import event_acl_deleted, event_acl_edited
+from .handlers import (
+    handler_effective_access_acl_permissions_update,
+    handler_effective_access_acl_update,
+    handler_effective_access_object_delete
+)
 from .links import (
     link_acl_create, link_acl_delete, link_acl_permissions,
     link_global_acl_list
@@ -76,3 +84,22 @@ class ACLsApp(MayanAppConfig):
         menu_setup.bind_links(
             links=(link_global_acl_list,)
         )
+
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_effective_access_acl_permissions_update',
+            receiver=handler_effective_access_acl_permissions_update,
+            sender=AccessControlList.permissions.through
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_effective_access_acl_update',
+            receiver=handler_effective_access_acl_update,
+            sender=AccessControlList
+        )
+        # Any model can hold access control lists, connect the delete handler
+        # for all models and filter them at runtime. The save handlers are
+        # connected by ModelPermission.register_inheritance for the models
+        # that inherit access.
+        post_delete.connect(
+            dispatch_uid='acls_handler_effective_access_object_delete',
+            receiver=handler_effective_access_object_delete
+        )
@@ -3,6 +3,7 @@ import logging
 
 from django.apps import apps
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_save, pre_save
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -19,6 +20,38 @@ class ModelPermission:
     _manager_names = {}
     _model_permissions = {}
 
+    @classmethod
+    def _connect_effective_access_handlers(cls, model):
+        """
+        Connect the handlers that keep the materialized effective access of
+        the model and of its proxy models up to date when they change
+        parents.
+        """
+        # Avoid circular import.
+        from .handlers import (
+            handler_effective_access_object_post_save,
+            handler_effective_access_object_pre_save
+        )
+
+        senders = [model]
+        senders.extend(
+            [
+                proxy_model for proxy_model in apps.get_models() if proxy_model._meta.proxy and proxy_model._meta.concrete_model is model
+            ]
+        )
+
+        for sender in senders:
+            post_save.connect(
+                dispatch_uid='acls_handler_effective_access_object_post_save',
+                receiver=handler_effective_access_object_post_save,
+                sender=sender
+            )
+            pre_save.connect(
+                dispatch_uid='acls_handler_effective_access_object_pre_save',
+                receiver=handler_effective_access_object_pre_save,
+                sender=sender
+            )
+
     @classmethod
     def deregister(cls, model):
         cls._model_permissions.pop(model, None)
@@ -166,6 +199,8 @@ class ModelPermission:
             {'field_name': related, 'fk_field_cast': fk_field_cast}
         )
 
+        cls._connect_effective_access_handlers(model=model)
+
     @classmethod
     def register_manager(cls, model, manager_name):
         cls._manager_names[model] = manager_name
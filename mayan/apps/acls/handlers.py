@@ -0,0 +1,150 @@
+from django.apps import apps
+from django.db import transaction
+
+from .classes import ModelPermission
+from .settings import setting_effective_access_enable
+from .tasks import task_effective_access_acl_update
+
+
+def _is_effective_access_model(model):
+    EffectiveAccessEntry = apps.get_model(
+        app_label='acls', model_name='EffectiveAccessEntry'
+    )
+
+    if model._meta.proxy:
+        model = model._meta.proxy_for_model
+
+    if model in ModelPermission._inheritances or model in ModelPermission._inheritances_reverse:
+        return EffectiveAccessEntry.objects.is_model_supported(model=model)
+    else:
+        return False
+
+
+def handler_effective_access_acl_update(sender, instance, **kwargs):
+    if setting_effective_access_enable.value:
+        acl_id = instance.pk
+
+        transaction.on_commit(
+            func=lambda: task_effective_access_acl_update.apply_async(
+                kwargs={'acl_id': acl_id}
+            )
+        )
+
+
+def handler_effective_access_acl_permissions_update(
+    sender, instance, action, pk_set=None, reverse=False, **kwargs
+):
+    """
+    Removed permissions stop granting access in the same transaction.
+    Added permissions can reach a large number of descendants and are
+    materialized by a task after the commit.
+    With `reverse` the instance is a stored permission and `pk_set`
+    holds the primary keys of the access control lists.
+    """
+    if not setting_effective_access_enable.value:
+        return
+
+    EffectiveAccessEntry = apps.get_model(
+        app_label='acls', model_name='EffectiveAccessEntry'
+    )
+
+    if action == 'post_add':
+        if reverse:
+            acl_id_list = pk_set
+        else:
+            acl_id_list = (instance.pk,)
+
+        for acl_id in acl_id_list:
+            transaction.on_commit(
+                func=lambda acl_id=acl_id: task_effective_access_acl_update.apply_async(
+                    kwargs={'acl_id': acl_id}
+                )
+            )
+    elif action in ('post_clear', 'post_remove'):
+        if reverse:
+            queryset = EffectiveAccessEntry.objects.filter(permission=instance)
+            field_name = 'acl_id__in'
+        else:
+            queryset = EffectiveAccessEntry.objects.filter(acl=instance)
+            field_name = 'permission_id__in'
+
+        if action == 'post_remove':
+            queryset = queryset.filter(**{field_name: pk_set})
+
+        queryset.delete()
+
+
+def handler_effective_access_object_delete(sender, instance, **kwargs):
+    if setting_effective_access_enable.value and _is_effective_access_model(model=sender):
+        EffectiveAccessEntry = apps.get_model(
+            app_label='acls', model_name='EffectiveAccessEntry'
+        )
+
+        EffectiveAccessEntry.objects.object_delete(obj=instance)
+
+
+def handler_effective_access_object_pre_save(
+    sender, instance, raw=False, **kwargs
+):
+    """
+    Store the access control lists inherited by the object before it is
+    saved to be able to tell which ones it loses if it changes parents.
+    Connected only to the models that inherit access.
+    """
+    if raw or not setting_effective_access_enable.value:
+        return
+
+    if sender._meta.proxy:
+        sender = sender._meta.proxy_for_model
+
+    if instance.pk and _is_effective_access_model(model=sender):
+        EffectiveAccessEntry = apps.get_model(
+            app_label='acls', model_name='EffectiveAccessEntry'
+        )
+
+        try:
+            instance_previous = sender._base_manager.get(pk=instance.pk)
+        except sender.DoesNotExist:
+            return
+
+        instance._effective_access_ancestor_acls = EffectiveAccessEntry.objects.get_ancestor_acls(
+            obj=instance_previous
+        )
+
+
+def handler_effective_access_object_post_save(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    Update the entries of a new object, or of an object that changed
+    parents and of its descendants, in the same transaction as the save.
+    Connected only to the models that inherit access.
+    """
+    if raw or not setting_effective_access_enable.value:
+        return
+
+    if sender._meta.proxy:
+        sender = sender._meta.proxy_for_model
+
+    if _is_effective_access_model(model=sender):
+        EffectiveAccessEntry = apps.get_model(
+            app_label='acls', model_name='EffectiveAccessEntry'
+        )
+
+        acls_previous = instance.__dict__.pop(
+            '_effective_access_ancestor_acls', []
+        )
+        acls_current = EffectiveAccessEntry.objects.get_ancestor_acls(
+            obj=instance
+        )
+
+        acls_added = [acl for acl in acls_current if acl not in acls_previous]
+        acls_removed = [
+            acl for acl in acls_previous if acl not in acls_current
+        ]
+
+        if acls_added or acls_removed:
+            EffectiveAccessEntry.objects.object_update(
+                acls_added=acls_added, acls_removed=acls_removed,
+                obj=instance
+            )
@@ -0,0 +1,3 @@
+DEFAULT_ACLS_EFFECTIVE_ACCESS_ENABLE = False
+
+EFFECTIVE_ACCESS_BULK_CREATE_BATCH_SIZE = 1000
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from ...models import EffectiveAccessEntry
+
+
+class Command(BaseCommand):
+    help = 'Erase and recompute the materialized effective access entries'
+
+    def handle(self, *args, **options):
+        EffectiveAccessEntry.objects.rebuild()
@@ -2,10 +2,11 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
+from django.db import models, transaction
 from django.db.models import CharField, Q, Value
 from django.db.models.functions import Cast, Concat
 from django.utils.encoding import force_text
@@ -19,6 +20,8 @@ from mayan.apps.permissions.models import StoredPermission
 
 from .exceptions import PermissionNotValidForClass
 from .classes import ModelPermission
+from .literals import EFFECTIVE_ACCESS_BULK_CREATE_BATCH_SIZE
+from .settings import setting_effective_access_enable
 
 logger = logging.getLogger(name=__name__)
 
@@ -275,6 +278,19 @@ class AccessControlListManager(models.Manager):
                 permissions=(permission,), user=user
             )
         except PermissionDenied:
+            EffectiveAccessEntry = apps.get_model(
+                app_label='acls', model_name='EffectiveAccessEntry'
+            )
+
+            if setting_effective_access_enable.value and EffectiveAccessEntry.objects.is_model_supported(model=queryset.model):
+                return queryset.filter(
+                    pk__in=EffectiveAccessEntry.objects.get_object_id_queryset(
+                        model=queryset.model,
+                        stored_permission=permission.stored_permission,
+                        user=user
+                    )
+                )
+
             acl_filters = self._get_acl_filters(
                 queryset=queryset,
                 stored_permission=permission.stored_permission, user=user
@@ -380,3 +396,271 @@ class AccessControlListManager(models.Manager):
 
         if acl.permissions.count() == 0:
             acl.delete()
+
+
+class EffectiveAccessEntryManager(models.Manager):
+    """
+    Maintain the materialized effective access of each access control
+    list. An access control list grants its permissions to its object and
+    to every object that inherits access from it using foreign key
+    inheritances. Models with generic foreign key inheritances or field
+    query functions are not materialized and keep using the access control
+    list subqueries.
+    """
+    def _create_entries(self, acl, model, pk_queryset, stored_permissions):
+        content_type = ContentType.objects.get_for_model(model=model)
+
+        entries = []
+        for object_id in pk_queryset.values_list('pk', flat=True).iterator():
+            for stored_permission in stored_permissions:
+                entries.append(
+                    self.model(
+                        acl=acl, content_type=content_type,
+                        object_id=object_id, permission=stored_permission,
+                        role_id=acl.role_id
+                    )
+                )
+
+            if len(entries) >= EFFECTIVE_ACCESS_BULK_CREATE_BATCH_SIZE:
+                self.bulk_create(objs=entries, ignore_conflicts=True)
+                entries = []
+
+        if entries:
+            self.bulk_create(objs=entries, ignore_conflicts=True)
+
+    def _get_descendants(self, model, pk_queryset, _visited_pks=None):
+        """
+        Generator returning a tuple of model and primary key queryset
+        for the objects of `pk_queryset` and for all the objects that
+        inherit access from them.
+        `_visited_pks` holds the primary keys of the objects of `model`
+        already yielded while following a self referential inheritance.
+        """
+        yield model, pk_queryset
+
+        for child_model in ModelPermission._inheritances_reverse.get(model, ()):
+            for inheritance in ModelPermission.get_inheritances(model=child_model):
+                related_field = get_related_field(
+                    model=child_model,
+                    related_field_name=inheritance['field_name']
+                )
+
+                if isinstance(related_field, GenericForeignKey) or related_field.related_model != model:
+                    continue
+
+                child_pk_queryset = child_model._base_manager.filter(
+                    **{'{}__in'.format(inheritance['field_name']): pk_queryset}
+                ).values('pk')
+
+                if child_model == model:
+                    # Object and parent are of the same type. The depth of
+                    # the tree is not known, evaluate each level to stop at
+                    # the leaves and on cycles.
+                    visited_pks = set(_visited_pks or ())
+                    visited_pks.update(
+                        pk_queryset.values_list('pk', flat=True)
+                    )
+
+                    child_pk_list = list(
+                        child_pk_queryset.exclude(
+                            pk__in=visited_pks
+                        ).values_list('pk', flat=True)
+                    )
+
+                    if not child_pk_list:
+                        continue
+
+                    yield from self._get_descendants(
+                        model=child_model,
+                        pk_queryset=child_model._base_manager.filter(
+                            pk__in=child_pk_list
+                        ).values('pk'), _visited_pks=visited_pks
+                    )
+                else:
+                    yield from self._get_descendants(
+                        model=child_model, pk_queryset=child_pk_queryset
+                    )
+
+    def acl_update(self, acl):
+        """
+        Recompute the entries generated by an access control list.
+        """
+        with transaction.atomic():
+            self.filter(acl=acl).delete()
+
+            stored_permissions = list(acl.permissions.all())
+            model = acl.content_type.model_class()
+
+            if not stored_permissions or model is None:
+                return
+
+            pk_queryset = model._base_manager.filter(
+                pk=acl.object_id
+            ).values('pk')
+
+            for descendant_model, descendant_pk_queryset in self._get_descendants(model=model, pk_queryset=pk_queryset):
+                self._create_entries(
+                    acl=acl, model=descendant_model,
+                    pk_queryset=descendant_pk_queryset,
+                    stored_permissions=stored_permissions
+                )
+
+    def get_ancestor_acls(self, obj, _visited=None):
+        """
+        Return the list of the access control lists of the objects from
+        which `obj` inherits access using foreign key inheritances.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        result = []
+        # Stop on cycles of self referential inheritances.
+        _visited = _visited or {(type(obj), obj.pk)}
+
+        try:
+            inheritances = ModelPermission.get_inheritances(model=type(obj))
+        except KeyError:
+            return result
+
+        for inheritance in inheritances:
+            related_field = get_related_field(
+                model=type(obj), related_field_name=inheritance['field_name']
+            )
+            if isinstance(related_field, GenericForeignKey):
+                continue
+
+            try:
+                parent_object = resolve_attribute(
+                    obj=obj, attribute=inheritance['field_name']
+                )
+            except AttributeError:
+                parent_object = return_related(
+                    instance=obj, related_field=inheritance['field_name']
+                )
+
+            if parent_object is None:
+                continue
+
+            result.extend(
+                AccessControlList.objects.filter(
+                    content_type=ContentType.objects.get_for_model(
+                        model=parent_object
+                    ), object_id=parent_object.pk
+                )
+            )
+
+            parent_key = (type(parent_object), parent_object.pk)
+
+            if parent_key not in _visited:
+                _visited.add(parent_key)
+                result.extend(
+                    self.get_ancestor_acls(
+                        obj=parent_object, _visited=_visited
+                    )
+                )
+
+        return result
+
+    def get_object_id_queryset(self, model, stored_permission, user):
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(model=model),
+            permission=stored_permission, role__groups__user=user
+        ).values('object_id')
+
+    def is_model_supported(self, model, _visited=None):
+        """
+        Return True if the access of the model can be resolved entirely
+        using the materialized entries.
+        """
+        if model._meta.proxy:
+            model = model._meta.proxy_for_model
+
+        _visited = _visited or set()
+        if model in _visited:
+            return True
+
+        _visited.add(model)
+
+        if model in ModelPermission._field_query_functions:
+            return False
+
+        for inheritance in ModelPermission._inheritances.get(model, ()):
+            related_field = get_related_field(
+                model=model, related_field_name=inheritance['field_name']
+            )
+
+            if isinstance(related_field, GenericForeignKey):
+                return False
+
+            if not self.is_model_supported(model=related_field.related_model, _visited=_visited):
+                return False
+
+        return True
+
+    def object_delete(self, obj):
+        self.filter(
+            content_type=ContentType.objects.get_for_model(model=obj),
+            object_id=obj.pk
+        ).delete()
+
+    def object_update(self, obj, acls_added=None, acls_removed=None):
+        """
+        Update the entries of an object and of its descendants after the
+        object changed parents. `acls_removed` are the access control lists
+        of the previous ancestors, `acls_added` are the ones of the new
+        ancestors.
+        """
+        model = type(obj)._meta.concrete_model
+
+        self.queryset_update(
+            acls_added=acls_added, acls_removed=acls_removed,
+            queryset=model._base_manager.filter(pk=obj.pk)
+        )
+
+    def queryset_update(self, queryset, acls_added=None, acls_removed=None):
+        """
+        Same as `object_update` for several objects sharing the same
+        ancestors. Used for the objects created in bulk, which don't send
+        the post_save signal.
+        """
+        model = queryset.model._meta.concrete_model
+        pk_queryset = queryset.values('pk')
+        descendants = list(
+            self._get_descendants(model=model, pk_queryset=pk_queryset)
+        )
+
+        with transaction.atomic():
+            if acls_removed:
+                object_query = reduce(
+                    operator.or_, [
+                        Q(
+                            content_type=ContentType.objects.get_for_model(
+                                model=descendant_model
+                            ), object_id__in=descendant_pk_queryset
+                        ) for descendant_model, descendant_pk_queryset in descendants
+                    ]
+                )
+                self.filter(object_query).filter(acl__in=acls_removed).delete()
+
+            for acl in acls_added or ():
+                stored_permissions = list(acl.permissions.all())
+                for descendant_model, descendant_pk_queryset in descendants:
+                    self._create_entries(
+                        acl=acl, model=descendant_model,
+                        pk_queryset=descendant_pk_queryset,
+                        stored_permissions=stored_permissions
+                    )
+
+    def rebuild(self):
+        """
+        Erase and recompute the entries of all the access control lists.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        self.all().delete()
+
+        for acl in AccessControlList.objects.iterator():
+            self.acl_update(acl=acl)
@@ -0,0 +1,64 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('acls', '0004_auto_20210130_0322'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('permissions', '0004_auto_20191213_0044'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EffectiveAccessEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                ('object_id', models.PositiveIntegerField()),
+                (
+                    'acl', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_access_entries',
+                        to='acls.AccessControlList',
+                        verbose_name='Access control list'
+                    )
+                ),
+                (
+                    'content_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='contenttypes.ContentType'
+                    )
+                ),
+                (
+                    'permission', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_access_entries',
+                        to='permissions.StoredPermission',
+                        verbose_name='Permission'
+                    )
+                ),
+                (
+                    'role', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_access_entries',
+                        to='permissions.Role', verbose_name='Role'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Effective access entry',
+                'verbose_name_plural': 'Effective access entries',
+                'unique_together': {
+                    ('acl', 'permission', 'content_type', 'object_id')
+                },
+                'index_together': {
+                    ('content_type', 'permission', 'role', 'object_id')
+                },
+            },
+        ),
+    ]
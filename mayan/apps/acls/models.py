@@ -14,7 +14,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted, event_acl_edited
-from .managers import AccessControlListManager
+from .managers import AccessControlListManager, EffectiveAccessEntryManager
 
 logger = logging.getLogger(name=__name__)
 
@@ -121,3 +121,45 @@ class AccessControlList(ExtraDataModelMixin, models.Model):
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
+
+
+class EffectiveAccessEntry(models.Model):
+    """
+    Materialized access granted by an access control list to its object or
+    to an object that inherits access from it. Rows are maintained by the
+    ACL and object signal handlers and can be recomputed with the
+    "rebuildeffectiveaccess" management command.
+    """
+    acl = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_access_entries',
+        to=AccessControlList, verbose_name=_('Access control list')
+    )
+    role = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_access_entries',
+        to=Role, verbose_name=_('Role')
+    )
+    permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_access_entries',
+        to=StoredPermission, verbose_name=_('Permission')
+    )
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=ContentType
+    )
+    object_id = models.PositiveIntegerField()
+
+    objects = EffectiveAccessEntryManager()
+
+    class Meta:
+        index_together = (
+            ('content_type', 'permission', 'role', 'object_id'),
+        )
+        unique_together = (
+            'acl', 'permission', 'content_type', 'object_id'
+        )
+        verbose_name = _('Effective access entry')
+        verbose_name_plural = _('Effective access entries')
+
+    def __str__(self):
+        return '{}.{}: {}'.format(
+            self.content_type, self.object_id, self.permission
+        )
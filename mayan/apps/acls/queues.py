@@ -0,0 +1,12 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.task_manager.classes import CeleryQueue
+from mayan.apps.task_manager.workers import worker_b
+
+queue_acls = CeleryQueue(label=_('ACLs'), name='acls', worker=worker_b)
+
+queue_acls.add_task_type(
+    dotted_path='mayan.apps.acls.tasks.task_effective_access_acl_update',
+    label=_('Update the effective access of an ACL'),
+    name='task_effective_access_acl_update'
+)
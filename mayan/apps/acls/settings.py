@@ -0,0 +1,18 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import DEFAULT_ACLS_EFFECTIVE_ACCESS_ENABLE
+
+namespace = SettingNamespace(label=_('ACLs'), name='acls')
+
+setting_effective_access_enable = namespace.add_setting(
+    default=DEFAULT_ACLS_EFFECTIVE_ACCESS_ENABLE,
+    global_name='ACLS_EFFECTIVE_ACCESS_ENABLE', help_text=_(
+        'Maintain a precomputed table of the effective access granted by '
+        'the access control lists, including the access inherited from '
+        'parent objects, and use it to filter querysets and check access. '
+        'Execute the "rebuildeffectiveaccess" management command after '
+        'enabling this setting.'
+    )
+)
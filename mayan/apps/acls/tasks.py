@@ -0,0 +1,25 @@
+import logging
+
+from django.apps import apps
+
+from mayan.celery import app
+
+logger = logging.getLogger(name=__name__)
+
+
+@app.task(ignore_result=True)
+def task_effective_access_acl_update(acl_id):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    EffectiveAccessEntry = apps.get_model(
+        app_label='acls', model_name='EffectiveAccessEntry'
+    )
+
+    try:
+        acl = AccessControlList.objects.get(pk=acl_id)
+    except AccessControlList.DoesNotExist:
+        # The entries of a deleted ACL are deleted with it.
+        logger.debug('ACL %s no longer exists', acl_id)
+    else:
+        EffectiveAccessEntry.objects.acl_update(acl=acl)
@@ -1,13 +1,14 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
+from django.db import connection, models
 
 from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..models import AccessControlList, EffectiveAccessEntry
+from ..settings import setting_effective_access_enable
 
 from .mixins import ACLTestMixin
 
@@ -625,3 +626,219 @@ class ProxyModelPermissionTestCase(ACLTestMixin, BaseTestCase):
                 user=self._test_case_user
             )
         )
+
+
+class EffectiveAccessTestCase(ACLTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.old_value = setting_effective_access_enable.value
+        setting_effective_access_enable.set(value=True)
+
+        self._create_test_permission()
+        self.TestModelParent = self._create_test_model(
+            model_name='TestModelParent'
+        )
+        self.TestModelChild = self._create_test_model(
+            fields={
+                'parent': models.ForeignKey(
+                    on_delete=models.CASCADE, related_name='children',
+                    to='TestModelParent',
+                )
+            }, model_name='TestModelChild'
+        )
+
+        ModelPermission.register(
+            model=self.TestModelParent, permissions=(
+                self.test_permission,
+            )
+        )
+        ModelPermission.register(
+            model=self.TestModelChild, permissions=(
+                self.test_permission,
+            )
+        )
+        ModelPermission.register_inheritance(
+            model=self.TestModelChild, related='parent',
+        )
+
+        self.test_object_parent = self.TestModelParent.objects.create()
+        self.test_object_child = self.TestModelChild.objects.create(
+            parent=self.test_object_parent
+        )
+
+    def tearDown(self):
+        setting_effective_access_enable.set(value=self.old_value)
+        super().tearDown()
+
+    def _execute_on_commit_callbacks(self):
+        """
+        The transaction.on_commit callbacks never execute inside the
+        transaction of the test case. Use `captureOnCommitCallbacks` when
+        upgraded to Django 3.2.
+        """
+        callbacks = connection.run_on_commit
+        connection.run_on_commit = []
+
+        for savepoint_ids, callback in callbacks:
+            callback()
+
+    def _get_test_child_queryset(self):
+        return AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild.objects.all(),
+            user=self._test_case_user
+        )
+
+    def test_inherited_access_grant(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 2)
+        self.assertTrue(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_inherited_access_revoke(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+
+        self.revoke_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 0)
+        self.assertFalse(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_inherited_access_permission_remove(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+
+        test_acl = AccessControlList.objects.get(role=self._test_case_role)
+        test_acl.permissions.remove(self.test_permission.stored_permission)
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 0)
+        self.assertFalse(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_inherited_access_permission_remove_reverse(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+
+        test_acl = AccessControlList.objects.get(role=self._test_case_role)
+        self.test_permission.stored_permission.acls.remove(test_acl)
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 0)
+        self.assertFalse(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_inherited_access_permission_add_reverse(self):
+        test_acl = AccessControlList.objects.create(
+            content_object=self.test_object_parent,
+            role=self._test_case_role
+        )
+        self.test_permission.stored_permission.acls.add(test_acl)
+        self._execute_on_commit_callbacks()
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 2)
+        self.assertTrue(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_child_creation(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+
+        test_object_child = self.TestModelChild.objects.create(
+            parent=self.test_object_parent
+        )
+
+        self.assertTrue(test_object_child in self._get_test_child_queryset())
+
+    def test_child_parent_change(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+
+        self.test_object_child.parent = self.TestModelParent.objects.create()
+        self.test_object_child.save()
+
+        self.assertFalse(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_rebuild(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self._execute_on_commit_callbacks()
+        EffectiveAccessEntry.objects.all().delete()
+
+        EffectiveAccessEntry.objects.rebuild()
+
+        self.assertTrue(
+            self.test_object_child in self._get_test_child_queryset()
+        )
+
+    def test_acl_update_deferred_until_commit(self):
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 0)
+
+        self._execute_on_commit_callbacks()
+
+        self.assertEqual(EffectiveAccessEntry.objects.count(), 2)
+
+    def test_self_referential_inheritance(self):
+        TestModelNode = self._create_test_model(
+            fields={
+                'parent': models.ForeignKey(
+                    blank=True, null=True, on_delete=models.CASCADE,
+                    related_name='children', to='self'
+                )
+            }, model_name='TestModelNode'
+        )
+        ModelPermission.register(
+            model=TestModelNode, permissions=(self.test_permission,)
+        )
+        ModelPermission.register_inheritance(
+            model=TestModelNode, related='parent',
+        )
+
+        test_object_root = TestModelNode.objects.create()
+        test_object_node = TestModelNode.objects.create(
+            parent=test_object_root
+        )
+        test_object_leaf = TestModelNode.objects.create(
+            parent=test_object_node
+        )
+        self._execute_on_commit_callbacks()
+
+        self.grant_access(obj=test_object_root, permission=self.test_permission)
+        self._execute_on_commit_callbacks()
+
+        self.assertEqual(
+            set(
+                AccessControlList.objects.restrict_queryset(
+                    permission=self.test_permission,
+                    queryset=TestModelNode.objects.all(),
+                    user=self._test_case_user
+                )
+            ), {test_object_root, test_object_node, test_object_leaf}
+        )
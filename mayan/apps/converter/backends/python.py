@@ -1,5 +1,7 @@
 import io
 import logging
+import os
+import re
 import shutil
 import struct
 
@@ -10,7 +12,7 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup, mkdtemp
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
@@ -18,7 +20,8 @@ from ..settings import setting_graphics_backend_arguments
 
 from ..literals import (
     DEFAULT_PDFTOPPM_DPI, DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH,
-    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS
+    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
+    PDFTOPPM_OUTPUT_FILENAME_PREFIX
 )
 
 logger = logging.getLogger(name=__name__)
@@ -84,6 +87,86 @@ class Python(ConverterBase):
             finally:
                 new_file_object.close()
 
+    def _convert_range_pdftoppm(
+        self, input_filepath, first_page_number, last_page_number
+    ):
+        output_directory = mkdtemp()
+        kwargs = {'f': first_page_number + 1}
+        if last_page_number is not None:
+            kwargs['l'] = last_page_number + 1
+
+        try:
+            pdftoppm(
+                input_filepath, os.path.join(
+                    output_directory, PDFTOPPM_OUTPUT_FILENAME_PREFIX
+                ), **kwargs
+            )
+
+            # pdftoppm names the output files using the prefix, the
+            # page number zero padded to the width of the last page
+            # number and the extension of the format.
+            output_files = {}
+            for filename in os.listdir(output_directory):
+                match = re.match(
+                    pattern=r'^{}-(\d+)\.'.format(
+                        PDFTOPPM_OUTPUT_FILENAME_PREFIX
+                    ), string=filename
+                )
+                if match:
+                    output_files[int(match.group(1)) - 1] = filename
+
+            for page_number in sorted(output_files):
+                output_filepath = os.path.join(
+                    output_directory, output_files[page_number]
+                )
+                with open(file=output_filepath, mode='rb') as file_object:
+                    image_buffer = io.BytesIO(file_object.read())
+
+                yield page_number, Image.open(fp=image_buffer)
+        finally:
+            fs_cleanup(filename=output_directory)
+
+    def convert_range(
+        self, first_page_number=0, last_page_number=None, chunk_size=None
+    ):
+        if self.mime_type == 'application/pdf' and pdftoppm:
+            # Copy the source file only once for the entire range and
+            # launch pdftoppm once per chunk instead of once per page.
+            new_file_object = NamedTemporaryFile()
+            input_filepath = new_file_object.name
+            self.file_object.seek(0)
+            shutil.copyfileobj(fsrc=self.file_object, fdst=new_file_object)
+            self.file_object.seek(0)
+            new_file_object.flush()
+
+            try:
+                if chunk_size:
+                    if last_page_number is None:
+                        last_page_number = self.get_page_count() - 1
+
+                    for chunk_first_page_number in range(first_page_number, last_page_number + 1, chunk_size):
+                        yield from self._convert_range_pdftoppm(
+                            first_page_number=chunk_first_page_number,
+                            input_filepath=input_filepath,
+                            last_page_number=min(
+                                chunk_first_page_number + chunk_size - 1,
+                                last_page_number
+                            )
+                        )
+                else:
+                    yield from self._convert_range_pdftoppm(
+                        first_page_number=first_page_number,
+                        input_filepath=input_filepath,
+                        last_page_number=last_page_number
+                    )
+            finally:
+                new_file_object.close()
+        else:
+            yield from super().convert_range(
+                chunk_size=chunk_size, first_page_number=first_page_number,
+                last_page_number=last_page_number
+            )
+
     def get_page_count(self):
         super().get_page_count()
 
@@ -79,9 +79,7 @@ class ConverterBase:
     def __init__(self, file_object, mime_type=None):
         self.file_object = file_object
         self.image = None
-        self.mime_type = mime_type or get_mimetype(
-            file_object=file_object, mimetype_only=False
-        )[0]
+        self._mime_type = mime_type
         self.soffice_file = None
         Image.init()
         try:
@@ -91,9 +89,60 @@ class ConverterBase:
         except sh.CommandNotFound:
             self.command_libreoffice = None
 
+    @property
+    def mime_type(self):
+        """
+        Detect the MIME type of the file object only when required by the
+        conversion. Images are opened without reading it.
+        """
+        if not self._mime_type:
+            position = self.file_object.tell()
+            self._mime_type = get_mimetype(
+                file_object=self.file_object, mimetype_only=True
+            )[0]
+            self.file_object.seek(position)
+
+        return self._mime_type
+
+    @mime_type.setter
+    def mime_type(self, value):
+        self._mime_type = value
+
+    def _get_image_pages(self, image, first_page_number, last_page_number):
+        page_number = first_page_number
+
+        while last_page_number is None or page_number <= last_page_number:
+            try:
+                image.seek(page_number)
+            except EOFError:
+                """End of sequence"""
+                break
+            else:
+                image.load()
+                yield page_number, image
+                page_number += 1
+
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
+    def convert_range(
+        self, first_page_number=0, last_page_number=None, chunk_size=None
+    ):
+        """
+        Generator returning a tuple of page number and image for each page
+        in the range. Page numbers start at 0. When `last_page_number` is
+        None, all pages until the end of the file are converted.
+        Backends that can rasterize several pages in a single pass should
+        override this method and rasterize at most `chunk_size` pages per
+        pass, the next pass starts only when the pages of the previous one
+        were consumed.
+        """
+        if last_page_number is None:
+            last_page_number = self.get_page_count() - 1
+
+        for page_number in range(first_page_number, last_page_number + 1):
+            yield page_number, self.convert(page_number=page_number)
+
     def get_page(self, output_format=None):
         output_format = output_format or setting_graphics_backend_arguments.value.get(
             'pillow_format', DEFAULT_PILLOW_FORMAT
@@ -122,6 +171,36 @@ class ConverterBase:
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
+    def get_pages(
+        self, first_page_number=0, last_page_number=None, output_format=None,
+        chunk_size=None
+    ):
+        """
+        Generator returning a tuple of page number and image buffer for
+        each page in the range. Page numbers start at 0. Paged image
+        formats are read directly, other formats are rasterized using
+        `convert_range` in passes of `chunk_size` pages.
+        """
+        self.file_object.seek(0)
+
+        try:
+            image = Image.open(fp=self.file_object)
+        except IOError:
+            # Cannot identify image file.
+            image_iterator = self.convert_range(
+                chunk_size=chunk_size, first_page_number=first_page_number,
+                last_page_number=last_page_number
+            )
+        else:
+            image_iterator = self._get_image_pages(
+                image=image, first_page_number=first_page_number,
+                last_page_number=last_page_number
+            )
+
+        for page_number, image in image_iterator:
+            self.image = image
+            yield page_number, self.get_page(output_format=output_format)
+
     def seek_page(self, page_number):
         """
         Seek the specified page number from the source file object.
@@ -91,6 +91,8 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'pillow_maximum_image_pixels': DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
 }
 
+PDFTOPPM_OUTPUT_FILENAME_PREFIX = 'page'
+
 STORAGE_NAME_ASSETS = 'converter__assets'
 STORAGE_NAME_ASSETS_CACHE = 'converter__assets_cache'
 
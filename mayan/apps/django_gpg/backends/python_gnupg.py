@@ -1,17 +1,114 @@
+import atexit
+from contextlib import contextmanager
+import logging
 import os
 import shutil
+import threading
 
 import gnupg
 
 from mayan.apps.storage.utils import mkdtemp
 
 from ..classes import GPGBackend
-from ..literals import DEFAULT_GPG_PATH
+from ..literals import DEFAULT_GPG_KEYRING_PERSISTENT, DEFAULT_GPG_PATH
 from ..settings import setting_gpg_backend_arguments
 
 gpg_path = setting_gpg_backend_arguments.value.get(
     'gpg_path', DEFAULT_GPG_PATH
 )
+logger = logging.getLogger(name=__name__)
+
+
+class PythonGNUPGKeyring:
+    """
+    Long lived keyring of a process. The keyring is synchronized with the
+    keys of a key source before being used. Only the keys missing from the
+    keyring are imported. The keyring is rebuilt when keys are removed.
+    During a session the keyring is synchronized only once.
+    """
+    _lock = threading.Lock()
+    _registry = {}
+
+    @classmethod
+    def delete_all(cls):
+        with cls._lock:
+            for keyring in cls._registry.values():
+                keyring.delete()
+
+            cls._registry.clear()
+
+    @classmethod
+    def get(cls, gpg_path):
+        # Keyrings are not shared with forked processes.
+        key = (os.getpid(), gpg_path)
+
+        with cls._lock:
+            try:
+                return cls._registry[key]
+            except KeyError:
+                keyring = cls(gpg_path=gpg_path)
+                cls._registry[key] = keyring
+                return keyring
+
+    def __init__(self, gpg_path):
+        self.directory = None
+        self.fingerprints = set()
+        self.gpg = None
+        self.gpg_path = gpg_path
+        self.lock = threading.RLock()
+        self.session_depth = 0
+
+    def create(self):
+        self.directory = mkdtemp()
+        os.chmod(self.directory, 0x1C0)
+
+        self.gpg = gnupg.GPG(
+            gnupghome=self.directory, gpgbinary=self.gpg_path
+        )
+        self.fingerprints = set()
+
+    def delete(self):
+        if self.directory:
+            shutil.rmtree(path=self.directory, ignore_errors=True)
+
+        self.directory = None
+        self.fingerprints = set()
+        self.gpg = None
+
+    @contextmanager
+    def session(self, key_source):
+        with self.lock:
+            self.synchronize(key_source=key_source)
+            self.session_depth += 1
+            try:
+                yield self
+            finally:
+                self.session_depth -= 1
+
+    def synchronize(self, key_source):
+        if self.session_depth:
+            return
+
+        fingerprints = key_source.get_fingerprints()
+
+        if not self.gpg or not self.fingerprints.issubset(fingerprints):
+            logger.debug(msg='building keyring')
+            self.delete()
+            self.create()
+
+        fingerprints_missing = fingerprints - self.fingerprints
+
+        if fingerprints_missing:
+            logger.debug(
+                'importing %d keys into the keyring', len(fingerprints_missing)
+            )
+            for key_data in key_source.get_key_data_list(fingerprints=fingerprints_missing):
+                self.gpg.import_keys(key_data=key_data)
+
+            self.fingerprints.update(fingerprints_missing)
+
+
+atexit.register(PythonGNUPGKeyring.delete_all)
 
 
 class PythonGNUPGBackend(GPGBackend):
@@ -88,6 +185,27 @@ class PythonGNUPGBackend(GPGBackend):
 
         return result
 
+    def get_keyring(self):
+        return PythonGNUPGKeyring.get(gpg_path=self.kwargs['gpg_path'])
+
+    def keyring_command(self, function, key_source, **kwargs):
+        keyring = self.get_keyring()
+
+        with keyring.session(key_source=key_source):
+            return function(gpg=keyring.gpg, **kwargs)
+
+    def keyring_session(self, key_source):
+        if self.keyring_persistent:
+            return self.get_keyring().session(key_source=key_source)
+        else:
+            return super().keyring_session(key_source=key_source)
+
+    @property
+    def keyring_persistent(self):
+        return self.kwargs.get(
+            'keyring_persistent', DEFAULT_GPG_KEYRING_PERSISTENT
+        )
+
     def import_key(self, key_data):
         return self.gpg_command(
             function=PythonGNUPGBackend._import_key, key_data=key_data
@@ -114,17 +232,33 @@ class PythonGNUPGBackend(GPGBackend):
             detached=detached, binary=binary, output=output
         )
 
-    def decrypt_file(self, file_object, keys):
-        return self.gpg_command(
-            function=PythonGNUPGBackend._decrypt_file, file_object=file_object,
-            keys=keys
-        )
+    def decrypt_file(self, file_object, keys, key_source=None):
+        if key_source and self.keyring_persistent:
+            return self.keyring_command(
+                function=PythonGNUPGBackend._decrypt_file,
+                file_object=file_object, key_source=key_source, keys=()
+            )
+        else:
+            return self.gpg_command(
+                function=PythonGNUPGBackend._decrypt_file,
+                file_object=file_object, keys=keys
+            )
 
-    def verify_file(self, file_object, keys, data_filename=None):
-        return self.gpg_command(
-            function=PythonGNUPGBackend._verify_file, file_object=file_object,
-            keys=keys, data_filename=data_filename
-        )
+    def verify_file(
+        self, file_object, keys, data_filename=None, key_source=None
+    ):
+        if key_source and self.keyring_persistent:
+            return self.keyring_command(
+                data_filename=data_filename, file_object=file_object,
+                function=PythonGNUPGBackend._verify_file,
+                key_source=key_source, keys=()
+            )
+        else:
+            return self.gpg_command(
+                function=PythonGNUPGBackend._verify_file,
+                file_object=file_object, keys=keys,
+                data_filename=data_filename
+            )
 
     def recv_keys(self, keyserver, key_id):
         return self.gpg_command(
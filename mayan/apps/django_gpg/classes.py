@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from datetime import datetime
 
 from django.utils.module_loading import import_string
@@ -18,6 +19,35 @@ class GPGBackend:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
 
+    @property
+    def keyring_persistent(self):
+        return False
+
+    @contextmanager
+    def keyring_session(self, key_source):
+        """
+        Backends with a persistent keyring synchronize it once for all
+        the operations executed during the session.
+        """
+        yield
+
+
+class KeyringKeySource:
+    """
+    Provide the keys a keyring must contain. The key data is fetched only
+    for the keys missing from the keyring.
+    """
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    def get_fingerprints(self):
+        return set(self.queryset.values_list('fingerprint', flat=True))
+
+    def get_key_data_list(self, fingerprints):
+        return self.queryset.filter(fingerprint__in=fingerprints).values_list(
+            'key_data', flat=True
+        )
+
 
 class KeyStub:
     def __init__(self, raw):
@@ -9,6 +9,7 @@ elif platform.system() == 'OpenBSD':
 else:
     DEFAULT_GPG_PATH = '/usr/bin/gpg1'
 
+DEFAULT_GPG_KEYRING_PERSISTENT = True
 DEFAULT_SIGNATURES_BACKEND = 'mayan.apps.django_gpg.backends.python_gnupg.PythonGNUPGBackend'
 DEFAULT_DEFAULT_GPG_PATH = {
     'gpg_path': DEFAULT_GPG_PATH,
@@ -6,7 +6,9 @@ from django.db import models
 
 from mayan.apps.storage.utils import NamedTemporaryFile
 
-from .classes import GPGBackend, KeyStub, SignatureVerification
+from .classes import (
+    GPGBackend, KeyringKeySource, KeyStub, SignatureVerification
+)
 from .exceptions import (
     DecryptionError, KeyDoesNotExist, KeyFetchingError, VerificationError
 )
@@ -50,7 +52,10 @@ class KeyManager(models.Manager):
         )
 
         decrypt_result = GPGBackend.get_instance().decrypt_file(
-            file_object=file_object, keys=keys
+            file_object=file_object, keys=keys,
+            key_source=self.get_keyring_key_source(
+                key_fingerprint=key_fingerprint, key_id=key_id
+            )
         )
 
         logger.debug('decrypt_result.status: %s', decrypt_result.status)
@@ -62,6 +67,23 @@ class KeyManager(models.Manager):
 
         return io.BytesIO(decrypt_result.data)
 
+    def get_keyring_key_source(self, key_fingerprint=None, key_id=None):
+        """
+        Operations not restricted to specific keys can use a persistent
+        keyring with all the keys.
+        """
+        if not (key_fingerprint or key_id):
+            return KeyringKeySource(queryset=self.all())
+
+    def keyring_session(self):
+        """
+        Synchronize the keyring once for all the verifications and
+        decryptions done during the session.
+        """
+        return GPGBackend.get_instance().keyring_session(
+            key_source=self.get_keyring_key_source()
+        )
+
     def private_keys(self):
         return self.filter(key_type=KEY_TYPE_SECRET)
 
@@ -96,6 +118,10 @@ class KeyManager(models.Manager):
         keys = self._preload_keys(
             all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
         )
+        backend = GPGBackend.get_instance()
+        key_source = self.get_keyring_key_source(
+            key_fingerprint=key_fingerprint, key_id=key_id
+        )
 
         if signature_file:
             # Save the original data and invert the argument order
@@ -109,15 +135,16 @@ class KeyManager(models.Manager):
             signature_file_buffer.write(signature_file.read())
             signature_file_buffer.seek(0)
             signature_file.seek(0)
-            verify_result = GPGBackend.get_instance().verify_file(
+            verify_result = backend.verify_file(
                 file_object=signature_file_buffer,
-                data_filename=temporary_filename, keys=keys
+                data_filename=temporary_filename, key_source=key_source,
+                keys=keys
             )
             signature_file_buffer.close()
             temporary_file_object.close()
         else:
-            verify_result = GPGBackend.get_instance().verify_file(
-                file_object=file_object, keys=keys
+            verify_result = backend.verify_file(
+                file_object=file_object, key_source=key_source, keys=keys
             )
 
         logger.debug('verify_result.status: %s', verify_result.status)
@@ -126,8 +153,9 @@ class KeyManager(models.Manager):
             # Signed and key present
             logger.debug(msg='signed and key present')
             return SignatureVerification(verify_result.__dict__)
-        elif verify_result.status == 'no public key' and not (key_fingerprint or all_keys or key_id):
-            # Signed but key not present, retry with key fetch
+        elif verify_result.status == 'no public key' and not (key_fingerprint or all_keys or key_id or backend.keyring_persistent):
+            # Signed but key not present, retry with key fetch. Not needed
+            # when the keyring already contains all the keys.
             logger.debug(msg='no public key')
             file_object.seek(0)
             return self.verify_file(
@@ -77,6 +77,34 @@ class KeyTestCase(BaseTestCase):
 
         self.assertEqual(result.fingerprint, TEST_KEY_PRIVATE_FINGERPRINT)
 
+    def test_embedded_verification_deleted_key(self):
+        key = Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            result = Key.objects.verify_file(signed_file)
+
+        self.assertEqual(result.fingerprint, TEST_KEY_PRIVATE_FINGERPRINT)
+
+        key.delete()
+
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            result = Key.objects.verify_file(signed_file)
+
+        self.assertEqual(result.fingerprint, None)
+        self.assertTrue(result.key_id in TEST_KEY_PRIVATE_FINGERPRINT)
+
+    def test_embedded_verification_keyring_session(self):
+        Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+
+        with Key.objects.keyring_session():
+            for count in range(2):
+                with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+                    result = Key.objects.verify_file(signed_file)
+
+                self.assertEqual(
+                    result.fingerprint, TEST_KEY_PRIVATE_FINGERPRINT
+                )
+
     def test_embedded_verification_with_correct_fingerprint(self):
         Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
 
@@ -12,7 +12,7 @@ from mayan.apps.rest_api.api_view_mixins import (
     AsymmetricSerializerAPIViewMixin, ExternalObjectAPIViewMixin
 )
 
-from .models import IndexTemplate, IndexInstance
+from .models import DocumentIndexInstanceNode, IndexTemplate, IndexInstance
 from .permissions import (
     permission_index_template_create, permission_index_template_delete,
     permission_index_template_edit,
@@ -45,7 +45,9 @@ class APIDocumentIndexInstanceNodeListView(
     serializer_class = IndexInstanceNodeSerializer
 
     def get_queryset(self):
-        return self.external_object.index_instance_nodes.all()
+        return DocumentIndexInstanceNode.objects.get_for(
+            document=self.external_object
+        )
 
 
 class APIIndexInstanceDetailView(generics.RetrieveAPIView):
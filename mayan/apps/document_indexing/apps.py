@@ -139,6 +139,11 @@ class DocumentIndexingApp(MayanAppConfig):
             source=IndexTemplate, widget=TwoStateWidget
         )
         column_index_enabled.add_exclude(source=IndexInstance)
+        column_index_rebuild_progress = SourceColumn(
+            attribute='get_rebuild_progress', include_label=True,
+            source=IndexTemplate
+        )
+        column_index_rebuild_progress.add_exclude(source=IndexInstance)
 
         SourceColumn(
             func=lambda context: context[
@@ -1 +1,5 @@
+DEFAULT_DOCUMENT_INDEXING_INCREMENTAL_ENABLE = False
+DEFAULT_DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE = 1000
 DEFAULT_TASK_RETRY_DELAY = 5
+
+INDEX_REBUILD_RETRY_COUNT = 10
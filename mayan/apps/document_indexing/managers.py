@@ -1,3 +1,4 @@
+from django.apps import apps
 from django.db import models
 
 from mptt.managers import TreeManager
@@ -5,7 +6,16 @@ from mptt.managers import TreeManager
 
 class DocumentIndexInstanceNodeManager(models.Manager):
     def get_for(self, document):
-        return self.filter(documents=document)
+        IndexTemplateRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexTemplateRebuild'
+        )
+
+        # Exclude the shadow instance trees of the rebuilds in progress.
+        return self.filter(documents=document).exclude(
+            tree_id__in=IndexTemplateRebuild.objects.values(
+                'index_instance_root_node__tree_id'
+            )
+        )
 
 
 class IndexInstanceNodeManager(TreeManager):
@@ -16,9 +26,16 @@ class IndexInstanceNodeManager(TreeManager):
                 index_instance_node.delete_empty()
 
     def remove_document(self, document):
+        IndexTemplateDocumentState = apps.get_model(
+            app_label='document_indexing',
+            model_name='IndexTemplateDocumentState'
+        )
+
         for index_instance_node in self.filter(documents=document):
             index_instance_node.remove_document(document=document)
 
+        IndexTemplateDocumentState.objects.filter(document=document).delete()
+
 
 class IndexTemplateManager(models.Manager):
     def get_by_natural_key(self, slug):
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0075_delete_duplicateddocumentold'),
+        ('document_indexing', '0022_indexinstance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexTemplateDocumentState',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'values', models.TextField(
+                        blank=True, verbose_name='Values'
+                    )
+                ),
+                (
+                    'document', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_template_states',
+                        to='documents.Document', verbose_name='Document'
+                    )
+                ),
+                (
+                    'index_template', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='document_states',
+                        to='document_indexing.IndexTemplate',
+                        verbose_name='Index'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Index template document state',
+                'verbose_name_plural': 'Index template document states',
+                'unique_together': {('index_template', 'document')},
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_indexing', '0023_indextemplatedocumentstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexTemplateRebuild',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'chunk_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Chunk count'
+                    )
+                ),
+                (
+                    'chunk_completed_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Completed chunk count'
+                    )
+                ),
+                (
+                    'datetime_started', models.DateTimeField(
+                        auto_now_add=True, verbose_name='Date time started'
+                    )
+                ),
+                (
+                    'index_instance_root_node', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_template_rebuild',
+                        to='document_indexing.IndexInstanceNode',
+                        verbose_name='Index instance root node'
+                    )
+                ),
+                (
+                    'index_template', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_rebuild',
+                        to='document_indexing.IndexTemplate',
+                        verbose_name='Index'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Index rebuild',
+                'verbose_name_plural': 'Index rebuilds',
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
+import json
 import logging
+import time
 
-from django.db import models, transaction
+from django.db import OperationalError, models, transaction
 from django.urls import reverse
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext, ugettext_lazy as _
@@ -19,10 +21,15 @@ from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.templating.classes import Template
 
 from .events import event_index_template_created, event_index_template_edited
+from .literals import INDEX_REBUILD_RETRY_COUNT
 from .managers import (
     DocumentIndexInstanceNodeManager, IndexTemplateManager,
     IndexInstanceNodeManager
 )
+from .settings import (
+    setting_incremental_enable, setting_rebuild_chunk_size,
+    setting_task_retry
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -110,10 +117,19 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
         """
         logger.debug('Index; Indexing document: %s', document)
 
+        if setting_incremental_enable.value:
+            return self.index_document_incremental(document=document)
+
         if Document.valid.filter(pk=document.pk).exists():
             # Only index valid documents
             self.initialize_instance_root()
 
+            # The document nodes will be recreated from scratch, forget
+            # the recorded template values.
+            self.document_states.filter(document=document).delete()
+
+            index_instance_root_nodes = self.get_instance_root_nodes()
+
             with transaction.atomic():
                 # Remove the document from all instance nodes from
                 # this index
@@ -121,10 +137,221 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
                     index_instance_node.remove_document(document=document)
 
                 # Delete all empty nodes. Starting from the bottom up
-                for index_instance_node in self.instance_root.get_leafnodes():
-                    index_instance_node.delete_empty()
+                for index_instance_root_node in index_instance_root_nodes:
+                    for index_instance_node in index_instance_root_node.get_leafnodes():
+                        index_instance_node.delete_empty()
+
+            for index_instance_root_node in index_instance_root_nodes:
+                self.template_root.index_document(
+                    document=document,
+                    index_instance_root_node=index_instance_root_node
+                )
+
+    def index_document_incremental(self, document):
+        """
+        Index a document updating only the instance nodes that changed.
+        The templates are evaluated without holding any lock and the
+        resulting values are compared with the ones recorded the last time
+        the document was indexed. If they differ, the missing instance
+        nodes are created, the document is added to the new nodes and
+        removed from the nodes it no longer belongs to. Only the nodes that
+        lost the document are checked for deletion.
+        Every enabled template node is rendered on each call, since the
+        document attributes read by a template are not known in advance.
+        """
+        if not Document.valid.filter(pk=document.pk).exists():
+            # Only index valid documents
+            return
+
+        self.initialize_instance_root()
+
+        template_root = self.template_root
+        template_nodes = list(template_root.get_descendants())
+
+        template_values = self.get_document_template_values(
+            document=document, template_nodes=template_nodes
+        )
+        values = json.dumps(obj=template_values, sort_keys=True)
+
+        document_state = self.document_states.filter(
+            document=document
+        ).first()
+
+        if document_state and document_state.values == values:
+            logger.debug(
+                'Index; Document %s values unchanged, skipping.', document
+            )
+            return
+
+        template_node_children = {}
+        for template_node in template_nodes:
+            template_node_children.setdefault(
+                template_node.parent_id, []
+            ).append(template_node)
+
+        # Start transaction after the lock in case the locking backend uses
+        # the database.
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=template_root.get_lock_string()
+        )
 
-            self.template_root.index_document(document=document)
+        try:
+            with transaction.atomic():
+                index_instance_root_node = template_root.get_instance_root_node()
+                index_instance_node_id_list = set()
+
+                def _create_instance_nodes(
+                    template_node_parent, index_instance_node_parent
+                ):
+                    for template_node in template_node_children.get(template_node_parent.pk, ()):
+                        value = template_values[
+                            force_text(s=template_node.pk)
+                        ][-1]
+
+                        if value:
+                            index_instance_node, created = template_node.index_instance_nodes.get_or_create(
+                                parent=index_instance_node_parent,
+                                value=value
+                            )
+
+                            if template_node.link_documents:
+                                index_instance_node_id_list.add(
+                                    index_instance_node.pk
+                                )
+
+                            _create_instance_nodes(
+                                template_node_parent=template_node,
+                                index_instance_node_parent=index_instance_node
+                            )
+
+                _create_instance_nodes(
+                    template_node_parent=template_root,
+                    index_instance_node_parent=index_instance_root_node
+                )
+
+                index_instance_node_id_list_current = set(
+                    IndexInstanceNode.objects.filter(
+                        documents=document,
+                        tree_id=index_instance_root_node.tree_id
+                    ).values_list('pk', flat=True)
+                )
+
+                for index_instance_node in IndexInstanceNode.objects.filter(pk__in=index_instance_node_id_list - index_instance_node_id_list_current):
+                    index_instance_node.documents.add(document)
+
+                for index_instance_node in IndexInstanceNode.objects.filter(pk__in=index_instance_node_id_list_current - index_instance_node_id_list):
+                    index_instance_node.documents.remove(document)
+                    index_instance_node.delete_empty_ancestors()
+
+                self.document_states.update_or_create(
+                    document=document, defaults={'values': values}
+                )
+        finally:
+            lock.release()
+
+        index_template_rebuild = self.get_rebuild()
+        if index_template_rebuild:
+            self.index_document_instance_root_node(
+                document=document,
+                index_instance_root_node=index_template_rebuild.index_instance_root_node
+            )
+
+    def index_document_instance_root_node(
+        self, document, index_instance_root_node
+    ):
+        """
+        Remove the document from the nodes of a single instance tree and
+        index it again in that tree. Used to populate the shadow instance
+        tree of a rebuild.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.template_root.get_lock_string()
+        )
+
+        try:
+            with transaction.atomic():
+                for index_instance_node in IndexInstanceNode.objects.filter(documents=document, tree_id=index_instance_root_node.tree_id):
+                    index_instance_node.documents.remove(document)
+                    index_instance_node.delete_empty_ancestors()
+
+                self.template_root.index_document(
+                    acquire_lock=False, document=document,
+                    index_instance_root_node=index_instance_root_node
+                )
+        finally:
+            lock.release()
+
+    def get_document_template_values(self, document, template_nodes):
+        """
+        Evaluate the template nodes for a document. The values include the
+        template node attributes so that editing the template is detected
+        as a change by the incremental indexing.
+        """
+        template_values = {}
+        for template_node in template_nodes:
+            if template_node.enabled:
+                value = template_node.evaluate(document=document)
+            else:
+                value = None
+
+            template_values[force_text(s=template_node.pk)] = (
+                template_node.parent_id, template_node.expression,
+                template_node.enabled, template_node.link_documents, value
+            )
+
+        return template_values
+
+    def get_instance_root_nodes(self):
+        """
+        Return the current instance root node and the root node of the
+        shadow instance tree if the index is being rebuilt.
+        """
+        result = [self.instance_root]
+
+        index_template_rebuild = self.get_rebuild()
+        if index_template_rebuild:
+            result.append(index_template_rebuild.index_instance_root_node)
+
+        return result
+
+    def get_rebuild(self):
+        return IndexTemplateRebuild.objects.filter(index_template=self).first()
+
+    def get_rebuild_document_id_ranges(self):
+        """
+        Generator returning the first and last primary key of the chunks
+        of documents to index during a rebuild.
+        """
+        queryset = Document.valid.filter(
+            document_type__in=self.document_types.all()
+        ).order_by('pk').values_list('pk', flat=True)
+
+        chunk_size = setting_rebuild_chunk_size.value
+        document_id_first = None
+        count = 0
+
+        for document_id in queryset.iterator():
+            if document_id_first is None:
+                document_id_first = document_id
+
+            document_id_last = document_id
+            count += 1
+
+            if count == chunk_size:
+                yield document_id_first, document_id_last
+                document_id_first = None
+                count = 0
+
+        if document_id_first is not None:
+            yield document_id_first, document_id_last
+
+    def get_rebuild_progress(self):
+        index_template_rebuild = self.get_rebuild()
+        if index_template_rebuild:
+            return index_template_rebuild.get_progress_display()
+        else:
+            return _('None')
+    get_rebuild_progress.short_description = _('Rebuild progress')
 
     def initialize_instance_root(self):
         return self.template_root.initialize_index_instance_root_node()
@@ -138,35 +365,96 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
 
     def rebuild(self):
         """
-        Delete and reconstruct the index by deleting of all its instance nodes
-        and recreating them for the documents whose types are associated with
-        this index
+        Reconstruct the index for the documents whose types are associated
+        with this index. The documents are indexed into a shadow instance
+        tree that replaces the current one when complete, the index remains
+        available during the rebuild.
+        Documents that can't be indexed because the index is locked are
+        retried like `task_rebuild_index_chunk` does. If they still fail
+        the rebuild is cancelled and the error raised, a rebuild is never
+        left unfinished.
         """
-        # Delete all index instance nodes by deleting the root index
-        # instance node. All child index instance nodes will be cascade
-        # deleted.
+        index_template_rebuild, document_id_ranges = self.rebuild_start()
+
         try:
-            self.instance_root.delete()
-        except IndexInstanceNode.DoesNotExist:
-            # Empty index, ignore this exception
-            pass
+            for document_id_first, document_id_last in document_id_ranges:
+                document_id_list = None
+                retry_count = 0
+
+                while True:
+                    document_id_list = index_template_rebuild.index_documents(
+                        document_id_first=document_id_first,
+                        document_id_last=document_id_last,
+                        document_id_list=document_id_list
+                    )
+
+                    if not document_id_list:
+                        break
+
+                    retry_count += 1
+
+                    if retry_count > INDEX_REBUILD_RETRY_COUNT:
+                        raise LockError(
+                            'Unable to index documents: {}'.format(
+                                document_id_list
+                            )
+                        )
 
-        # Create the new root index instance node
-        self.template_root.index_instance_nodes.create()
+                    time.sleep(setting_task_retry.value)
+        except Exception:
+            self.rebuild_cancel()
+            raise
+
+    def rebuild_start(self):
+        """
+        Create the shadow instance tree and the rebuild tracking entry.
+        Return the rebuild and the list of document primary key ranges
+        to index.
+        """
+        self.rebuild_cancel()
+        self.initialize_instance_root()
+
+        with transaction.atomic():
+            index_instance_root_node = self.template_root.index_instance_nodes.create()
+            index_template_rebuild = IndexTemplateRebuild.objects.create(
+                index_instance_root_node=index_instance_root_node,
+                index_template=self
+            )
+
+        # The document ranges are calculated after the rebuild entry is
+        # committed. Documents created afterwards are indexed into the
+        # shadow instance tree by the document indexing.
+        document_id_ranges = list(self.get_rebuild_document_id_ranges())
 
-        # Re-index each document with a type associated with this index
-        for document in Document.objects.filter(document_type__in=self.document_types.all()):
-            # Evaluate each index template node for each document
-            # associated with this index.
-            self.index_document(document=document)
+        IndexTemplateRebuild.objects.filter(
+            pk=index_template_rebuild.pk
+        ).update(chunk_count=len(document_id_ranges))
+        index_template_rebuild.chunk_count = len(document_id_ranges)
+
+        if not document_id_ranges:
+            index_template_rebuild.complete()
+
+        return index_template_rebuild, document_id_ranges
+
+    def rebuild_cancel(self):
+        """
+        Delete the shadow instance tree of a rebuild in progress. The
+        rebuild tracking entry is cascade deleted.
+        """
+        for index_instance_node in IndexInstanceNode.objects.filter(index_template_rebuild__index_template=self):
+            index_instance_node.delete()
 
     def reset(self):
+        self.rebuild_cancel()
+
         try:
             self.instance_root.delete()
         except IndexInstanceNode.DoesNotExist:
             # Empty index, ignore this exception
             pass
 
+        self.document_states.all().delete()
+
         # Create the new root index instance node
         self.template_root.index_instance_nodes.create()
 
@@ -247,13 +535,45 @@ class IndexTemplateNode(MPTTModel):
         else:
             return self.expression
 
+    def evaluate(self, document):
+        """
+        Render the node expression for a document. Return None if the
+        expression raises an error.
+        """
+        logger.debug(
+            'IndexTemplateNode; Evaluating template: %s', self.expression
+        )
+
+        try:
+            template = Template(template_string=self.expression)
+            result = template.render(context={'document': document})
+        except Exception as exception:
+            logger.debug('Evaluating error: %s', exception)
+            error_message = _(
+                'Error indexing document: %(document)s; expression: '
+                '%(expression)s; %(exception)s'
+            ) % {
+                'document': document,
+                'expression': self.expression,
+                'exception': exception
+            }
+            logger.debug(error_message)
+        else:
+            logger.debug('Evaluation result: %s', result)
+            return result
+
     def get_lock_string(self):
         return 'indexing:indexing_template_node_{}'.format(self.pk)
 
     def get_instance_root_node(self):
-        return self.index_instance_nodes.get(parent=None)
+        return self.index_instance_nodes.get(
+            index_template_rebuild__isnull=True, parent=None
+        )
 
-    def index_document(self, document, acquire_lock=True, index_instance_node_parent=None):
+    def index_document(
+        self, document, acquire_lock=True, index_instance_node_parent=None,
+        index_instance_root_node=None
+    ):
         # Start transaction after the lock in case the locking backend uses
         # the database.
         try:
@@ -272,7 +592,7 @@ class IndexTemplateNode(MPTTModel):
                 if not index_instance_node_parent:
                     # I'm the root
                     with transaction.atomic():
-                        index_instance_root_node = self.get_instance_root_node()
+                        index_instance_root_node = index_instance_root_node or self.get_instance_root_node()
 
                         for child in self.get_children():
                             child.index_document(
@@ -287,51 +607,32 @@ class IndexTemplateNode(MPTTModel):
                             'My parent instance node is: %s',
                             index_instance_node_parent
                         )
-                        logger.debug(
-                            'IndexTemplateNode; Evaluating template: %s', self.expression
-                        )
+                        result = self.evaluate(document=document)
 
-                        try:
-                            template = Template(
-                                template_string=self.expression
-                            )
-                            result = template.render(
-                                context={'document': document}
+                        if result:
+                            index_instance_node, created = self.index_instance_nodes.get_or_create(
+                                parent=index_instance_node_parent,
+                                value=result
                             )
-                        except Exception as exception:
-                            logger.debug('Evaluating error: %s', exception)
-                            error_message = _(
-                                'Error indexing document: %(document)s; expression: '
-                                '%(expression)s; %(exception)s'
-                            ) % {
-                                'document': document,
-                                'expression': self.expression,
-                                'exception': exception
-                            }
-                            logger.debug(error_message)
-                        else:
-                            logger.debug('Evaluation result: %s', result)
-
-                            if result:
-                                index_instance_node, created = self.index_instance_nodes.get_or_create(
-                                    parent=index_instance_node_parent,
-                                    value=result
-                                )
 
-                                if self.link_documents:
-                                    index_instance_node.documents.add(document)
+                            if self.link_documents:
+                                index_instance_node.documents.add(document)
 
-                                for child in self.get_children():
-                                    child.index_document(
-                                        document=document, acquire_lock=False,
-                                        index_instance_node_parent=index_instance_node
-                                    )
+                            for child in self.get_children():
+                                child.index_document(
+                                    document=document, acquire_lock=False,
+                                    index_instance_node_parent=index_instance_node
+                                )
             finally:
                 if acquire_lock:
                     lock.release()
 
     def initialize_index_instance_root_node(self):
-        self.index_instance_nodes.get_or_create(parent=None)
+        queryset = self.index_instance_nodes.filter(
+            index_template_rebuild__isnull=True, parent=None
+        )
+        if not queryset.exists():
+            self.index_instance_nodes.create()
 
 
 class IndexInstance(IndexTemplate):
@@ -346,7 +647,9 @@ class IndexInstance(IndexTemplate):
         verbose_name_plural = _('Index instances')
 
     def get_children(self):
-        root_node_queryset = self.get_nodes().filter(parent=None)
+        root_node_queryset = self.get_nodes().filter(
+            index_template_rebuild__isnull=True, parent=None
+        )
         if root_node_queryset.exists():
             return root_node_queryset.first().get_children()
         else:
@@ -426,6 +729,23 @@ class IndexInstanceNode(MPTTModel):
             finally:
                 lock.release()
 
+    def delete_empty_ancestors(self):
+        """
+        Delete this node and its ancestors while they have no documents
+        and no children. Must be called while holding the index template
+        root lock.
+        """
+        index_instance_node = self
+
+        while not index_instance_node.is_root_node():
+            if index_instance_node.get_documents().exists() or index_instance_node.get_children().exists():
+                break
+
+            parent_id = index_instance_node.parent_id
+            index_instance_node.delete()
+            # Reload the parent to get the updated tree fields.
+            index_instance_node = IndexInstanceNode.objects.get(pk=parent_id)
+
     def get_absolute_url(self):
         return reverse(
             viewname='indexing:index_instance_node_view', kwargs={
@@ -508,6 +828,175 @@ class IndexInstanceNode(MPTTModel):
                 lock.release()
 
 
+class IndexTemplateDocumentState(models.Model):
+    """
+    Values produced by the templates of an index for a document the last
+    time it was indexed. Used by the incremental indexing to skip documents
+    whose values did not change.
+    """
+    index_template = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='document_states',
+        to=IndexTemplate, verbose_name=_('Index')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='index_template_states',
+        to=Document, verbose_name=_('Document')
+    )
+    values = models.TextField(blank=True, verbose_name=_('Values'))
+
+    class Meta:
+        unique_together = ('index_template', 'document')
+        verbose_name = _('Index template document state')
+        verbose_name_plural = _('Index template document states')
+
+    def __str__(self):
+        return '{}: {}'.format(self.index_template, self.document)
+
+
+class IndexTemplateRebuild(models.Model):
+    """
+    Track the rebuild of an index. Documents are indexed in chunks into a
+    shadow instance tree which replaces the current instance tree of the
+    index once all the chunks are completed.
+    """
+    index_template = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='index_rebuild',
+        to=IndexTemplate, verbose_name=_('Index')
+    )
+    index_instance_root_node = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='index_template_rebuild',
+        to=IndexInstanceNode, verbose_name=_('Index instance root node')
+    )
+    chunk_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Chunk count')
+    )
+    chunk_completed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Completed chunk count')
+    )
+    datetime_started = models.DateTimeField(
+        auto_now_add=True, verbose_name=_('Date time started')
+    )
+
+    class Meta:
+        verbose_name = _('Index rebuild')
+        verbose_name_plural = _('Index rebuilds')
+
+    def __str__(self):
+        return force_text(s=self.index_template)
+
+    def complete(self):
+        """
+        Replace the current instance tree of the index with the shadow
+        instance tree.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.index_template.template_root.get_lock_string()
+        )
+
+        try:
+            with transaction.atomic():
+                if not IndexTemplateRebuild.objects.filter(pk=self.pk).exists():
+                    # Already completed by another chunk.
+                    return
+
+                try:
+                    self.index_template.instance_root.delete()
+                except IndexInstanceNode.DoesNotExist:
+                    pass
+
+                # Deleting the tracking entry turns the shadow root node
+                # into the instance root node of the index.
+                self.delete()
+
+                # The states of the indexed documents were recorded by the
+                # chunks, forget the documents no longer in the index.
+                self.index_template.document_states.exclude(
+                    document__in=Document.valid.filter(
+                        document_type__in=self.index_template.document_types.all()
+                    )
+                ).delete()
+        finally:
+            lock.release()
+
+    def get_progress_display(self):
+        if self.chunk_count:
+            percent = self.chunk_completed_count * 100 // self.chunk_count
+        else:
+            percent = 0
+
+        return _('%(percent)d%% (%(completed)d of %(total)d chunks)') % {
+            'completed': self.chunk_completed_count,
+            'percent': percent, 'total': self.chunk_count
+        }
+
+    def index_documents(
+        self, document_id_first, document_id_last, document_id_list=None
+    ):
+        """
+        Index a chunk of documents into the shadow instance tree and
+        record the template values of each document for the incremental
+        indexing. Complete the rebuild if this was the last chunk.
+        Documents that can't be indexed because the index is locked by
+        another chunk are skipped and their primary keys returned, the
+        chunk is only counted as completed when the list is empty.
+        """
+        queryset = Document.valid.filter(
+            document_type__in=self.index_template.document_types.all(),
+            pk__gte=document_id_first, pk__lte=document_id_last
+        )
+
+        if document_id_list is not None:
+            queryset = queryset.filter(pk__in=document_id_list)
+
+        template_nodes = list(
+            self.index_template.template_root.get_descendants()
+        )
+        document_id_list_failed = []
+
+        for document in queryset.iterator():
+            template_values = self.index_template.get_document_template_values(
+                document=document, template_nodes=template_nodes
+            )
+
+            try:
+                self.index_template.index_document_instance_root_node(
+                    document=document,
+                    index_instance_root_node=self.index_instance_root_node
+                )
+            except (LockError, OperationalError) as exception:
+                logger.debug(
+                    'Unable to index document %s into the rebuild of '
+                    'index %s; %s', document.pk, self.index_template,
+                    exception
+                )
+                document_id_list_failed.append(document.pk)
+            else:
+                self.index_template.document_states.update_or_create(
+                    document=document, defaults={
+                        'values': json.dumps(
+                            obj=template_values, sort_keys=True
+                        )
+                    }
+                )
+
+        if document_id_list_failed:
+            return document_id_list_failed
+
+        IndexTemplateRebuild.objects.filter(pk=self.pk).update(
+            chunk_completed_count=models.F('chunk_completed_count') + 1
+        )
+
+        try:
+            self.refresh_from_db()
+        except IndexTemplateRebuild.DoesNotExist:
+            return []
+
+        if self.chunk_completed_count >= self.chunk_count:
+            self.complete()
+
+        return []
+
+
 class DocumentIndexInstanceNode(IndexInstanceNode):
     """
     Proxy model of node instance. It is used to represent the node instance
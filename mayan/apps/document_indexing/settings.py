@@ -2,12 +2,34 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.smart_settings.classes import SettingNamespace
 
-from .literals import DEFAULT_TASK_RETRY_DELAY
+from .literals import (
+    DEFAULT_DOCUMENT_INDEXING_INCREMENTAL_ENABLE,
+    DEFAULT_DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE, DEFAULT_TASK_RETRY_DELAY
+)
 
 namespace = SettingNamespace(
     label=_('Document indexing'), name='document_indexing',
 )
 
+setting_incremental_enable = namespace.add_setting(
+    default=DEFAULT_DOCUMENT_INDEXING_INCREMENTAL_ENABLE,
+    global_name='DOCUMENT_INDEXING_INCREMENTAL_ENABLE', help_text=_(
+        'Record the values produced by the index templates for each '
+        'document. When a document is indexed again, only the index nodes '
+        'whose values changed are updated instead of removing the document '
+        'from the entire index and deleting the empty nodes of the whole '
+        'index. All the index templates are still rendered each time a '
+        'document is indexed, this setting reduces the index writes and '
+        'locking, not the template rendering cost.'
+    )
+)
+setting_rebuild_chunk_size = namespace.add_setting(
+    default=DEFAULT_DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE,
+    global_name='DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE', help_text=_(
+        'Number of documents indexed by each task when rebuilding an index. '
+        'The chunks are processed in parallel by the indexing workers.'
+    )
+)
 setting_task_retry = namespace.add_setting(
     default=DEFAULT_TASK_RETRY_DELAY,
     global_name='DOCUMENT_INDEXING_TASK_RETRY_DELAY', help_text=_(
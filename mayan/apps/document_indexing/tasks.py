@@ -72,10 +72,61 @@ def task_rebuild_index(self, index_id):
 
     try:
         index = IndexTemplate.objects.get(pk=index_id)
-        index.rebuild()
+        index_template_rebuild, document_id_ranges = index.rebuild_start()
     except LockError as exception:
         # This index is being rebuilt by another task, retry later
         raise self.retry(exc=exception)
+    else:
+        for document_id_first, document_id_last in document_id_ranges:
+            task_rebuild_index_chunk.apply_async(
+                kwargs={
+                    'document_id_first': document_id_first,
+                    'document_id_last': document_id_last,
+                    'index_template_rebuild_id': index_template_rebuild.pk
+                }
+            )
+
+
+@app.task(
+    bind=True, default_retry_delay=setting_task_retry.value, max_retries=None,
+    ignore_result=True
+)
+def task_rebuild_index_chunk(
+    self, index_template_rebuild_id, document_id_first, document_id_last,
+    document_id_list=None
+):
+    IndexTemplateRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexTemplateRebuild'
+    )
+
+    try:
+        index_template_rebuild = IndexTemplateRebuild.objects.get(
+            pk=index_template_rebuild_id
+        )
+    except IndexTemplateRebuild.DoesNotExist:
+        # The rebuild was cancelled or superseded by a newer rebuild.
+        pass
+    else:
+        document_id_list_failed = index_template_rebuild.index_documents(
+            document_id_first=document_id_first,
+            document_id_last=document_id_last,
+            document_id_list=document_id_list
+        )
+
+        if document_id_list_failed:
+            # Retry only the documents that could not be indexed.
+            raise self.retry(
+                exc=LockError(
+                    'Unable to index documents: {}'.format(
+                        document_id_list_failed
+                    )
+                ), kwargs={
+                    'document_id_first': document_id_first,
+                    'document_id_last': document_id_last,
+                    'document_id_list': document_id_list_failed,
+                    'index_template_rebuild_id': index_template_rebuild_id
+                }
+            )
 
 
 @app.task(
@@ -1,12 +1,20 @@
+import mock
+
 from mayan.apps.documents.tests.base import DocumentTestMixin
 from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_DESCRIPTION, TEST_DOCUMENT_DESCRIPTION_EDITED,
     TEST_DOCUMENT_LABEL_EDITED
 )
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.metadata.models import MetadataType, DocumentTypeMetadataType
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..models import IndexInstanceNode, IndexTemplate, IndexTemplateNode
+from ..models import (
+    DocumentIndexInstanceNode, IndexInstanceNode, IndexTemplate,
+    IndexTemplateDocumentState, IndexTemplateNode, IndexTemplateRebuild
+)
+from ..settings import setting_incremental_enable
 
 from .literals import (
     TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION,
@@ -274,3 +282,233 @@ class IndexTestCase(IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_index_template.get_absolute_url())
+
+
+class IncrementalIndexTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self.old_value = setting_incremental_enable.value
+        setting_incremental_enable.set(value=True)
+
+        self._create_test_document_stub()
+        self._create_test_index_template(add_test_document_type=True)
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION,
+            link_documents=True
+        )
+
+    def tearDown(self):
+        setting_incremental_enable.set(value=self.old_value)
+        super().tearDown()
+
+    def test_document_indexing(self):
+        self.test_index_template.rebuild()
+
+        self.assertEqual(
+            IndexInstanceNode.objects.last().value, self.test_document.label
+        )
+        self.assertTrue(
+            self.test_document in IndexInstanceNode.objects.last().documents.all()
+        )
+        self.assertEqual(IndexTemplateDocumentState.objects.count(), 1)
+
+    def test_document_value_change(self):
+        self.test_index_template.rebuild()
+
+        self.test_document.label = TEST_DOCUMENT_LABEL_EDITED
+        self.test_document.save()
+
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['', TEST_DOCUMENT_LABEL_EDITED]
+        )
+
+    def test_document_value_unchanged(self):
+        self.test_index_template.rebuild()
+
+        index_instance_node = IndexInstanceNode.objects.last()
+        document_state_values = IndexTemplateDocumentState.objects.get(
+            document=self.test_document
+        ).values
+
+        self.test_index_template.index_document(document=self.test_document)
+
+        self.assertEqual(IndexInstanceNode.objects.last(), index_instance_node)
+        self.assertEqual(
+            IndexTemplateDocumentState.objects.get(
+                document=self.test_document
+            ).values, document_state_values
+        )
+
+    def test_template_change(self):
+        self.test_index_template.rebuild()
+
+        template_node = self.test_index_template.node_templates.get(
+            link_documents=True
+        )
+        template_node.expression = TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION
+        template_node.save()
+
+        self.test_document.description = TEST_DOCUMENT_DESCRIPTION
+        self.test_document.save()
+
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['', TEST_DOCUMENT_DESCRIPTION]
+        )
+
+
+class IndexRebuildTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_index_template(add_test_document_type=True)
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION,
+            link_documents=True
+        )
+        self.test_index_template.rebuild()
+
+    def test_rebuild_start(self):
+        index_instance_root_node = self.test_index_template.instance_root
+
+        index_template_rebuild, document_id_ranges = self.test_index_template.rebuild_start()
+
+        self.assertEqual(
+            document_id_ranges, [
+                (self.test_document.pk, self.test_document.pk)
+            ]
+        )
+        self.assertEqual(
+            self.test_index_template.instance_root, index_instance_root_node
+        )
+        self.assertEqual(
+            DocumentIndexInstanceNode.objects.get_for(
+                document=self.test_document
+            ).count(), 1
+        )
+
+    def test_rebuild_chunk_completion(self):
+        index_template_rebuild, document_id_ranges = self.test_index_template.rebuild_start()
+
+        for document_id_first, document_id_last in document_id_ranges:
+            index_template_rebuild.index_documents(
+                document_id_first=document_id_first,
+                document_id_last=document_id_last
+            )
+
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 0)
+        self.assertEqual(
+            self.test_index_template.instance_root,
+            index_template_rebuild.index_instance_root_node
+        )
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['', self.test_document.label]
+        )
+
+    def test_document_indexing_during_rebuild(self):
+        index_template_rebuild, document_id_ranges = self.test_index_template.rebuild_start()
+
+        self.test_document.label = TEST_DOCUMENT_LABEL_EDITED
+        self.test_document.save()
+
+        self.assertTrue(
+            self.test_document in index_template_rebuild.index_instance_root_node.get_children().get(
+                value=TEST_DOCUMENT_LABEL_EDITED
+            ).documents.all()
+        )
+
+    def test_reset_cancels_rebuild(self):
+        self.test_index_template.rebuild_start()
+
+        self.test_index_template.reset()
+
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 0)
+        self.assertEqual(IndexInstanceNode.objects.count(), 1)
+
+    def test_rebuild_document_states(self):
+        self.assertEqual(
+            IndexTemplateDocumentState.objects.filter(
+                document=self.test_document,
+                index_template=self.test_index_template
+            ).count(), 1
+        )
+
+    @mock.patch('mayan.apps.document_indexing.models.time.sleep')
+    def test_rebuild_chunk_locked_retry(self, mock_sleep):
+        index_documents = IndexTemplateRebuild.index_documents
+        document_id_list_locked = [self.test_document.pk]
+
+        def mock_index_documents(index_template_rebuild, **kwargs):
+            if document_id_list_locked:
+                return [document_id_list_locked.pop()]
+
+            return index_documents(index_template_rebuild, **kwargs)
+
+        with mock.patch.object(IndexTemplateRebuild, 'index_documents', autospec=True, side_effect=mock_index_documents):
+            self.test_index_template.rebuild()
+
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 0)
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['', self.test_document.label]
+        )
+
+    @mock.patch('mayan.apps.document_indexing.models.time.sleep')
+    def test_rebuild_chunk_locked_abort(self, mock_sleep):
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_index_template.template_root.get_lock_string()
+        )
+
+        try:
+            with self.assertRaises(expected_exception=LockError):
+                self.test_index_template.rebuild()
+        finally:
+            lock.release()
+
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 0)
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                index_template_rebuild__index_template=self.test_index_template
+            ).exists()
+        )
+
+    def test_rebuild_chunk_locked(self):
+        index_template_rebuild, document_id_ranges = self.test_index_template.rebuild_start()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_index_template.template_root.get_lock_string()
+        )
+
+        try:
+            document_id_list_failed = index_template_rebuild.index_documents(
+                document_id_first=document_id_ranges[0][0],
+                document_id_last=document_id_ranges[0][1]
+            )
+        finally:
+            lock.release()
+
+        self.assertEqual(document_id_list_failed, [self.test_document.pk])
+        index_template_rebuild.refresh_from_db()
+        self.assertEqual(index_template_rebuild.chunk_completed_count, 0)
+
+        document_id_list_failed = index_template_rebuild.index_documents(
+            document_id_first=document_id_ranges[0][0],
+            document_id_last=document_id_ranges[0][1],
+            document_id_list=document_id_list_failed
+        )
+
+        self.assertEqual(document_id_list_failed, [])
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 0)
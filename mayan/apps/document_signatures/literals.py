@@ -6,5 +6,6 @@ DEFAULT_SIGNATURES_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorag
 DEFAULT_SIGNATURES_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(settings.MEDIA_ROOT, 'document_signatures')
 }
+DOCUMENT_FILE_VERIFY_BATCH_SIZE = 100
 RETRY_DELAY = 10
 STORAGE_NAME_DOCUMENT_SIGNATURES_DETACHED_SIGNATURE = 'document_signatures__detachedsignature'
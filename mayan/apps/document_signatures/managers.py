@@ -91,6 +91,21 @@ class EmbeddedSignatureManager(models.Manager):
         finally:
             os.unlink(temporary_filename)
 
+    def verify_document_files(self, document_files):
+        """
+        Check a group of document files for embedded signatures using a
+        single keyring session.
+        """
+        with Key.objects.keyring_session():
+            for document_file in document_files:
+                try:
+                    self.create(document_file=document_file)
+                except IOError as exception:
+                    logger.error(
+                        'File missing for document file ID %s; %s',
+                        document_file.pk, exception
+                    )
+
     def unsigned_document_files(self):
         return DocumentFile.objects.exclude(
             pk__in=self.values('document_file')
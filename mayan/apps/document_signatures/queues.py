@@ -20,6 +20,10 @@ queue_signatures.add_task_type(
     dotted_path='mayan.apps.document_signatures.tasks.task_verify_document_file',
     label=_('Verify document file')
 )
+queue_signatures.add_task_type(
+    dotted_path='mayan.apps.document_signatures.tasks.task_verify_document_files',
+    label=_('Verify document files')
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.document_signatures.tasks.task_verify_missing_embedded_signature',
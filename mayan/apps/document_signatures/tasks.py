@@ -4,6 +4,8 @@ from django.apps import apps
 
 from mayan.celery import app
 
+from .literals import DOCUMENT_FILE_VERIFY_BATCH_SIZE
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -16,12 +18,14 @@ def task_unverify_key_signatures(self, key_id):
     EmbeddedSignature = apps.get_model(
         app_label='document_signatures', model_name='EmbeddedSignature'
     )
+    Key = apps.get_model(app_label='django_gpg', model_name='Key')
 
-    for signature in DetachedSignature.objects.filter(key_id__endswith=key_id).filter(signature_id__isnull=False):
-        signature.save()
+    with Key.objects.keyring_session():
+        for signature in DetachedSignature.objects.filter(key_id__endswith=key_id).filter(signature_id__isnull=False):
+            signature.save()
 
-    for signature in EmbeddedSignature.objects.filter(key_id__endswith=key_id).filter(signature_id__isnull=False):
-        signature.save()
+        for signature in EmbeddedSignature.objects.filter(key_id__endswith=key_id).filter(signature_id__isnull=False):
+            signature.save()
 
 
 @app.task(bind=True, ignore_result=True)
@@ -40,11 +44,12 @@ def task_verify_key_signatures(self, key_pk):
 
     key = Key.objects.get(pk=key_pk)
 
-    for signature in DetachedSignature.objects.filter(key_id__endswith=key.key_id).filter(signature_id__isnull=True):
-        signature.save()
+    with Key.objects.keyring_session():
+        for signature in DetachedSignature.objects.filter(key_id__endswith=key.key_id).filter(signature_id__isnull=True):
+            signature.save()
 
-    for signature in EmbeddedSignature.objects.filter(key_id__endswith=key.key_id).filter(signature_id__isnull=True):
-        signature.save()
+        for signature in EmbeddedSignature.objects.filter(key_id__endswith=key.key_id).filter(signature_id__isnull=True):
+            signature.save()
 
 
 @app.task(bind=True, ignore_result=True)
@@ -53,9 +58,19 @@ def task_verify_missing_embedded_signature(self):
         app_label='document_signatures', model_name='EmbeddedSignature'
     )
 
-    for document_file in EmbeddedSignature.objects.unsigned_document_files():
-        task_verify_document_file.apply_async(
-            kwargs=dict(document_file_pk=document_file.pk)
+    document_file_id_list = list(
+        EmbeddedSignature.objects.unsigned_document_files().values_list(
+            'pk', flat=True
+        )
+    )
+
+    for index in range(0, len(document_file_id_list), DOCUMENT_FILE_VERIFY_BATCH_SIZE):
+        task_verify_document_files.apply_async(
+            kwargs={
+                'document_file_id_list': document_file_id_list[
+                    index:index + DOCUMENT_FILE_VERIFY_BATCH_SIZE
+                ]
+            }
         )
 
 
@@ -80,6 +95,23 @@ def task_verify_document_file(self, document_file_pk):
         raise IOError(error_message)
 
 
+@app.task(bind=True, ignore_result=True)
+def task_verify_document_files(self, document_file_id_list):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    EmbeddedSignature = apps.get_model(
+        app_label='document_signatures', model_name='EmbeddedSignature'
+    )
+
+    EmbeddedSignature.objects.verify_document_files(
+        document_files=DocumentFile.objects.filter(
+            pk__in=document_file_id_list
+        )
+    )
+
+
 @app.task(ignore_result=True)
 def task_refresh_signature_information():
     DetachedSignature = apps.get_model(
@@ -88,25 +120,27 @@ def task_refresh_signature_information():
     EmbeddedSignature = apps.get_model(
         app_label='document_signatures', model_name='EmbeddedSignature'
     )
-
-    for signanture in DetachedSignature.objects.all():
-        try:
-            signanture.save()
-        except Exception as exception:
-            logger.error(
-                'Error refreshing detached signature {} for document file ID {}; {}'.format(
-                    signanture, signanture.document_file_id, exception,
-                ), exc_info=True
-            )
-            raise
-
-    for signanture in EmbeddedSignature.objects.all():
-        try:
-            signanture.save()
-        except Exception as exception:
-            logger.error(
-                'Error refreshing embedded signature {} for document file ID {}; {}'.format(
-                    signanture, signanture.document_file_id, exception,
-                ), exc_info=True
-            )
-            raise
+    Key = apps.get_model(app_label='django_gpg', model_name='Key')
+
+    with Key.objects.keyring_session():
+        for signanture in DetachedSignature.objects.all():
+            try:
+                signanture.save()
+            except Exception as exception:
+                logger.error(
+                    'Error refreshing detached signature {} for document file ID {}; {}'.format(
+                        signanture, signanture.document_file_id, exception,
+                    ), exc_info=True
+                )
+                raise
+
+        for signanture in EmbeddedSignature.objects.all():
+            try:
+                signanture.save()
+            except Exception as exception:
+                logger.error(
+                    'Error refreshing embedded signature {} for document file ID {}; {}'.format(
+                        signanture, signanture.document_file_id, exception,
+                    ), exc_info=True
+                )
+                raise
@@ -256,6 +256,28 @@ class EmbeddedSignaturesTestCase(
             TEST_UNSIGNED_DOCUMENT_COUNT
         )
 
+    def test_verify_document_files_with_key(self):
+        old_hooks = DocumentFile._post_save_hooks
+
+        DocumentFile._post_save_hooks = {}
+
+        self.test_document_path = TEST_SIGNED_DOCUMENT_PATH
+        self._upload_test_document()
+        self._upload_test_document()
+
+        DocumentFile._post_save_hooks = old_hooks
+
+        self._create_test_key_public()
+
+        EmbeddedSignature.objects.verify_document_files(
+            document_files=DocumentFile.objects.all()
+        )
+
+        self.assertEqual(EmbeddedSignature.objects.count(), 2)
+
+        for signature in EmbeddedSignature.objects.all():
+            self.assertEqual(signature.signature_id, TEST_SIGNATURE_ID)
+
     def test_embedded_signing(self):
         self._create_test_key_private()
 
@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -23,7 +23,8 @@ from .classes import DocumentStateHelper, WorkflowAction
 from .events import event_workflow_template_edited
 from .handlers import (
     handler_create_workflow_image_cache, handler_index_document,
-    handler_launch_workflow, handler_trigger_transition
+    handler_launch_workflow, handler_trigger_transition,
+    handler_workflow_instance_state_update
 )
 from .html_widgets import WorkflowLogExtraDataWidget, widget_transition_events
 from .links import (
@@ -269,6 +270,13 @@ class DocumentStatesApp(MayanAppConfig):
         column_workflow_get_initial_state.add_exclude(
             source=WorkflowRuntimeProxy
         )
+        column_workflow_get_launch_progress = SourceColumn(
+            attribute='get_launch_progress', include_label=True,
+            source=Workflow
+        )
+        column_workflow_get_launch_progress.add_exclude(
+            source=WorkflowRuntimeProxy
+        )
         SourceColumn(
             attribute='get_current_state', include_label=True,
             label=_('Current state'), source=WorkflowInstance,
@@ -583,6 +591,11 @@ class DocumentStatesApp(MayanAppConfig):
 
         menu_tools.bind_links(links=(link_tool_launch_workflows,))
 
+        post_delete.connect(
+            dispatch_uid='workflows_handler_workflow_instance_state_update',
+            receiver=handler_workflow_instance_state_update,
+            sender=WorkflowInstanceLogEntry
+        )
         post_save.connect(
             dispatch_uid='workflows_handler_launch_workflow',
             receiver=handler_launch_workflow,
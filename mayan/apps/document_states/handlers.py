@@ -71,3 +71,17 @@ def handler_trigger_transition(sender, **kwargs):
                 comment=_('Event trigger: %s') % EventType.get(name=action.verb).label,
                 transition=valid_transitions[0]
             )
+
+
+def handler_workflow_instance_state_update(sender, instance, **kwargs):
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+
+    # The last log entry reference is cleared by the deletion of the log
+    # entry. Recalculate the state from the remaining log entries.
+    queryset = WorkflowInstance.objects.filter(
+        log_entry_last__isnull=True, pk=instance.workflow_instance_id
+    )
+    for workflow_instance in queryset:
+        workflow_instance.state_update()
@@ -11,6 +11,7 @@ DEFAULT_WORKFLOWS_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(settings.MEDIA_ROOT, 'workflows')
 }
 DEFAULT_WORKFLOWS_IMAGE_CACHE_TIME = '31556926'
+DEFAULT_WORKFLOWS_LAUNCH_CHUNK_SIZE = 500
 
 FIELD_TYPE_CHOICE_CHAR = 1
 FIELD_TYPE_CHOICE_INTEGER = 2
@@ -28,6 +29,7 @@ STORAGE_NAME_WORKFLOW_CACHE = 'document_states__workflowimagecache'
 SYMBOL_MATH_CONDITIONAL = '&rarr;'
 
 TASK_GENERATE_WORKFLOW_IMAGE_RETRY_DELAY = 10
+TASK_LAUNCH_WORKFLOW_CHUNK_RETRY_DELAY = 10
 
 WIDGET_CLASS_TEXTAREA = 1
 WIDGET_CLASS_CHOICES = (
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ...models import WorkflowInstance
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalculate the stored current state and last log entry of all '
+        'workflow instances from their log entries.'
+    )
+
+    def handle(self, *args, **options):
+        WorkflowInstance.objects.state_update_all()
@@ -1,4 +1,6 @@
+from django.apps import apps
 from django.db import models
+from django.db.models import OuterRef, Subquery
 
 
 class WorkflowManager(models.Manager):
@@ -13,3 +15,30 @@ class ValidWorkflowInstanceManager(models.Manager):
         return models.QuerySet(
             model=self.model, using=self._db
         ).filter(document__in_trash=False)
+
+
+class WorkflowInstanceManager(models.Manager):
+    def state_update_all(self):
+        """
+        Update the stored current state and last log entry of all the
+        workflow instances from their log entries.
+        """
+        WorkflowInstanceLogEntry = apps.get_model(
+            app_label='document_states',
+            model_name='WorkflowInstanceLogEntry'
+        )
+
+        self.update(
+            log_entry_last=Subquery(
+                queryset=WorkflowInstanceLogEntry.objects.filter(
+                    workflow_instance=OuterRef('pk')
+                ).order_by('-datetime', '-pk').values('pk')[:1]
+            )
+        )
+        self.update(
+            state=Subquery(
+                queryset=WorkflowInstanceLogEntry.objects.filter(
+                    pk=OuterRef('log_entry_last')
+                ).values('transition__destination_state')[:1]
+            )
+        )
@@ -0,0 +1,67 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def operation_workflow_instance_state_update(apps, schema_editor):
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+    WorkflowInstanceLogEntry = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstanceLogEntry'
+    )
+
+    queryset = WorkflowInstance.objects.using(
+        alias=schema_editor.connection.alias
+    )
+
+    queryset.update(
+        log_entry_last=Subquery(
+            queryset=WorkflowInstanceLogEntry.objects.filter(
+                workflow_instance=OuterRef('pk')
+            ).order_by('-datetime', '-pk').values('pk')[:1]
+        )
+    )
+    queryset.update(
+        state=Subquery(
+            queryset=WorkflowInstanceLogEntry.objects.filter(
+                pk=OuterRef('log_entry_last')
+            ).values('transition__destination_state')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_states', '0023_auto_20200930_0726'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='log_entry_last',
+            field=models.ForeignKey(
+                blank=True, editable=False, null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+',
+                to='document_states.WorkflowInstanceLogEntry',
+                verbose_name='Last log entry'
+            ),
+        ),
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='state',
+            field=models.ForeignKey(
+                blank=True, editable=False, help_text='State reached by the '
+                'last transition. Empty when no transition has been '
+                'executed.', null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='workflow_instances',
+                to='document_states.WorkflowState', verbose_name='State'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_workflow_instance_state_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_states', '0024_workflowinstance_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowLaunch',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'chunk_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Chunk count'
+                    )
+                ),
+                (
+                    'chunk_completed_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Completed chunk count'
+                    )
+                ),
+                (
+                    'datetime_started', models.DateTimeField(
+                        auto_now_add=True, verbose_name='Date time started'
+                    )
+                ),
+                (
+                    'workflow', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='launch',
+                        to='document_states.Workflow',
+                        verbose_name='Workflow'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Workflow launch',
+                'verbose_name_plural': 'Workflow launches',
+            },
+        ),
+    ]
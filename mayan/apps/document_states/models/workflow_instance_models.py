@@ -11,10 +11,11 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.documents.models import Document
 
-from ..managers import ValidWorkflowInstanceManager
+from ..managers import ValidWorkflowInstanceManager, WorkflowInstanceManager
 from ..permissions import permission_workflow_instance_transition
 
 from .workflow_models import Workflow
+from .workflow_state_models import WorkflowState
 from .workflow_transition_models import (
     WorkflowTransition, WorkflowTransitionField
 )
@@ -35,8 +36,21 @@ class WorkflowInstance(models.Model):
     context = models.TextField(
         blank=True, verbose_name=_('Context')
     )
+    state = models.ForeignKey(
+        blank=True, editable=False, help_text=_(
+            'State reached by the last transition. Empty when no '
+            'transition has been executed.'
+        ), null=True, on_delete=models.SET_NULL,
+        related_name='workflow_instances', to=WorkflowState,
+        verbose_name=_('State')
+    )
+    log_entry_last = models.ForeignKey(
+        blank=True, editable=False, null=True, on_delete=models.SET_NULL,
+        related_name='+', to='WorkflowInstanceLogEntry',
+        verbose_name=_('Last log entry')
+    )
 
-    objects = models.Manager()
+    objects = WorkflowInstanceManager()
     valid = ValidWorkflowInstanceManager()
 
     class Meta:
@@ -73,7 +87,29 @@ class WorkflowInstance(models.Model):
         Serialize the context data.
         """
         self.context = json.dumps(obj=context)
-        self.save()
+        self.save(update_fields=('context',))
+
+    def execute_initial_state_actions(self, action_list=None):
+        """
+        Execute the enabled entry actions of the initial state of the
+        workflow. The list of actions can be provided to avoid querying
+        them for each instance when launching in bulk.
+        """
+        if action_list is None:
+            initial_state = self.workflow.get_initial_state()
+            if not initial_state:
+                return
+
+            action_list = initial_state.entry_actions.filter(enabled=True)
+
+        for action in action_list:
+            context = self.get_context()
+            context.update(
+                {
+                    'action': action
+                }
+            )
+            action.execute(context=context, workflow_instance=self)
 
     def get_absolute_url(self):
         return reverse(
@@ -101,16 +137,10 @@ class WorkflowInstance(models.Model):
         archived; this field will tell at the current state where the
         document is right now.
         """
-        try:
-            return self.get_last_transition().destination_state
-        except AttributeError:
-            return self.workflow.get_initial_state()
+        return self.state or self.workflow.get_initial_state()
 
     def get_last_log_entry(self):
-        try:
-            return self.log_entries.order_by('datetime').last()
-        except AttributeError:
-            return None
+        return self.log_entry_last
 
     def get_last_transition(self):
         """
@@ -161,6 +191,29 @@ class WorkflowInstance(models.Model):
         """
         return json.loads(s=self.context or '{}')
 
+    def state_update(self, log_entry=None):
+        """
+        Update the stored current state and last log entry. Uses the
+        latest log entry when one is not provided.
+        """
+        if not log_entry:
+            log_entry = self.log_entries.select_related(
+                'transition__destination_state'
+            ).order_by('datetime', 'pk').last()
+
+        if log_entry:
+            state = log_entry.transition.destination_state
+        else:
+            state = None
+
+        # Update only these fields to not overwrite the context of the
+        # instance.
+        WorkflowInstance.objects.filter(pk=self.pk).update(
+            log_entry_last=log_entry, state=state
+        )
+        self.log_entry_last = log_entry
+        self.state = state
+
 
 class WorkflowInstanceLogEntry(models.Model):
     """
@@ -222,7 +275,14 @@ class WorkflowInstanceLogEntry(models.Model):
         return json.loads(s=self.extra_data or '{}')
 
     def save(self, *args, **kwargs):
+        is_new = not self.pk
         result = super().save(*args, **kwargs)
+
+        if is_new:
+            # Update the current state before executing the actions, which
+            # can cause further transitions.
+            self.workflow_instance.state_update(log_entry=self)
+
         context = self.workflow_instance.get_context()
         context.update(
             {
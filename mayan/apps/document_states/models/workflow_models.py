@@ -6,12 +6,14 @@ from graphviz import Digraph
 
 from django.apps import apps
 from django.core import serializers
-from django.db import IntegrityError, models
+from django.db import IntegrityError, OperationalError, models, transaction
 from django.urls import reverse
+from django.utils.encoding import force_text
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.acls.models import AccessControlList
+from mayan.apps.acls.models import AccessControlList, EffectiveAccessEntry
+from mayan.apps.acls.settings import setting_effective_access_enable
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.common.validators import validate_internal_name
 from mayan.apps.documents.models import Document, DocumentType
@@ -19,14 +21,16 @@ from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.events.classes import EventManagerSave
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.exceptions import LockError
 from ..events import event_workflow_template_created, event_workflow_template_edited
 from ..literals import (
     STORAGE_NAME_WORKFLOW_CACHE, SYMBOL_MATH_CONDITIONAL,
     WORKFLOW_ACTION_ON_ENTRY
 )
 from ..managers import WorkflowManager
+from ..settings import setting_workflow_launch_chunk_size
 
-__all__ = ('Workflow', 'WorkflowRuntimeProxy')
+__all__ = ('Workflow', 'WorkflowLaunch', 'WorkflowRuntimeProxy')
 logger = logging.getLogger(name=__name__)
 
 
@@ -159,6 +163,26 @@ class Workflow(ExtraDataModelMixin, models.Model):
             return None
     get_initial_state.short_description = _('Initial state')
 
+    def get_launch(self):
+        return WorkflowLaunch.objects.filter(workflow=self).first()
+
+    def get_launch_document_queryset(self):
+        """
+        Return the valid documents of the document types of the workflow
+        for which the workflow has not been launched.
+        """
+        return Document.valid.filter(
+            document_type__in=self.document_types.all()
+        ).exclude(workflows__workflow=self)
+
+    def get_launch_progress(self):
+        workflow_launch = self.get_launch()
+        if workflow_launch:
+            return workflow_launch.get_progress_display()
+        else:
+            return _('None')
+    get_launch_progress.short_description = _('Launch progress')
+
     def launch_for(self, document):
         if document.document_type in self.document_types.all():
             try:
@@ -166,19 +190,7 @@ class Workflow(ExtraDataModelMixin, models.Model):
                     'Launching workflow %s for document %s', self, document
                 )
                 workflow_instance = self.instances.create(document=document)
-                initial_state = self.get_initial_state()
-                if initial_state:
-                    for action in initial_state.entry_actions.filter(enabled=True):
-                        context = workflow_instance.get_context()
-                        context.update(
-                            {
-                                'action': action
-                            }
-                        )
-                        action.execute(
-                            context=context,
-                            workflow_instance=workflow_instance
-                        )
+                workflow_instance.execute_initial_state_actions()
             except IntegrityError:
                 logger.info(
                     'Workflow %s already launched for document %s', self, document
@@ -194,6 +206,73 @@ class Workflow(ExtraDataModelMixin, models.Model):
                 'document.'
             )
 
+    def launch_start(self):
+        """
+        Create the instances of the workflow for all the documents
+        pending launch in bulk. Return the launch tracking entry and the
+        chunks of document primary keys whose instances need to execute
+        the initial state actions. The tracking entry is None when there
+        are no initial state actions.
+        """
+        WorkflowInstance = apps.get_model(
+            app_label='document_states', model_name='WorkflowInstance'
+        )
+
+        document_id_list = list(
+            self.get_launch_document_queryset().order_by('pk').values_list(
+                'pk', flat=True
+            )
+        )
+
+        chunk_size = setting_workflow_launch_chunk_size.value
+        document_id_chunks = [
+            document_id_list[index:index + chunk_size] for index in range(
+                0, len(document_id_list), chunk_size
+            )
+        ]
+
+        for document_id_chunk in document_id_chunks:
+            # Ignore the instances created concurrently by the launch
+            # for a single document.
+            WorkflowInstance.objects.bulk_create(
+                ignore_conflicts=True, objs=[
+                    WorkflowInstance(document_id=document_id, workflow=self)
+                    for document_id in document_id_chunk
+                ]
+            )
+
+            if setting_effective_access_enable.value:
+                # Bulk creation doesn't send the post_save signal that
+                # updates the effective access of new objects.
+                EffectiveAccessEntry.objects.queryset_update(
+                    acls_added=EffectiveAccessEntry.objects.get_ancestor_acls(
+                        obj=WorkflowInstance(workflow=self)
+                    ), queryset=WorkflowInstance.objects.filter(
+                        document_id__in=document_id_chunk, workflow=self
+                    )
+                )
+
+        logger.info(
+            'Created %d instances of workflow %s', len(document_id_list), self
+        )
+
+        initial_state = self.get_initial_state()
+
+        if not document_id_chunks or not initial_state:
+            return None, []
+
+        if not initial_state.entry_actions.filter(enabled=True).exists():
+            return None, []
+
+        workflow_launch, created = WorkflowLaunch.objects.get_or_create(
+            workflow=self
+        )
+        WorkflowLaunch.objects.filter(pk=workflow_launch.pk).update(
+            chunk_count=models.F('chunk_count') + len(document_id_chunks)
+        )
+
+        return workflow_launch, document_id_chunks
+
     def render(self):
         diagram = Digraph(
             name='finite_state_machine', graph_attr={
@@ -295,6 +374,98 @@ class Workflow(ExtraDataModelMixin, models.Model):
         return super().save(*args, **kwargs)
 
 
+class WorkflowLaunch(models.Model):
+    """
+    Track the execution of the initial state actions of a workflow
+    launched for all its documents. The actions are executed in chunks
+    of documents.
+    """
+    workflow = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='launch', to=Workflow,
+        verbose_name=_('Workflow')
+    )
+    chunk_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Chunk count')
+    )
+    chunk_completed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Completed chunk count')
+    )
+    datetime_started = models.DateTimeField(
+        auto_now_add=True, verbose_name=_('Date time started')
+    )
+
+    class Meta:
+        verbose_name = _('Workflow launch')
+        verbose_name_plural = _('Workflow launches')
+
+    def __str__(self):
+        return force_text(s=self.workflow)
+
+    def execute_initial_state_actions(self, document_id_list):
+        """
+        Execute the initial state actions of the workflow instances of a
+        chunk of documents. The actions of each document are executed in
+        their own transaction. Return the list of the documents whose
+        actions failed with a locking or database error, the chunk is
+        completed only when the list is empty. The tracking entry is
+        deleted after the last chunk.
+        """
+        WorkflowInstance = apps.get_model(
+            app_label='document_states', model_name='WorkflowInstance'
+        )
+
+        document_id_list_failed = []
+        initial_state = self.workflow.get_initial_state()
+
+        if initial_state:
+            action_list = list(
+                initial_state.entry_actions.filter(enabled=True)
+            )
+
+            queryset = WorkflowInstance.valid.filter(
+                document_id__in=document_id_list, workflow=self.workflow
+            ).select_related('document', 'workflow')
+
+            for workflow_instance in queryset:
+                try:
+                    with transaction.atomic():
+                        workflow_instance.execute_initial_state_actions(
+                            action_list=action_list
+                        )
+                except (LockError, OperationalError) as exception:
+                    logger.debug(
+                        'Error executing the initial state actions of '
+                        'workflow instance: %s; %s', workflow_instance,
+                        exception
+                    )
+                    document_id_list_failed.append(
+                        workflow_instance.document_id
+                    )
+
+        if document_id_list_failed:
+            return document_id_list_failed
+
+        WorkflowLaunch.objects.filter(pk=self.pk).update(
+            chunk_completed_count=models.F('chunk_completed_count') + 1
+        )
+        WorkflowLaunch.objects.filter(
+            chunk_completed_count__gte=models.F('chunk_count'), pk=self.pk
+        ).delete()
+
+        return document_id_list_failed
+
+    def get_progress_display(self):
+        if self.chunk_count:
+            percent = self.chunk_completed_count * 100 // self.chunk_count
+        else:
+            percent = 0
+
+        return _('%(percent)d%% (%(completed)d of %(total)d chunks)') % {
+            'completed': self.chunk_completed_count,
+            'percent': percent, 'total': self.chunk_count
+        }
+
+
 class WorkflowRuntimeProxy(Workflow):
     class Meta:
         proxy = True
@@ -2,11 +2,10 @@ import hashlib
 import json
 import logging
 
-from django.apps import apps
 from django.conf import settings
 from django.core import serializers
 from django.db import models
-from django.db.models import F, Max, Q
+from django.db.models import Q
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
@@ -95,30 +94,9 @@ class WorkflowState(ExtraDataModelMixin, models.Model):
         return self.actions.filter(when=WORKFLOW_ACTION_ON_EXIT)
 
     def get_documents(self):
-        WorkflowInstanceLogEntry = apps.get_model(
-            app_label='document_states',
-            model_name='WorkflowInstanceLogEntry'
-        )
-
-        latest_entries = WorkflowInstanceLogEntry.objects.annotate(
-            max_datetime=Max(
-                'workflow_instance__log_entries__datetime'
-            )
-        ).filter(
-            datetime=F('max_datetime')
-        )
-
-        state_latest_entries = latest_entries.filter(
-            transition__destination_state=self
-        )
-
         return Document.valid.filter(
-            Q(
-                workflows__pk__in=state_latest_entries.values_list(
-                    'workflow_instance', flat=True
-                )
-            ) | Q(
-                workflows__log_entries__isnull=True,
+            Q(workflows__state=self) | Q(
+                workflows__state__isnull=True,
                 workflows__workflow__states=self,
                 workflows__workflow__states__initial=True
             )
@@ -22,6 +22,10 @@ queue_document_states_medium.add_task_type(
     label=_('Launch a workflow for a document'),
     dotted_path='mayan.apps.document_states.tasks.task_launch_workflow_for'
 )
+queue_document_states_medium.add_task_type(
+    label=_('Execute the initial state actions of a launched workflow'),
+    dotted_path='mayan.apps.document_states.tasks.task_launch_workflow_chunk'
+)
 queue_document_states_medium.add_task_type(
     label=_('Launch all workflows for a document'),
     dotted_path='mayan.apps.document_states.tasks.task_launch_all_workflow_for'
@@ -7,7 +7,7 @@ from .literals import (
     DEFAULT_GRAPHVIZ_DOT_PATH, DEFAULT_WORKFLOWS_IMAGE_CACHE_MAXIMUM_SIZE,
     DEFAULT_WORKFLOWS_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_WORKFLOWS_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
-    DEFAULT_WORKFLOWS_IMAGE_CACHE_TIME
+    DEFAULT_WORKFLOWS_IMAGE_CACHE_TIME, DEFAULT_WORKFLOWS_LAUNCH_CHUNK_SIZE
 )
 from .setting_callbacks import callback_update_workflow_image_cache_size
 
@@ -51,3 +51,10 @@ setting_workflow_image_cache_storage_backend_arguments = namespace.add_setting(
         'Arguments to pass to the WORKFLOWS_IMAGE_CACHE_STORAGE_BACKEND.'
     )
 )
+setting_workflow_launch_chunk_size = namespace.add_setting(
+    default=DEFAULT_WORKFLOWS_LAUNCH_CHUNK_SIZE,
+    global_name='WORKFLOWS_LAUNCH_CHUNK_SIZE', help_text=_(
+        'Number of documents per task when executing the initial state '
+        'actions of a workflow launched for all its documents.'
+    )
+)
@@ -6,7 +6,10 @@ from mayan.celery import app
 
 from mayan.apps.lock_manager.exceptions import LockError
 
-from .literals import TASK_GENERATE_WORKFLOW_IMAGE_RETRY_DELAY
+from .literals import (
+    TASK_GENERATE_WORKFLOW_IMAGE_RETRY_DELAY,
+    TASK_LAUNCH_WORKFLOW_CHUNK_RETRY_DELAY
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -33,21 +36,21 @@ def task_generate_workflow_image(self, document_state_id):
 
 @app.task(ignore_result=True)
 def task_launch_all_workflows():
-    Document = apps.get_model(app_label='documents', model_name='Document')
     Workflow = apps.get_model(
         app_label='document_states', model_name='Workflow'
     )
 
     logger.info('Start launching workflows')
-    for document in Document.valid.all():
-        Workflow.objects.launch_for(document=document)
+    for workflow_id in Workflow.objects.filter(auto_launch=True).values_list('pk', flat=True):
+        task_launch_workflow.apply_async(
+            kwargs={'workflow_id': workflow_id}
+        )
 
     logger.info('Finished launching workflows')
 
 
 @app.task(ignore_result=True)
 def task_launch_workflow(workflow_id):
-    Document = apps.get_model(app_label='documents', model_name='Document')
     Workflow = apps.get_model(
         app_label='document_states', model_name='Workflow'
     )
@@ -55,12 +58,63 @@ def task_launch_workflow(workflow_id):
     workflow = Workflow.objects.get(pk=workflow_id)
 
     logger.info('Start launching workflow: %d', workflow_id)
-    for document in Document.valid.filter(document_type__in=workflow.document_types.all()):
-        workflow.launch_for(document=document)
+    workflow_launch, document_id_chunks = workflow.launch_start()
+
+    for document_id_list in document_id_chunks:
+        task_launch_workflow_chunk.apply_async(
+            kwargs={
+                'document_id_list': document_id_list,
+                'workflow_launch_id': workflow_launch.pk
+            }
+        )
 
     logger.info('Finished launching workflow: %d', workflow_id)
 
 
+@app.task(
+    bind=True, default_retry_delay=TASK_LAUNCH_WORKFLOW_CHUNK_RETRY_DELAY,
+    ignore_result=True, max_retries=None, retry_backoff=True
+)
+def task_launch_workflow_chunk(self, workflow_launch_id, document_id_list):
+    WorkflowLaunch = apps.get_model(
+        app_label='document_states', model_name='WorkflowLaunch'
+    )
+
+    workflow_launch = WorkflowLaunch.objects.get(pk=workflow_launch_id)
+
+    logger.info(
+        'Start executing the initial state actions of workflow: %d for '
+        '%d documents', workflow_launch.workflow_id, len(document_id_list)
+    )
+
+    document_id_list_failed = workflow_launch.execute_initial_state_actions(
+        document_id_list=document_id_list
+    )
+
+    if document_id_list_failed:
+        logger.warning(
+            'Error executing the initial state actions of workflow: %d for '
+            '%d documents. Retrying.', workflow_launch.workflow_id,
+            len(document_id_list_failed)
+        )
+        # Retry only the documents whose actions didn't execute, the
+        # actions are not idempotent.
+        raise self.retry(
+            exc=LockError(
+                'Unable to execute the initial state actions for '
+                'documents: {}'.format(document_id_list_failed)
+            ), kwargs={
+                'document_id_list': document_id_list_failed,
+                'workflow_launch_id': workflow_launch_id
+            }
+        )
+
+    logger.info(
+        'Finished executing the initial state actions of workflow: %d for '
+        '%d documents', workflow_launch.workflow_id, len(document_id_list)
+    )
+
+
 @app.task(ignore_result=True)
 def task_launch_workflow_for(document_id, workflow_id):
     Document = apps.get_model(app_label='documents', model_name='Document')
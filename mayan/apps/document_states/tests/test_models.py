@@ -2,9 +2,11 @@ import json
 
 from mayan.apps.documents.events import event_document_edited
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
-from mayan.apps.events.classes import EventType
+from mayan.apps.events.classes import EventCommitBuffer, EventType
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..models import WorkflowInstance
+
 from .literals import (
     TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_DOTTED_PATH,
     TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_TEXT_LABEL,
@@ -83,6 +85,113 @@ class WorkflowInstanceModelTestCase(
             self.test_workflow_instance.get_transition_choices().count(), 1
         )
 
+    def test_workflow_template_transition_buffered_event_trigger(self):
+        EventType.refresh()
+
+        self.test_workflow_template_transition.trigger_events.create(
+            event_type=event_document_edited.get_stored_event_type()
+        )
+
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+
+        EventCommitBuffer.flush(
+            action_list=[
+                event_document_edited.get_action(target=self.test_document)
+            ]
+        )
+
+        self.test_workflow_instance.refresh_from_db()
+        self.assertEqual(
+            self.test_workflow_instance.get_last_transition(),
+            self.test_workflow_template_transition
+        )
+
+
+class WorkflowInstanceStateModelTestCase(
+    WorkflowTemplateTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_workflow_template()
+        self._create_test_workflow_template_state()
+        self._create_test_workflow_template_state()
+        self._create_test_workflow_template_transition()
+        self.test_workflow_template.document_types.add(self.test_document_type)
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+
+    def test_initial_state(self):
+        self.assertEqual(self.test_workflow_instance.state, None)
+        self.assertEqual(
+            self.test_workflow_instance.get_current_state(),
+            self.test_workflow_template_states[0]
+        )
+        self.assertTrue(
+            self.test_document in self.test_workflow_template_states[0].get_documents()
+        )
+        self.assertFalse(
+            self.test_document in self.test_workflow_template_states[1].get_documents()
+        )
+
+    def test_do_transition_state_update(self):
+        log_entry = self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        self.test_workflow_instance.refresh_from_db()
+
+        self.assertEqual(
+            self.test_workflow_instance.state,
+            self.test_workflow_template_states[1]
+        )
+        self.assertEqual(
+            self.test_workflow_instance.get_last_log_entry(), log_entry
+        )
+        self.assertFalse(
+            self.test_document in self.test_workflow_template_states[0].get_documents()
+        )
+        self.assertTrue(
+            self.test_document in self.test_workflow_template_states[1].get_documents()
+        )
+
+    def test_log_entry_delete_state_update(self):
+        log_entry = self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        log_entry.delete()
+
+        self.test_workflow_instance.refresh_from_db()
+
+        self.assertEqual(self.test_workflow_instance.state, None)
+        self.assertEqual(
+            self.test_workflow_instance.get_last_log_entry(), None
+        )
+
+    def test_state_update_all(self):
+        log_entry = self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        WorkflowInstance.objects.update(log_entry_last=None, state=None)
+
+        WorkflowInstance.objects.state_update_all()
+
+        self.test_workflow_instance.refresh_from_db()
+
+        self.assertEqual(
+            self.test_workflow_instance.state,
+            self.test_workflow_template_states[1]
+        )
+        self.assertEqual(
+            self.test_workflow_instance.get_last_log_entry(), log_entry
+        )
+
 
 class WorkflowModelTestCase(WorkflowTemplateTestMixin, BaseTestCase):
     def test_workflow_template_preview(self):
@@ -1,7 +1,22 @@
+import json
+
+import mock
+
+from django.test import override_settings
+
 from mayan.apps.documents.models.document_models import Document
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.smart_settings.classes import SettingNamespace
 
+from ..literals import WORKFLOW_ACTION_ON_ENTRY
+from ..models import WorkflowInstance, WorkflowLaunch
 
+from .literals import (
+    TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_DOTTED_PATH,
+    TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_TEXT_DATA,
+    TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_TEXT_LABEL
+)
 from .mixins.workflow_template_mixins import (
     WorkflowTaskTestCaseMixin, WorkflowTemplateTestMixin
 )
@@ -99,3 +114,139 @@ class WorkflowTaskTestCase(
         self.assertEqual(
             self.test_document.workflows.count(), workflow_instance_count
         )
+
+
+class WorkflowLaunchTaskTestCase(
+    WorkflowTaskTestCaseMixin, WorkflowTemplateTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._create_test_workflow_template(add_test_document_type=True)
+        self._create_test_workflow_template_state()
+
+    def tearDown(self):
+        SettingNamespace.invalidate_cache_all()
+        super().tearDown()
+
+    def _create_test_workflow_template_state_entry_action(self):
+        self.test_workflow_template_state.actions.create(
+            action_data=json.dumps(
+                obj=TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_TEXT_DATA
+            ),
+            action_path=TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_DOTTED_PATH,
+            label='', when=WORKFLOW_ACTION_ON_ENTRY,
+        )
+
+    def test_task_launch_workflow_bulk(self):
+        self._execute_task_launch_workflow()
+
+        for test_document in self.test_documents:
+            self.assertEqual(
+                test_document.workflows.filter(
+                    workflow=self.test_workflow_template
+                ).count(), 1
+            )
+
+    def test_task_launch_workflow_repeated(self):
+        self._execute_task_launch_workflow()
+        self._execute_task_launch_workflow()
+
+        self.assertEqual(
+            self.test_workflow_template.instances.count(),
+            len(self.test_documents)
+        )
+
+    def test_task_launch_workflow_existing_instance(self):
+        self.test_workflow_template.launch_for(document=self.test_document)
+
+        self._execute_task_launch_workflow()
+
+        self.assertEqual(
+            self.test_workflow_template.instances.count(),
+            len(self.test_documents)
+        )
+
+    @override_settings(WORKFLOWS_LAUNCH_CHUNK_SIZE=2)
+    def test_task_launch_workflow_initial_state_actions(self):
+        SettingNamespace.invalidate_cache_all()
+        self._create_test_workflow_template_state_entry_action()
+
+        self._execute_task_launch_workflow()
+
+        for test_document in self.test_documents:
+            test_document.refresh_from_db()
+            self.assertEqual(
+                test_document.label,
+                TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_TEXT_LABEL
+            )
+
+        self.assertEqual(WorkflowLaunch.objects.count(), 0)
+
+    @override_settings(WORKFLOWS_LAUNCH_CHUNK_SIZE=2)
+    def test_workflow_launch_start_progress(self):
+        SettingNamespace.invalidate_cache_all()
+        self._create_test_workflow_template_state_entry_action()
+
+        workflow_launch, document_id_chunks = self.test_workflow_template.launch_start()
+
+        self.assertEqual(len(document_id_chunks), 2)
+        workflow_launch.refresh_from_db()
+        self.assertEqual(workflow_launch.chunk_count, len(document_id_chunks))
+        self.assertEqual(workflow_launch.chunk_completed_count, 0)
+
+        for document_id_list in document_id_chunks:
+            workflow_launch.execute_initial_state_actions(
+                document_id_list=document_id_list
+            )
+
+        self.assertEqual(WorkflowLaunch.objects.count(), 0)
+
+    def test_workflow_launch_retry_failed_documents(self):
+        self._create_test_workflow_template_state_entry_action()
+
+        workflow_launch, document_id_chunks = self.test_workflow_template.launch_start()
+        document_id_list = document_id_chunks[0]
+
+        document_id_list_executed = []
+        document_id_list_locked = [document_id_list[0]]
+
+        def mock_execute_initial_state_actions(workflow_instance, action_list=None):
+            if workflow_instance.document_id in document_id_list_locked:
+                document_id_list_locked.remove(workflow_instance.document_id)
+                raise LockError
+
+            document_id_list_executed.append(workflow_instance.document_id)
+
+        with mock.patch.object(WorkflowInstance, 'execute_initial_state_actions', autospec=True, side_effect=mock_execute_initial_state_actions):
+            document_id_list_failed = workflow_launch.execute_initial_state_actions(
+                document_id_list=document_id_list
+            )
+
+            self.assertEqual(document_id_list_failed, [document_id_list[0]])
+            workflow_launch.refresh_from_db()
+            self.assertEqual(workflow_launch.chunk_completed_count, 0)
+
+            document_id_list_failed = workflow_launch.execute_initial_state_actions(
+                document_id_list=document_id_list_failed
+            )
+
+        self.assertEqual(document_id_list_failed, [])
+        self.assertEqual(
+            sorted(document_id_list_executed), sorted(document_id_list)
+        )
+        self.assertEqual(WorkflowLaunch.objects.count(), 0)
+
+    def test_workflow_launch_start_no_initial_state_actions(self):
+        workflow_launch, document_id_chunks = self.test_workflow_template.launch_start()
+
+        self.assertEqual(workflow_launch, None)
+        self.assertEqual(document_id_chunks, [])
+        self.assertEqual(
+            self.test_workflow_template.instances.count(),
+            len(self.test_documents)
+        )
@@ -539,6 +539,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[1]
@@ -581,6 +582,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[1]
@@ -651,6 +653,7 @@ class WorkflowInstanceTransitionFieldViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[1]
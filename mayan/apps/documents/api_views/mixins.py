@@ -1,10 +1,154 @@
+import logging
+
+from django.conf import settings
+from django.http import FileResponse
+from django.views.decorators.cache import cache_control, patch_cache_control
+
 from rest_framework.generics import get_object_or_404
 
 from mayan.apps.acls.models import AccessControlList
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.file_caching.utils import get_cache_partition_file_response
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.views.mixins import ConditionalResponseViewMixin
+
+from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 
 from ..models.document_models import Document
 from ..models.document_type_models import DocumentType
 
+logger = logging.getLogger(name=__name__)
+
+
+class PageImageAPIViewMixin(ConditionalResponseViewMixin):
+    """
+    Serve page images found in the cache from the view. Only the images
+    missing from the cache are generated by the image task. Conditional
+    requests are answered from the page and cache metadata.
+    """
+    page_image_cache_time_setting = None
+    page_image_task = None
+    page_image_task_object_kwarg = None
+
+    def get_conditional_etag(self):
+        return self.page.get_combined_etag(
+            _combined_cache_filename=self.page_image_cache_filename,
+            user=self.request.user
+        )
+
+    def get_conditional_last_modified(self):
+        if self.page_image_cache_file:
+            return self.page_image_cache_file.datetime
+
+    def get_page_image_kwargs(self):
+        result = {
+            'height': self.request.GET.get('height'),
+            'maximum_layer_order': self.request.GET.get('maximum_layer_order'),
+            'rotation': self.request.GET.get('rotation'),
+            'width': self.request.GET.get('width'),
+            'zoom': self.request.GET.get('zoom')
+        }
+
+        for key in ('maximum_layer_order', 'rotation', 'zoom'):
+            if result[key]:
+                result[key] = int(result[key])
+
+        return result
+
+    def get_page_image_task_result(self, page, page_image_kwargs):
+        task_kwargs = page_image_kwargs.copy()
+        task_kwargs.update(
+            {
+                self.page_image_task_object_kwarg: page.pk,
+                'user_id': self.request.user.pk
+            }
+        )
+
+        task = self.page_image_task.apply_async(kwargs=task_kwargs)
+
+        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
+        if settings.DEBUG:
+            # In debug more, task are run synchronously, causing this method
+            # to be called inside another task. Disable the check of nested
+            # tasks when using debug mode.
+            kwargs['disable_sync_subtasks'] = False
+
+        return task.get(**kwargs)
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
+
+    def render_page_image(self):
+        try:
+            if not self.page_image_cache_file:
+                raise CachePartitionFile.DoesNotExist
+
+            return get_cache_partition_file_response(
+                cache_partition_file=self.page_image_cache_file,
+                content_type='image'
+            )
+        except (CachePartitionFile.DoesNotExist, IOError, LockError):
+            logger.debug(
+                'Page image cache file "%s" not available, generating',
+                self.page_image_cache_filename
+            )
+            cache_filename = self.get_page_image_task_result(
+                page=self.page, page_image_kwargs=self.page_image_kwargs
+            )
+            cache_file = self.page.cache_partition.get_file(
+                filename=cache_filename
+            )
+
+            try:
+                return get_cache_partition_file_response(
+                    cache_partition_file=cache_file, content_type='image'
+                )
+            except LockError:
+                # The cache file is being deleted or written again, serve
+                # the image without the cache instead of failing.
+                logger.debug(
+                    'Page image cache file "%s" locked, rendering without '
+                    'the cache', cache_filename
+                )
+                return FileResponse(
+                    self.page.get_image(
+                        transformations=self.page.get_combined_transformation_list(
+                            user=self.request.user, **self.page_image_kwargs
+                        )
+                    ), content_type='image'
+                )
+
+    @cache_control(private=True)
+    def retrieve(self, request, *args, **kwargs):
+        self.page = self.get_object()
+        self.page_image_kwargs = self.get_page_image_kwargs()
+
+        self.page_image_cache_filename = self.page.get_combined_cache_filename(
+            user=request.user, **self.page_image_kwargs
+        )
+
+        try:
+            self.page_image_cache_file = self.page.cache_partition.get_file(
+                filename=self.page_image_cache_filename
+            )
+        except CachePartitionFile.DoesNotExist:
+            self.page_image_cache_file = None
+
+        response = self.render_conditional_response(
+            render_function=self.render_page_image
+        )
+
+        if '_hash' in request.GET:
+            patch_cache_control(
+                response=response,
+                max_age=self.page_image_cache_time_setting.value
+            )
+
+        return response
+
 
 class ParentObjectDocumentAPIViewMixin:
     def get_document(self, permission=None):
@@ -21,6 +21,7 @@ DEFAULT_DOCUMENTS_STORAGE_BACKEND_ARGUMENTS = {
 DEFAULT_DOCUMENTS_DISPLAY_HEIGHT = ''
 DEFAULT_DOCUMENTS_DISPLAY_WIDTH = '3600'
 DEFAULT_DOCUMENTS_FAVORITE_COUNT = 400
+DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE = 1
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE = 500 * 2 ** 20  # 500 Megabytes
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME = '31556926'
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
@@ -84,6 +85,7 @@ DOCUMENT_FILE_ACTION_PAGE_CHOICES = (
     (DOCUMENT_FILE_ACTION_PAGES_APPEND, _('Append. Create a new version and append the new file pages.')),
     (DOCUMENT_FILE_ACTION_PAGES_KEEP, _('Keep. Do not create a new version and keep the current version pages.')),
 )
+DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME = 'base_image'
 DOCUMENT_IMAGE_TASK_TIMEOUT = 120
 
 IMAGE_ERROR_NO_ACTIVE_VERSION = 'document_no_active_version'
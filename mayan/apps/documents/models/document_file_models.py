@@ -19,18 +19,23 @@ from mayan.apps.converter.exceptions import (
 from mayan.apps.events.classes import EventManagerMethodAfter
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.mimetype.api import get_mimetype
-from mayan.apps.storage.classes import DefinedStorageLazy
+from mayan.apps.storage.classes import DefinedStorage, DefinedStorageLazy
 
 from ..events import (
     event_document_file_created, event_document_file_deleted,
     event_document_file_downloaded, event_document_file_edited
 )
 from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE, STORAGE_NAME_DOCUMENT_FILES
 )
 from ..managers import DocumentFileManager, ValidDocumentFileManager
-from ..settings import setting_hash_block_size
+from ..settings import (
+    setting_document_file_page_image_batch_size, setting_hash_block_size
+)
 from ..signals import (
     signal_post_document_created, signal_post_document_file_upload
 )
@@ -193,6 +198,23 @@ class DocumentFile(
 
         if self.exists():
             hash_object = DocumentFile.hash_function()
+
+            # Use the digest computed by the storage while saving the file
+            # if it uses the same hash function, avoiding a second read.
+            # The storage class is checked first to initialize the storage
+            # only when it provides the digest.
+            defined_storage = DefinedStorage.get(
+                name=STORAGE_NAME_DOCUMENT_FILES
+            )
+            if hash_object.name == 'sha256' and hasattr(defined_storage.get_storage_subclass(), 'get_content_hash'):
+                self.checksum = defined_storage.get_storage_instance().get_content_hash(
+                    name=self.file.name
+                )
+                if save:
+                    self.save()
+
+                return self.checksum
+
             with self.open() as file_object:
                 while (True):
                     data = file_object.read(block_size)
@@ -266,6 +288,14 @@ class DocumentFile(
 
         return result
 
+    def get_download_etag(self):
+        """
+        Return an identifier of the stored file content. Files without a
+        checksum have no identifier.
+        """
+        if self.checksum:
+            return '{}-{}'.format(self.pk, self.checksum)
+
     @method_event(
         event_manager_class=EventManagerMethodAfter,
         event=event_document_file_downloaded,
@@ -287,7 +317,7 @@ class DocumentFile(
             try:
                 with self.open() as file_object:
                     converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
+                        file_object=file_object, mime_type=self.mimetype
                     )
                     with converter.to_pdf() as pdf_file_object:
                         with self.cache_partition.create_file(filename=cache_filename) as file_object:
@@ -329,7 +359,7 @@ class DocumentFile(
             try:
                 with self.open() as file_object:
                     self.mimetype, self.encoding = get_mimetype(
-                        file_object=file_object
+                        checksum=self.checksum, file_object=file_object
                     )
             except Exception:
                 self.mimetype = ''
@@ -390,8 +420,114 @@ class DocumentFile(
             if save:
                 self.save()
 
+            batch_size = setting_document_file_page_image_batch_size.value
+
+            if detected_pages and batch_size > 1:
+                # Avoid circular import.
+                from ..tasks import task_document_file_page_images_generate
+
+                # Rasterize the first batch of pages ahead of their first
+                # request once the pages are visible to the workers.
+                transaction.on_commit(
+                    lambda: task_document_file_page_images_generate.apply_async(
+                        kwargs={
+                            'document_file_id': self.pk,
+                            'page_number_first': 1,
+                            'page_number_last': batch_size
+                        }
+                    )
+                )
+
             return detected_pages
 
+    def page_images_generate(self, page_number_first=1, page_number_last=None):
+        """
+        Rasterize a range of pages of the document file and store the base
+        image of every page in the range that is not already in the cache.
+        The range is rasterized in chunks of
+        DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE pages, each one under its own
+        lock with a timeout sized to the chunk. Returns the number of page
+        images generated.
+        """
+        queryset = self.file_pages.filter(page_number__gte=page_number_first)
+        if page_number_last is not None:
+            queryset = queryset.filter(page_number__lte=page_number_last)
+
+        cached_partition_names = set(
+            CachePartitionFile.objects.filter(
+                completed=True,
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+                partition__cache=self.cache,
+                partition__name__startswith='{}-'.format(self.uuid)
+            ).values_list('partition__name', flat=True)
+        )
+
+        pages_missing = {
+            file_page.page_number: file_page for file_page in queryset
+            if file_page.uuid not in cached_partition_names
+        }
+
+        if not pages_missing:
+            return 0
+
+        chunk_size = max(setting_document_file_page_image_batch_size.value, 1)
+        page_number_first = min(pages_missing)
+        page_number_last = max(pages_missing)
+        page_images_generated = 0
+
+        with self.get_intermediate_file() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+
+            # Converter page numbers start at 0. The converter rasterizes
+            # a chunk when its first page is requested, which happens
+            # with the lock of the chunk held.
+            page_images = converter.get_pages(
+                chunk_size=chunk_size,
+                first_page_number=page_number_first - 1,
+                last_page_number=page_number_last - 1
+            )
+
+            for chunk_page_number_first in range(page_number_first, page_number_last + 1, chunk_size):
+                chunk_page_number_last = min(
+                    chunk_page_number_first + chunk_size - 1,
+                    page_number_last
+                )
+
+                lock = LockingBackend.get_backend().acquire_lock(
+                    name='document_file_page_images_generate_{}'.format(
+                        self.pk
+                    ), timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * (
+                        chunk_page_number_last - chunk_page_number_first + 1
+                    )
+                )
+
+                try:
+                    for page_number, page_image in page_images:
+                        file_page = pages_missing.get(page_number + 1)
+
+                        # A page that can't be stored is left for the
+                        # single page path and doesn't abort the rest of
+                        # the batch.
+                        if file_page:
+                            try:
+                                if file_page.base_image_store(image_buffer=page_image):
+                                    page_images_generated += 1
+                            except (CachePartitionFile.DoesNotExist, LockError) as exception:
+                                logger.warning(
+                                    'Unable to store the base image of '
+                                    'document file page: %s; %s',
+                                    file_page, exception
+                                )
+
+                        if page_number + 1 >= chunk_page_number_last:
+                            break
+                finally:
+                    lock.release()
+
+        return page_images_generated
+
     @property
     def pages(self):
         DocumentFilePage = apps.get_model(
@@ -1,9 +1,11 @@
+import hashlib
 import logging
 
 from furl import furl
 
 from django.db import models
 from django.urls import reverse
+from django.utils.encoding import force_bytes
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
@@ -16,11 +18,15 @@ from mayan.apps.converter.transformations import (
 )
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT
+)
 from ..managers import DocumentFilePageManager, ValidDocumentFilePageManager
 from ..settings import (
-    setting_display_width, setting_display_height, setting_zoom_max_level,
+    setting_display_width, setting_display_height,
+    setting_document_file_page_image_batch_size, setting_zoom_max_level,
     setting_zoom_min_level
 )
 
@@ -59,6 +65,23 @@ class DocumentFilePage(PagedModelMixin, models.Model):
     def __str__(self):
         return self.get_label()
 
+    def base_image_store(self, image_buffer):
+        """
+        Store an already rasterized image as the base image of the page.
+        Returns False if the page already had a base image in the cache.
+        """
+        try:
+            self.cache_partition.get_file(
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+            )
+        except CachePartitionFile.DoesNotExist:
+            with self.cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as file_object:
+                file_object.write(image_buffer.getvalue())
+
+            return True
+        else:
+            return False
+
     @cached_property
     def cache_partition(self):
         partition, created = self.document_file.cache.partitions.get_or_create(
@@ -160,6 +183,24 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             transformations=transformation_list
         )
 
+    def get_combined_etag(self, _combined_cache_filename=None, user=None, **kwargs):
+        """
+        Return an identifier of the page image that changes when the file
+        or the combined transformations change.
+        """
+        combined_cache_filename = _combined_cache_filename or self.get_combined_cache_filename(
+            user=user, **kwargs
+        )
+
+        return hashlib.sha256(
+            force_bytes(
+                s='{}-{}-{}-{}'.format(
+                    self.document_file_id, self.document_file.checksum,
+                    self.page_number, combined_cache_filename
+                )
+            )
+        ).hexdigest()
+
     def get_combined_transformation_list(self, user=None, *args, **kwargs):
         """
         Return a list of transformation containing the server side
@@ -214,7 +255,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         return transformation_list
 
     def get_image(self, transformations=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
@@ -222,49 +263,74 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         except CachePartitionFile.DoesNotExist:
             logger.debug('Page cache file "%s" not found', cache_filename)
 
-            try:
-                with self.document_file.get_intermediate_file() as file_object:
-                    converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
-                    )
-                    converter.seek_page(page_number=self.page_number - 1)
-
-                    page_image = converter.get_page()
-
-                    # Since open "wb+" doesn't create files, create it explicitly
-                    with self.cache_partition.create_file(filename=cache_filename) as file_object:
-                        file_object.write(page_image.getvalue())
+            batch_size = setting_document_file_page_image_batch_size.value
+            cache_file = None
 
-                    # Apply runtime transformations
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
+            if batch_size > 1:
+                # Rasterize this page and the following pages in a single
+                # pass to fill the cache of the pages likely to be
+                # requested next.
+                try:
+                    self.document_file.page_images_generate(
+                        page_number_first=self.page_number,
+                        page_number_last=self.page_number + batch_size - 1
+                    )
+                    cache_file = self.cache_partition.get_file(
+                        filename=cache_filename
+                    )
+                except (CachePartitionFile.DoesNotExist, LockError) as exception:
+                    # Another process is rasterizing the batch or this
+                    # page could not be stored, rasterize only this page.
+                    logger.warning(
+                        'Unable to generate the base image of document '
+                        'file page: %s as part of a batch; %s', self,
+                        exception
+                    )
 
-                    return converter.get_page()
-            except Exception as exception:
-                logger.error(
-                    'Error creating document file page cache file from '
-                    'document file intermediate file. Expected file named '
-                    '"%s" failed to be created; %s', cache_filename,
-                    exception, exc_info=True
-                )
-                raise
+            if not cache_file:
+                try:
+                    with self.document_file.get_intermediate_file() as file_object:
+                        converter = ConverterBase.get_converter_class()(
+                            file_object=file_object
+                        )
+                        converter.seek_page(page_number=self.page_number - 1)
+
+                        page_image = converter.get_page()
+
+                        # Since open "wb+" doesn't create files, create it explicitly
+                        with self.cache_partition.create_file(filename=cache_filename) as file_object:
+                            file_object.write(page_image.getvalue())
+
+                        # Apply runtime transformations
+                        for transformation in transformations or ():
+                            converter.transform(transformation=transformation)
+
+                        return converter.get_page()
+                except Exception as exception:
+                    logger.error(
+                        'Error creating document file page cache file from '
+                        'document file intermediate file. Expected file named '
+                        '"%s" failed to be created; %s', cache_filename,
+                        exception, exc_info=True
+                    )
+                    raise
         else:
             logger.debug('Page cache file "%s" found', cache_filename)
 
-            with cache_file.open() as file_object:
-                converter = ConverterBase.get_converter_class()(
-                    file_object=file_object
-                )
+        with cache_file.open() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
 
-                converter.seek_page(page_number=0)
+            converter.seek_page(page_number=0)
 
-                # This code is also repeated below to allow using a context
-                # manager with cache_file.open and close it automatically.
-                # Apply runtime transformations
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+            # This code is also repeated above to allow using a context
+            # manager with cache_file.open and close it automatically.
+            # Apply runtime transformations
+            for transformation in transformations or ():
+                converter.transform(transformation=transformation)
 
-                return converter.get_page()
+            return converter.get_page()
 
     def get_label(self):
         return _(
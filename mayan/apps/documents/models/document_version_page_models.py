@@ -1,3 +1,4 @@
+import hashlib
 import logging
 
 from furl import furl
@@ -7,7 +8,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.urls import reverse
-from django.utils.encoding import force_text
+from django.utils.encoding import force_bytes, force_text
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
@@ -226,6 +227,25 @@ class DocumentVersionPage(
             BaseTransformation.combine(transformations=transformation_list)
         )
 
+    def get_combined_etag(self, _combined_cache_filename=None, user=None, **kwargs):
+        """
+        Return an identifier of the page image that changes when the
+        source page, its content or the combined transformations change.
+        """
+        combined_cache_filename = _combined_cache_filename or self.get_combined_cache_filename(
+            user=user, **kwargs
+        )
+
+        return hashlib.sha256(
+            force_bytes(
+                s='{}-{}-{}-{}'.format(
+                    self.content_type_id, self.object_id,
+                    self.content_object.get_combined_etag(user=user),
+                    combined_cache_filename
+                )
+            )
+        ).hexdigest()
+
     def get_combined_transformation_list(self, user=None, *args, **kwargs):
         """
         Return a list of transformation containing the server side
@@ -279,6 +299,31 @@ class DocumentVersionPage(
 
         return transformation_list
 
+    def get_decoded_image(self, user=None, **kwargs):
+        """
+        Return the page image as a decoded image object with the combined
+        transformations applied. The transformed image is not stored in
+        the cache, which avoids encoding and decoding it again for
+        consumers like OCR that only need the pixels.
+        """
+        transformation_list = self.get_combined_transformation_list(
+            user=user, **kwargs
+        )
+
+        content_object_cache_filename = self.content_object.generate_image()
+        content_object_cache_file = self.content_object.cache_partition.get_file(
+            filename=content_object_cache_filename
+        )
+
+        with content_object_cache_file.open() as file_object:
+            image = Image.open(fp=file_object)
+            image.load()
+
+        for transformation in transformation_list:
+            image = transformation.execute_on(image=image)
+
+        return image
+
     def get_image(self, transformations=None):
         cache_filename = '{}-base_image'.format(self.content_object.get_combined_cache_filename())
         logger.debug('Page cache filename: %s', cache_filename)
@@ -26,6 +26,10 @@ queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_generate',
     label=_('Generate document file page image')
 )
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_images_generate',
+    label=_('Generate document file page images in batch')
+)
 queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_version_page_image_generate',
     label=_('Generate document version page image')
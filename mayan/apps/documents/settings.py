@@ -5,6 +5,7 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 from .literals import (
     DEFAULT_DOCUMENTS_DISPLAY_HEIGHT, DEFAULT_DOCUMENTS_DISPLAY_WIDTH,
     DEFAULT_DOCUMENTS_FAVORITE_COUNT,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME,
@@ -47,6 +48,14 @@ setting_display_width = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_DISPLAY_WIDTH,
     global_name='DOCUMENTS_DISPLAY_WIDTH'
 )
+setting_document_file_page_image_batch_size = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE', help_text=_(
+        'Number of consecutive document file pages to rasterize in a '
+        'single pass when the base image of a page is not found in the '
+        'cache. A value of 1 rasterizes only the requested page.'
+    )
+)
 setting_document_file_page_image_cache_maximum_size = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
     global_name='DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE',
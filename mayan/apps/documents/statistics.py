@@ -6,54 +6,82 @@ from django.utils.translation import ugettext_lazy as _
 import qsstats
 
 from mayan.apps.mayan_statistics.classes import (
-    StatisticLineChart, StatisticNamespace
+    StatisticLineChart, StatisticNamespace, StatisticRollup
 )
 
 from .permissions import permission_document_view
 
 from .literals import MONTH_NAMES
 
+rollup_documents = StatisticRollup(
+    app_label='documents', date_field='datetime_created',
+    exclude_filter={'in_trash': True}, model_name='Document',
+    slug='documents-created'
+)
+rollup_document_files = StatisticRollup(
+    app_label='documents', date_field='document__datetime_created',
+    exclude_filter={'document__in_trash': True}, model_name='DocumentFile',
+    slug='document-files-created'
+)
+rollup_document_pages = StatisticRollup(
+    app_label='documents',
+    date_field='document_file__document__datetime_created',
+    exclude_filter={'document_file__document__in_trash': True},
+    model_name='DocumentFilePage', slug='document-file-pages-created'
+)
+
 
 def get_month_name(month_number):
     return force_text(s=MONTH_NAMES[month_number - 1])
 
 
-def new_documents_per_month():
-    Document = apps.get_model(app_label='documents', model_name='Document')
+def get_rollup_new_per_month(rollup):
+    rollup.update()
 
-    qss = qsstats.QuerySetStats(Document.valid.all(), 'datetime_created')
+    now = timezone.localdate()
+    monthly_values = rollup.get_monthly_values(year=now.year)
 
-    now = timezone.now().date()
-    start = timezone.datetime(year=now.year, month=1, day=1).date()
+    return [
+        {
+            get_month_name(month_number=month): monthly_values.get(month, 0)
+        } for month in range(1, now.month + 1)
+    ]
+
+
+def get_rollup_total_per_month(rollup):
+    rollup.update()
+
+    now = timezone.localdate()
+    monthly_values = rollup.get_monthly_values(year=now.year)
+    total = rollup.get_total(
+        date_before=now.replace(day=1, month=1)
+    )
+
+    result = []
 
+    for month in range(1, now.month + 1):
+        total += monthly_values.get(month, 0)
+        result.append(
+            {
+                get_month_name(month_number=month): total
+            }
+        )
+
+    return result
+
+
+def new_documents_per_month():
     return {
         'series': {
-            'Documents': map(
-                lambda x: {get_month_name(month_number=x[0].month): x[1]},
-                qss.time_series(start=start, end=now, interval='months')
-            )
+            'Documents': get_rollup_new_per_month(rollup=rollup_documents)
         }
     }
 
 
 def new_document_pages_per_month():
-    DocumentFilePage = apps.get_model(
-        app_label='documents', model_name='DocumentFilePage'
-    )
-
-    qss = qsstats.QuerySetStats(
-        DocumentFilePage.valid.all(), 'document_file__document__datetime_created'
-    )
-
-    now = timezone.now().date()
-    start = timezone.datetime(year=now.year, month=1, day=1).date()
-
     return {
         'series': {
-            'Pages': map(
-                lambda x: {get_month_name(month_number=x[0].month): x[1]},
-                qss.time_series(start=start, end=now, interval='months')
-            )
+            'Pages': get_rollup_new_per_month(rollup=rollup_document_pages)
         }
     }
 
@@ -64,36 +92,25 @@ def new_documents_this_month(user=None):
     )
     Document = apps.get_model(app_label='documents', model_name='Document')
 
-    queryset = Document.valid.all()
+    if not user:
+        rollup_documents.update()
+        return rollup_documents.get_total(
+            date_after=timezone.localdate().replace(day=1)
+        ) or '0'
 
-    if user:
-        queryset = AccessControlList.objects.restrict_queryset(
-            permission=permission_document_view, user=user,
-            queryset=queryset
-        )
+    queryset = AccessControlList.objects.restrict_queryset(
+        permission=permission_document_view, user=user,
+        queryset=Document.valid.all()
+    )
 
     qss = qsstats.QuerySetStats(queryset, 'datetime_created')
     return qss.this_month() or '0'
 
 
 def new_document_files_per_month():
-    DocumentFile = apps.get_model(
-        app_label='documents', model_name='DocumentFile'
-    )
-
-    qss = qsstats.QuerySetStats(
-        DocumentFile.valid.all(), 'document__datetime_created'
-    )
-
-    now = timezone.now().date()
-    start = timezone.datetime(year=now.year, month=1, day=1).date()
-
     return {
         'series': {
-            'Files': map(
-                lambda x: {get_month_name(month_number=x[0].month): x[1]},
-                qss.time_series(start=start, end=now, interval='months')
-            )
+            'Files': get_rollup_new_per_month(rollup=rollup_document_files)
         }
     }
 
@@ -106,13 +123,16 @@ def new_document_pages_this_month(user=None):
         app_label='documents', model_name='DocumentFilePage'
     )
 
-    queryset = DocumentFilePage.valid.all()
+    if not user:
+        rollup_document_pages.update()
+        return rollup_document_pages.get_total(
+            date_after=timezone.localdate().replace(day=1)
+        ) or '0'
 
-    if user:
-        queryset = AccessControlList.objects.restrict_queryset(
-            permission=permission_document_view, user=user,
-            queryset=queryset
-        )
+    queryset = AccessControlList.objects.restrict_queryset(
+        permission=permission_document_view, user=user,
+        queryset=DocumentFilePage.valid.all()
+    )
 
     qss = qsstats.QuerySetStats(
         queryset, 'document_file__document__datetime_created'
@@ -121,108 +141,29 @@ def new_document_pages_this_month(user=None):
 
 
 def total_document_per_month():
-    Document = apps.get_model(app_label='documents', model_name='Document')
-
-    qss = qsstats.QuerySetStats(Document.valid.all(), 'datetime_created')
-    now = timezone.now()
-
-    result = []
-
-    for month in range(1, now.month + 1):
-        next_month = month + 1
-
-        if month == 12:
-            next_month = 1
-            year = now.year + 1
-        else:
-            next_month = month + 1
-            year = now.year
-
-        result.append(
-            {
-                get_month_name(month_number=month): qss.until(
-                    timezone.datetime(year, next_month, 1, tzinfo=now.tzinfo)
-                )
-            }
-        )
-
     return {
         'series': {
-            'Documents': result
+            'Documents': get_rollup_total_per_month(rollup=rollup_documents)
         }
     }
 
 
 def total_document_file_per_month():
-    DocumentFile = apps.get_model(
-        app_label='documents', model_name='DocumentFile'
-    )
-
-    qss = qsstats.QuerySetStats(
-        DocumentFile.valid.all(), 'document__datetime_created'
-    )
-    now = timezone.now()
-
-    result = []
-
-    for month in range(1, now.month + 1):
-        next_month = month + 1
-
-        if month == 12:
-            next_month = 1
-            year = now.year + 1
-        else:
-            next_month = month + 1
-            year = now.year
-
-        result.append(
-            {
-                get_month_name(month_number=month): qss.until(
-                    timezone.datetime(year, next_month, 1, tzinfo=now.tzinfo)
-                )
-            }
-        )
-
     return {
         'series': {
-            'Files': result
+            'Files': get_rollup_total_per_month(
+                rollup=rollup_document_files
+            )
         }
     }
 
 
 def total_document_page_per_month():
-    DocumentFilePage = apps.get_model(
-        app_label='documents', model_name='DocumentFilePage'
-    )
-
-    qss = qsstats.QuerySetStats(
-        DocumentFilePage.valid.all(), 'document_file__document__datetime_created'
-    )
-    now = timezone.now()
-
-    result = []
-
-    for month in range(1, now.month + 1):
-        next_month = month + 1
-
-        if month == 12:
-            next_month = 1
-            year = now.year + 1
-        else:
-            next_month = month + 1
-            year = now.year
-
-        result.append(
-            {
-                get_month_name(month_number=month): qss.until(
-                    timezone.datetime(year, next_month, 1, tzinfo=now.tzinfo)
-                )
-            }
-        )
-
     return {
         'series': {
-            'Pages': result
+            'Pages': get_rollup_total_per_month(
+                rollup=rollup_document_pages
+            )
         }
     }
 
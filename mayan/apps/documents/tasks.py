@@ -86,6 +86,33 @@ def task_document_file_page_image_generate(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_file_page_image_generate_retry_delay.value,
+    ignore_result=True
+)
+def task_document_file_page_images_generate(
+    self, document_file_id, page_number_first=1, page_number_last=None
+):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    document_file = DocumentFile.objects.get(pk=document_file_id)
+    try:
+        document_file.page_images_generate(
+            page_number_first=page_number_first,
+            page_number_last=page_number_last
+        )
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate the page images for '
+            'document id: %d, document file id: %d. Retrying.',
+            document_file.document_id, document_file.pk
+        )
+        raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=UPLOAD_NEW_VERSION_RETRY_DELAY,
     ignore_result=True
@@ -30,9 +30,10 @@ class DocumentFileAPIViewTestMixin:
             }
         )
 
-    def _request_test_document_file_download_api_view(self):
+    def _request_test_document_file_download_api_view(self, headers=None):
         return self.get(
-            viewname='rest_api:documentfile-download', kwargs={
+            viewname='rest_api:documentfile-download', headers=headers,
+            kwargs={
                 'document_id': self.test_document.pk,
                 'document_file_id': self.test_document.file_latest.pk,
             }
@@ -141,6 +141,30 @@ class DocumentFileAPIViewTestCase(
         self.assertEqual(events[0].target, self.test_document_file)
         self.assertEqual(events[0].verb, event_document_file_downloaded.id)
 
+    def test_document_file_download_api_view_not_modified(self):
+        self._upload_test_document()
+
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_download
+        )
+
+        response = self._request_test_document_file_download_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.has_header('ETag'))
+
+        self._clear_events()
+
+        response = self._request_test_document_file_download_api_view(
+            headers={'HTTP_IF_NONE_MATCH': response['ETag']}
+        )
+        self.assertEqual(
+            response.status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_file_list_api_view_no_permission(self):
         self._upload_test_document()
 
@@ -1,7 +1,23 @@
 from pathlib import Path
 
+import mock
+
+from django.db import connection
+from django.test import override_settings
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT
+)
+
+from ..models.document_file_page_models import DocumentFilePage
+from ..tasks import task_document_file_page_images_generate
+
 from .base import GenericDocumentTestCase
-from .literals import TEST_SMALL_DOCUMENT_CHECKSUM
+from .literals import TEST_HYBRID_DOCUMENT, TEST_SMALL_DOCUMENT_CHECKSUM
 
 
 class DocumentFileTestCase(GenericDocumentTestCase):
@@ -48,3 +64,114 @@ class DocumentFileTestCase(GenericDocumentTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_document.file_latest.get_absolute_url())
+
+
+class DocumentFilePageImagesGenerateTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_HYBRID_DOCUMENT
+
+    def test_method_page_images_generate(self):
+        page_count = self.test_document_file.file_pages.count()
+
+        self.assertEqual(
+            self.test_document_file.page_images_generate(), page_count
+        )
+
+        for test_document_file_page in self.test_document_file.file_pages.all():
+            self.assertTrue(
+                test_document_file_page.cache_partition.files.filter(
+                    filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                ).exists()
+            )
+
+    def test_method_page_images_generate_cached(self):
+        self.test_document_file.page_images_generate()
+
+        self.assertEqual(self.test_document_file.page_images_generate(), 0)
+
+    def test_method_page_images_generate_range(self):
+        self.assertEqual(
+            self.test_document_file.page_images_generate(
+                page_number_first=1, page_number_last=1
+            ), 1
+        )
+
+    def test_method_page_images_generate_page_locked(self):
+        page_count = self.test_document_file.file_pages.count()
+        base_image_store = DocumentFilePage.base_image_store
+
+        def mock_base_image_store(document_file_page, image_buffer):
+            if document_file_page.page_number == 1:
+                raise LockError
+
+            return base_image_store(
+                document_file_page, image_buffer=image_buffer
+            )
+
+        with mock.patch.object(DocumentFilePage, 'base_image_store', autospec=True, side_effect=mock_base_image_store):
+            self.assertEqual(
+                self.test_document_file.page_images_generate(),
+                page_count - 1
+            )
+
+        self.assertEqual(self.test_document_file.page_images_generate(), 1)
+
+
+class DocumentFilePageImagesGenerateChunkTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_HYBRID_DOCUMENT
+
+    def tearDown(self):
+        SettingNamespace.invalidate_cache_all()
+        super().tearDown()
+
+    @override_settings(DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE=1)
+    def test_method_page_images_generate_chunk_lock(self):
+        SettingNamespace.invalidate_cache_all()
+        page_count = self.test_document_file.file_pages.count()
+        locking_backend = LockingBackend.get_backend()
+        acquire_lock = locking_backend.acquire_lock
+
+        with mock.patch.object(locking_backend, 'acquire_lock', side_effect=acquire_lock) as mock_acquire_lock:
+            self.assertEqual(
+                self.test_document_file.page_images_generate(), page_count
+            )
+
+        lock_name = 'document_file_page_images_generate_{}'.format(
+            self.test_document_file.pk
+        )
+        timeouts = [
+            call[1]['timeout'] for call in mock_acquire_lock.call_args_list
+            if call[1]['name'] == lock_name
+        ]
+        self.assertEqual(
+            timeouts, [DOCUMENT_IMAGE_TASK_TIMEOUT] * page_count
+        )
+
+
+class DocumentFilePageImagesGenerateDispatchTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    def tearDown(self):
+        SettingNamespace.invalidate_cache_all()
+        super().tearDown()
+
+    @override_settings(DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE=2)
+    def test_page_count_update_dispatch(self):
+        SettingNamespace.invalidate_cache_all()
+        self._upload_test_document()
+
+        callback_count = len(connection.run_on_commit)
+
+        with mock.patch.object(task_document_file_page_images_generate, 'apply_async') as mock_apply_async:
+            self.test_document_file.page_count_update()
+
+            mock_apply_async.assert_not_called()
+
+            for savepoint_id, callback in connection.run_on_commit[callback_count:]:
+                callback()
+
+        mock_apply_async.assert_called_once_with(
+            kwargs={
+                'document_file_id': self.test_document_file.pk,
+                'page_number_first': 1, 'page_number_last': 2
+            }
+        )
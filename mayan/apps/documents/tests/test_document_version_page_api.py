@@ -1,3 +1,5 @@
+import mock
+
 from rest_framework import status
 
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
@@ -9,6 +11,7 @@ from ..events import (
 from ..permissions import (
     permission_document_version_edit, permission_document_version_view
 )
+from ..tasks import task_document_version_page_image_generate
 
 from .mixins.document_mixins import DocumentTestMixin
 from .mixins.document_version_mixins import (
@@ -233,6 +236,41 @@ class DocumentVersionPageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_version_page_image_api_view_cache_hit(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with mock.patch.object(task_document_version_page_image_generate, 'apply_async') as mock_apply_async:
+            response = self._request_test_document_version_page_image_api_view()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(mock_apply_async.called)
+
+    def test_document_version_page_image_api_view_not_modified(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.has_header('ETag'))
+
+        with mock.patch.object(task_document_version_page_image_generate, 'apply_async') as mock_apply_async:
+            response = self._request_test_document_version_page_image_api_view(
+                headers={'HTTP_IF_NONE_MATCH': response['ETag']}
+            )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_304_NOT_MODIFIED
+        )
+        self.assertFalse(mock_apply_async.called)
+
     def test_document_version_page_list_api_view_no_permission(self):
         self._clear_events()
 
@@ -1,3 +1,5 @@
+from PIL import Image
+
 from mayan.apps.converter.transformations import (
     BaseTransformation, TransformationRotate90
 )
@@ -181,3 +183,11 @@ class DocumentVersionPageTestCase(LayerTestMixin, GenericDocumentTestCase):
         self.assertEqual(test_generate_image_1, test_generate_image_5)
         self.assertEqual(test_api_image_url_1, test_api_image_url_5)
         self.assertEqual(test_image_1, test_image_5)
+
+    def test_method_get_decoded_image(self):
+        self.test_document_version_page.generate_image()
+
+        image = self.test_document_version_page.get_decoded_image()
+
+        with self.test_document_version_page.cache_partition.get_file(filename=self.test_document_version_page.get_combined_cache_filename()).open() as file_object:
+            self.assertEqual(Image.open(fp=file_object).size, image.size)
@@ -1,6 +1,18 @@
+import mock
+
+from django.utils import timezone
+
+from mayan.apps.mayan_statistics.models import StatisticRollupEntry
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..statistics import namespace
+from ..models.document_models import Document
+from ..models.trashed_document_models import TrashedDocument
+from ..statistics import (
+    get_month_name, namespace, new_documents_per_month,
+    new_documents_this_month, rollup_documents, total_document_per_month
+)
+
+from .base import GenericDocumentTestCase
 
 
 class DocumentStatisticsTestCase(BaseTestCase):
@@ -13,3 +25,124 @@ class DocumentStatisticsTestCase(BaseTestCase):
                     'Error executing: {};  {}'.format(statistic, exception)
                 )
                 raise
+
+
+class DocumentStatisticRollupTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    def _get_series_value(self, data, month):
+        return data['series']['Documents'][month - 1][
+            get_month_name(month_number=month)
+        ]
+
+    def test_new_documents_per_month(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        month = timezone.localdate().month
+
+        self.assertEqual(
+            self._get_series_value(
+                data=new_documents_per_month(), month=month
+            ), 2
+        )
+
+    def test_new_documents_per_month_incremental(self):
+        self._create_test_document_stub()
+
+        new_documents_per_month()
+
+        self._create_test_document_stub()
+
+        month = timezone.localdate().month
+
+        self.assertEqual(
+            self._get_series_value(
+                data=new_documents_per_month(), month=month
+            ), 2
+        )
+        self.assertEqual(
+            StatisticRollupEntry.objects.filter(
+                slug=rollup_documents.slug
+            ).count(), 1
+        )
+
+    def test_total_document_per_month(self):
+        self._create_test_document_stub()
+
+        month = timezone.localdate().month
+
+        self.assertEqual(
+            self._get_series_value(
+                data=total_document_per_month(), month=month
+            ), 1
+        )
+
+    def test_new_documents_this_month(self):
+        self._create_test_document_stub()
+
+        self.assertEqual(new_documents_this_month(), 1)
+
+    def test_rollup_rebuild(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        rollup_documents.update()
+
+        self.test_documents[0].delete()
+
+        rollup_documents.rebuild()
+
+        self.assertEqual(rollup_documents.get_total(), 1)
+
+    def test_rollup_trashed_and_restored_document(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        rollup_documents.update()
+
+        self.test_documents[0].delete()
+        rollup_documents.update()
+
+        self.assertEqual(rollup_documents.get_total(), 1)
+
+        TrashedDocument.objects.get(pk=self.test_documents[0].pk).restore()
+        rollup_documents.update()
+
+        self.assertEqual(rollup_documents.get_total(), 2)
+
+    def test_rollup_late_commit_below_newest_row(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        # Remove the first document without touching the instance to
+        # insert it again, after the update, with its lower primary key
+        # like a transaction committing late.
+        Document.objects.filter(pk=self.test_documents[0].pk).delete()
+
+        rollup_documents.update()
+
+        self.assertEqual(rollup_documents.get_total(), 1)
+
+        Document.objects.bulk_create(objs=(self.test_documents[0],))
+
+        rollup_documents.update()
+
+        self.assertEqual(rollup_documents.get_total(), 2)
+
+    @mock.patch(
+        'mayan.apps.mayan_statistics.classes.STATISTIC_ROLLUP_WATERMARK_HOLD_BACK', 0
+    )
+    def test_rollup_deleted_document(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        rollup_documents.update()
+
+        self.assertEqual(rollup_documents.get_total(), 2)
+
+        self.test_documents[0].delete()
+        TrashedDocument.objects.get(pk=self.test_documents[0].pk).delete()
+        rollup_documents.update()
+
+        self.assertEqual(rollup_documents.get_total(), 1)
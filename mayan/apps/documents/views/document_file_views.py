@@ -96,11 +96,16 @@ class DocumentFileDownloadView(SingleObjectDownloadView):
     pk_url_kwarg = 'document_file_id'
     source_queryset = DocumentFile.valid
 
+    def get_conditional_etag(self):
+        return self.object.get_download_etag()
+
+    def get_conditional_last_modified(self):
+        return self.object.timestamp
+
     def get_download_file_object(self):
-        instance = self.get_object()
-        instance._event_action_object = instance.document
-        instance._event_actor = self.request.user
-        return instance.get_download_file_object()
+        self.object._event_action_object = self.object.document
+        self.object._event_actor = self.request.user
+        return self.object.get_download_file_object()
 
     def get_download_filename(self):
         return self.object.filename
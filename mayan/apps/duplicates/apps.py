@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
@@ -13,7 +13,8 @@ from mayan.apps.navigation.classes import SourceColumn
 
 from .classes import DuplicateBackend
 from .handlers import (
-    handler_remove_empty_duplicates_lists, handler_scan_duplicates_for
+    handler_document_checksum_update, handler_remove_empty_duplicates_lists,
+    handler_scan_duplicates_for
 )
 from .links import (
     link_document_duplicates_list, link_duplicated_document_list,
@@ -35,6 +36,9 @@ class DuplicatesApp(MayanAppConfig):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
 
         DuplicateBackendEntry = self.get_model(
             model_name='DuplicateBackendEntry'
@@ -82,11 +86,21 @@ class DuplicatesApp(MayanAppConfig):
 
         menu_multi_item.add_proxy_inclusions(source=DuplicateTargetDocument)
 
+        post_delete.connect(
+            dispatch_uid='duplicates_handler_document_checksum_update_delete',
+            receiver=handler_document_checksum_update,
+            sender=DocumentFile
+        )
         post_delete.connect(
             dispatch_uid='duplicates_handler_remove_empty_duplicates_lists',
             receiver=handler_remove_empty_duplicates_lists,
             sender=Document
         )
+        post_save.connect(
+            dispatch_uid='duplicates_handler_document_checksum_update_save',
+            receiver=handler_document_checksum_update,
+            sender=DocumentFile
+        )
         signal_post_document_file_upload.connect(
             dispatch_uid='duplicates_handler_scan_duplicates_for',
             receiver=handler_scan_duplicates_for
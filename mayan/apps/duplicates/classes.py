@@ -1,6 +1,7 @@
 import logging
 
 from django.apps import apps
+from django.db.models import Count
 from django.utils import six
 from django.utils.translation import ugettext_lazy as _
 
@@ -67,6 +68,50 @@ class DuplicateBackend(
         self.model_instance_id = model_instance_id
         self.kwargs = kwargs
 
+    def get_group_queryset(self):
+        """
+        Optional method for backends that support bulk scanning. Must return
+        a queryset of valid documents annotated with a `duplicate_key`
+        value. Documents that share the same key are duplicates of each
+        other. Returns None if the backend only supports per document
+        scanning.
+        """
+        return None
+
+    def get_groups(self):
+        """
+        Return an iterator of lists of the IDs of the documents that are
+        duplicates of each other or None if the backend does not support
+        bulk scanning.
+        """
+        queryset = self.get_group_queryset()
+
+        if queryset is not None:
+            return self._get_groups(queryset=queryset)
+
+    def _get_groups(self, queryset):
+        duplicated_keys = queryset.order_by().values('duplicate_key').annotate(
+            duplicate_count=Count('pk')
+        ).filter(duplicate_count__gt=1).values('duplicate_key')
+
+        queryset = queryset.filter(
+            duplicate_key__in=duplicated_keys
+        ).order_by('duplicate_key', 'pk').values_list('duplicate_key', 'pk')
+
+        group = []
+        group_key = None
+
+        for key, document_id in queryset.iterator():
+            if group and key != group_key:
+                yield group
+                group = []
+
+            group_key = key
+            group.append(document_id)
+
+        if group:
+            yield group
+
     def get_model_instance(self):
         StoredDuplicateBackend = apps.get_model(
             app_label='duplicated', model_name='StoredDuplicateBackend'
@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.db.models import F, Max
+from django.db.models import F
 from django.utils.translation import ugettext_lazy as _
 
 from .classes import DuplicateBackend
@@ -12,25 +12,40 @@ class DuplicateBackendFileChecksum(DuplicateBackend):
     def verify(cls, document):
         return document.file_latest
 
+    def get_group_queryset(self):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        return Document.valid.filter(
+            duplicates_checksum__isnull=False
+        ).annotate(duplicate_key=F('duplicates_checksum__checksum'))
+
     def process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
 
         # Get the documents whose latest file matches the checksum
-        # of the current document and exclude the current document
+        # of the current document and exclude the current document.
+        # Uses the indexed table of the latest file checksum of each
+        # document instead of aggregating every document file.
 
-        return Document.objects.annotate(
-            max_timestamp=Max('files__timestamp')
-        ).filter(
-            files__timestamp=F('max_timestamp'),
-            files__checksum=document.file_latest.checksum
+        return Document.objects.filter(
+            duplicates_checksum__checksum=document.file_latest.checksum
         ).exclude(pk=document.pk)
 
 
 class DuplicateBackendLabel(DuplicateBackend):
     label = _('Exact document label')
 
+    def get_group_queryset(self):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        return Document.valid.annotate(duplicate_key=F('label'))
+
     def process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -1,6 +1,15 @@
+from django.apps import apps
+
 from .tasks import task_duplicates_clean_empty_lists, task_duplicates_scan_for
 
 
+def handler_document_checksum_update(sender, instance, **kwargs):
+    DocumentChecksum = apps.get_model(
+        app_label='duplicates', model_name='DocumentChecksum'
+    )
+    DocumentChecksum.objects.update_for(document=instance.document)
+
+
 def handler_scan_duplicates_for(sender, instance, **kwargs):
     task_duplicates_scan_for.apply_async(
         kwargs={'document_id': instance.document_id}
@@ -0,0 +1 @@
+SCAN_ALL_BULK_CREATE_BATCH_SIZE = 1000
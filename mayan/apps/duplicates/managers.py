@@ -1,7 +1,7 @@
 import logging
 
 from django.apps import apps
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q, Value
 
 from mayan.apps.acls.models import AccessControlList
@@ -9,14 +9,216 @@ from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 
 from .classes import DuplicateBackend
+from .literals import SCAN_ALL_BULK_CREATE_BATCH_SIZE
 
 logger = logging.getLogger(name=__name__)
 
 
+class DocumentChecksumManager(models.Manager):
+    def update_for(self, document):
+        """
+        Update the stored checksum of the latest file of the document.
+        """
+        document_file = document.file_latest
+
+        if document_file and document_file.checksum:
+            self.update_or_create(
+                defaults={'checksum': document_file.checksum},
+                document=document
+            )
+        else:
+            self.filter(document=document).delete()
+
+
 class StoredDuplicateBackendManager(models.Manager):
-    def scan_document(self, document):
+    def _scan_document_backend(self, backend_path, backend_class, document):
+        DuplicateBackendEntry = apps.get_model(
+            app_label='duplicates', model_name='DuplicateBackendEntry'
+        )
+
+        stored_backend, created = self.get_or_create(
+            backend_path=backend_path
+        )
+
+        if backend_class.verify(document=document):
+            duplicates = stored_backend.get_backend_instance().process(
+                document=document
+            )
+
+            if duplicates.exists():
+                duplicates_entry, created = stored_backend.duplicate_entries.get_or_create(
+                    document=document
+                )
+
+                bulk_create_list = [
+                    duplicates_entry.documents.through(
+                        duplicatebackendentry_id=duplicates_entry.pk,
+                        document=duplicate
+                    ) for duplicate in duplicates
+                ]
+
+                duplicates_entry.documents.through.objects.bulk_create(
+                    bulk_create_list, ignore_conflicts=True
+                )
+
+                # Create empty duplicate entries for the
+                # duplicates as source that do not have one.
+                bulk_create_list = [
+                    DuplicateBackendEntry(
+                        stored_backend=stored_backend,
+                        document=duplicate,
+                    ) for duplicate in duplicates.filter(
+                        duplicates__stored_backend=None
+                    )
+                ]
+
+                DuplicateBackendEntry.objects.bulk_create(
+                    bulk_create_list, ignore_conflicts=True
+                )
+
+                # Get all duplicate entries for the duplicates as
+                # source.
+                duplicate_entries = stored_backend.duplicate_entries.filter(
+                    document__in=duplicates
+                )
+
+                # Create the many to many entries for this
+                # document as a target.
+                bulk_create_list = [
+                    document.as_duplicate.through(
+                        duplicatebackendentry_id=duplicate_entry.pk,
+                        document_id=document.pk
+                    ) for duplicate_entry in duplicate_entries
+                ]
+
+                document.as_duplicate.through.objects.bulk_create(
+                    bulk_create_list, ignore_conflicts=True
+                )
+            else:
+                # Document has no duplicates for this backend.
+                # Delete any existing entry for where this
+                # document is the source for the backend.
+                stored_backend.duplicate_entries.filter(
+                    document=document
+                ).delete()
+
+                # Delete any existing entry for where this
+                # document is a duplicate for the backend.
+                document.as_duplicate.filter(
+                    stored_backend=stored_backend
+                ).delete()
+        else:
+            # Document cannot be scanned for duplicates for this
+            # backend. Delete any existing entries for the
+            # backend where the document is a source or target.
+            stored_backend.duplicate_entries.filter(
+                documents=document
+            ).delete()
+
+            document.as_duplicate.filter(
+                stored_backend=stored_backend
+            ).delete()
+
+    def _scan_groups(self, groups, stored_backend):
+        """
+        Replace the duplicate entries of the backend with the groups of
+        duplicated documents, writing the entries in batches.
+        """
+        with transaction.atomic():
+            stored_backend.duplicate_entries.all().delete()
+
+            group_list = []
+            group_list_size = 0
+
+            for group in groups:
+                group_list.append(group)
+                group_list_size += len(group)
+
+                if group_list_size >= SCAN_ALL_BULK_CREATE_BATCH_SIZE:
+                    self._scan_groups_create(
+                        group_list=group_list, stored_backend=stored_backend
+                    )
+                    group_list = []
+                    group_list_size = 0
+
+            if group_list:
+                self._scan_groups_create(
+                    group_list=group_list, stored_backend=stored_backend
+                )
+
+    def _scan_groups_create(self, group_list, stored_backend):
+        DuplicateBackendEntry = apps.get_model(
+            app_label='duplicates', model_name='DuplicateBackendEntry'
+        )
+        DuplicateBackendEntryDocument = DuplicateBackendEntry.documents.through
+
+        document_id_list = [
+            document_id for group in group_list for document_id in group
+        ]
+
+        DuplicateBackendEntry.objects.bulk_create(
+            batch_size=SCAN_ALL_BULK_CREATE_BATCH_SIZE, ignore_conflicts=True,
+            objs=[
+                DuplicateBackendEntry(
+                    document_id=document_id, stored_backend=stored_backend
+                ) for document_id in document_id_list
+            ]
+        )
+
+        entry_ids = dict(
+            stored_backend.duplicate_entries.filter(
+                document_id__in=document_id_list
+            ).values_list('document_id', 'pk')
+        )
+
+        DuplicateBackendEntryDocument.objects.bulk_create(
+            batch_size=SCAN_ALL_BULK_CREATE_BATCH_SIZE, ignore_conflicts=True,
+            objs=[
+                DuplicateBackendEntryDocument(
+                    duplicatebackendentry_id=entry_ids[document_id],
+                    document_id=duplicate_id
+                ) for group in group_list for document_id in group
+                for duplicate_id in group if duplicate_id != document_id
+            ]
+        )
+
+    def scan_all(self):
+        """
+        Find the duplicates of all documents. Backends that support bulk
+        scanning are processed in a single pass. The rest of the backends
+        are processed one document at a time.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        backend_paths = []
+
+        for backend_path, backend_class in DuplicateBackend.get_all():
+            stored_backend, created = self.get_or_create(
+                backend_path=backend_path
+            )
+
+            groups = stored_backend.get_backend_instance().get_groups()
+
+            if groups is None:
+                backend_paths.append(backend_path)
+            else:
+                logger.debug('bulk scanning backend: %s', backend_path)
+                self._scan_groups(
+                    groups=groups, stored_backend=stored_backend
+                )
+
+        if backend_paths:
+            for document in Document.valid.iterator():
+                self.scan_document(
+                    backend_paths=backend_paths, document=document
+                )
+
+    def scan_document(self, document, backend_paths=None):
         """
         Find duplicates of document based on each registered backend's logic.
+        Optionally limit the scan to the backends in `backend_paths`.
         """
         lock_name = 'duplicates__scan_document-{}'.format(document.pk)
         try:
@@ -24,93 +226,12 @@ class StoredDuplicateBackendManager(models.Manager):
             lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
             logger.debug('acquired lock: %s', lock_name)
             try:
-                DuplicateBackendEntry = apps.get_model(
-                    app_label='duplicates', model_name='DuplicateBackendEntry'
-                )
-
                 for backend_path, backend_class in DuplicateBackend.get_all():
-                    if backend_class.verify(document=document):
-
-                        stored_backend, created = self.get_or_create(
-                            backend_path=backend_path
-                        )
-                        duplicates = stored_backend.get_backend_instance().process(
-                            document=document
+                    if backend_paths is None or backend_path in backend_paths:
+                        self._scan_document_backend(
+                            backend_class=backend_class,
+                            backend_path=backend_path, document=document
                         )
-
-                        if duplicates.exists():
-                            duplicates_entry, created = stored_backend.duplicate_entries.get_or_create(
-                                document=document
-                            )
-
-                            bulk_create_list = [
-                                duplicates_entry.documents.through(
-                                    duplicatebackendentry_id=duplicates_entry.pk,
-                                    document=duplicate
-                                ) for duplicate in duplicates
-                            ]
-
-                            duplicates_entry.documents.through.objects.bulk_create(
-                                bulk_create_list, ignore_conflicts=True
-                            )
-
-                            # Create empty duplicate entries for the
-                            # duplicates as source that do not have one.
-                            bulk_create_list = [
-                                DuplicateBackendEntry(
-                                    stored_backend=stored_backend,
-                                    document=duplicate,
-                                ) for duplicate in duplicates.filter(
-                                    duplicates__stored_backend=None
-                                )
-                            ]
-
-                            DuplicateBackendEntry.objects.bulk_create(
-                                bulk_create_list, ignore_conflicts=True
-                            )
-
-                            # Get all duplicate entries for the duplicates as
-                            # source.
-                            duplicate_entries = stored_backend.duplicate_entries.filter(
-                                document__in=duplicates
-                            )
-
-                            # Create the many to many entries for this
-                            # document as a target.
-                            bulk_create_list = [
-                                document.as_duplicate.through(
-                                    duplicatebackendentry_id=duplicate_entry.pk,
-                                    document_id=document.pk
-                                ) for duplicate_entry in duplicate_entries
-                            ]
-
-                            document.as_duplicate.through.objects.bulk_create(
-                                bulk_create_list, ignore_conflicts=True
-                            )
-                        else:
-                            # Document has no duplicates for this backend.
-                            # Delete any existing entry for where this
-                            # document is the source for the backend.
-                            stored_backend.duplicate_entries.filter(
-                                document=document
-                            ).delete()
-
-                            # Delete any existing entry for where this
-                            # document is a duplicate for the backend.
-                            document.as_duplicate.filter(
-                                stored_backend=stored_backend
-                            ).delete()
-                    else:
-                        # Document cannot be scanned for duplicates for this
-                        # backend. Delete any existing entries for the
-                        # backend where the document is a source or target.
-                        stored_backend.duplicate_entries.filter(
-                            documents=document
-                        ).delete()
-
-                        document.as_duplicate.filter(
-                            stored_backend=stored_backend
-                        ).delete()
             finally:
                 lock.release()
         except LockError:
@@ -0,0 +1,82 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+def code_document_checksum_create(apps, schema_editor):
+    Document = apps.get_model(app_label='documents', model_name='Document')
+    DocumentChecksum = apps.get_model(
+        app_label='duplicates', model_name='DocumentChecksum'
+    )
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    file_latest_checksum = DocumentFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).filter(document=OuterRef('pk')).order_by('-timestamp').values(
+        'checksum'
+    )[:1]
+
+    queryset = Document.objects.using(
+        alias=schema_editor.connection.alias
+    ).annotate(
+        file_latest_checksum=Subquery(file_latest_checksum)
+    ).exclude(file_latest_checksum=None).exclude(
+        file_latest_checksum=''
+    ).values_list('pk', 'file_latest_checksum')
+
+    bulk_create_list = []
+
+    for document_id, checksum in queryset.iterator():
+        bulk_create_list.append(
+            DocumentChecksum(checksum=checksum, document_id=document_id)
+        )
+
+        if len(bulk_create_list) >= BULK_CREATE_BATCH_SIZE:
+            DocumentChecksum.objects.using(
+                alias=schema_editor.connection.alias
+            ).bulk_create(objs=bulk_create_list)
+            bulk_create_list = []
+
+    DocumentChecksum.objects.using(
+        alias=schema_editor.connection.alias
+    ).bulk_create(objs=bulk_create_list)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0075_delete_duplicateddocumentold'),
+        ('duplicates', '0010_auto_20210419_0709'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentChecksum',
+            fields=[
+                (
+                    'document', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True, related_name='duplicates_checksum',
+                        serialize=False, to='documents.Document',
+                        verbose_name='Document'
+                    )
+                ),
+                (
+                    'checksum', models.CharField(
+                        db_index=True, max_length=64, verbose_name='Checksum'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Document checksum',
+                'verbose_name_plural': 'Document checksums',
+            },
+        ),
+        migrations.RunPython(
+            code=code_document_checksum_create,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -8,7 +8,8 @@ from mayan.apps.documents.models.document_models import Document
 
 from .classes import NullBackend
 from .managers import (
-    DuplicateBackendEntryManager, StoredDuplicateBackendManager
+    DocumentChecksumManager, DuplicateBackendEntryManager,
+    StoredDuplicateBackendManager
 )
 
 logger = logging.getLogger(name=__name__)
@@ -50,6 +51,31 @@ class DuplicateBackendEntry(models.Model):
         verbose_name_plural = _('Duplicated backend entries')
 
 
+class DocumentChecksum(models.Model):
+    """
+    Checksum of the latest file of each document. Allows looking up
+    documents by checksum using an index instead of aggregating the files
+    of every document.
+    """
+    document = models.OneToOneField(
+        on_delete=models.CASCADE, primary_key=True,
+        related_name='duplicates_checksum', to=Document,
+        verbose_name=_('Document')
+    )
+    checksum = models.CharField(
+        db_index=True, max_length=64, verbose_name=_('Checksum')
+    )
+
+    objects = DocumentChecksumManager()
+
+    class Meta:
+        verbose_name = _('Document checksum')
+        verbose_name_plural = _('Document checksums')
+
+    def __str__(self):
+        return self.checksum
+
+
 class DuplicateSourceDocument(Document):
     class Meta:
         proxy = True
@@ -14,16 +14,11 @@ def task_duplicates_clean_empty_lists():
 
 @app.task(ignore_result=True)
 def task_duplicates_scan_all():
-    Document = apps.get_model(
-        app_label='documents', model_name='Document'
+    StoredDuplicateBackend = apps.get_model(
+        app_label='duplicates', model_name='StoredDuplicateBackend'
     )
 
-    for document in Document.valid.all():
-        task_duplicates_scan_for.apply_async(
-            kwargs={
-                'document_id': document.pk
-            }
-        )
+    StoredDuplicateBackend.objects.scan_all()
 
 
 @app.task(bind=True, ignore_result=True)
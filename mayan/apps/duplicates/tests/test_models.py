@@ -1,10 +1,53 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import TEST_SMALL_DOCUMENT_PATH
 
-from ..models import DuplicateBackendEntry, StoredDuplicateBackend
+from ..models import (
+    DocumentChecksum, DuplicateBackendEntry, StoredDuplicateBackend
+)
 
 from .mixins import DuplicatedDocumentTestMixin
 
 
+class DocumentChecksumModelTestCase(GenericDocumentTestCase):
+    def test_document_checksum_create(self):
+        self.assertEqual(
+            DocumentChecksum.objects.get(
+                document=self.test_document
+            ).checksum, self.test_document_file.checksum
+        )
+
+    def test_document_checksum_file_new(self):
+        self.test_document_path = TEST_SMALL_DOCUMENT_PATH
+        self._upload_test_document_file()
+
+        self.assertEqual(
+            DocumentChecksum.objects.get(
+                document=self.test_document
+            ).checksum, self.test_document_file.checksum
+        )
+
+    def test_document_checksum_file_delete(self):
+        test_document_file = self.test_document_file
+
+        self.test_document_path = TEST_SMALL_DOCUMENT_PATH
+        self._upload_test_document_file()
+        self.test_document_file.delete()
+
+        self.assertEqual(
+            DocumentChecksum.objects.get(
+                document=self.test_document
+            ).checksum, test_document_file.checksum
+        )
+
+        test_document_file.delete()
+
+        self.assertFalse(
+            DocumentChecksum.objects.filter(
+                document=self.test_document
+            ).exists()
+        )
+
+
 class DuplicatedDocumentModelTestCase(
     DuplicatedDocumentTestMixin, GenericDocumentTestCase
 ):
@@ -50,3 +93,31 @@ class DuplicatedDocumentModelTestCase(
         StoredDuplicateBackend.objects.scan_document(
             document=self.test_documents[0]
         )
+
+    def test_scan_all(self):
+        self._upload_duplicate_document()
+        self.test_document_path = TEST_SMALL_DOCUMENT_PATH
+        self._upload_test_document(label='non duplicated document label')
+        DuplicateBackendEntry.objects.all().delete()
+
+        StoredDuplicateBackend.objects.scan_all()
+
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self.test_documents[0]
+                )
+            ), [self.test_documents[1]]
+        )
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self.test_documents[1]
+                )
+            ), [self.test_documents[0]]
+        )
+        self.assertEqual(
+            DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self.test_documents[2]
+            ).count(), 0
+        )
@@ -1,11 +1,19 @@
 from django.http import Http404
 from django.utils.encoding import force_text
 
-from .classes import SearchModel
+from .classes import SearchModel, SearchResultList
 from .literals import SEARCH_MODEL_NAME_KWARG
 
 
 class SearchModelAPIViewMixin:
+    def filter_queryset(self, queryset):
+        # Cached search results are already restricted to the permission
+        # of the search model and are not a queryset.
+        if isinstance(queryset, SearchResultList):
+            return queryset
+        else:
+            return super().filter_queryset(queryset=queryset)
+
     def get_search_model_name(self):
         return self.kwargs.get(
             SEARCH_MODEL_NAME_KWARG, self.request.GET.get(
@@ -1,9 +1,13 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
 from mayan.apps.common.menus import menu_facet, menu_secondary, menu_tools
 
 from .classes import SearchModel
+from .handlers import handler_search_result_cache_acls_invalidate
 from .links import (
     link_search, link_search_advanced, link_search_again,
     link_search_backend_reindex
@@ -21,6 +25,12 @@ class DynamicSearchApp(MayanAppConfig):
     def ready(self):
         super().ready()
 
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+        User = get_user_model()
+
         SearchModel.load_modules()
         SearchModel.initialize()
 
@@ -36,3 +46,26 @@ class DynamicSearchApp(MayanAppConfig):
         menu_tools.bind_links(
             links=(link_search_backend_reindex,),
         )
+
+        post_delete.connect(
+            dispatch_uid='search_handler_search_result_cache_acls_invalidate_acl_delete',
+            receiver=handler_search_result_cache_acls_invalidate,
+            sender=AccessControlList
+        )
+        post_save.connect(
+            dispatch_uid='search_handler_search_result_cache_acls_invalidate_acl_save',
+            receiver=handler_search_result_cache_acls_invalidate,
+            sender=AccessControlList
+        )
+
+        for sender in (
+            AccessControlList.permissions.through, Role.groups.through,
+            Role.permissions.through, User.groups.through
+        ):
+            m2m_changed.connect(
+                dispatch_uid='search_handler_search_result_cache_acls_invalidate_{}'.format(
+                    sender._meta.label
+                ),
+                receiver=handler_search_result_cache_acls_invalidate,
+                sender=sender
+            )
@@ -34,6 +34,18 @@ class DjangoSearchBackend(SearchBackend):
         database directly.
         """
 
+    def index_instances(self, search_model, queryset):
+        """
+        This backend doesn't index instances. Searches query the
+        database directly.
+        """
+
+    def index_search_model(self, search_model):
+        """
+        This backend doesn't index instances. Searches query the
+        database directly.
+        """
+
     def get_search_query(self, search_model, query_string, global_and_search=False):
         return SearchQuery(
             query_string=query_string, search_model=search_model,
@@ -236,6 +236,48 @@ class WhooshSearchBackend(SearchBackend):
                             instance=instance, exclude_set=exclude_set
                         )
 
+    def index_instances(self, search_model, queryset, _delete=True):
+        index = self.get_index(search_model=search_model)
+        field_map = self.get_resolved_field_map(search_model=search_model)
+
+        for chunk in SearchBackend.get_queryset_chunks(queryset=queryset):
+            # Lock each chunk instead of the entire queryset to keep the
+            # lock held for less than its timeout and let single instance
+            # indexing proceed between chunks.
+            try:
+                lock = LockingBackend.get_backend().acquire_lock(
+                    name='dynamic_search_whoosh_index_instance'
+                )
+            except LockError:
+                raise
+            else:
+                try:
+                    # Use a single writer and a single commit for the
+                    # entire chunk to avoid creating a new index segment
+                    # per instance.
+                    writer = index.writer()
+                    try:
+                        for instance in chunk:
+                            kwargs = search_model.sieve(
+                                field_map=field_map, instance=instance
+                            )
+                            if _delete:
+                                writer.delete_by_term('id', str(instance.pk))
+                            writer.add_document(**kwargs)
+                    except Exception as exception:
+                        writer.cancel()
+                        logger.error(
+                            'Unexpected exception while bulk indexing '
+                            'search model: %s; %s',
+                            search_model.get_full_name(), exception,
+                            exc_info=True
+                        )
+                        raise
+                    else:
+                        writer.commit()
+                finally:
+                    lock.release()
+
     def index_search_model(self, search_model):
         index = self.get_index(search_model=search_model)
 
@@ -244,5 +286,9 @@ class WhooshSearchBackend(SearchBackend):
             index.schema, indexname=search_model.get_full_name()
         )
 
-        for instance in search_model.model._meta.default_manager.all():
-            self.index_instance(instance=instance)
+        # The index is empty, skip deleting the previous entries of each
+        # instance.
+        self.index_instances(
+            search_model=search_model,
+            queryset=search_model.get_indexing_queryset(), _delete=False
+        )
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import uuid
+
+from django.core.cache import caches
+from django.utils.encoding import force_bytes
+
+from .settings import setting_results_cache_name, setting_results_cache_timeout
+
+
+class SearchResultCache:
+    """
+    Stores the ordered primary key list of search results. Entries are
+    not deleted individually. Instead every key includes a version token
+    of the search model and of the access control state. Changing a token
+    makes all the entries that used it unreachable and they expire
+    on their own.
+    """
+    @staticmethod
+    def get_key_hash(key):
+        return hashlib.sha256(force_bytes(s=key)).hexdigest()
+
+    @staticmethod
+    def get_acl_version_key():
+        return SearchResultCache.get_key_hash(key='search_acl_version')
+
+    @staticmethod
+    def get_search_model_version_key(search_model):
+        return SearchResultCache.get_key_hash(
+            key='search_model_version_{}'.format(search_model.get_full_name())
+        )
+
+    def __init__(self, name=None):
+        self.name = name
+
+    def _get_version(self, key):
+        # Use random tokens instead of counters. An evicted counter would
+        # restart at a previously used value and make stale entries
+        # reachable again.
+        version = self.cache.get(key=key)
+        if version is None:
+            self.cache.add(key=key, timeout=None, value=uuid.uuid4().hex)
+            version = self.cache.get(key=key)
+
+        return version
+
+    @property
+    def cache(self):
+        return caches[self.name or setting_results_cache_name.value]
+
+    def get_results(
+        self, search_model, query_string, user, global_and_search=False
+    ):
+        return self.cache.get(
+            key=self.get_results_key(
+                global_and_search=global_and_search,
+                query_string=query_string, search_model=search_model,
+                user=user
+            )
+        )
+
+    def get_results_key(
+        self, search_model, query_string, user, global_and_search=False
+    ):
+        normalized_query_string = sorted(
+            (key, str(value).strip()) for key, value in query_string.items()
+            if value
+        )
+
+        if user.is_superuser or user.is_staff:
+            user_fingerprint = 'admin'
+        else:
+            user_fingerprint = 'user_{}'.format(user.pk)
+
+        return SearchResultCache.get_key_hash(
+            key=json.dumps(
+                [
+                    search_model.get_full_name(),
+                    self._get_version(
+                        key=SearchResultCache.get_search_model_version_key(
+                            search_model=search_model
+                        )
+                    ),
+                    normalized_query_string, bool(global_and_search),
+                    user_fingerprint,
+                    self._get_version(
+                        key=SearchResultCache.get_acl_version_key()
+                    )
+                ]
+            )
+        )
+
+    def invalidate_acls(self):
+        self.cache.set(
+            key=SearchResultCache.get_acl_version_key(), timeout=None,
+            value=uuid.uuid4().hex
+        )
+
+    def invalidate_model(self, model):
+        """
+        Invalidate the search models of a model, of its proxies and the
+        search models related to it.
+        """
+        # Hide a circular import.
+        from .classes import SearchModel
+
+        related_models = SearchModel._model_search_relationships.get(
+            model, ()
+        )
+
+        for search_model in SearchModel.all():
+            if search_model.model == model or model in search_model.proxies or search_model.model in related_models:
+                self.invalidate_search_model(search_model=search_model)
+
+    def invalidate_search_model(self, search_model):
+        self.cache.set(
+            key=SearchResultCache.get_search_model_version_key(
+                search_model=search_model
+            ), timeout=None, value=uuid.uuid4().hex
+        )
+
+    def set_results(
+        self, search_model, query_string, user, pk_list,
+        global_and_search=False
+    ):
+        self.cache.set(
+            key=self.get_results_key(
+                global_and_search=global_and_search,
+                query_string=query_string, search_model=search_model,
+                user=user
+            ), timeout=setting_results_cache_timeout.value,
+            value=list(pk_list)
+        )
@@ -2,6 +2,8 @@ from collections import Iterable
 import logging
 
 from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.signals import post_save, pre_delete
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
@@ -18,11 +20,11 @@ from mayan.apps.views.literals import LIST_MODE_CHOICE_LIST
 from .exceptions import DynamicSearchException
 from .literals import (
     DEFAULT_SCOPE_OPERATOR, DELIMITER, SCOPE_DELIMITER,
-    SCOPE_OPERATOR_CHOICES
+    SCOPE_OPERATOR_CHOICES, SEARCH_RESULTS_QUERY_CHUNK_SIZE
 )
 from .settings import (
-    setting_backend, setting_backend_arguments,
-    setting_results_limit
+    setting_backend, setting_backend_arguments, setting_indexing_chunk_size,
+    setting_results_cache_enable, setting_results_limit
 )
 logger = logging.getLogger(name=__name__)
 
@@ -34,6 +36,31 @@ class SearchBackend:
             **setting_backend_arguments.value
         )
 
+    @staticmethod
+    def get_queryset_chunks(queryset, chunk_size=None):
+        """
+        Generator that returns the instances of a queryset as lists of
+        at most `chunk_size` elements. Uses primary key ranges instead of
+        server side cursors to keep the `prefetch_related` lookups of the
+        queryset working.
+        """
+        chunk_size = chunk_size or setting_indexing_chunk_size.value
+        queryset = queryset.order_by('pk')
+        last_pk = None
+
+        while True:
+            if last_pk is None:
+                chunk = list(queryset[:chunk_size])
+            else:
+                chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+
+            if not chunk:
+                break
+
+            yield chunk
+
+            last_pk = chunk[-1].pk
+
     @staticmethod
     def limit_queryset(queryset):
         pk_list = queryset.values('pk')[:setting_results_limit.value]
@@ -51,6 +78,30 @@ class SearchBackend:
     def index_instance(self, instance):
         raise NotImplementedError
 
+    def index_instances(self, search_model, queryset):
+        """
+        Index all the instances of a queryset of a search model. Backends
+        able to write several instances in a single operation should
+        override this method.
+        """
+        for instance in queryset:
+            self.index_instance(instance=instance)
+
+    def get_results_queryset(self, search_model, pk_list):
+        """
+        Return the list of cached results in the order of the list.
+        """
+        return SearchResultList(pk_list=pk_list, search_model=search_model)
+
+    def index_search_model(self, search_model):
+        """
+        Index all the instances of a search model.
+        """
+        self.index_instances(
+            search_model=search_model,
+            queryset=search_model.get_indexing_queryset()
+        )
+
     def search(
         self, search_model, query_string, user, global_and_search=False
     ):
@@ -64,6 +115,21 @@ class SearchBackend:
         query_string = query_string.copy()
         query_string.pop('_match_all', None)
 
+        if setting_results_cache_enable.value:
+            # Hide a circular import.
+            from .runtime import search_result_cache
+
+            pk_list = search_result_cache.get_results(
+                global_and_search=global_and_search,
+                query_string=query_string, search_model=search_model,
+                user=user
+            )
+
+            if pk_list is not None:
+                return self.get_results_queryset(
+                    pk_list=pk_list, search_model=search_model
+                )
+
         # Turn scoped query dictionary into a series of unscoped queries.
         scopes = {}
         operators = []
@@ -131,6 +197,19 @@ class SearchBackend:
                 user=user
             )
 
+        if setting_results_cache_enable.value:
+            pk_list = list(queryset.values_list('pk', flat=True))
+
+            search_result_cache.set_results(
+                global_and_search=global_and_search, pk_list=pk_list,
+                query_string=query_string, search_model=search_model,
+                user=user
+            )
+
+            return self.get_results_queryset(
+                pk_list=pk_list, search_model=search_model
+            )
+
         return queryset
 
     def solve_scope(self, global_and_search, search_model, user, result, scopes, operators):
@@ -365,6 +444,61 @@ class SearchModel(AppsModuleLoaderMixin):
         else:
             return self.model.objects.all()
 
+    def get_indexing_queryset(self):
+        """
+        Return a queryset of all the instances of the search model with
+        the related lookups required by the search fields already
+        joined or prefetched to avoid per instance queries when indexing.
+        """
+        select_related, prefetch_related = self.get_related_lookups()
+
+        queryset = self.model._meta.default_manager.all()
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        return queryset
+
+    def get_related_lookups(self):
+        """
+        Return a tuple of the lookups usable by `select_related` and
+        by `prefetch_related` derived from the search fields paths.
+        """
+        prefetch_related = set()
+        select_related = set()
+
+        for search_field in self.search_fields:
+            is_many = False
+            lookup_parts = []
+            model = self.model
+
+            for field_name in search_field.field.split(LOOKUP_SEP)[:-1]:
+                try:
+                    field = model._meta.get_field(field_name=field_name)
+                except FieldDoesNotExist:
+                    break
+
+                if not field.is_relation or not field.related_model:
+                    break
+
+                if field.many_to_many or field.one_to_many:
+                    is_many = True
+
+                lookup_parts.append(field_name)
+                model = field.related_model
+
+            if lookup_parts:
+                lookup = LOOKUP_SEP.join(lookup_parts)
+                if is_many:
+                    prefetch_related.add(lookup)
+                else:
+                    select_related.add(lookup)
+
+        return sorted(select_related), sorted(prefetch_related)
+
     def get_search_field(self, full_name):
         try:
             return self.search_fields[full_name]
@@ -428,3 +562,88 @@ class SearchModel(AppsModuleLoaderMixin):
                 )(value)
 
         return result
+
+
+class SearchResultList:
+    """
+    Sequence of the cached results of a search. Slicing queries only the
+    primary keys of the slice and returns the instances in the order of
+    the cache, keeping the query of each page of results bounded by the
+    page size instead of by the number of results.
+    """
+    ordered = True
+
+    def __init__(self, search_model, pk_list):
+        self.model = search_model.model
+        self.pk_list = pk_list
+        self.search_model = search_model
+
+    def __contains__(self, item):
+        return isinstance(item, self.model) and item.pk in self.pk_list
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._get_instances(pk_list=self.pk_list[key])
+        else:
+            try:
+                return self._get_instances(pk_list=(self.pk_list[key],))[0]
+            except IndexError:
+                raise IndexError('Search result index out of range.')
+
+    def __iter__(self):
+        for index in range(0, len(self.pk_list), SEARCH_RESULTS_QUERY_CHUNK_SIZE):
+            yield from self[index:index + SEARCH_RESULTS_QUERY_CHUNK_SIZE]
+
+    def __len__(self):
+        return len(self.pk_list)
+
+    def _get_instances(self, pk_list):
+        instances = self.search_model.get_queryset().in_bulk(
+            id_list=pk_list
+        )
+
+        # Results deleted after being cached are skipped.
+        return [instances[pk] for pk in pk_list if pk in instances]
+
+    def all(self):
+        return self
+
+    def count(self):
+        return len(self.pk_list)
+
+    def exists(self):
+        return bool(self.pk_list)
+
+    def order_by(self, *field_names):
+        """
+        Return the results sorted by the fields. The values of the fields
+        are queried in chunks and sorted in Python to avoid a query with
+        the entire primary key list.
+        """
+        sort_values = {}
+        lookups = [field_name.lstrip('-') for field_name in field_names]
+        queryset = self.search_model.get_queryset()
+
+        for index in range(0, len(self.pk_list), SEARCH_RESULTS_QUERY_CHUNK_SIZE):
+            rows = queryset.filter(
+                pk__in=self.pk_list[index:index + SEARCH_RESULTS_QUERY_CHUNK_SIZE]
+            ).values_list('pk', *lookups)
+
+            for row in rows:
+                sort_values.setdefault(row[0], row[1:])
+
+        pk_list = [pk for pk in self.pk_list if pk in sort_values]
+
+        # Stable sort from the last field to the first one. None values
+        # are grouped apart and never compared to the other values.
+        for position, field_name in reversed(list(enumerate(field_names))):
+            pk_list.sort(
+                key=lambda pk, position=position: (
+                    sort_values[pk][position] is None,
+                    sort_values[pk][position]
+                ), reverse=field_name.startswith('-')
+            )
+
+        return SearchResultList(
+            pk_list=pk_list, search_model=self.search_model
+        )
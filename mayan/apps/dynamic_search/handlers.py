@@ -1,11 +1,22 @@
+from .settings import setting_results_cache_enable
 from .tasks import task_deindex_instance, task_index_instance
 
 
+def _search_result_cache_invalidate(model):
+    # Hide a circular import.
+    from .runtime import search_result_cache
+
+    search_result_cache.invalidate_model(model=model)
+
+
 def handler_factory_deindex_instance(search_model):
 
     def handler_deindex_instance(sender, **kwargs):
         instance = kwargs['instance']
 
+        if setting_results_cache_enable.value:
+            _search_result_cache_invalidate(model=sender)
+
         task_deindex_instance.apply_async(
             kwargs={
                 'app_label': instance._meta.app_label,
@@ -20,6 +31,9 @@ def handler_factory_deindex_instance(search_model):
 def handler_index_instance(sender, **kwargs):
     instance = kwargs['instance']
 
+    if setting_results_cache_enable.value:
+        _search_result_cache_invalidate(model=sender)
+
     task_index_instance.apply_async(
         kwargs={
             'app_label': instance._meta.app_label,
@@ -27,3 +41,11 @@ def handler_index_instance(sender, **kwargs):
             'object_id': instance.pk
         }
     )
+
+
+def handler_search_result_cache_acls_invalidate(sender, **kwargs):
+    if setting_results_cache_enable.value:
+        # Hide a circular import.
+        from .runtime import search_result_cache
+
+        search_result_cache.invalidate_acls()
@@ -4,12 +4,17 @@ DEFAULT_RESULTS_LIMIT = 100
 DEFAULT_SEARCH_BACKEND = 'mayan.apps.dynamic_search.backends.django.DjangoSearchBackend'
 DEFAULT_SEARCH_BACKEND_ARGUMENTS = {}
 DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH = False
+DEFAULT_SEARCH_INDEXING_CHUNK_SIZE = 1000
 DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE = 'false'
+DEFAULT_SEARCH_RESULTS_CACHE_ENABLE = False
+DEFAULT_SEARCH_RESULTS_CACHE_NAME = 'default'
+DEFAULT_SEARCH_RESULTS_CACHE_TIMEOUT = 600
 DEFAULT_SEARCH_RESULTS_LIMIT = 100
 
 DELIMITER = '_'
 
 SEARCH_MODEL_NAME_KWARG = 'search_model_name'
+SEARCH_RESULTS_QUERY_CHUNK_SIZE = 500
 TASK_RETRY_DELAY = 5
 
 SCOPE_DELIMITER = '__'
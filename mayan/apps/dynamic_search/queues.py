@@ -18,6 +18,11 @@ queue_search.add_task_type(
     label=_('Index a model instance to the search engine.'),
     name='task_index_instance',
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_instances',
+    label=_('Index a batch of model instances to the search engine.'),
+    name='task_index_instances',
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_search_model',
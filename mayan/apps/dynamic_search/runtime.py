@@ -0,0 +1,3 @@
+from .caches import SearchResultCache
+
+search_result_cache = SearchResultCache()
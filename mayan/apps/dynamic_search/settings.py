@@ -4,8 +4,10 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_SEARCH_BACKEND, DEFAULT_SEARCH_BACKEND_ARGUMENTS,
-    DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH,
-    DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE, DEFAULT_SEARCH_RESULTS_LIMIT
+    DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH, DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
+    DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE,
+    DEFAULT_SEARCH_RESULTS_CACHE_ENABLE, DEFAULT_SEARCH_RESULTS_CACHE_NAME,
+    DEFAULT_SEARCH_RESULTS_CACHE_TIMEOUT, DEFAULT_SEARCH_RESULTS_LIMIT
 )
 
 namespace = SettingNamespace(label=_('Search'), name='search')
@@ -27,11 +29,41 @@ setting_disable_simple_search = namespace.add_setting(
         'search button.'
     )
 )
+setting_indexing_chunk_size = namespace.add_setting(
+    default=DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
+    global_name='SEARCH_INDEXING_CHUNK_SIZE', help_text=_(
+        'Number of instances to fetch from the database and write to the '
+        'search backend index in a single batch when indexing in bulk.'
+    )
+)
 setting_match_all_default_value = namespace.add_setting(
     global_name='SEARCH_MATCH_ALL_DEFAULT_VALUE',
     default=DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE,
     help_text=_('Sets the default state of the "Match all" checkbox.')
 )
+setting_results_cache_enable = namespace.add_setting(
+    default=DEFAULT_SEARCH_RESULTS_CACHE_ENABLE,
+    global_name='SEARCH_RESULTS_CACHE_ENABLE', help_text=_(
+        'Store the primary keys of search results to serve repeated '
+        'searches and result pagination without executing the query again. '
+        'Entries are invalidated when instances of the search model or '
+        'access control lists are changed. Requires a cache shared by all '
+        'processes, like Redis or Memcached.'
+    )
+)
+setting_results_cache_name = namespace.add_setting(
+    default=DEFAULT_SEARCH_RESULTS_CACHE_NAME,
+    global_name='SEARCH_RESULTS_CACHE_NAME', help_text=_(
+        'Name of the Django cache, as defined in the CACHES setting, used '
+        'to store search results.'
+    )
+)
+setting_results_cache_timeout = namespace.add_setting(
+    default=DEFAULT_SEARCH_RESULTS_CACHE_TIMEOUT,
+    global_name='SEARCH_RESULTS_CACHE_TIMEOUT', help_text=_(
+        'Time in seconds to keep the search results in the cache.'
+    )
+)
 setting_results_limit = namespace.add_setting(
     default=DEFAULT_SEARCH_RESULTS_LIMIT, global_name='SEARCH_RESULTS_LIMIT',
     help_text=_('Maximum number search results to fetch and display.')
@@ -7,10 +7,24 @@ from mayan.celery import app
 
 from .classes import SearchBackend, SearchModel
 from .literals import TASK_RETRY_DELAY
+from .settings import setting_results_cache_enable
 
 logger = logging.getLogger(name=__name__)
 
 
+def _search_result_cache_invalidate(model):
+    """
+    Invalidate the cached results again once the index reflects the
+    change. Searches executed between the signal handler invalidation and
+    the end of the task cache results of the previous index content.
+    """
+    if setting_results_cache_enable.value:
+        # Hide a circular import.
+        from .runtime import search_result_cache
+
+        search_result_cache.invalidate_model(model=model)
+
+
 @app.task(
     bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
     ignore_result=True
@@ -26,6 +40,8 @@ def task_deindex_instance(self, app_label, model_name, object_id):
     except LockError as exception:
         raise self.retry(exc=exception)
 
+    _search_result_cache_invalidate(model=Model)
+
     logger.info('Finished')
 
 
@@ -36,12 +52,13 @@ def task_deindex_instance(self, app_label, model_name, object_id):
 def task_index_search_model(self, search_model_full_name):
     search_model = SearchModel.get(name=search_model_full_name)
 
-    for instance in search_model.model._meta.default_manager.all():
-        task_index_instance.apply_async(
+    queryset = search_model.model._meta.default_manager.only('pk')
+
+    for chunk in SearchBackend.get_queryset_chunks(queryset=queryset):
+        task_index_instances.apply_async(
             kwargs={
-                'app_label': instance._meta.app_label,
-                'model_name': instance._meta.model_name,
-                'object_id': instance.pk
+                'id_list': [instance.pk for instance in chunk],
+                'search_model_full_name': search_model_full_name
             }
         )
 
@@ -74,4 +91,37 @@ def task_index_instance(self, app_label, model_name, object_id):
             except LockError as exception:
                 raise self.retry(exc=exception)
 
+            _search_result_cache_invalidate(model=Model)
+
+    logger.info('Finished')
+
+
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_instances(self, search_model_full_name, id_list):
+    logger.info('Executing')
+
+    try:
+        search_model = SearchModel.get(name=search_model_full_name)
+    except KeyError:
+        """
+        The search model does not exists anymore. Non fatal, just exit
+        the task.
+        """
+    else:
+        queryset = search_model.get_indexing_queryset().filter(
+            pk__in=id_list
+        )
+
+        try:
+            SearchBackend.get_instance().index_instances(
+                search_model=search_model, queryset=queryset
+            )
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
+        _search_result_cache_invalidate(model=search_model.model)
+
     logger.info('Finished')
@@ -348,3 +348,44 @@ class WhooshSearchBackendDocumentSearchTestCase(
             user=self._test_case_user
         )
         self.assertEqual(queryset.count(), 1)
+
+    def test_index_search_model(self):
+        self._upload_test_document(label='first_doc')
+        self._upload_test_document(label='second_doc')
+
+        self.grant_access(
+            obj=self.test_documents[0], permission=permission_document_view
+        )
+        self.grant_access(
+            obj=self.test_documents[1], permission=permission_document_view
+        )
+
+        self.search_backend.clear_search_model_index(
+            search_model=document_search
+        )
+        self.search_backend.index_search_model(search_model=document_search)
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first* OR second*'},
+            user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 2)
+
+    def test_index_instances_update(self):
+        self._upload_test_document(label='first_doc')
+
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.search_backend.index_instances(
+            search_model=document_search,
+            queryset=document_search.get_indexing_queryset()
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
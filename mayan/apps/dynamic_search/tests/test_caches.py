@@ -0,0 +1,156 @@
+from mayan.apps.documents.permissions import permission_document_view
+from mayan.apps.documents.search import document_search
+from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..caches import SearchResultCache
+from ..classes import SearchBackend
+from ..runtime import search_result_cache
+from ..settings import setting_results_cache_enable
+from ..tasks import task_index_instance
+
+
+class SearchResultCacheTestCase(DocumentTestMixin, BaseTestCase):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self.cache = SearchResultCache()
+        self.test_query_string = {'q': 'first'}
+
+    def _set_test_results(self):
+        self.cache.set_results(
+            pk_list=[1, 2, 3], query_string=self.test_query_string,
+            search_model=document_search, user=self._test_case_user
+        )
+
+    def _get_test_results(self):
+        return self.cache.get_results(
+            query_string=self.test_query_string,
+            search_model=document_search, user=self._test_case_user
+        )
+
+    def test_set_results(self):
+        self._set_test_results()
+
+        self.assertEqual(self._get_test_results(), [1, 2, 3])
+
+    def test_invalidate_acls(self):
+        self._set_test_results()
+        self.cache.invalidate_acls()
+
+        self.assertEqual(self._get_test_results(), None)
+
+    def test_invalidate_search_model(self):
+        self._set_test_results()
+        self.cache.invalidate_search_model(search_model=document_search)
+
+        self.assertEqual(self._get_test_results(), None)
+
+
+class SearchResultCacheBackendTestCase(DocumentTestMixin, BaseTestCase):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self.old_value = setting_results_cache_enable.value
+        setting_results_cache_enable.set(value=True)
+        self.search_backend = SearchBackend.get_instance()
+
+    def tearDown(self):
+        setting_results_cache_enable.set(value=self.old_value)
+        super().tearDown()
+
+    def _do_test_search(self):
+        return self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first'}, user=self._test_case_user
+        )
+
+    def test_search_cache_invalidation_on_save(self):
+        self._upload_test_document(label='first_doc')
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.assertEqual(self._do_test_search().count(), 1)
+
+        self.test_document.label = 'second_doc'
+        self.test_document.save()
+
+        self.assertEqual(self._do_test_search().count(), 0)
+
+    def test_search_cache_invalidation_on_acl_change(self):
+        self._upload_test_document(label='first_doc')
+
+        self.assertEqual(self._do_test_search().count(), 0)
+
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.assertEqual(self._do_test_search().count(), 1)
+
+    def test_search_cache_result_order(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        pk_list = [
+            self.test_documents[1].pk, self.test_documents[0].pk
+        ]
+
+        search_result_cache.set_results(
+            pk_list=pk_list, query_string={'q': 'first'},
+            search_model=document_search, user=self._test_case_user
+        )
+
+        self.assertEqual(
+            [document.pk for document in self._do_test_search()], pk_list
+        )
+
+    def test_search_cache_result_slice(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        pk_list = [
+            self.test_documents[2].pk, self.test_documents[0].pk,
+            self.test_documents[1].pk
+        ]
+
+        search_result_cache.set_results(
+            pk_list=pk_list, query_string={'q': 'first'},
+            search_model=document_search, user=self._test_case_user
+        )
+
+        queryset = self._do_test_search()
+
+        self.assertEqual(queryset.count(), 3)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                [document.pk for document in queryset[1:3]], pk_list[1:3]
+            )
+
+    def test_search_cache_invalidation_on_index_task(self):
+        self._create_test_document_stub()
+
+        search_result_cache.set_results(
+            pk_list=[self.test_document.pk], query_string={'q': 'first'},
+            search_model=document_search, user=self._test_case_user
+        )
+
+        task_index_instance.apply_async(
+            kwargs={
+                'app_label': self.test_document._meta.app_label,
+                'model_name': self.test_document._meta.model_name,
+                'object_id': self.test_document.pk
+            }
+        )
+
+        self.assertEqual(
+            search_result_cache.get_results(
+                query_string={'q': 'first'}, search_model=document_search,
+                user=self._test_case_user
+            ), None
+        )
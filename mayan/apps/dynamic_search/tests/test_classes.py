@@ -90,3 +90,11 @@ class ScopedSearchTestCase(DocumentTestMixin, TagTestMixin, BaseTestCase):
             user=self._test_case_user
         )
         self.assertEqual(queryset.count(), 1)
+
+
+class SearchModelTestCase(BaseTestCase):
+    def test_get_related_lookups(self):
+        select_related, prefetch_related = document_search.get_related_lookups()
+
+        self.assertTrue('document_type' in select_related)
+        self.assertTrue('files' in prefetch_related)
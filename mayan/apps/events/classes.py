@@ -1,28 +1,42 @@
 import csv
+import functools
+import gzip
+import io
 import logging
+import threading
 
 from furl import furl
 
 from django.apps import apps
-from django.contrib.auth import get_user_model
-from django.core.exceptions import PermissionDenied
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models.signals import post_save
 from django.urls import reverse
 from django.utils.encoding import force_text
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from actstream import action
+from actstream.registry import check
 
 from mayan.apps.common.menus import menu_list_facet
 from mayan.apps.common.settings import setting_project_url
 from mayan.apps.common.utils import return_attrib
 
 from .literals import (
-    DEFAULT_EVENT_LIST_EXPORT_FILENAME, EVENT_MANAGER_ORDER_AFTER
+    DEFAULT_EVENT_LIST_EXPORT_FILENAME,
+    DEFAULT_EVENT_LIST_EXPORT_JSON_LINES_FILENAME,
+    EVENT_COMMIT_BULK_CREATE_BATCH_SIZE, EVENT_EXPORT_BATCH_SIZE,
+    EVENT_EXPORT_FORMAT_CSV, EVENT_EXPORT_FORMAT_JSON_LINES,
+    EVENT_MANAGER_ORDER_AFTER
 )
 from .links import (
     link_events_for_object, link_object_event_types_user_subcriptions_list
 )
-from .permissions import permission_events_export, permission_events_view
+from .permissions import permission_events_export
+from .settings import setting_commit_buffer_enable
 
 logger = logging.getLogger(name=__name__)
 
@@ -35,33 +49,218 @@ DEFAULT_ACTION_EXPORTER_FIELD_NAMES = (
 
 
 class ActionExporter:
-    def __init__(self, queryset, field_names=None):
+    """
+    Export a queryset of actions. The actions are read in batches from a
+    database cursor and the generic relations of each batch are fetched
+    with one query per content type instead of one query per row.
+    """
+    export_formats = {
+        EVENT_EXPORT_FORMAT_CSV: {
+            'filename': DEFAULT_EVENT_LIST_EXPORT_FILENAME,
+            'label': _('Event list export to CSV'),
+            'method_name': 'export_csv',
+            'mode': 'w'
+        },
+        EVENT_EXPORT_FORMAT_JSON_LINES: {
+            'filename': DEFAULT_EVENT_LIST_EXPORT_JSON_LINES_FILENAME,
+            'label': _('Event list export to compressed JSON Lines'),
+            'method_name': 'export_json_lines',
+            'mode': 'wb'
+        }
+    }
+
+    @classmethod
+    def get_export_format_choices(cls):
+        return (
+            (EVENT_EXPORT_FORMAT_CSV, _('CSV')),
+            (
+                EVENT_EXPORT_FORMAT_JSON_LINES,
+                _('JSON Lines, gzip compressed')
+            )
+        )
+
+    def __init__(
+        self, queryset, date_after=None, date_before=None,
+        export_format=EVENT_EXPORT_FORMAT_CSV, field_names=None, verbs=None
+    ):
+        self.date_after = date_after
+        self.date_before = date_before
+        self.export_format = export_format
         self.field_names = field_names or DEFAULT_ACTION_EXPORTER_FIELD_NAMES
         self.queryset = queryset
+        self.verbs = verbs
+
+    def _get_field_value_getters(self):
+        """
+        Return a function per exported field that returns the value of the
+        field for an action and the generic relation objects of its batch.
+        """
+        result = []
+
+        for field_name in self.field_names:
+            field = self.queryset.model._meta.get_field(field_name)
+
+            if isinstance(field, GenericForeignKey):
+                result.append(
+                    functools.partial(
+                        self._get_generic_foreign_key_value, field=field
+                    )
+                )
+            elif field.is_relation and field.related_model == ContentType:
+                result.append(
+                    functools.partial(
+                        self._get_content_type_value, field=field
+                    )
+                )
+            else:
+                result.append(
+                    functools.partial(
+                        self._get_attribute_value, field_name=field_name
+                    )
+                )
 
-    def export(self, file_object, user=None):
+        return result
+
+    @staticmethod
+    def _get_attribute_value(entry, field_name, related_objects):
+        return getattr(entry, field_name)
+
+    @staticmethod
+    def _get_content_type_value(entry, field, related_objects):
+        content_type_id = getattr(entry, field.attname)
+        if content_type_id:
+            return ContentType.objects.get_for_id(id=content_type_id)
+
+    @staticmethod
+    def _get_generic_foreign_key_value(entry, field, related_objects):
+        return related_objects.get(
+            (
+                getattr(entry, '{}_id'.format(field.ct_field)),
+                force_text(s=getattr(entry, field.fk_field))
+            )
+        )
+
+    def get_queryset(self, user=None):
         AccessControlList = apps.get_model(
             app_label='acls', model_name='AccessControlList'
         )
+
+        queryset = self.queryset
+
+        if self.date_after:
+            queryset = queryset.filter(timestamp__gte=self.date_after)
+
+        if self.date_before:
+            queryset = queryset.filter(timestamp__lt=self.date_before)
+
+        if self.verbs:
+            queryset = queryset.filter(verb__in=self.verbs)
+
         if user:
-            self.queryset = AccessControlList.objects.restrict_queryset(
-                queryset=self.queryset,
-                permission=permission_events_export,
+            queryset = AccessControlList.objects.restrict_queryset(
+                queryset=queryset, permission=permission_events_export,
                 user=user
             )
 
+        return queryset
+
+    def get_related_objects(self, entries):
+        """
+        Fetch the generic relation objects of a batch of actions. Returns
+        a dictionary keyed by content type ID and object ID.
+        """
+        object_id_map = {}
+
+        for field in self.queryset.model._meta.private_fields:
+            if isinstance(field, GenericForeignKey) and field.name in self.field_names:
+                for entry in entries:
+                    content_type_id = getattr(
+                        entry, '{}_id'.format(field.ct_field)
+                    )
+                    if content_type_id:
+                        object_id_map.setdefault(content_type_id, set()).add(
+                            getattr(entry, field.fk_field)
+                        )
+
+        result = {}
+
+        for content_type_id, object_id_set in object_id_map.items():
+            model = ContentType.objects.get_for_id(
+                id=content_type_id
+            ).model_class()
+
+            # The model of the content type was removed.
+            if model:
+                for obj in model._base_manager.filter(pk__in=object_id_set):
+                    result[(content_type_id, force_text(s=obj.pk))] = obj
+
+        return result
+
+    def get_rows(self, user=None):
+        """
+        Yield a tuple of the exported field values per action.
+        """
+        field_value_getters = self._get_field_value_getters()
+        queryset = self.get_queryset(user=user)
+
+        entries = []
+
+        for entry in queryset.iterator(chunk_size=EVENT_EXPORT_BATCH_SIZE):
+            entries.append(entry)
+
+            if len(entries) == EVENT_EXPORT_BATCH_SIZE:
+                yield from self.get_rows_for_entries(
+                    entries=entries, field_value_getters=field_value_getters
+                )
+                entries = []
+
+        yield from self.get_rows_for_entries(
+            entries=entries, field_value_getters=field_value_getters
+        )
+
+    def get_rows_for_entries(self, entries, field_value_getters):
+        related_objects = self.get_related_objects(entries=entries)
+
+        for entry in entries:
+            yield tuple(
+                getter(
+                    entry=entry, related_objects=related_objects
+                ) for getter in field_value_getters
+            )
+
+    def export(self, file_object, user=None):
+        getattr(
+            self, self.export_formats[self.export_format]['method_name']
+        )(file_object=file_object, user=user)
+
+    def export_csv(self, file_object, user=None):
         writer = csv.writer(
             file_object, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL
         )
-        file_object.write(','.join(self.field_names + ('\n',)))
+        writer.writerow(self.field_names)
+
+        for row in self.get_rows(user=user):
+            writer.writerow(
+                [str(value) for value in row]
+            )
 
-        for entry in self.queryset.iterator():
-            row = [
-                str(
-                    getattr(entry, field_name)
-                ) for field_name in self.field_names
-            ]
-            writer.writerow(row)
+    def export_json_lines(self, file_object, user=None):
+        encoder = DjangoJSONEncoder()
+
+        with gzip.GzipFile(fileobj=file_object, mode='wb') as file_object_gzip:
+            with io.TextIOWrapper(buffer=file_object_gzip, encoding='utf-8') as file_object_text:
+                for row in self.get_rows(user=user):
+                    file_object_text.write(
+                        encoder.encode(
+                            o={
+                                field_name: force_text(
+                                    s=value
+                                ) if isinstance(value, models.Model) else value
+                                for field_name, value in zip(self.field_names, row)
+                            }
+                        )
+                    )
+                    file_object_text.write('\n')
 
     def export_to_download_file(self, user=None):
         # Avoid circular import
@@ -74,15 +273,17 @@ class ActionExporter:
             app_label='messaging', model_name='Message'
         )
 
+        export_format = self.export_formats[self.export_format]
+
         download_file = DownloadFile(
-            filename=DEFAULT_EVENT_LIST_EXPORT_FILENAME,
-            label=_('Event list export to CSV'),
+            filename=export_format['filename'],
+            label=export_format['label'],
             permission=permission_events_export.stored_permission
         )
         download_file._event_actor = user
         download_file.save()
 
-        with download_file.open(mode='w') as file_object:
+        with download_file.open(mode=export_format['mode']) as file_object:
             self.export(file_object=file_object, user=user)
 
         event_events_exported.commit(
@@ -117,6 +318,72 @@ class ActionExporter:
             )
 
 
+class EventCommitBuffer:
+    """
+    Per thread buffer of the actions of the events committed during a
+    database transaction. The actions are inserted in bulk when the
+    transaction is committed and their notifications are created by a
+    background task.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def add(cls, action):
+        connection = transaction.get_connection()
+        callback = getattr(cls._local, 'callback', None)
+
+        # The callback is discarded by Django if the transaction is rolled
+        # back, start a new buffer if it is no longer pending.
+        if callback and any(
+            function is callback for savepoint_ids, function in connection.run_on_commit
+        ):
+            cls._local.action_list.append(action)
+        else:
+            cls._local.action_list = [action]
+            cls._local.callback = functools.partial(
+                cls.flush, action_list=cls._local.action_list
+            )
+            # Executes immediately when not in a transaction.
+            transaction.on_commit(func=cls._local.callback)
+
+    @staticmethod
+    def flush(action_list):
+        # Avoid circular import
+        from .tasks import task_event_notifications_create
+
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+
+        if transaction.get_connection().features.can_return_ids_from_bulk_insert:
+            Action.objects.bulk_create(
+                batch_size=EVENT_COMMIT_BULK_CREATE_BATCH_SIZE,
+                objs=action_list
+            )
+
+            # Bulk creation doesn't send the post_save signal, send it for
+            # the receivers of the actions like the workflow transition
+            # triggers.
+            for action in action_list:
+                post_save.send(
+                    created=True, instance=action, raw=False, sender=Action,
+                    update_fields=None, using=action._state.db
+                )
+        else:
+            # The primary keys are needed for the notifications.
+            for action in action_list:
+                action.save(force_insert=True)
+
+        for index in range(0, len(action_list), EVENT_COMMIT_BULK_CREATE_BATCH_SIZE):
+            task_event_notifications_create.apply_async(
+                kwargs={
+                    'action_id_list': [
+                        action.pk for action in action_list[
+                            index:index + EVENT_COMMIT_BULK_CREATE_BATCH_SIZE
+                        ]
+                    ]
+                }
+            )
+
+
 class EventManager:
     EVENT_ATTRIBUTES = ('ignore', 'keep_attributes',)
     EVENT_ARGUMENTS = ('actor', 'action_object', 'target')
@@ -292,19 +559,9 @@ class EventType:
         return '{}: {}'.format(self.namespace.label, self.label)
 
     def commit(self, actor=None, action_object=None, target=None):
-        AccessControlList = apps.get_model(
-            app_label='acls', model_name='AccessControlList'
-        )
-        EventSubscription = apps.get_model(
-            app_label='events', model_name='EventSubscription'
-        )
         Notification = apps.get_model(
             app_label='events', model_name='Notification'
         )
-        ObjectEventSubscription = apps.get_model(
-            app_label='events', model_name='ObjectEventSubscription'
-        )
-        User = get_user_model()
 
         if actor is None and target is None:
             # If the actor and the target are None there is no way to
@@ -315,6 +572,13 @@ class EventType:
             )
             return
 
+        if setting_commit_buffer_enable.value:
+            result = self.get_action(
+                action_object=action_object, actor=actor, target=target
+            )
+            EventCommitBuffer.add(action=result)
+            return result
+
         result = action.send(
             actor or target, actor=actor, verb=self.id,
             action_object=action_object, target=target
@@ -323,70 +587,34 @@ class EventType:
         # and ignore the handler.
 
         # Create notifications for the actions created by the event committed.
+        Notification.objects.create_for_actions(actions=(result,))
 
-        # Gather the users subscribed globally to the event.
-        user_queryset = User.objects.filter(
-            id__in=EventSubscription.objects.filter(
-                stored_event_type__name=result.verb
-            ).values('user')
-        )
+        return result
 
-        # Gather the users subscribed to the target object event.
-        if result.target:
-            user_queryset = user_queryset | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.target_content_type,
-                    object_id=result.target.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
+    def get_action(self, actor=None, action_object=None, target=None):
+        """
+        Return an unsaved action of the event with the same values
+        the actstream action handler uses.
+        """
+        Action = apps.get_model(app_label='actstream', model_name='Action')
 
-        # Gather the users subscribed to the action object event.
-        if result.action_object:
-            user_queryset = user_queryset | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.action_object_content_type,
-                    object_id=result.action_object.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
+        sender = actor or target
 
-        for user in user_queryset:
-            if result.target:
-                try:
-                    AccessControlList.objects.check_access(
-                        obj=result.target,
-                        permissions=(permission_events_view,),
-                        user=user
-                    )
-                except PermissionDenied:
-                    """
-                    User is subscribed to the event but does
-                    not have permissions for the event's target.
-                    """
-                else:
-                    Notification.objects.create(action=result, user=user)
-                    # Don't check or add any other notification for the
-                    # same user-event-object.
-                    continue
-
-            if result.action_object:
-                try:
-                    AccessControlList.objects.check_access(
-                        obj=result.action_object,
-                        permissions=(permission_events_view,),
-                        user=user
-                    )
-                except PermissionDenied:
-                    """
-                    User is subscribed to the event but does
-                    not have permissions for the event's action_object.
-                    """
-                else:
-                    Notification.objects.create(action=result, user=user)
-                    # Don't check or add any other notification for the
-                    # same user-event-object.
-                    continue
+        result = Action(
+            actor_content_type=ContentType.objects.get_for_model(
+                model=sender
+            ), actor_object_id=sender.pk, public=True, timestamp=now(),
+            verb=self.id
+        )
+
+        for name, obj in (('action_object', action_object), ('target', target)):
+            if obj is not None:
+                check(obj)
+                setattr(result, '{}_object_id'.format(name), obj.pk)
+                setattr(
+                    result, '{}_content_type'.format(name),
+                    ContentType.objects.get_for_model(model=obj)
+                )
 
         return result
 
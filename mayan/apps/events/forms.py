@@ -2,9 +2,51 @@ from django import forms
 from django.forms.formsets import formset_factory
 from django.utils.translation import ugettext_lazy as _
 
+from .classes import ActionExporter, EventType
 from .models import EventSubscription, ObjectEventSubscription
 
 
+class EventExportForm(forms.Form):
+    date_after = forms.DateField(
+        help_text=_('Export only the events of this date or later.'),
+        label=_('Start date'), required=False
+    )
+    date_before = forms.DateField(
+        help_text=_('Export only the events of this date or earlier.'),
+        label=_('End date'), required=False
+    )
+    verbs = forms.MultipleChoiceField(
+        help_text=_(
+            'Export only the events of the selected types. Leave empty to '
+            'export the events of all types.'
+        ), label=_('Event types'), required=False
+    )
+    export_format = forms.ChoiceField(
+        choices=ActionExporter.get_export_format_choices(),
+        help_text=_('File format of the export. Defaults to CSV.'),
+        label=_('Format'), required=False
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['verbs'].choices = [
+            (event_type.id, str(event_type)) for event_type in EventType.all()
+        ]
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date_after = cleaned_data.get('date_after')
+        date_before = cleaned_data.get('date_before')
+
+        if date_after and date_before and date_after > date_before:
+            raise forms.ValidationError(
+                message=_('The start date must be before the end date.'),
+                code='invalid'
+            )
+
+        return cleaned_data
+
+
 class EventTypeUserRelationshipForm(forms.Form):
     namespace = forms.CharField(
         label=_('Namespace'), required=False,
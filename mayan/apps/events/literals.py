@@ -1,4 +1,10 @@
 DEFAULT_EVENT_LIST_EXPORT_FILENAME = 'events_list.csv'
+DEFAULT_EVENT_LIST_EXPORT_JSON_LINES_FILENAME = 'events_list.jsonl.gz'
+DEFAULT_EVENTS_COMMIT_BUFFER_ENABLE = False
 
+EVENT_COMMIT_BULK_CREATE_BATCH_SIZE = 1000
+EVENT_EXPORT_BATCH_SIZE = 2000
+EVENT_EXPORT_FORMAT_CSV = 'csv'
+EVENT_EXPORT_FORMAT_JSON_LINES = 'jsonl'
 EVENT_MANAGER_ORDER_AFTER = 1
 EVENT_MANAGER_ORDER_BEFORE = 2
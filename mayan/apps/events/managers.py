@@ -1,6 +1,13 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
+from mayan.apps.acls.classes import ModelPermission
+
+from .literals import EVENT_COMMIT_BULK_CREATE_BATCH_SIZE
+from .permissions import permission_events_view
+
 
 class EventSubscriptionManager(models.Manager):
     def create_for(self, stored_event_type, user):
@@ -15,6 +22,141 @@ class EventSubscriptionManager(models.Manager):
 
 
 class NotificationManager(models.Manager):
+    def create_for_actions(self, actions):
+        """
+        Create the notifications of the users subscribed to the event type
+        of the actions or to their target or action object. The
+        subscriptions and the access of the users to the objects are
+        resolved for the whole batch of actions.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+        EventSubscription = apps.get_model(
+            app_label='events', model_name='EventSubscription'
+        )
+        ObjectEventSubscription = apps.get_model(
+            app_label='events', model_name='ObjectEventSubscription'
+        )
+        User = get_user_model()
+
+        def get_action_objects(action):
+            # The target is checked before the action object.
+            for prefix in ('target', 'action_object'):
+                content_type_id = getattr(
+                    action, '{}_content_type_id'.format(prefix)
+                )
+                if content_type_id:
+                    yield content_type_id, str(
+                        getattr(action, '{}_object_id'.format(prefix))
+                    )
+
+        actions = list(actions)
+
+        if not actions:
+            return []
+
+        verbs = {action.verb for action in actions}
+
+        # Gather the users subscribed globally to the events.
+        user_subscriptions = {}
+        queryset = EventSubscription.objects.filter(
+            stored_event_type__name__in=verbs
+        ).values_list('stored_event_type__name', 'user_id')
+
+        for verb, user_id in queryset:
+            user_subscriptions.setdefault(verb, set()).add(user_id)
+
+        # Gather the users subscribed to the target and action object
+        # events.
+        action_objects = {
+            action_object for action in actions
+            for action_object in get_action_objects(action=action)
+        }
+
+        if action_objects:
+            queryset = ObjectEventSubscription.objects.filter(
+                content_type_id__in={
+                    content_type_id for content_type_id, object_id in action_objects
+                }, object_id__in={
+                    object_id for content_type_id, object_id in action_objects
+                    if object_id.isdigit()
+                }, stored_event_type__name__in=verbs
+            ).values_list(
+                'content_type_id', 'object_id', 'stored_event_type__name',
+                'user_id'
+            )
+
+            for content_type_id, object_id, verb, user_id in queryset:
+                user_subscriptions.setdefault(
+                    (content_type_id, str(object_id), verb), set()
+                ).add(user_id)
+
+        action_users = []
+        access_requests = {}
+
+        for action in actions:
+            user_ids = set(user_subscriptions.get(action.verb, ()))
+            for content_type_id, object_id in get_action_objects(action=action):
+                user_ids.update(
+                    user_subscriptions.get(
+                        (content_type_id, object_id, action.verb), ()
+                    )
+                )
+
+            action_users.append((action, sorted(user_ids)))
+
+            for user_id in user_ids:
+                for content_type_id, object_id in get_action_objects(action=action):
+                    access_requests.setdefault(
+                        (user_id, content_type_id), set()
+                    ).add(object_id)
+
+        # Check the access of each user to the objects of each content
+        # type with a single query.
+        users = User.objects.in_bulk(
+            id_list={user_id for user_id, content_type_id in access_requests}
+        )
+        access_granted = set()
+
+        for (user_id, content_type_id), object_ids in access_requests.items():
+            model = ContentType.objects.get_for_id(
+                id=content_type_id
+            ).model_class()
+
+            if model is None or user_id not in users:
+                continue
+
+            queryset = AccessControlList.objects.restrict_queryset(
+                permission=permission_events_view,
+                queryset=ModelPermission.get_manager(model=model).filter(
+                    pk__in=object_ids
+                ), user=users[user_id]
+            )
+
+            access_granted.update(
+                (user_id, content_type_id, str(pk))
+                for pk in queryset.values_list('pk', flat=True)
+            )
+
+        notifications = []
+
+        for action, user_ids in action_users:
+            for user_id in user_ids:
+                for content_type_id, object_id in get_action_objects(action=action):
+                    if (user_id, content_type_id, object_id) in access_granted:
+                        notifications.append(
+                            self.model(action=action, user_id=user_id)
+                        )
+                        # Don't add any other notification for the same
+                        # user and action.
+                        break
+
+        return self.bulk_create(
+            batch_size=EVENT_COMMIT_BULK_CREATE_BATCH_SIZE,
+            objs=notifications
+        )
+
     def get_unread(self):
         return self.filter(read=False)
 
@@ -0,0 +1,17 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import DEFAULT_EVENTS_COMMIT_BUFFER_ENABLE
+
+namespace = SettingNamespace(label=_('Events'), name='events')
+
+setting_commit_buffer_enable = namespace.add_setting(
+    default=DEFAULT_EVENTS_COMMIT_BUFFER_ENABLE,
+    global_name='EVENTS_COMMIT_BUFFER_ENABLE', help_text=_(
+        'Buffer the events committed during a database transaction and '
+        'store them in bulk when the transaction is committed. The '
+        'notifications of the subscribed users are then created by a '
+        'background task.'
+    )
+)
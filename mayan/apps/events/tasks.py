@@ -1,20 +1,47 @@
+from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.utils.dateparse import parse_datetime
 
 from mayan.apps.common.classes import QuerysetParametersSerializer
 from mayan.celery import app
 
 from .classes import ActionExporter
+from .literals import EVENT_EXPORT_FORMAT_CSV
 
 
 @app.task(ignore_result=True)
-def task_event_queryset_export(decomposed_queryset, user_id=None):
+def task_event_notifications_create(action_id_list):
+    Action = apps.get_model(app_label='actstream', model_name='Action')
+    Notification = apps.get_model(
+        app_label='events', model_name='Notification'
+    )
+
+    Notification.objects.create_for_actions(
+        actions=Action.objects.filter(pk__in=action_id_list)
+    )
+
+
+@app.task(ignore_result=True)
+def task_event_queryset_export(
+    decomposed_queryset, date_after=None, date_before=None,
+    export_format=EVENT_EXPORT_FORMAT_CSV, user_id=None, verbs=None
+):
     queryset = QuerysetParametersSerializer.rebuild(
         decomposed_queryset=decomposed_queryset
     )
 
+    if date_after:
+        date_after = parse_datetime(value=date_after)
+
+    if date_before:
+        date_before = parse_datetime(value=date_before)
+
     if user_id:
         user = get_user_model().objects.get(pk=user_id)
     else:
         user = None
 
-    ActionExporter(queryset=queryset).export_to_download_file(user=user)
+    ActionExporter(
+        date_after=date_after, date_before=date_before,
+        export_format=export_format, queryset=queryset, verbs=verbs
+    ).export_to_download_file(user=user)
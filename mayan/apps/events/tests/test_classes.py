@@ -1,13 +1,105 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+
+from django.utils.timezone import now
+
+from actstream.models import Action
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import (
-    EventManagerMethodAfter, EventModelRegistry, EventType, ModelEventType
+    ActionExporter, EventManagerMethodAfter, EventModelRegistry, EventType,
+    ModelEventType
 )
 from ..decorators import method_event
 
+from ..literals import EVENT_EXPORT_FORMAT_JSON_LINES
+
 from .mixins import EventTypeTestMixin
 
 
+class ActionExporterTestCase(EventTypeTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_test_user()
+        self._create_test_object()
+
+        EventModelRegistry.register(model=self.TestModel)
+
+        ModelEventType.register(
+            event_types=(self.test_event_type,), model=self.TestModel
+        )
+
+        EventType.refresh()
+
+        self._clear_events()
+
+        self.test_event_type.commit(
+            actor=self.test_user, target=self.test_object
+        )
+
+    def _get_test_export_csv_rows(self, **kwargs):
+        file_object = io.StringIO()
+
+        ActionExporter(
+            queryset=Action.objects.all(), **kwargs
+        ).export(file_object=file_object)
+
+        file_object.seek(0)
+        return list(csv.DictReader(file_object))
+
+    def test_export_csv(self):
+        rows = self._get_test_export_csv_rows()
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['actor'], str(self.test_user))
+        self.assertEqual(rows[0]['action_object'], 'None')
+        self.assertEqual(rows[0]['target'], str(self.test_object))
+        self.assertEqual(rows[0]['verb'], self.test_event_type.id)
+
+    def test_export_csv_date_filter(self):
+        rows = self._get_test_export_csv_rows(
+            date_after=now() + datetime.timedelta(days=1)
+        )
+        self.assertEqual(len(rows), 0)
+
+        rows = self._get_test_export_csv_rows(
+            date_before=now() + datetime.timedelta(days=1)
+        )
+        self.assertEqual(len(rows), 1)
+
+    def test_export_csv_verb_filter(self):
+        rows = self._get_test_export_csv_rows(verbs=('invalid',))
+        self.assertEqual(len(rows), 0)
+
+        rows = self._get_test_export_csv_rows(
+            verbs=(self.test_event_type.id,)
+        )
+        self.assertEqual(len(rows), 1)
+
+    def test_export_json_lines(self):
+        file_object = io.BytesIO()
+
+        ActionExporter(
+            export_format=EVENT_EXPORT_FORMAT_JSON_LINES,
+            queryset=Action.objects.all()
+        ).export(file_object=file_object)
+
+        file_object.seek(0)
+        with gzip.GzipFile(fileobj=file_object, mode='rb') as file_object_gzip:
+            rows = [json.loads(line) for line in file_object_gzip]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['actor'], str(self.test_user))
+        self.assertEqual(rows[0]['action_object'], None)
+        self.assertEqual(rows[0]['target'], str(self.test_object))
+        self.assertEqual(rows[0]['verb'], self.test_event_type.id)
+
+
 class EventManagerTestCase(EventTypeTestMixin, BaseTestCase):
     def setUp(self):
         super().setUp()
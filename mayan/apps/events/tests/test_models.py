@@ -1,6 +1,7 @@
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..classes import EventCommitBuffer
 from ..models import EventSubscription, Notification, ObjectEventSubscription
 from ..permissions import permission_events_view
 
@@ -435,3 +436,76 @@ class ObjectEventNotificationModelTestCase(NotificationTestMixin, BaseTestCase):
         self.assertEqual(notifications[0].action, result_1)
         self.assertEqual(notifications[1].user, self.test_users[0])
         self.assertEqual(notifications[1].action, result_0)
+
+
+class EventCommitBufferTestCase(NotificationTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_local_test_user()
+        self._create_local_test_object()
+
+    def test_flush_action_insert_and_notifications(self):
+        self._create_local_test_object()
+
+        EventSubscription.objects.create(
+            stored_event_type=self.test_event_type.stored_event_type,
+            user=self.test_user
+        )
+
+        AccessControlList.objects.grant(
+            obj=self.test_objects[0], permission=permission_events_view,
+            role=self.test_role
+        )
+
+        notification_count = Notification.objects.count()
+
+        action_list = [
+            self.test_event_type.get_action(
+                actor=None, action_object=None, target=test_object
+            ) for test_object in self.test_objects
+        ]
+
+        EventCommitBuffer.flush(action_list=action_list)
+
+        self.assertTrue(all(action.pk for action in action_list))
+        self.assertEqual(Notification.objects.count(), notification_count + 1)
+        notification = Notification.objects.first()
+        self.assertEqual(notification.user, self.test_user)
+        self.assertEqual(notification.action, action_list[0])
+
+
+class NotificationManagerTestCase(NotificationTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_local_test_user()
+        self._create_local_test_object()
+
+    def test_create_for_actions_single_notification_per_action(self):
+        EventSubscription.objects.create(
+            stored_event_type=self.test_event_type.stored_event_type,
+            user=self.test_user
+        )
+        ObjectEventSubscription.objects.create(
+            content_object=self.test_object,
+            stored_event_type=self.test_event_type.stored_event_type,
+            user=self.test_user
+        )
+
+        AccessControlList.objects.grant(
+            obj=self.test_object, permission=permission_events_view,
+            role=self.test_role
+        )
+
+        notification_count = Notification.objects.count()
+
+        result = self.test_event_type.commit(target=self.test_object)
+
+        self.assertEqual(Notification.objects.count(), notification_count + 1)
+
+        Notification.objects.all().delete()
+
+        Notification.objects.create_for_actions(actions=(result,))
+
+        self.assertEqual(Notification.objects.count(), 1)
@@ -1,13 +1,18 @@
+import datetime
+
 from django.contrib import messages
+from django.utils.timezone import make_aware
 from django.utils.translation import ugettext_lazy as _
 
 from actstream.models import Action
 
 from mayan.apps.common.classes import QuerysetParametersSerializer
-from mayan.apps.views.generics import ConfirmView
+from mayan.apps.views.generics import FormView
 from mayan.apps.views.mixins import ExternalContentTypeObjectViewMixin
 
 from ..classes import EventType
+from ..forms import EventExportForm
+from ..literals import EVENT_EXPORT_FORMAT_CSV
 from ..permissions import permission_events_export
 from ..tasks import task_event_queryset_export
 
@@ -17,26 +22,48 @@ __all__ = (
 )
 
 
-class EventExportBaseView(ConfirmView):
+class EventExportBaseView(FormView):
+    form_class = EventExportForm
     object_permission = permission_events_export
 
-    def get_extra_context(self):
-        return {
-            'message': _(
-                'The process will be performed in the background. '
-                'The exported events will be available in the downloads area.'
-            )
-        }
+    @staticmethod
+    def get_date_timestamp(date):
+        """
+        Return the ISO formatted timestamp of the start of a date in the
+        current timezone.
+        """
+        return make_aware(
+            value=datetime.datetime.combine(date, datetime.time.min)
+        ).isoformat()
+
+    def form_valid(self, form):
+        date_after = form.cleaned_data['date_after']
+        date_before = form.cleaned_data['date_before']
 
-    def view_action(self):
         decomposed_queryset = QuerysetParametersSerializer.decompose(
             _model=Action, **self.get_queryset_parameters()
         )
 
+        if date_after:
+            date_after = self.get_date_timestamp(date=date_after)
+
+        if date_before:
+            # The end date is inclusive, filter up to the start of the
+            # next day.
+            date_before = self.get_date_timestamp(
+                date=date_before + datetime.timedelta(days=1)
+            )
+
         task_event_queryset_export.apply_async(
             kwargs={
+                'date_after': date_after,
+                'date_before': date_before,
                 'decomposed_queryset': decomposed_queryset,
-                'user_id': self.request.user.pk
+                'export_format': form.cleaned_data[
+                    'export_format'
+                ] or EVENT_EXPORT_FORMAT_CSV,
+                'user_id': self.request.user.pk,
+                'verbs': form.cleaned_data['verbs']
             }
         )
 
@@ -46,6 +73,17 @@ class EventExportBaseView(ConfirmView):
             )
         )
 
+        return super().form_valid(form=form)
+
+    def get_extra_context(self):
+        return {
+            'message': _(
+                'The process will be performed in the background. '
+                'The exported events will be available in the downloads area.'
+            ),
+            'submit_label': _('Export')
+        }
+
 
 class EventListExportView(EventExportBaseView):
     object_permission = permission_events_export
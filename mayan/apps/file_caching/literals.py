@@ -1,2 +1,29 @@
+from django.utils.translation import ugettext_lazy as _
+
+CACHE_EVICTION_POLICY_LFU = 'lfu'
+CACHE_EVICTION_POLICY_LRU = 'lru'
+
+CACHE_EVICTION_POLICY_CHOICES = (
+    (CACHE_EVICTION_POLICY_LFU, _('Least frequently used')),
+    (CACHE_EVICTION_POLICY_LRU, _('Least recently used')),
+)
+
+CACHE_EVICTION_POLICY_ORDERING = {
+    CACHE_EVICTION_POLICY_LFU: ('hits', 'datetime'),
+    CACHE_EVICTION_POLICY_LRU: ('datetime_accessed', 'datetime'),
+}
+
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
+DEFAULT_FILE_CACHING_RESPONSE_OFFLOAD_HEADER = None
+DEFAULT_FILE_CACHING_RESPONSE_OFFLOAD_PREFIX = '/file_caching/'
+
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_PRUNE_BATCH_SIZE = 100
+DEFAULT_PRUNE_HIGH_WATERMARK = 100
+DEFAULT_PRUNE_LOW_WATERMARK = 90
+
+PRUNE_LOCK_TIMEOUT = 600
+PRUNE_SCHEDULE_TIMEOUT = PRUNE_LOCK_TIMEOUT
+
+RESPONSE_OFFLOAD_HEADER_X_ACCEL_REDIRECT = 'X-Accel-Redirect'
+RESPONSE_OFFLOAD_HEADER_X_SENDFILE = 'X-Sendfile'
@@ -0,0 +1,80 @@
+from django.db import migrations, models
+from django.db.models import F, Sum
+import django.utils.timezone
+
+
+def code_cache_current_size_update(apps, schema_editor):
+    Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(alias=schema_editor.connection.alias).all():
+        cache.current_size = CachePartitionFile.objects.using(
+            alias=schema_editor.connection.alias
+        ).filter(partition__cache=cache).aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save(update_fields=('current_size',))
+
+
+def code_cache_partition_file_datetime_accessed_update(apps, schema_editor):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    CachePartitionFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).update(datetime_accessed=F('datetime'))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0008_auto_20210426_0717'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache',
+            name='current_size',
+            field=models.BigIntegerField(
+                default=0, help_text='Running total of the size of the '
+                'files of the cache in bytes.', verbose_name='Current size'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='eviction_policy',
+            field=models.CharField(
+                choices=[
+                    ('lfu', 'Least frequently used'),
+                    ('lru', 'Least recently used')
+                ], default='lfu', help_text='Order in which files are '
+                'deleted when the cache is full.', max_length=8,
+                verbose_name='Eviction policy'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cachepartitionfile',
+            name='datetime_accessed',
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now,
+                help_text='Date and time this cache partition file was '
+                'last accessed.', verbose_name='Date time accessed'
+            ),
+        ),
+        migrations.AlterIndexTogether(
+            name='cachepartitionfile',
+            index_together={
+                ('hits', 'datetime'), ('datetime_accessed', 'datetime')
+            },
+        ),
+        migrations.RunPython(
+            code=code_cache_current_size_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+        migrations.RunPython(
+            code=code_cache_partition_file_datetime_accessed_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
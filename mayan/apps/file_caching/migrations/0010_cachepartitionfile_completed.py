@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0009_auto_20211018_0712'),
+    ]
+
+    operations = [
+        # Existing files were created by a write that finished.
+        migrations.AddField(
+            model_name='cachepartitionfile',
+            name='completed',
+            field=models.BooleanField(
+                default=True, help_text='The file was completely written '
+                'and is available for reading.', verbose_name='Completed'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='cachepartitionfile',
+            name='completed',
+            field=models.BooleanField(
+                default=False, help_text='The file was completely written '
+                'and is available for reading.', verbose_name='Completed'
+            ),
+        ),
+    ]
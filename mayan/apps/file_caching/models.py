@@ -2,11 +2,13 @@ from contextlib import contextmanager
 import logging
 
 from django.core import validators
+from django.core.cache import caches
 from django.core.files.base import ContentFile
 from django.db import models
 from django.db.models import F, Sum
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
 from django.utils.text import format_lazy
@@ -27,10 +29,16 @@ from .events import (
     event_cache_purged
 )
 from .exceptions import FileCachingException
+from .literals import (
+    CACHE_EVICTION_POLICY_CHOICES, CACHE_EVICTION_POLICY_LFU,
+    CACHE_EVICTION_POLICY_ORDERING, PRUNE_SCHEDULE_TIMEOUT
+)
 from .settings import (
     setting_maximum_failed_prune_attempts,
-    setting_maximum_normal_prune_attempts
+    setting_maximum_normal_prune_attempts, setting_prune_batch_size,
+    setting_prune_high_watermark, setting_prune_low_watermark
 )
+from .tasks import task_cache_prune
 
 logger = logging.getLogger(name=__name__)
 
@@ -46,6 +54,17 @@ class Cache(ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_('Maximum size')
     )
+    current_size = models.BigIntegerField(
+        default=0, help_text=_(
+            'Running total of the size of the files of the cache in bytes.'
+        ), verbose_name=_('Current size')
+    )
+    eviction_policy = models.CharField(
+        choices=CACHE_EVICTION_POLICY_CHOICES,
+        default=CACHE_EVICTION_POLICY_LFU, help_text=_(
+            'Order in which files are deleted when the cache is full.'
+        ), max_length=8, verbose_name=_('Eviction policy')
+    )
 
     class Meta:
         verbose_name = _('Cache')
@@ -80,13 +99,31 @@ class Cache(ValueChangeModelMixin, models.Model):
                 dotted_path='', label=_('Unknown'), name='unknown'
             )
 
+    def get_prune_lock_name(self):
+        return 'file_caching-cache_prune-{}'.format(self.pk)
+
+    def get_prune_schedule_key(self):
+        return 'file_caching-cache_prune_schedule-{}'.format(self.pk)
+
+    def get_prune_start_size(self):
+        """
+        Size at which the cache starts deleting files.
+        """
+        return self.maximum_size * setting_prune_high_watermark.value // 100
+
+    def get_prune_target_size(self):
+        """
+        Size down to which files are deleted when the cache is full.
+        """
+        return self.maximum_size * setting_prune_low_watermark.value // 100
+
     def get_total_size(self):
         """
         Return the actual usage of the cache.
         """
-        return self.get_files().aggregate(
-            file_size__sum=Sum('file_size')
-        )['file_size__sum'] or 0
+        return Cache.objects.filter(pk=self.pk).values_list(
+            'current_size', flat=True
+        ).first() or 0
 
     def get_total_size_display(self):
         return format_lazy(
@@ -103,30 +140,41 @@ class Cache(ValueChangeModelMixin, models.Model):
 
     def prune(self):
         """
-        Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        Deletes files in batches, in the order of the eviction policy of the
+        cache, until the total size of the cache is below the low watermark.
+        Pruning only starts when the cache reaches the high watermark.
+        Returns the number of files deleted.
         """
+        deleted_count = 0
+        total_size = self.get_total_size()
+
+        if total_size < self.get_prune_start_size():
+            return deleted_count
+
+        target_size = self.get_prune_target_size()
+        ordering = CACHE_EVICTION_POLICY_ORDERING[self.eviction_policy]
+
         failed_attempts = 0
         normal_attempts = 0
-        file_index = 0
+        skipped_id_list = set()
 
-        while self.get_total_size() >= self.maximum_size:
-            cache_partition_file_queryset = self.get_files().order_by(
-                'hits', 'datetime'
-            )
+        while total_size > target_size:
+            cache_partition_file_queryset = self.get_files().exclude(
+                pk__in=skipped_id_list
+            ).order_by(*ordering)[:setting_prune_batch_size.value]
 
-            try:
-                cache_partition_file = cache_partition_file_queryset[file_index]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-            else:
+            cache_partition_files = list(cache_partition_file_queryset)
+
+            if not cache_partition_files:
+                break
+
+            for cache_partition_file in cache_partition_files:
                 try:
                     cache_partition_file.delete()
                 except CachePartitionFile.DoesNotExist:
                     # The file selected from deletion was deleted by another
                     # process before the lock was acquired.
-                    file_index += 1
+                    pass
                 except LockError:
                     logger.debug(
                         'Lock error trying to delete file "%s" for prune. '
@@ -134,21 +182,55 @@ class Cache(ValueChangeModelMixin, models.Model):
                         cache_partition_file
                     )
                     failed_attempts += 1
-                    file_index += 1
+                    skipped_id_list.add(cache_partition_file.pk)
 
                     if failed_attempts > setting_maximum_failed_prune_attempts.value:
                         raise FileCachingException(
                             'Too many cache prune attempts failed.'
                         )
                 else:
-                    file_index = 0
-                    normal_attempts += 1
+                    deleted_count += 1
+                    total_size -= cache_partition_file.file_size
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prunes trying to create a '
-                            'single new file.'
-                        )
+                    if total_size <= target_size:
+                        break
+
+            normal_attempts += 1
+
+            if normal_attempts > setting_maximum_normal_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prunes trying to create a '
+                    'single new file.'
+                )
+
+            # Account for the files added or removed by other processes.
+            total_size = self.get_total_size()
+
+        return deleted_count
+
+    def prune_schedule(self):
+        """
+        Queue the pruning of the cache if it reached the high watermark.
+        Callers never wait for the files to be deleted.
+        """
+        if self.get_total_size() >= self.get_prune_start_size():
+            # Adding the key fails if it exists. Only the first caller
+            # queues a prune until the prune finishes or the key expires.
+            if caches['default'].add(key=self.get_prune_schedule_key(), timeout=PRUNE_SCHEDULE_TIMEOUT, value=True):
+                task_cache_prune.apply_async(kwargs={'cache_id': self.pk})
+
+    def prune_schedule_clear(self):
+        caches['default'].delete(key=self.get_prune_schedule_key())
+
+    def update_size(self):
+        """
+        Recalculate the running total of the size of the cache files.
+        """
+        Cache.objects.filter(pk=self.pk).update(
+            current_size=self.get_files().aggregate(
+                file_size__sum=Sum('file_size')
+            )['file_size__sum'] or 0
+        )
 
     @method_event(
         event=event_cache_purged,
@@ -191,7 +273,7 @@ class Cache(ValueChangeModelMixin, models.Model):
         result = super().save(*args, **kwargs)
 
         if self.maximum_size < old_maximum_size:
-            self.prune()
+            task_cache_prune.apply_async(kwargs={'cache_id': self.pk})
 
         return result
 
@@ -229,7 +311,7 @@ class CachePartition(models.Model):
             lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
             logger.debug('acquired lock: %s', lock_name)
             try:
-                self.cache.prune()
+                self.cache.prune_schedule()
 
                 # Since open "wb+" doesn't create files, force the creation
                 # of an empty file.
@@ -241,6 +323,10 @@ class CachePartition(models.Model):
                     content=ContentFile(content='')
                 )
 
+                # Remove the entry left by a write that didn't finish.
+                for partition_file in self.files.filter(filename=filename, completed=False):
+                    partition_file.delete(_acquire_lock=False)
+
                 partition_file = None
 
                 try:
@@ -264,6 +350,10 @@ class CachePartition(models.Model):
                 else:
                     partition_file.close(_acquire_lock=False)
                     partition_file._update_size(_acquire_lock=False)
+                    # Make the file available to readers only after it is
+                    # completely written.
+                    partition_file.completed = True
+                    partition_file.save(update_fields=('completed',))
             finally:
                 lock.release()
         except LockError:
@@ -275,7 +365,7 @@ class CachePartition(models.Model):
         return super().delete(*args, **kwargs)
 
     def get_file(self, filename):
-        return self.files.get(filename=filename)
+        return self.files.get(completed=True, filename=filename)
 
     def get_file_lock_name(self, filename):
         return 'cache_partition-file-{}-{}-{}'.format(
@@ -311,14 +401,27 @@ class CachePartitionFile(models.Model):
     file_size = models.PositiveIntegerField(
         default=0, verbose_name=_('File size')
     )
+    completed = models.BooleanField(
+        default=False, help_text=_(
+            'The file was completely written and is available for reading.'
+        ), verbose_name=_('Completed')
+    )
     hits = models.PositiveIntegerField(
         db_index=True, default=0, help_text=_(
             'Times this cache partition file has been accessed.'
         ), verbose_name='Hits'
     )
+    datetime_accessed = models.DateTimeField(
+        db_index=True, default=timezone.now, help_text=_(
+            'Date and time this cache partition file was last accessed.'
+        ), verbose_name=_('Date time accessed')
+    )
 
     class Meta:
         get_latest_by = 'datetime'
+        index_together = (
+            ('hits', 'datetime'), ('datetime_accessed', 'datetime')
+        )
         unique_together = ('partition', 'filename')
         verbose_name = _('Cache partition file')
         verbose_name_plural = _('Cache partition files')
@@ -349,10 +452,14 @@ class CachePartitionFile(models.Model):
         """
         Called after creation and initial write only.
         """
+        file_size_previous = self.file_size
         self.file_size = self.partition.cache.storage.size(
             name=self.full_filename
         )
         self.save()
+        Cache.objects.filter(pk=self.partition.cache_id).update(
+            current_size=F('current_size') + self.file_size - file_size_previous
+        )
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -368,7 +475,16 @@ class CachePartitionFile(models.Model):
     @locked_class_method
     def delete(self, *args, **kwargs):
         self.partition.cache.storage.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+        result = super().delete(*args, **kwargs)
+
+        if result[0]:
+            # Only update the size if the entry was not already deleted by
+            # another process.
+            Cache.objects.filter(pk=self.partition.cache_id).update(
+                current_size=F('current_size') - self.file_size
+            )
+
+        return result
 
     @cached_property
     def full_filename(self):
@@ -385,7 +501,7 @@ class CachePartitionFile(models.Model):
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
             self._lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
-            CachePartitionFile.objects.filter(pk=self.pk).update(hits=F('hits') + 1)
+            self.update_access()
             logger.debug('acquired lock: %s', lock_name)
             self._storage_object = None
             try:
@@ -407,3 +523,33 @@ class CachePartitionFile(models.Model):
         except LockError:
             logger.debug('unable to obtain lock: %s' % lock_name)
             raise
+
+    def open_stream(self):
+        """
+        Open the file for reading to stream it after the caller returns,
+        like with a FileResponse. The file lock is held only while the
+        file is opened to not open a file being deleted. Completed files
+        are never written again, the lock is released before the file is
+        read to not block concurrent readers.
+        """
+        lock_name = self._lock_manager_get_lock_name()
+        try:
+            logger.debug('trying to acquire lock: %s', lock_name)
+            lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
+            logger.debug('acquired lock: %s', lock_name)
+        except LockError:
+            logger.debug('unable to obtain lock: %s' % lock_name)
+            raise
+
+        try:
+            self.update_access()
+            return self.partition.cache.storage.open(
+                mode='rb', name=self.full_filename
+            )
+        finally:
+            lock.release()
+
+    def update_access(self):
+        CachePartitionFile.objects.filter(pk=self.pk).update(
+            datetime_accessed=timezone.now(), hits=F('hits') + 1
+        )
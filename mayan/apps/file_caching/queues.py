@@ -12,6 +12,10 @@ queue_file_caching.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_partition_purge',
     label=_('Purge a file cache partition')
 )
+queue_file_caching.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_cache_prune',
+    label=_('Prune a file cache')
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_purge',
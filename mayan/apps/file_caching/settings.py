@@ -3,8 +3,11 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
+    DEFAULT_FILE_CACHING_RESPONSE_OFFLOAD_HEADER,
+    DEFAULT_FILE_CACHING_RESPONSE_OFFLOAD_PREFIX,
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS, DEFAULT_PRUNE_BATCH_SIZE,
+    DEFAULT_PRUNE_HIGH_WATERMARK, DEFAULT_PRUNE_LOW_WATERMARK
 )
 
 namespace = SettingNamespace(label=_('File caching'), name='file_caching')
@@ -20,7 +23,44 @@ setting_maximum_failed_prune_attempts = namespace.add_setting(
 setting_maximum_normal_prune_attempts = namespace.add_setting(
     default=DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS,
     global_name='FILE_CACHING_MAXIMUM_NORMAL_PRUNE_ATTEMPTS', help_text=_(
-        'Number of times a cache will attempt to prune files to free up '
+        'Number of batches of files a cache will delete to free up '
         'space for new a file being requested, before giving up.'
     )
 )
+setting_prune_batch_size = namespace.add_setting(
+    default=DEFAULT_PRUNE_BATCH_SIZE,
+    global_name='FILE_CACHING_PRUNE_BATCH_SIZE', help_text=_(
+        'Number of files selected for deletion at once when pruning a '
+        'cache.'
+    )
+)
+setting_prune_high_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_HIGH_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_HIGH_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache at which a background '
+        'task is queued to delete files from the cache.'
+    )
+)
+setting_prune_low_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_LOW_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_LOW_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache down to which files are '
+        'deleted when the cache becomes full.'
+    )
+)
+setting_response_offload_header = namespace.add_setting(
+    default=DEFAULT_FILE_CACHING_RESPONSE_OFFLOAD_HEADER,
+    global_name='FILE_CACHING_RESPONSE_OFFLOAD_HEADER', help_text=_(
+        'Header used to let the web server send the cache files served '
+        'directly by views. Use "X-Accel-Redirect" for NGINX or '
+        '"X-Sendfile" for Apache and lighttpd. When empty the files are '
+        'streamed by the application.'
+    )
+)
+setting_response_offload_prefix = namespace.add_setting(
+    default=DEFAULT_FILE_CACHING_RESPONSE_OFFLOAD_PREFIX,
+    global_name='FILE_CACHING_RESPONSE_OFFLOAD_PREFIX', help_text=_(
+        'Internal URL prefix of the cache storage locations, prepended '
+        'to the cache file names when using the "X-Accel-Redirect" header.'
+    )
+)
@@ -3,9 +3,13 @@ import logging
 from django.apps import apps
 from django.contrib.auth import get_user_model
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .exceptions import FileCachingException
+from .literals import PRUNE_LOCK_TIMEOUT
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -47,6 +51,45 @@ def task_cache_partition_purge(
         logger.info('Finished cache partition id %s purge', cache_partition)
 
 
+@app.task(ignore_result=True)
+def task_cache_prune(cache_id):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    try:
+        cache = Cache.objects.get(pk=cache_id)
+    except Cache.DoesNotExist:
+        return
+
+    lock_name = cache.get_prune_lock_name()
+
+    try:
+        logger.debug('trying to acquire lock: %s', lock_name)
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=lock_name, timeout=PRUNE_LOCK_TIMEOUT
+        )
+    except LockError:
+        # Another worker is already pruning this cache.
+        logger.debug('unable to obtain lock: %s', lock_name)
+    else:
+        try:
+            logger.info('Starting cache id %s prune', cache)
+            deleted_count = cache.prune()
+        except FileCachingException as exception:
+            logger.warning(
+                'Unable to prune cache id %s; %s', cache, exception
+            )
+        else:
+            logger.info(
+                'Finished cache id %s prune; %d files deleted', cache,
+                deleted_count
+            )
+        finally:
+            lock.release()
+            cache.prune_schedule_clear()
+
+
 @app.task(bind=True, ignore_result=True)
 def task_cache_purge(self, cache_id, user_id=None):
     Cache = apps.get_model(
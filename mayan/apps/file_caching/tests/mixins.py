@@ -4,7 +4,9 @@ from mayan.apps.storage.classes import DefinedStorage
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
 from ..models import Cache
-from ..tasks import task_cache_partition_purge, task_cache_purge
+from ..tasks import (
+    task_cache_partition_purge, task_cache_prune, task_cache_purge
+)
 
 from .literals import (
     TEST_CACHE_MAXIMUM_SIZE, TEST_CACHE_PARTITION_FILE_FILENAME,
@@ -107,6 +109,13 @@ class FileCachingTaskTestMixin:
             }
         ).get()
 
+    def _execute_task_cache_prune(self):
+        task_cache_prune.apply_async(
+            kwargs={
+                'cache_id': self.test_cache.pk
+            }
+        ).get()
+
     def _execute_task_cache_purge(self):
         task_cache_purge.apply_async(
             kwargs={
@@ -1,9 +1,13 @@
 import mock
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..exceptions import FileCachingException
+from ..literals import CACHE_EVICTION_POLICY_LRU
 from ..models import CachePartitionFile
+from ..settings import setting_prune_high_watermark
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
 from .mixins import CacheTestMixin
@@ -107,6 +111,58 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             self.test_cache_partition_file.hits, cache_partition_file_hits + 1
         )
 
+    def test_cache_partition_file_not_available_while_written(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+
+        with self.test_cache_partition.create_file(filename=TEST_CACHE_PARTITION_FILE_FILENAME) as file_object:
+            file_object.write(b' ')
+
+            with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+                self.test_cache_partition.get_file(
+                    filename=TEST_CACHE_PARTITION_FILE_FILENAME
+                )
+
+        self.assertTrue(
+            self.test_cache_partition.get_file(
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME
+            ).completed
+        )
+
+    def test_cache_partition_file_open_stream_concurrent(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        file_object = self.test_cache_partition_file.open_stream()
+
+        with self.test_cache_partition_file.open():
+            """Do nothing"""
+
+        file_object_second = self.test_cache_partition_file.open_stream()
+
+        self.assertEqual(file_object.read(), file_object_second.read())
+
+        file_object.close()
+        file_object_second.close()
+
+    def test_cache_partition_file_open_stream_locked(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_cache_partition.get_file_lock_name(
+                filename=self.test_cache_partition_file.filename
+            )
+        )
+
+        try:
+            with self.assertRaises(expected_exception=LockError):
+                self.test_cache_partition_file.open_stream()
+        finally:
+            lock.release()
+
     def test_cache_partition_file_lru_eviction(self):
         self._create_test_cache(
             extra_data={
@@ -187,3 +243,111 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.assertTrue(
             self.test_cache_partition_files[2] in CachePartitionFile.objects.all()
         )
+
+    def test_cache_current_size_update(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=2)
+        self._create_test_cache_partition_file(file_size=3)
+
+        self.assertEqual(self.test_cache.get_total_size(), 5)
+
+        self.test_cache_partition_files[0].delete()
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
+    def test_cache_prune_low_watermark(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+        self._create_test_cache_partition()
+
+        for index in range(10):
+            self._create_test_cache_partition_file(file_size=1)
+
+        self.test_cache.prune()
+
+        # Files are deleted down to 90% of the maximum size.
+        self.assertEqual(self.test_cache.get_total_size(), 9)
+        self.assertEqual(CachePartitionFile.objects.count(), 9)
+
+    def test_cache_partition_file_lru_policy_eviction(self):
+        self._create_test_cache(
+            extra_data={
+                'eviction_policy': CACHE_EVICTION_POLICY_LRU,
+                'maximum_size': 2
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        with self.test_cache_partition_files[1].open():
+            """Increase hits of file #1"""
+
+        with self.test_cache_partition_files[1].open():
+            """Increase hits of file #1"""
+
+        with self.test_cache_partition_files[0].open():
+            """File #0 is the most recently used"""
+
+        self._create_test_cache_partition_file(file_size=1)
+
+        self.assertTrue(
+            self.test_cache_partition_files[0] in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self.test_cache_partition_files[1] not in CachePartitionFile.objects.all()
+        )
+
+    @mock.patch('mayan.apps.file_caching.models.task_cache_prune.apply_async')
+    def test_cache_prune_high_watermark(self, mock_task_cache_prune):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+        self._create_test_cache_partition()
+
+        self._create_test_cache_partition_file(file_size=5)
+        self._create_test_cache_partition_file(file_size=1)
+        self.assertFalse(mock_task_cache_prune.called)
+
+        old_value = setting_prune_high_watermark.value
+        setting_prune_high_watermark.set(value=50)
+
+        try:
+            self._create_test_cache_partition_file(file_size=1)
+        finally:
+            setting_prune_high_watermark.set(value=old_value)
+            self.test_cache.prune_schedule_clear()
+
+        self.assertTrue(mock_task_cache_prune.called)
+
+    @mock.patch('mayan.apps.file_caching.models.task_cache_prune.apply_async')
+    def test_cache_prune_schedule_single(self, mock_task_cache_prune):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=10)
+        self.test_cache.prune_schedule_clear()
+        mock_task_cache_prune.reset_mock()
+
+        try:
+            self.test_cache.prune_schedule()
+            self.test_cache.prune_schedule()
+
+            self.assertEqual(mock_task_cache_prune.call_count, 1)
+
+            self.test_cache.prune_schedule_clear()
+            self.test_cache.prune_schedule()
+
+            self.assertEqual(mock_task_cache_prune.call_count, 2)
+        finally:
+            self.test_cache.prune_schedule_clear()
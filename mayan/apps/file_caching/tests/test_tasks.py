@@ -1,6 +1,7 @@
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..events import event_cache_partition_purged, event_cache_purged
+from ..models import Cache
 
 from .mixins import CacheTestMixin, FileCachingTaskTestMixin
 
@@ -29,6 +30,26 @@ class FileCachingTaskTestCase(
         self.assertEqual(events[0].target, self.test_cache_partition)
         self.assertEqual(events[0].verb, event_cache_partition_purged.id)
 
+    def test_task_cache_prune(self):
+        Cache.objects.filter(pk=self.test_cache.pk).update(
+            maximum_size=self.test_cache.get_total_size()
+        )
+
+        self._clear_events()
+
+        self._execute_task_cache_prune()
+
+        self.assertEqual(self.test_cache_partition.files.count(), 0)
+        self.assertEqual(self.test_cache.get_total_size(), 0)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_task_cache_prune_below_high_watermark(self):
+        self._execute_task_cache_prune()
+
+        self.assertEqual(self.test_cache_partition.files.count(), 1)
+
     def test_task_cache_purge(self):
         self._clear_events()
 
@@ -0,0 +1,55 @@
+from django.test import override_settings
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..literals import RESPONSE_OFFLOAD_HEADER_X_ACCEL_REDIRECT
+from ..utils import get_cache_partition_file_response
+
+from .mixins import CacheTestMixin
+
+
+class CachePartitionFileResponseTestCase(CacheTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+    def tearDown(self):
+        SettingNamespace.invalidate_cache_all()
+        super().tearDown()
+
+    def test_response_streaming(self):
+        response = get_cache_partition_file_response(
+            cache_partition_file=self.test_cache_partition_file,
+            content_type='image'
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            len(b''.join(response.streaming_content)),
+            self.test_cache_partition_file.file_size
+        )
+        response.close()
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 1)
+
+    @override_settings(
+        FILE_CACHING_RESPONSE_OFFLOAD_HEADER=RESPONSE_OFFLOAD_HEADER_X_ACCEL_REDIRECT
+    )
+    def test_response_x_accel_redirect(self):
+        SettingNamespace.invalidate_cache_all()
+
+        response = get_cache_partition_file_response(
+            cache_partition_file=self.test_cache_partition_file,
+            content_type='image'
+        )
+
+        self.assertFalse(response.streaming)
+        self.assertTrue(
+            response[RESPONSE_OFFLOAD_HEADER_X_ACCEL_REDIRECT].endswith(
+                self.test_cache_partition_file.full_filename
+            )
+        )
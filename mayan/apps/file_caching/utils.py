@@ -0,0 +1,51 @@
+import logging
+import posixpath
+
+from django.http import FileResponse, HttpResponse
+
+from .literals import (
+    RESPONSE_OFFLOAD_HEADER_X_ACCEL_REDIRECT,
+    RESPONSE_OFFLOAD_HEADER_X_SENDFILE
+)
+from .settings import (
+    setting_response_offload_header, setting_response_offload_prefix
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+def get_cache_partition_file_response(cache_partition_file, content_type):
+    """
+    Return a response with the content of a cache partition file. The
+    file is streamed from the storage or, when an offload header is
+    configured, sent by the web server.
+    """
+    offload_header = setting_response_offload_header.value
+
+    if offload_header == RESPONSE_OFFLOAD_HEADER_X_ACCEL_REDIRECT:
+        cache_partition_file.update_access()
+        response = HttpResponse(content_type=content_type)
+        response[offload_header] = posixpath.join(
+            setting_response_offload_prefix.value,
+            cache_partition_file.full_filename
+        )
+        return response
+    elif offload_header == RESPONSE_OFFLOAD_HEADER_X_SENDFILE:
+        try:
+            path = cache_partition_file.partition.cache.storage.path(
+                name=cache_partition_file.full_filename
+            )
+        except NotImplementedError:
+            logger.debug(
+                'Cache storage without local paths, streaming file: %s',
+                cache_partition_file.full_filename
+            )
+        else:
+            cache_partition_file.update_access()
+            response = HttpResponse(content_type=content_type)
+            response[offload_header] = path
+            return response
+
+    return FileResponse(
+        cache_partition_file.open_stream(), content_type=content_type
+    )
@@ -31,6 +31,10 @@ class CacheDetailView(SingleObjectDetailView):
             {
                 'field': 'get_total_size_display',
             },
+            {
+                'field': 'get_eviction_policy_display',
+                'label': _('Eviction policy')
+            },
         ]
     }
     model = Cache
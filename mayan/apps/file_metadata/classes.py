@@ -26,36 +26,72 @@ class FileMetadataDriver:
     _registry = {}
 
     @classmethod
-    def process_document_file(cls, document_file):
+    def get_driver_classes(cls, mimetype):
         # Get list of drivers for the document's MIME type
-        driver_classes = cls._registry.get(document_file.mimetype, ())
+        driver_classes = tuple(cls._registry.get(mimetype, ()))
         # Add wilcard drivers, drivers meant to be executed for all MIME types.
-        driver_classes = driver_classes + tuple(cls._registry.get('*', ()))
-
-        for driver_class in driver_classes:
-            try:
-                driver = driver_class()
-
-                driver.initialize()
+        return driver_classes + tuple(cls._registry.get('*', ()))
 
-                driver.process(document_file=document_file)
+    @classmethod
+    def process_document_file(cls, document_file):
+        cls.process_document_files(document_files=(document_file,))
 
-                signal_post_document_file_file_metadata_processing.send(
-                    sender=document_file.__class__,
-                    instance=document_file
+    @classmethod
+    def process_document_files(cls, document_files):
+        """
+        Process several document files. The document files are grouped by
+        driver and each driver processes its group in a single batch.
+        Document files that a driver fails to process are passed to the
+        next driver registered for their MIME type.
+        """
+        drivers = {}
+        pending = [
+            (
+                document_file, cls.get_driver_classes(
+                    mimetype=document_file.mimetype
                 )
-
-                event_file_metadata_document_file_finish.commit(
-                    action_object=document_file.document,
-                    target=document_file
+            ) for document_file in document_files
+        ]
+
+        while pending:
+            driver_batches = {}
+
+            for document_file, driver_classes in pending:
+                if driver_classes:
+                    driver_batches.setdefault(driver_classes[0], []).append(
+                        (document_file, driver_classes[1:])
+                    )
+
+            pending = []
+
+            for driver_class, batch in driver_batches.items():
+                try:
+                    driver = drivers[driver_class]
+                except KeyError:
+                    driver = driver_class()
+                    driver.initialize()
+                    drivers[driver_class] = driver
+
+                document_files_failed = driver.process_many(
+                    document_files=[entry[0] for entry in batch]
                 )
 
-            except FileMetadataDriverError:
-                """If driver raises error, try next in the list."""
-            else:
-                # If driver was successful there is no need to try
-                # others in the list for this mimetype.
-                return
+                for document_file, driver_classes in batch:
+                    if document_file in document_files_failed:
+                        # If driver raises error, try next in the list.
+                        pending.append((document_file, driver_classes))
+                    else:
+                        # If driver was successful there is no need to
+                        # try others in the list for this mimetype.
+                        signal_post_document_file_file_metadata_processing.send(
+                            sender=document_file.__class__,
+                            instance=document_file
+                        )
+
+                        event_file_metadata_document_file_finish.commit(
+                            action_object=document_file.document,
+                            target=document_file
+                        )
 
     @classmethod
     def register(cls, mimetypes):
@@ -83,6 +119,31 @@ class FileMetadataDriver:
             'Starting processing document file: %s', document_file
         )
 
+        results = self._process(document_file=document_file)
+
+        self.store_results(document_file=document_file, results=results)
+
+    def process_many(self, document_files):
+        """
+        Process and store the results of several document files. Return
+        the list of document files that the driver failed to process.
+        """
+        logger.info(
+            'Starting processing %d document files', len(document_files)
+        )
+
+        results = self._process_many(document_files=document_files)
+
+        for document_file, document_file_results in results.items():
+            self.store_results(
+                document_file=document_file, results=document_file_results
+            )
+
+        return [
+            document_file for document_file in document_files if document_file not in results
+        ]
+
+    def store_results(self, document_file, results):
         self.driver_model.driver_entries.filter(
             document_file=document_file
         ).delete()
@@ -91,9 +152,7 @@ class FileMetadataDriver:
             document_file=document_file
         )
 
-        results = self._process(document_file=document_file) or {}
-
-        for key, value in results.items():
+        for key, value in (results or {}).items():
             document_file_driver_entry.entries.create(
                 key=key, value=value
             )
@@ -103,3 +162,25 @@ class FileMetadataDriver:
             'Your %s class has not defined the required '
             '_process() method.' % self.__class__.__name__
         )
+
+    def _process_many(self, document_files):
+        """
+        Return a dictionary of results keyed by document file. Document
+        files the driver fails to process are not included. Drivers able
+        to process several document files at once should override this
+        method.
+        """
+        result = {}
+
+        for document_file in document_files:
+            try:
+                result[document_file] = self._process(
+                    document_file=document_file
+                )
+            except FileMetadataDriverError as exception:
+                logger.debug(
+                    'Driver %s unable to process document file: %s; %s',
+                    self.get_driver_path(), document_file, exception
+                )
+
+        return result
@@ -1,20 +1,169 @@
+import atexit
+from contextlib import contextmanager
 import json
 import logging
+import os
 from pathlib import Path
+import subprocess
+import threading
 
 import sh
 
+from django.utils.encoding import force_bytes, force_text
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
-from ..literals import DEFAULT_EXIF_PATH
 from ..classes import FileMetadataDriver
+from ..exceptions import FileMetadataDriverError
+from ..literals import (
+    DEFAULT_EXIF_PATH, DEFAULT_EXIF_STAY_OPEN, DEFAULT_EXIF_WORKER_POOL_SIZE,
+    EXIF_WORKER_STOP_TIMEOUT
+)
 from ..settings import setting_drivers_arguments
 
 logger = logging.getLogger(name=__name__)
 
 
+class EXIFToolWorker:
+    """
+    Long lived exiftool process in batch mode. The arguments of each
+    command are written to the standard input of the process, one per
+    line, and the output of the command is read until the ready marker
+    of the command is found. Workers are pooled per process and per
+    exiftool path to avoid paying the start up time of exiftool for each
+    file.
+    """
+    _condition = threading.Condition()
+    _registry = {}
+    _worker_counts = {}
+
+    @classmethod
+    @contextmanager
+    def get(cls, exiftool_path, pool_size):
+        # Workers are not shared with forked processes.
+        key = (os.getpid(), exiftool_path)
+        worker = None
+
+        with cls._condition:
+            while True:
+                idle_workers = cls._registry.setdefault(key, [])
+
+                if idle_workers:
+                    worker = idle_workers.pop()
+
+                    if not worker.is_running():
+                        # Replace a worker whose process exited while
+                        # idle, keeping its place in the pool.
+                        worker.stop()
+                        worker = None
+
+                    break
+                elif cls._worker_counts.get(key, 0) < pool_size:
+                    cls._worker_counts[key] = cls._worker_counts.get(key, 0) + 1
+                    break
+                else:
+                    cls._condition.wait()
+
+        try:
+            if not worker:
+                worker = cls(exiftool_path=exiftool_path)
+
+            yield worker
+        finally:
+            with cls._condition:
+                if worker and worker.is_running():
+                    cls._registry[key].append(worker)
+                else:
+                    cls._worker_counts[key] -= 1
+
+                cls._condition.notify()
+
+    @classmethod
+    def stop_all(cls):
+        with cls._condition:
+            for key, workers in cls._registry.items():
+                if key[0] == os.getpid():
+                    for worker in workers:
+                        worker.stop()
+
+            cls._registry.clear()
+            cls._worker_counts.clear()
+
+    def __init__(self, exiftool_path):
+        self.command_count = 0
+        self.exiftool_path = exiftool_path
+        self.process = subprocess.Popen(
+            args=(exiftool_path, '-stay_open', 'True', '-@', '-'),
+            stderr=subprocess.DEVNULL, stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+
+    def execute(self, *args):
+        """
+        Execute a command and return its standard output. The worker is
+        stopped if the command can't be completed, leaving the process in
+        an unknown state.
+        """
+        for argument in args:
+            if '\n' in argument:
+                raise FileMetadataDriverError(
+                    'Invalid exiftool argument: {}'.format(argument)
+                )
+
+        self.command_count += 1
+        ready_marker = '{{ready{}}}'.format(self.command_count)
+
+        try:
+            self.process.stdin.write(
+                force_bytes(
+                    s='\n'.join(
+                        args + ('-execute{}'.format(self.command_count),)
+                    ) + '\n'
+                )
+            )
+            self.process.stdin.flush()
+
+            output = []
+
+            while True:
+                line = self.process.stdout.readline()
+
+                if not line:
+                    raise FileMetadataDriverError(
+                        'exiftool worker exited unexpectedly.'
+                    )
+
+                if line.rstrip() == force_bytes(s=ready_marker):
+                    break
+
+                output.append(line)
+        except Exception:
+            self.stop()
+            raise
+
+        return b''.join(output)
+
+    def is_running(self):
+        return self.process.poll() is None
+
+    def stop(self):
+        if self.is_running():
+            try:
+                self.process.stdin.write(b'-stay_open\nFalse\n')
+                self.process.stdin.flush()
+                self.process.wait(timeout=EXIF_WORKER_STOP_TIMEOUT)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+        self.process.stdin.close()
+        self.process.stdout.close()
+
+
+atexit.register(EXIFToolWorker.stop_all)
+
+
 class EXIFToolDriver(FileMetadataDriver):
     label = _('EXIF Tool')
     internal_name = 'exiftool'
@@ -33,41 +182,139 @@ class EXIFToolDriver(FileMetadataDriver):
                 self.command_exiftool = self.command_exiftool.bake('-j')
 
     def _process(self, document_file):
-        if self.command_exiftool:
-            temporary_folder = mkdtemp()
-            path_temporary_file = Path(temporary_folder, document_file.document.label)
+        result = self._process_many(document_files=(document_file,))
+
+        if self.command_exiftool and document_file not in result:
+            raise FileMetadataDriverError(
+                'Unable to process document file: {}'.format(document_file)
+            )
+
+        return result.get(document_file)
+
+    def _process_many(self, document_files):
+        result = {}
+
+        if not self.command_exiftool:
+            for document_file in document_files:
+                logger.warning(
+                    'EXIFTool binary not found, not processing document '
+                    'file: %s', document_file
+                )
+
+            return result
+
+        temporary_folders = []
+
+        try:
+            document_file_paths = {}
+
+            for document_file in document_files:
+                try:
+                    temporary_folder = mkdtemp()
+                    temporary_folders.append(temporary_folder)
+
+                    # Keep the document label as the file name reported by
+                    # exiftool. Arguments are passed to exiftool one per
+                    # line and stripped of surrounding white space.
+                    path_temporary_file = Path(
+                        temporary_folder,
+                        ' '.join(document_file.document.label.split())
+                    )
+
+                    with path_temporary_file.open(mode='xb') as temporary_fileobject:
+                        document_file.save_to_file(
+                            file_object=temporary_fileobject
+                        )
+                except Exception as exception:
+                    logger.error(
+                        'Error copying document file: %s; %s',
+                        document_file, exception, exc_info=True
+                    )
+                else:
+                    document_file_paths[str(path_temporary_file)] = document_file
 
             try:
-                with path_temporary_file.open(mode='xb') as temporary_fileobject:
-                    document_file.save_to_file(file_object=temporary_fileobject)
-                    temporary_fileobject.seek(0)
-                    try:
-                        result = self.command_exiftool(temporary_fileobject.name)
-                    except sh.ErrorReturnCode_1 as exception:
-                        result = json.loads(s=exception.stdout)[0]
-                        if result.get('Error', '') == 'Unknown file type':
-                            # Not a fatal error
-                            return result
-                    else:
-                        return json.loads(s=result.stdout)[0]
+                entries = self.get_file_metadata(
+                    paths=list(document_file_paths)
+                )
             except Exception as exception:
-                logger.error(
-                    'Error processing document file: %s; %s',
-                    document_file, exception, exc_info=True
+                # The output of the whole command is lost and the worker
+                # is stopped. Process the files one at a time with a new
+                # worker to keep the results of the files that don't
+                # cause the error.
+                logger.warning(
+                    'Error processing document files: %s; %s. Processing '
+                    'them one at a time.',
+                    ', '.join(map(str, document_file_paths.values())),
+                    exception
                 )
-                raise
-            finally:
-                fs_cleanup(filename=str(path_temporary_file))
+
+                entries = []
+
+                for path, document_file in document_file_paths.items():
+                    try:
+                        entries.extend(self.get_file_metadata(paths=(path,)))
+                    except Exception as exception:
+                        logger.error(
+                            'Error processing document file: %s; %s',
+                            document_file, exception, exc_info=True
+                        )
+
+            for entry in entries:
+                document_file = document_file_paths.get(
+                    entry.get('SourceFile')
+                )
+                if document_file:
+                    error = entry.get('Error')
+                    if error and error != 'Unknown file type':
+                        # Unknown file types are not a fatal error, other
+                        # errors leave the document file without entries.
+                        logger.warning(
+                            'Error processing document file: %s; %s',
+                            document_file, error
+                        )
+                        entry = None
+
+                    result[document_file] = entry
+        finally:
+            for temporary_folder in temporary_folders:
+                fs_cleanup(filename=temporary_folder)
+
+        return result
+
+    def get_file_metadata(self, paths):
+        """
+        Return the list of file metadata of several files. Each entry
+        includes the path of its file as the `SourceFile` key.
+        """
+        if self.stay_open:
+            with EXIFToolWorker.get(exiftool_path=self.exiftool_path, pool_size=self.worker_pool_size) as worker:
+                output = worker.execute('-j', *paths)
         else:
-            logger.warning(
-                'EXIFTool binary not found, not processing document '
-                'file: %s', document_file
-            )
+            try:
+                output = self.command_exiftool(*paths).stdout
+            except sh.ErrorReturnCode_1 as exception:
+                output = exception.stdout
+
+        if output:
+            return json.loads(s=force_text(s=output))
+        else:
+            return []
 
     def read_settings(self):
-        self.exiftool_path = setting_drivers_arguments.value.get(
+        driver_arguments = setting_drivers_arguments.value.get(
             'exif_driver', {}
-        ).get('exiftool_path', DEFAULT_EXIF_PATH)
+        )
+
+        self.exiftool_path = driver_arguments.get(
+            'exiftool_path', DEFAULT_EXIF_PATH
+        )
+        self.stay_open = driver_arguments.get(
+            'stay_open', DEFAULT_EXIF_STAY_OPEN
+        )
+        self.worker_pool_size = driver_arguments.get(
+            'worker_pool_size', DEFAULT_EXIF_WORKER_POOL_SIZE
+        )
 
 
 EXIFToolDriver.register(mimetypes=('*',))
@@ -5,6 +5,13 @@ if platform.system() in ('FreeBSD', 'OpenBSD', 'Darwin'):
 else:
     DEFAULT_EXIF_PATH = '/usr/bin/exiftool'
 
+DEFAULT_EXIF_STAY_OPEN = True
+DEFAULT_EXIF_WORKER_POOL_SIZE = 2
+
+DOCUMENT_FILE_PROCESS_BATCH_SIZE = 20
+
+EXIF_WORKER_STOP_TIMEOUT = 10
+
 LOCK_EXPIRE = 60 * 10  # Adjust to worst case scenario
 
 DEFAULT_FILE_METADATA_AUTO_PROCESS = True
@@ -37,3 +37,36 @@ def task_process_document_file(document_file_id):
             )
         finally:
             lock.release()
+
+
+@app.task(ignore_result=True)
+def task_process_document_files(document_file_id_list):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    document_files = []
+    locks = []
+
+    try:
+        for document_file in DocumentFile.objects.filter(pk__in=document_file_id_list):
+            lock_id = 'task_process_document_file-%d' % document_file.pk
+            try:
+                # Acquire lock to avoid processing the same document file
+                # more than once concurrently
+                locks.append(
+                    LockingBackend.get_backend().acquire_lock(
+                        name=lock_id, timeout=LOCK_EXPIRE
+                    )
+                )
+            except LockError:
+                logger.debug('unable to obtain lock: %s' % lock_id)
+            else:
+                document_files.append(document_file)
+
+        FileMetadataDriver.process_document_files(
+            document_files=document_files
+        )
+    finally:
+        for lock in locks:
+            lock.release()
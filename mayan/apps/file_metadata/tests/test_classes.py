@@ -1,5 +1,14 @@
+import mock
+
+from django.test import override_settings
+
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import TEST_PDF_DOCUMENT_FILENAME
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from ..classes import FileMetadataDriver
+from ..drivers.exiftool import EXIFToolDriver, EXIFToolWorker
+from ..exceptions import FileMetadataDriverError
 
 from .literals import (
     TEST_PDF_FILE_METADATA_DOTTED_NAME, TEST_PDF_FILE_METADATA_VALUE
@@ -9,9 +18,91 @@ from .literals import (
 class EXIFToolDriverTestCase(GenericDocumentTestCase):
     test_document_filename = TEST_PDF_DOCUMENT_FILENAME
 
+    def tearDown(self):
+        SettingNamespace.invalidate_cache_all()
+        super().tearDown()
+
     def test_driver_entries(self):
         self.test_document.submit_for_file_metadata_processing()
         value = self.test_document.get_file_metadata(
             dotted_name=TEST_PDF_FILE_METADATA_DOTTED_NAME
         )
         self.assertEqual(value, TEST_PDF_FILE_METADATA_VALUE)
+
+    @override_settings(
+        FILE_METADATA_DRIVERS_ARGUMENTS={'exif_driver': {'stay_open': False}}
+    )
+    def test_driver_entries_stay_open_disabled(self):
+        SettingNamespace.invalidate_cache_all()
+
+        self.test_document.submit_for_file_metadata_processing()
+        value = self.test_document.get_file_metadata(
+            dotted_name=TEST_PDF_FILE_METADATA_DOTTED_NAME
+        )
+        self.assertEqual(value, TEST_PDF_FILE_METADATA_VALUE)
+
+    def test_process_document_files(self):
+        self._upload_test_document()
+
+        for document in self.test_documents:
+            document.file_latest.file_metadata_drivers.all().delete()
+
+        FileMetadataDriver.process_document_files(
+            document_files=[
+                document.file_latest for document in self.test_documents
+            ]
+        )
+
+        for document in self.test_documents:
+            value = document.get_file_metadata(
+                dotted_name=TEST_PDF_FILE_METADATA_DOTTED_NAME
+            )
+            self.assertEqual(value, TEST_PDF_FILE_METADATA_VALUE)
+
+    def test_process_document_files_batch_error(self):
+        self._upload_test_document()
+
+        driver = EXIFToolDriver()
+        execute = EXIFToolWorker.execute
+        path_list_executed = []
+
+        def mock_execute(worker, *args):
+            path_list_executed.append(args[1:])
+
+            if len(args) > 2:
+                worker.stop()
+                raise FileMetadataDriverError
+
+            return execute(worker, *args)
+
+        with mock.patch.object(EXIFToolWorker, 'execute', autospec=True, side_effect=mock_execute):
+            result = driver._process_many(
+                document_files=[
+                    document.file_latest for document in self.test_documents
+                ]
+            )
+
+        self.assertEqual(len(path_list_executed), len(self.test_documents) + 1)
+        self.assertEqual(len(result), len(self.test_documents))
+
+    def test_worker_replace_stopped(self):
+        driver = EXIFToolDriver()
+
+        with EXIFToolWorker.get(exiftool_path=driver.exiftool_path, pool_size=1) as worker:
+            pass
+
+        worker.process.kill()
+        worker.process.wait()
+
+        with EXIFToolWorker.get(exiftool_path=driver.exiftool_path, pool_size=1) as worker_second:
+            self.assertNotEqual(worker, worker_second)
+            self.assertTrue(worker_second.is_running())
+
+    def test_worker_reuse(self):
+        driver = EXIFToolDriver()
+
+        with EXIFToolWorker.get(exiftool_path=driver.exiftool_path, pool_size=1) as worker:
+            self.assertTrue(worker.is_running())
+
+        with EXIFToolWorker.get(exiftool_path=driver.exiftool_path, pool_size=1) as worker_second:
+            self.assertEqual(worker, worker_second)
@@ -2,3 +2,5 @@ REDIS_LOCK_NAME_PREFIX = '_mayan_lock:'
 REDIS_LOCK_VERSION_REQUIRED = (3, 3)
 REDIS_SCAN_KEYS_COUNT = 5000
 REDIS_USE_CONNECTION_POOL = True
+
+DEFAULT_SHARDED_FILE_LOCK_SHARD_COUNT = 256
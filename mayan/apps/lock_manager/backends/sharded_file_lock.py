@@ -0,0 +1,141 @@
+from contextlib import contextmanager
+import hashlib
+import logging
+import json
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.files import locks
+from django.utils.encoding import force_bytes, force_text
+
+from mayan.apps.storage.settings import setting_temporary_directory
+
+from ..exceptions import LockError
+from ..settings import setting_backend_arguments
+
+from .base import LockingBackend
+from .literals import DEFAULT_SHARDED_FILE_LOCK_SHARD_COUNT
+
+logger = logging.getLogger(name=__name__)
+
+
+class ShardedFileLock(LockingBackend):
+    """
+    File lock backend that distributes the locks among several shard files
+    using the hash of the lock name. Acquiring or releasing a lock only
+    reads and rewrites the shard file of the lock and only waits for the
+    operations on the same shard. Expired locks are removed from a shard
+    the next time the shard is written.
+    """
+    @classmethod
+    def _acquire_lock(cls, name, timeout):
+        return ShardedFileLock(name=name, timeout=timeout)
+
+    @classmethod
+    def _initialize(cls):
+        cls.shard_count = setting_backend_arguments.value.get(
+            'shard_count', DEFAULT_SHARDED_FILE_LOCK_SHARD_COUNT
+        )
+        cls.lock_directory = os.path.join(
+            setting_temporary_directory.value, '{}_locks'.format(
+                hashlib.sha256(
+                    force_bytes(s=settings.SECRET_KEY)
+                ).hexdigest()
+            )
+        )
+        os.makedirs(cls.lock_directory, exist_ok=True)
+
+        # File locks are held per process, the shard thread locks
+        # serialize the threads of the same process.
+        cls.shard_thread_locks = [
+            threading.Lock() for index in range(cls.shard_count)
+        ]
+        logger.debug('lock_directory: %s', cls.lock_directory)
+
+    @classmethod
+    def _purge_locks(cls):
+        for index in range(cls.shard_count):
+            with cls._open_shard(index=index) as shard_locks:
+                shard_locks.clear()
+
+    @classmethod
+    def get_shard_index(cls, name):
+        return int(
+            hashlib.sha256(force_bytes(s=name)).hexdigest()[:8], 16
+        ) % cls.shard_count
+
+    @classmethod
+    @contextmanager
+    def _open_shard(cls, index):
+        """
+        Yield the dictionary of locks of a shard. The shard file is
+        rewritten only when the dictionary is changed.
+        """
+        shard_file = os.path.join(
+            cls.lock_directory, '{:04x}'.format(index)
+        )
+
+        with cls.shard_thread_locks[index]:
+            file_descriptor = os.open(shard_file, os.O_RDWR | os.O_CREAT)
+
+            with open(file=file_descriptor, mode='r+') as file_object:
+                locks.lock(f=file_object, flags=locks.LOCK_EX)
+
+                data = file_object.read()
+
+                if data:
+                    shard_locks = json.loads(s=data)
+                else:
+                    shard_locks = {}
+
+                shard_locks_original = dict(shard_locks)
+
+                yield shard_locks
+
+                if shard_locks != shard_locks_original:
+                    file_object.seek(0)
+                    file_object.truncate()
+                    file_object.write(json.dumps(obj=shard_locks))
+
+    def _get_lock_dictionary(self):
+        if self.timeout:
+            result = {
+                'expiration': time.time() + self.timeout,
+                'uuid': self.uuid
+            }
+        else:
+            result = {
+                'expiration': 0,
+                'uuid': self.uuid
+            }
+
+        return result
+
+    def _init(self, name, timeout):
+        self.name = name
+        self.timeout = timeout
+        self.uuid = force_text(s=uuid.uuid4())
+
+        with self.__class__._open_shard(index=self.__class__.get_shard_index(name=name)) as shard_locks:
+            now = time.time()
+
+            for lock_name, lock_dictionary in list(shard_locks.items()):
+                if lock_dictionary['expiration'] and now > lock_dictionary['expiration']:
+                    shard_locks.pop(lock_name)
+
+            if name in shard_locks:
+                # Someone already got this lock and it has not expired.
+                raise LockError
+
+            shard_locks[name] = self._get_lock_dictionary()
+
+    def _release(self):
+        with self.__class__._open_shard(index=self.__class__.get_shard_index(name=self.name)) as shard_locks:
+            if shard_locks.get(self.name, {}).get('uuid') == self.uuid:
+                shard_locks.pop(self.name)
+            else:
+                # Lock expired and someone else acquired or released it
+                pass
@@ -1,3 +1,12 @@
+BENCHMARK_LOCK_NAME_HELD_TEMPLATE = '_mayan_benchmark_held_lock_{}'
+BENCHMARK_LOCK_NAME_TEMPLATE = '_mayan_benchmark_lock_{}'
+BENCHMARK_LOCK_TIMEOUT = 300
+
+DEFAULT_BENCHMARK_HELD_LOCK_COUNT = 1000
+DEFAULT_BENCHMARK_ITERATION_COUNT = 1000
+DEFAULT_BENCHMARK_LOCK_NAME_COUNT = 16
+DEFAULT_BENCHMARK_PROCESS_COUNT = 4
+
 DEFAULT_LOCK_MANAGER_BACKEND = 'mayan.apps.lock_manager.backends.file_lock.FileLock'
 DEFAULT_LOCK_MANAGER_BACKEND_ARGUMENTS = {}
 DEFAULT_LOCK_MANAGER_DEFAULT_LOCK_TIMEOUT = 30
@@ -0,0 +1,137 @@
+import multiprocessing
+import time
+
+from django.core import management
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from ...exceptions import LockError
+from ...literals import (
+    BENCHMARK_LOCK_NAME_HELD_TEMPLATE, BENCHMARK_LOCK_NAME_TEMPLATE,
+    BENCHMARK_LOCK_TIMEOUT, DEFAULT_BENCHMARK_HELD_LOCK_COUNT,
+    DEFAULT_BENCHMARK_ITERATION_COUNT, DEFAULT_BENCHMARK_LOCK_NAME_COUNT,
+    DEFAULT_BENCHMARK_PROCESS_COUNT
+)
+from ...settings import setting_backend
+
+
+def benchmark_process(
+    backend_path, iteration_count, lock_name_count, process_index,
+    result_queue
+):
+    backend = import_string(dotted_path=backend_path)
+
+    acquired_count = 0
+    contended_count = 0
+
+    for iteration in range(iteration_count):
+        name = BENCHMARK_LOCK_NAME_TEMPLATE.format(
+            (process_index + iteration) % lock_name_count
+        )
+
+        try:
+            lock = backend.acquire_lock(
+                name=name, timeout=BENCHMARK_LOCK_TIMEOUT
+            )
+        except LockError:
+            contended_count += 1
+        else:
+            acquired_count += 1
+            lock.release()
+
+    connections.close_all()
+    result_queue.put((acquired_count, contended_count))
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the rate at which several processes acquire and release '
+        'locks of a lock backend while other locks are held.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backend', action='store', dest='backend',
+            help='Dotted path of the lock backend. Defaults to the '
+            'LOCK_MANAGER_BACKEND setting.'
+        )
+        parser.add_argument(
+            '--held-locks', action='store', dest='held_lock_count',
+            default=DEFAULT_BENCHMARK_HELD_LOCK_COUNT, type=int,
+            help='Number of locks held during the benchmark.'
+        )
+        parser.add_argument(
+            '--iterations', action='store', dest='iteration_count',
+            default=DEFAULT_BENCHMARK_ITERATION_COUNT, type=int,
+            help='Number of locks acquired and released by each process.'
+        )
+        parser.add_argument(
+            '--lock-names', action='store', dest='lock_name_count',
+            default=DEFAULT_BENCHMARK_LOCK_NAME_COUNT, type=int,
+            help='Number of different lock names the processes compete '
+            'for.'
+        )
+        parser.add_argument(
+            '--processes', action='store', dest='process_count',
+            default=DEFAULT_BENCHMARK_PROCESS_COUNT, type=int,
+            help='Number of processes acquiring and releasing locks.'
+        )
+
+    def handle(self, *args, **options):
+        backend_path = options['backend'] or setting_backend.value
+        backend = import_string(dotted_path=backend_path)
+
+        held_locks = [
+            backend.acquire_lock(
+                name=BENCHMARK_LOCK_NAME_HELD_TEMPLATE.format(index),
+                timeout=BENCHMARK_LOCK_TIMEOUT
+            ) for index in range(options['held_lock_count'])
+        ]
+
+        # Database connections must not be shared with the processes.
+        connections.close_all()
+
+        result_queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                kwargs={
+                    'backend_path': backend_path,
+                    'iteration_count': options['iteration_count'],
+                    'lock_name_count': options['lock_name_count'],
+                    'process_index': process_index,
+                    'result_queue': result_queue
+                }, target=benchmark_process
+            ) for process_index in range(options['process_count'])
+        ]
+
+        time_start = time.perf_counter()
+
+        for process in processes:
+            process.start()
+
+        results = [result_queue.get() for process in processes]
+
+        time_elapsed = time.perf_counter() - time_start
+
+        for process in processes:
+            process.join()
+
+        for lock in held_locks:
+            lock.release()
+
+        acquired_count = sum(result[0] for result in results)
+        contended_count = sum(result[1] for result in results)
+        operation_count = acquired_count + contended_count
+
+        self.stdout.write(
+            'Backend: {}\n'
+            'Processes: {}, held locks: {}, lock names: {}\n'
+            'Acquired: {}, contended: {}\n'
+            'Elapsed time: {:.3f} seconds, {:.1f} operations per '
+            'second'.format(
+                backend_path, options['process_count'],
+                options['held_lock_count'], options['lock_name_count'],
+                acquired_count, contended_count, time_elapsed,
+                operation_count / time_elapsed
+            )
+        )
@@ -4,6 +4,9 @@ from django.test import override_settings
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..exceptions import LockError
+
+from .literals import TEST_LOCK_1
 from .mixins import (
     LockBackendTestCaseMixin, LockBackendTestMixin, DefaultTimeoutTestMixin
 )
@@ -23,6 +26,36 @@ class ModelLockBackendTestCase(
     backend_string = 'mayan.apps.lock_manager.backends.model_lock.ModelLock'
 
 
+class ShardedFileLockBackendTestCase(
+    LockBackendTestMixin, LockBackendTestCaseMixin, DefaultTimeoutTestMixin,
+    BaseTestCase
+):
+    backend_string = 'mayan.apps.lock_manager.backends.sharded_file_lock.ShardedFileLock'
+
+    def test_shard_isolation(self):
+        lock_1 = self.locking_backend.acquire_lock(name=TEST_LOCK_1)
+
+        # Locks stored in the same shard are still independent.
+        shard_index = self.locking_backend.get_shard_index(name=TEST_LOCK_1)
+        index = 0
+        while True:
+            name = '{}_{}'.format(TEST_LOCK_1, index)
+            if self.locking_backend.get_shard_index(name=name) == shard_index:
+                break
+
+            index += 1
+
+        lock_2 = self.locking_backend.acquire_lock(name=name)
+
+        lock_1.release()
+
+        with self.assertRaises(expected_exception=LockError):
+            self.locking_backend.acquire_lock(name=name)
+
+        # Cleanup
+        lock_2.release()
+
+
 @skip('Skip until a Mock Redis server class is added.')
 @override_settings(
     LOCK_MANAGER_BACKEND_ARGUMENTS={'redis_url': 'redis://127.0.0.1:6379/0'}
@@ -1,9 +1,13 @@
+from io import StringIO
 from unittest import skip
 
+from django.core import management
 from django.test import override_settings
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..literals import BENCHMARK_LOCK_NAME_HELD_TEMPLATE
+
 from .mixins import (
     LockBackendManagementCommandTestCaseMixin, LockBackendTestMixin
 )
@@ -23,6 +27,31 @@ class ModelLockBackendManagementCommandTestCase(
     backend_string = 'mayan.apps.lock_manager.backends.model_lock.ModelLock'
 
 
+class ShardedFileLockBackendManagementCommandTestCase(
+    LockBackendTestMixin, LockBackendManagementCommandTestCaseMixin,
+    BaseTestCase
+):
+    backend_string = 'mayan.apps.lock_manager.backends.sharded_file_lock.ShardedFileLock'
+
+    def test_benchmarklocks_command(self):
+        stdout = StringIO()
+        management.call_command(
+            backend=self.backend_string, command_name='benchmarklocks',
+            held_lock_count=10, iteration_count=10, process_count=2,
+            stdout=stdout
+        )
+
+        self.assertTrue('Acquired: 20' in stdout.getvalue())
+
+        # Held locks are released after the benchmark.
+        lock = self.locking_backend.acquire_lock(
+            name=BENCHMARK_LOCK_NAME_HELD_TEMPLATE.format(0)
+        )
+
+        # Cleanup
+        lock.release()
+
+
 @skip('Skip until a Mock Redis server class is added.')
 @override_settings(
     LOCK_MANAGER_BACKEND_ARGUMENTS={'redis_url': 'redis://127.0.0.1:6379/0'}
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from .models import StatisticResult
+from .models import (
+    StatisticResult, StatisticRollupEntry, StatisticRollupWatermark
+)
 
 
 @admin.register(StatisticResult)
@@ -8,3 +10,14 @@ class StatisticResultAdmin(admin.ModelAdmin):
     list_display = (
         'slug', 'datetime', 'serialize_data'
     )
+
+
+@admin.register(StatisticRollupEntry)
+class StatisticRollupEntryAdmin(admin.ModelAdmin):
+    list_display = ('slug', 'date', 'value', 'pending_value')
+    list_filter = ('slug',)
+
+
+@admin.register(StatisticRollupWatermark)
+class StatisticRollupWatermarkAdmin(admin.ModelAdmin):
+    list_display = ('slug', 'value', 'datetime')
@@ -1,10 +1,15 @@
+from django.apps import apps
+from django.db.models.signals import pre_delete
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
 from mayan.apps.common.menus import menu_object, menu_secondary, menu_tools
 from mayan.apps.navigation.classes import SourceColumn
 
-from .classes import StatisticLineChart, StatisticNamespace
+from .classes import (
+    StatisticLineChart, StatisticNamespace, StatisticRollup
+)
+from .handlers import handler_factory_statistic_rollup_remove_instance
 from .links import (
     link_execute, link_namespace_details, link_namespace_list,
     link_statistics, link_view
@@ -53,3 +58,17 @@ class StatisticsApp(MayanAppConfig):
             sources=(StatisticNamespace, 'statistics:namespace_list')
         )
         menu_tools.bind_links(links=(link_statistics,))
+
+        # Connect to the proxies too, since deleting a proxy instance, like
+        # a trashed document, sends the signal for the proxy model.
+        for rollup in StatisticRollup.get_all():
+            for model in apps.get_models():
+                if model._meta.concrete_model == rollup.get_model():
+                    pre_delete.connect(
+                        dispatch_uid='statistics_handler_statistic_rollup_remove_instance_{}_{}'.format(
+                            rollup.slug, model._meta.label
+                        ),
+                        receiver=handler_factory_statistic_rollup_remove_instance(
+                            rollup=rollup
+                        ), sender=model, weak=False
+                    )
@@ -1,4 +1,9 @@
+import logging
+
 from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import TruncDate, TruncMonth
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -6,8 +11,271 @@ from celery.schedules import crontab
 
 from mayan.celery import app
 
+from .literals import (
+    STATISTIC_ROLLUP_SCAN_BATCH_SIZE, STATISTIC_ROLLUP_WATERMARK_HOLD_BACK
+)
 from .renderers import ChartJSLine
 
+logger = logging.getLogger(name=__name__)
+
+
+class StatisticRollup:
+    """
+    Per day count of the rows of a model. The counts are updated
+    incrementally by scanning the rows added since the last update, using
+    the primary key as the watermark. Rows are counted on the date of the
+    date field.
+    The watermark is held back from the newest rows to count the rows of
+    transactions that commit after rows with higher primary keys. The rows
+    above the watermark and the counted rows matching `exclude_filter`,
+    like the rows of documents in the trash, are counted again on each
+    update as the pending value of the entries. Deleted rows are
+    subtracted from the counts by a pre_delete handler.
+    """
+    _registry = {}
+
+    @classmethod
+    def get(cls, slug):
+        return cls._registry[slug]
+
+    @classmethod
+    def get_all(cls):
+        return list(cls._registry.values())
+
+    def __init__(
+        self, slug, app_label, model_name, date_field, exclude_filter=None,
+        manager_name='objects'
+    ):
+        self.app_label = app_label
+        self.date_field = date_field
+        self.exclude_filter = exclude_filter or {}
+        self.manager_name = manager_name
+        self.model_name = model_name
+        self.slug = slug
+        self.__class__._registry[slug] = self
+
+    def __str__(self):
+        return force_text(s=self.slug)
+
+    def _get_date_counts(self, queryset):
+        return queryset.annotate(
+            rollup_date=TruncDate(self.date_field)
+        ).order_by().values('rollup_date').annotate(
+            rollup_count=Count('pk')
+        )
+
+    def _get_watermark(self):
+        """
+        Return the watermark locked for update to serialize concurrent
+        updates. Must be called inside a transaction.
+        """
+        StatisticRollupWatermark = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupWatermark'
+        )
+
+        StatisticRollupWatermark.objects.get_or_create(slug=self.slug)
+        return StatisticRollupWatermark.objects.select_for_update().get(
+            slug=self.slug
+        )
+
+    def _update_entry(self, date, field_name, value):
+        StatisticRollupEntry = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupEntry'
+        )
+
+        updated = StatisticRollupEntry.objects.filter(
+            date=date, slug=self.slug
+        ).update(**{field_name: F(field_name) + value})
+
+        if not updated:
+            StatisticRollupEntry.objects.create(
+                date=date, slug=self.slug, **{field_name: value}
+            )
+
+    def _update_batch(self, primary_key_maximum):
+        with transaction.atomic():
+            watermark = self._get_watermark()
+
+            if watermark.value >= primary_key_maximum:
+                return False
+
+            primary_key_end = min(
+                watermark.value + STATISTIC_ROLLUP_SCAN_BATCH_SIZE,
+                primary_key_maximum
+            )
+
+            queryset = self._get_date_counts(
+                queryset=self.get_queryset().filter(
+                    pk__gt=watermark.value, pk__lte=primary_key_end
+                )
+            )
+
+            for entry in queryset:
+                self._update_entry(
+                    date=entry['rollup_date'], field_name='value',
+                    value=entry['rollup_count']
+                )
+
+            watermark.value = primary_key_end
+            watermark.save()
+
+        return True
+
+    def _update_pending(self):
+        StatisticRollupEntry = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupEntry'
+        )
+
+        with transaction.atomic():
+            watermark = self._get_watermark()
+
+            StatisticRollupEntry.objects.filter(slug=self.slug).exclude(
+                pending_value=0
+            ).update(pending_value=0)
+
+            queryset_pending = self.get_queryset().filter(
+                pk__gt=watermark.value
+            )
+
+            if self.exclude_filter:
+                queryset_pending = queryset_pending.exclude(
+                    **self.exclude_filter
+                )
+
+            for entry in self._get_date_counts(queryset=queryset_pending):
+                self._update_entry(
+                    date=entry['rollup_date'], field_name='pending_value',
+                    value=entry['rollup_count']
+                )
+
+            if self.exclude_filter:
+                queryset_excluded = self.get_queryset().filter(
+                    pk__lte=watermark.value, **self.exclude_filter
+                )
+
+                for entry in self._get_date_counts(queryset=queryset_excluded):
+                    self._update_entry(
+                        date=entry['rollup_date'],
+                        field_name='pending_value',
+                        value=-entry['rollup_count']
+                    )
+
+    def get_model(self):
+        return apps.get_model(
+            app_label=self.app_label, model_name=self.model_name
+        )
+
+    def get_monthly_values(self, year):
+        """
+        Return a dictionary of the counts of each month of a year.
+        """
+        StatisticRollupEntry = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupEntry'
+        )
+
+        queryset = StatisticRollupEntry.objects.filter(
+            date__year=year, slug=self.slug
+        ).annotate(month=TruncMonth('date')).order_by().values(
+            'month'
+        ).annotate(total=Sum('value') + Sum('pending_value'))
+
+        return {
+            entry['month'].month: entry['total'] for entry in queryset
+        }
+
+    def get_queryset(self):
+        return getattr(self.get_model(), self.manager_name).all()
+
+    def get_total(self, date_after=None, date_before=None):
+        """
+        Return the count of the rows created on or after date_after and
+        before date_before.
+        """
+        StatisticRollupEntry = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupEntry'
+        )
+
+        queryset = StatisticRollupEntry.objects.filter(slug=self.slug)
+
+        if date_after:
+            queryset = queryset.filter(date__gte=date_after)
+
+        if date_before:
+            queryset = queryset.filter(date__lt=date_before)
+
+        return queryset.aggregate(
+            total=Sum('value') + Sum('pending_value')
+        )['total'] or 0
+
+    def rebuild(self):
+        """
+        Discard the counts and scan all the rows again.
+        """
+        StatisticRollupEntry = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupEntry'
+        )
+        StatisticRollupWatermark = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticRollupWatermark'
+        )
+
+        with transaction.atomic():
+            StatisticRollupWatermark.objects.filter(slug=self.slug).delete()
+            StatisticRollupEntry.objects.filter(slug=self.slug).delete()
+
+        self.update()
+
+    def remove_instance(self, instance):
+        """
+        Subtract a row from the counts if it was already counted. Must be
+        called before the row is deleted, to resolve its date with the same
+        query used to count it, and in the transaction deleting it.
+        """
+        with transaction.atomic():
+            watermark = self._get_watermark()
+
+            # Rows above the watermark are only part of the pending value,
+            # which is counted again on each update.
+            if instance.pk > watermark.value:
+                return
+
+            queryset = self._get_date_counts(
+                queryset=self.get_queryset().filter(pk=instance.pk)
+            )
+
+            for entry in queryset:
+                self._update_entry(
+                    date=entry['rollup_date'], field_name='value',
+                    value=-entry['rollup_count']
+                )
+
+    def update(self):
+        """
+        Add the rows created since the last update to the counts. Large
+        deltas are scanned in batches of primary keys, each committed
+        independently. The newest rows and the excluded rows are counted
+        again as the pending value.
+        """
+        primary_key_maximum = self.get_queryset().aggregate(
+            primary_key_maximum=Max('pk')
+        )['primary_key_maximum'] or 0
+
+        primary_key_watermark = max(
+            primary_key_maximum - STATISTIC_ROLLUP_WATERMARK_HOLD_BACK, 0
+        )
+
+        logger.debug(
+            'Updating statistic rollup: %s up to primary key: %d', self.slug,
+            primary_key_watermark
+        )
+
+        has_rows = True
+        while has_rows:
+            has_rows = self._update_batch(
+                primary_key_maximum=primary_key_watermark
+            )
+
+        self._update_pending()
+
 
 class StatisticNamespace:
     _registry = {}
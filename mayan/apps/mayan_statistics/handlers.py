@@ -0,0 +1,6 @@
+def handler_factory_statistic_rollup_remove_instance(rollup):
+
+    def handler_statistic_rollup_remove_instance(sender, **kwargs):
+        rollup.remove_instance(instance=kwargs['instance'])
+
+    return handler_statistic_rollup_remove_instance
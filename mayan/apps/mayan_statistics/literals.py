@@ -0,0 +1,2 @@
+STATISTIC_ROLLUP_SCAN_BATCH_SIZE = 100000
+STATISTIC_ROLLUP_WATERMARK_HOLD_BACK = 10000
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...classes import StatisticRollup
+
+
+class Command(BaseCommand):
+    help = 'Recalculate the per day counts of the statistic rollups'
+
+    def handle(self, *args, **options):
+        for rollup in StatisticRollup.get_all():
+            rollup.rebuild()
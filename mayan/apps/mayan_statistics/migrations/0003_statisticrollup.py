@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('mayan_statistics', '0002_auto_20191116_0236'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatisticRollupEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'slug', models.SlugField(verbose_name='Slug')
+                ),
+                (
+                    'date', models.DateField(verbose_name='Date')
+                ),
+                (
+                    'value', models.BigIntegerField(
+                        default=0, verbose_name='Value'
+                    )
+                ),
+            ],
+            options={
+                'ordering': ('slug', 'date'),
+                'unique_together': {('slug', 'date')},
+                'verbose_name': 'Statistics rollup entry',
+                'verbose_name_plural': 'Statistics rollup entries',
+            },
+        ),
+        migrations.CreateModel(
+            name='StatisticRollupWatermark',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'slug', models.SlugField(unique=True, verbose_name='Slug')
+                ),
+                (
+                    'value', models.BigIntegerField(
+                        default=0, verbose_name='Value'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        auto_now=True, verbose_name='Date time'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Statistics rollup watermark',
+                'verbose_name_plural': 'Statistics rollup watermarks',
+            },
+        ),
+    ]
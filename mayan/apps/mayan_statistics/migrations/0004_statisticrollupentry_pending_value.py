@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('mayan_statistics', '0003_statisticrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='statisticrollupentry',
+            name='pending_value',
+            field=models.BigIntegerField(
+                default=0, help_text='Count of the rows not yet below the '
+                'watermark minus the count of the excluded rows. Calculated '
+                'again on each update.', verbose_name='Pending value'
+            ),
+        ),
+    ]
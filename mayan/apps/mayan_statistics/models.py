@@ -26,3 +26,46 @@ class StatisticResult(models.Model):
     def store_data(self, data):
         self.serialize_data = json.dumps(obj=data)
         self.save()
+
+
+class StatisticRollupEntry(models.Model):
+    """
+    Count of the rows of a statistic rollup created on a date.
+    """
+    slug = models.SlugField(db_index=True, verbose_name=_('Slug'))
+    date = models.DateField(verbose_name=_('Date'))
+    value = models.BigIntegerField(default=0, verbose_name=_('Value'))
+    pending_value = models.BigIntegerField(
+        default=0, help_text=_(
+            'Count of the rows not yet below the watermark minus the count '
+            'of the excluded rows. Calculated again on each update.'
+        ), verbose_name=_('Pending value')
+    )
+
+    class Meta:
+        ordering = ('slug', 'date')
+        unique_together = ('slug', 'date')
+        verbose_name = _('Statistics rollup entry')
+        verbose_name_plural = _('Statistics rollup entries')
+
+    def __str__(self):
+        return '{} {}'.format(self.slug, self.date)
+
+
+class StatisticRollupWatermark(models.Model):
+    """
+    Primary key of the last row of the source model added to a statistic
+    rollup.
+    """
+    slug = models.SlugField(unique=True, verbose_name=_('Slug'))
+    value = models.BigIntegerField(default=0, verbose_name=_('Value'))
+    datetime = models.DateTimeField(
+        auto_now=True, verbose_name=_('Date time')
+    )
+
+    class Meta:
+        verbose_name = _('Statistics rollup watermark')
+        verbose_name_plural = _('Statistics rollup watermarks')
+
+    def __str__(self):
+        return self.slug
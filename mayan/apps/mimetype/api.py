@@ -1,39 +1,58 @@
-from shutil import copyfileobj
+import threading
 
 import magic
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from .caches import MIMETypeCache
+from .settings import setting_file_read_size
 
+_thread_local = threading.local()
 
-def get_mimetype(file_object, mimetype_only=False):
+
+def get_magic_instance():
+    """
+    Return the libmagic wrapper of the current thread. The instance is
+    created once per thread to avoid loading the magic database on each
+    call and to avoid contention on the lock of a shared instance.
+    """
+    try:
+        return _thread_local.magic_instance
+    except AttributeError:
+        _thread_local.magic_instance = magic.Magic(
+            mime=True, mime_encoding=True
+        )
+        return _thread_local.magic_instance
+
+
+def get_mimetype(file_object, mimetype_only=False, checksum=None):
     """
     Determine a file's mimetype by calling the system's libmagic
-    library via python-magic.
+    library via python-magic. Only the start of the file is read. The
+    result is cached when the checksum of the file content is provided.
     """
-    file_mimetype = None
-    file_mime_encoding = None
+    result = None
 
-    temporary_file_object = NamedTemporaryFile()
-    file_object.seek(0)
-    copyfileobj(fsrc=file_object, fdst=temporary_file_object)
-    file_object.seek(0)
-    temporary_file_object.seek(0)
+    if checksum:
+        result = MIMETypeCache().get(checksum=checksum)
 
-    kwargs = {'mime': True}
+    if not result:
+        read_size = setting_file_read_size.value or -1
 
-    if not mimetype_only:
-        kwargs['mime_encoding'] = True
+        file_object.seek(0)
+        file_header = file_object.read(read_size)
+        file_object.seek(0)
 
-    try:
-        mime = magic.Magic(**kwargs)
-
-        if mimetype_only:
-            file_mimetype = mime.from_file(filename=temporary_file_object.name)
-        else:
-            file_mimetype, file_mime_encoding = mime.from_file(
-                filename=temporary_file_object.name
-            ).split('; charset=')
-    finally:
-        temporary_file_object.close()
-
-    return file_mimetype, file_mime_encoding
+        file_mimetype, separator, file_mime_encoding = get_magic_instance().from_buffer(
+            buffer=file_header
+        ).partition('; charset=')
+
+        result = (file_mimetype, file_mime_encoding or None)
+
+        if checksum:
+            MIMETypeCache().set(
+                checksum=checksum, mimetype=result[0], encoding=result[1]
+            )
+
+    if mimetype_only:
+        return result[0], None
+    else:
+        return result
@@ -0,0 +1,29 @@
+from django.core.cache import caches
+
+from .literals import MIMETYPE_CACHE_KEY_PREFIX
+from .settings import setting_cache_timeout
+
+
+class MIMETypeCache:
+    @staticmethod
+    def get_checksum_key(checksum):
+        return '{}{}'.format(MIMETYPE_CACHE_KEY_PREFIX, checksum)
+
+    def __init__(self, name='default'):
+        self.cache = caches[name]
+
+    def get(self, checksum):
+        """
+        Return the tuple of MIME type and encoding of a checksum or None
+        if it is not cached.
+        """
+        return self.cache.get(
+            key=MIMETypeCache.get_checksum_key(checksum=checksum)
+        )
+
+    def set(self, checksum, mimetype, encoding):
+        self.cache.set(
+            key=MIMETypeCache.get_checksum_key(checksum=checksum),
+            value=(mimetype, encoding),
+            timeout=setting_cache_timeout.value
+        )
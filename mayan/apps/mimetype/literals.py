@@ -0,0 +1,4 @@
+DEFAULT_MIMETYPE_CACHE_TIMEOUT = 86400
+DEFAULT_MIMETYPE_FILE_READ_SIZE = 1048576
+
+MIMETYPE_CACHE_KEY_PREFIX = 'mimetype_checksum_'
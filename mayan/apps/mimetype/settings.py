@@ -0,0 +1,26 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import (
+    DEFAULT_MIMETYPE_CACHE_TIMEOUT, DEFAULT_MIMETYPE_FILE_READ_SIZE
+)
+
+namespace = SettingNamespace(label=_('MIME types'), name='mimetype')
+
+setting_cache_timeout = namespace.add_setting(
+    default=DEFAULT_MIMETYPE_CACHE_TIMEOUT,
+    global_name='MIMETYPE_CACHE_TIMEOUT',
+    help_text=_(
+        'Time in seconds to cache the MIME type detected for a file '
+        'checksum.'
+    )
+)
+setting_file_read_size = namespace.add_setting(
+    default=DEFAULT_MIMETYPE_FILE_READ_SIZE,
+    global_name='MIMETYPE_FILE_READ_SIZE',
+    help_text=_(
+        'Number of bytes read from the start of a file to detect its MIME '
+        'type. Use 0 to read the entire file.'
+    )
+)
@@ -1,14 +1,23 @@
 import resource
+import threading
 import unittest
+from unittest import mock
 
 from django.test import override_settings, tag
 
 from mayan.apps.documents.models import Document
 from mayan.apps.documents.tests.base import DocumentTestMixin
-from mayan.apps.documents.tests.literals import TEST_PDF_DOCUMENT_FILENAME
+from mayan.apps.documents.tests.literals import (
+    TEST_PDF_DOCUMENT_FILENAME, TEST_SMALL_DOCUMENT_CHECKSUM,
+    TEST_SMALL_DOCUMENT_MIMETYPE, TEST_SMALL_DOCUMENT_PATH
+)
+from mayan.apps.smart_settings.classes import SettingNamespace
 from mayan.apps.testing.literals import EXCLUDE_TEST_TAG
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..api import get_magic_instance, get_mimetype
+from ..caches import MIMETypeCache
+
 from .literals import MAXIMUM_HEAP_MEMORY
 
 
@@ -33,3 +42,67 @@ class MIMETypeTestCase(DocumentTestMixin, BaseTestCase):
         self._upload_test_document()
 
         self.assertEqual(Document.objects.count(), 1)
+
+
+class GetMIMETypeTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        MIMETypeCache().cache.delete(
+            key=MIMETypeCache.get_checksum_key(
+                checksum=TEST_SMALL_DOCUMENT_CHECKSUM
+            )
+        )
+
+    def tearDown(self):
+        SettingNamespace.invalidate_cache_all()
+        super().tearDown()
+
+    def _get_test_file_mimetype(self, **kwargs):
+        with open(file=TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+            return get_mimetype(file_object=file_object, **kwargs)
+
+    def test_get_mimetype(self):
+        self.assertEqual(
+            self._get_test_file_mimetype(mimetype_only=True),
+            (TEST_SMALL_DOCUMENT_MIMETYPE, None)
+        )
+        self.assertEqual(
+            self._get_test_file_mimetype(),
+            (TEST_SMALL_DOCUMENT_MIMETYPE, 'binary')
+        )
+
+    @override_settings(MIMETYPE_FILE_READ_SIZE=1024)
+    def test_get_mimetype_file_read_size(self):
+        SettingNamespace.invalidate_cache_all()
+
+        with mock.patch.object(get_magic_instance(), 'from_buffer', wraps=get_magic_instance().from_buffer) as mock_from_buffer:
+            self.assertEqual(
+                self._get_test_file_mimetype(mimetype_only=True),
+                (TEST_SMALL_DOCUMENT_MIMETYPE, None)
+            )
+
+        self.assertEqual(len(mock_from_buffer.call_args[1]['buffer']), 1024)
+
+    def test_get_mimetype_checksum_cache(self):
+        self._get_test_file_mimetype(checksum=TEST_SMALL_DOCUMENT_CHECKSUM)
+
+        with mock.patch.object(get_magic_instance(), 'from_buffer') as mock_from_buffer:
+            self.assertEqual(
+                self._get_test_file_mimetype(
+                    checksum=TEST_SMALL_DOCUMENT_CHECKSUM
+                ), (TEST_SMALL_DOCUMENT_MIMETYPE, 'binary')
+            )
+
+        self.assertFalse(mock_from_buffer.called)
+
+    def test_magic_instance_per_thread(self):
+        result = []
+
+        thread = threading.Thread(
+            target=lambda: result.append(get_magic_instance())
+        )
+        thread.start()
+        thread.join()
+
+        self.assertEqual(get_magic_instance(), get_magic_instance())
+        self.assertNotEqual(get_magic_instance(), result[0])
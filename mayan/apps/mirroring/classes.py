@@ -0,0 +1,190 @@
+from collections import OrderedDict
+import logging
+
+from mayan.apps.storage.utils import TemporaryFile
+
+from .literals import FILE_READ_AHEAD_BLOCK_COUNT
+
+logger = logging.getLogger(name=__name__)
+
+
+class IndexFilesystemFile:
+    """
+    Positional reader of a document file. Reads are served from a bounded
+    cache of fixed size blocks. Blocks are read from the storage file
+    object seeking only when the block requested is not the next one.
+    Storage files that don't support seeking are either reopened when
+    reading backwards or copied to a local spool file as they are read.
+    """
+    def __init__(
+        self, document_file, block_cache_size, block_size, spool_enable=False
+    ):
+        self.block_cache = OrderedDict()
+        self.block_cache_size = max(1, block_cache_size)
+        self.block_index_last = -1
+        self.block_size = block_size
+        self.document_file = document_file
+        self.reference_count = 0
+        self.spool_complete = False
+        self.spool_enable = spool_enable
+        self.spool_file_object = None
+        self.spool_size = 0
+
+        self._open()
+
+    def _cache_block(self, index, data):
+        self.block_cache[index] = data
+        self.block_cache.move_to_end(key=index)
+
+        while len(self.block_cache) > self.block_cache_size:
+            self.block_cache.popitem(last=False)
+
+    def _get_block(self, index):
+        try:
+            self.block_cache.move_to_end(key=index)
+        except KeyError:
+            if index == self.block_index_last + 1:
+                # Sequential access, read the following blocks too.
+                block_count = min(
+                    FILE_READ_AHEAD_BLOCK_COUNT, self.block_cache_size
+                )
+            else:
+                block_count = 1
+
+            data = self._read(
+                offset=index * self.block_size,
+                size=block_count * self.block_size
+            )
+
+            result = data[:self.block_size]
+
+            for block_offset in range(block_count):
+                block = data[
+                    block_offset * self.block_size:(block_offset + 1) * self.block_size
+                ]
+                self._cache_block(index=index + block_offset, data=block)
+
+                if len(block) < self.block_size:
+                    # End of file.
+                    break
+        else:
+            result = self.block_cache[index]
+
+        self.block_index_last = index
+        return result
+
+    def _open(self):
+        self.file_object = self.document_file.open()
+        self.position = 0
+
+        try:
+            self.seekable = self.file_object.seekable()
+        except (AttributeError, ValueError):
+            self.seekable = False
+
+        if not self.seekable and self.spool_enable and not self.spool_file_object:
+            self.spool_file_object = TemporaryFile()
+
+    def _read(self, offset, size):
+        if self.spool_file_object:
+            return self._read_spool(offset=offset, size=size)
+
+        if offset != self.position:
+            if self.seekable:
+                self.file_object.seek(offset)
+                self.position = offset
+            else:
+                if offset < self.position:
+                    logger.debug(
+                        'Reopening non seekable file of document file: %s',
+                        self.document_file.pk
+                    )
+                    self.file_object.close()
+                    self._open()
+
+                while self.position < offset:
+                    data = self._read_file_object(
+                        size=min(self.block_size, offset - self.position)
+                    )
+                    if not data:
+                        return b''
+
+        return self._read_file_object(size=size)
+
+    def _read_file_object(self, size):
+        result = []
+        remaining = size
+
+        # Some file objects return less data than requested before the
+        # end of the file.
+        while remaining > 0:
+            data = self.file_object.read(remaining)
+            if not data:
+                break
+
+            result.append(data)
+            remaining -= len(data)
+
+        data = b''.join(result)
+        self.position += len(data)
+        return data
+
+    def _read_spool(self, offset, size):
+        end = offset + size
+
+        if end > self.spool_size and not self.spool_complete:
+            self.spool_file_object.seek(self.spool_size)
+
+            while self.spool_size < end:
+                data = self._read_file_object(size=self.block_size)
+                if not data:
+                    self.spool_complete = True
+                    break
+
+                self.spool_file_object.write(data)
+                self.spool_size += len(data)
+
+        if offset >= self.spool_size:
+            return b''
+
+        self.spool_file_object.seek(offset)
+        return self.spool_file_object.read(
+            min(size, self.spool_size - offset)
+        )
+
+    def close(self):
+        self.block_cache.clear()
+        self.file_object.close()
+
+        if self.spool_file_object:
+            self.spool_file_object.close()
+            self.spool_file_object = None
+
+    def read(self, offset, size):
+        """
+        Read up to size bytes starting at offset. A negative size reads
+        until the end of the file.
+        """
+        index, block_offset = divmod(offset, self.block_size)
+        remaining = size
+        result = []
+
+        while remaining != 0:
+            block = self._get_block(index=index)
+
+            if remaining > 0:
+                data = block[block_offset:block_offset + remaining]
+                remaining -= len(data)
+            else:
+                data = block[block_offset:]
+
+            result.append(data)
+
+            if len(block) < self.block_size:
+                # End of file.
+                break
+
+            index += 1
+            block_offset = 0
+
+        return b''.join(result)
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import datetime
 from errno import ENOENT
 import logging
@@ -15,12 +16,18 @@ from django.db.models.functions import Concat
 from mayan.apps.document_indexing.models import (
     IndexInstanceNode, IndexTemplate
 )
-from mayan.apps.documents.models import Document
+from mayan.apps.documents.models import Document, DocumentFile
 
+from .classes import IndexFilesystemFile
 from .literals import (
-    MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR, FILE_MODE, DIRECTORY_MODE
+    DIRECTORY_LISTING_CACHE_SIZE, MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR,
+    FILE_MODE, DIRECTORY_MODE
 )
 from .runtime import cache
+from .settings import (
+    setting_file_block_cache_size, setting_file_block_size,
+    setting_file_spool_enable, setting_node_lookup_cache_timeout
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -118,6 +125,115 @@ class IndexFilesystem(LoggingMixIn, Operations):
             }
         )
 
+    @staticmethod
+    def _get_timestamp(value):
+        return (
+            value.replace(tzinfo=None) - value.utcoffset() - datetime.datetime(1970, 1, 1)
+        ).total_seconds()
+
+    def _get_directory_attributes(self):
+        now = time()
+
+        # st_nlink tracks the number of hard links to a file.
+        # Must be 2 for directories and at least 1 for files
+        # https://www.gnu.org/software/libc/manual/html_node/Attribute-Meanings.html
+        return {
+            'st_mode': (S_IFDIR | DIRECTORY_MODE), 'st_ctime': now,
+            'st_mtime': now, 'st_atime': now, 'st_nlink': 2
+        }
+
+    def _get_directory_listing(self, path, node):
+        """
+        Return the entries of a directory with the objects needed to
+        answer getattr and open calls for them. Listings are kept for
+        the node lookup cache timeout.
+        """
+        try:
+            timestamp, listing = self.directory_listings[path]
+        except KeyError:
+            pass
+        else:
+            if time() - timestamp < setting_node_lookup_cache_timeout.value:
+                self.directory_listings.move_to_end(key=path)
+                return listing
+
+        listing = OrderedDict()
+
+        # Index instance nodes to directories
+        queryset = IndexFilesystem._clean_queryset(
+            queryset=node.get_children(), source_field_name='value',
+            destination_field_name='value_clean'
+        )
+
+        for value in queryset.values_list('value_clean', flat=True):
+            listing[value] = None
+
+        # Documents
+        if node.index_template_node.link_documents:
+            queryset = Document.valid.filter(
+                pk__in=node.documents.values('pk')
+            )
+
+            queryset = IndexFilesystem._clean_queryset(
+                queryset=queryset, source_field_name='label',
+                destination_field_name='label_clean'
+            )
+
+            documents = {document.pk: document for document in queryset}
+
+            # Fetch the latest file of all the documents in a single query.
+            document_files = {}
+            queryset = DocumentFile.objects.filter(
+                document_id__in=documents.keys()
+            ).order_by('timestamp')
+            for document_file in queryset:
+                document_files[document_file.document_id] = document_file
+
+            for document in documents.values():
+                listing.setdefault(
+                    document.label_clean, {
+                        'document': document,
+                        'document_file': document_files.get(document.pk)
+                    }
+                )
+
+        self.directory_listings[path] = (time(), listing)
+        self.directory_listings.move_to_end(key=path)
+
+        while len(self.directory_listings) > DIRECTORY_LISTING_CACHE_SIZE:
+            self.directory_listings.popitem(last=False)
+
+        return listing
+
+    def _get_directory_listing_entry(self, path):
+        """
+        Return the directory listing entry of a path from the listing of
+        its parent. Returns False if the path is not in a cached listing,
+        None for directories, and a dictionary for documents.
+        """
+        parent_path, name = path.rsplit('/', 1)
+        parent_path = parent_path or '/'
+
+        try:
+            timestamp, listing = self.directory_listings[parent_path]
+        except KeyError:
+            return False
+
+        if time() - timestamp < setting_node_lookup_cache_timeout.value:
+            return listing.get(name, False)
+        else:
+            return False
+
+    def _get_document_attributes(self, document, document_file, size):
+        return {
+            'st_mode': (S_IFREG | FILE_MODE),
+            'st_ctime': self._get_timestamp(value=document.datetime_created),
+            'st_mtime': self._get_timestamp(value=document_file.timestamp),
+            'st_atime': time(),
+            'st_size': size or 0,
+            'st_nlink': 1
+        }
+
     def _get_next_file_descriptor(self):
         while(True):
             self.file_descriptor_count += 1
@@ -209,8 +325,10 @@ class IndexFilesystem(LoggingMixIn, Operations):
         return node
 
     def __init__(self, index_slug):
+        self.directory_listings = OrderedDict()
         self.file_descriptor_count = MIN_FILE_DESCRIPTOR
         self.file_descriptors = {}
+        self.files = {}
 
         try:
             self.index_template = IndexTemplate.objects.get(slug=index_slug)
@@ -229,50 +347,78 @@ class IndexFilesystem(LoggingMixIn, Operations):
     def getattr(self, path, fh=None):
         logger.debug('path: %s, fh: %s', path, fh)
 
-        now = time()
-        result = self._path_to_node(path=path, directory_only=False)
+        entry = self._get_directory_listing_entry(path=path)
 
-        if not result:
-            raise FuseOSError(ENOENT)
+        if entry is None:
+            function_result = self._get_directory_attributes()
+        elif entry and entry['document_file']:
+            if 'size' not in entry:
+                # The size is a storage lookup, do it once per listing.
+                entry['size'] = entry['document_file'].size
 
-        # st_nlink tracks the number of hard links to a file.
-        # Must be 2 for directories and at least 1 for files
-        # https://www.gnu.org/software/libc/manual/html_node/Attribute-Meanings.html
-        if isinstance(result, IndexInstanceNode):
-            function_result = {
-                'st_mode': (S_IFDIR | DIRECTORY_MODE), 'st_ctime': now,
-                'st_mtime': now, 'st_atime': now, 'st_nlink': 2
-            }
+            function_result = self._get_document_attributes(
+                document=entry['document'],
+                document_file=entry['document_file'], size=entry['size']
+            )
         else:
-            function_result = {
-                'st_mode': (S_IFREG | FILE_MODE),
-                'st_ctime': (
-                    result.datetime_created.replace(tzinfo=None) - result.datetime_created.utcoffset() - datetime.datetime(1970, 1, 1)
-                ).total_seconds(),
-                'st_mtime': (
-                    result.file_latest.timestamp.replace(tzinfo=None) - result.file_latest.timestamp.utcoffset() - datetime.datetime(1970, 1, 1)
-                ).total_seconds(),
-                'st_atime': now,
-                'st_size': result.file_latest.size or 0,
-                'st_nlink': 1
-            }
+            result = self._path_to_node(path=path, directory_only=False)
+
+            if not result:
+                raise FuseOSError(ENOENT)
+
+            if isinstance(result, IndexInstanceNode):
+                function_result = self._get_directory_attributes()
+            else:
+                document_file = result.file_latest
+
+                if not document_file:
+                    raise FuseOSError(ENOENT)
+
+                function_result = self._get_document_attributes(
+                    document=result, document_file=document_file,
+                    size=document_file.size
+                )
 
         logger.debug('function_result: %s', function_result)
         return function_result
 
     def open(self, path, flags):
-        result = self._path_to_node(path=path, directory_only=False)
+        entry = self._get_directory_listing_entry(path=path)
 
-        if isinstance(result, Document):
-            next_file_descriptor = self._get_next_file_descriptor()
-            self.file_descriptors[next_file_descriptor] = result.file_latest.open()
-            return next_file_descriptor
+        if entry:
+            document_file = entry['document_file']
         else:
+            result = self._path_to_node(path=path, directory_only=False)
+
+            if isinstance(result, Document):
+                document_file = result.file_latest
+            else:
+                document_file = None
+
+        if not document_file:
             raise FuseOSError(ENOENT)
 
+        # Open files are shared between file descriptors of the same
+        # document file to reuse the block cache.
+        try:
+            index_filesystem_file = self.files[document_file.pk]
+        except KeyError:
+            index_filesystem_file = IndexFilesystemFile(
+                block_cache_size=setting_file_block_cache_size.value,
+                block_size=setting_file_block_size.value,
+                document_file=document_file,
+                spool_enable=setting_file_spool_enable.value
+            )
+            self.files[document_file.pk] = index_filesystem_file
+
+        index_filesystem_file.reference_count += 1
+
+        next_file_descriptor = self._get_next_file_descriptor()
+        self.file_descriptors[next_file_descriptor] = index_filesystem_file
+        return next_file_descriptor
+
     def read(self, path, size, offset, fh):
-        self.file_descriptors[fh].seek(offset)
-        return self.file_descriptors[fh].read(size)
+        return self.file_descriptors[fh].read(offset=offset, size=size)
 
     def readdir(self, path, fh):
         logger.debug('path: %s', path)
@@ -285,29 +431,15 @@ class IndexFilesystem(LoggingMixIn, Operations):
         yield '.'
         yield '..'
 
-        # Index instance nodes to directories
-        queryset = IndexFilesystem._clean_queryset(
-            queryset=node.get_children(), source_field_name='value',
-            destination_field_name='value_clean'
-        )
-
-        for value in queryset.values_list('value_clean', flat=True):
+        for value in self._get_directory_listing(path=path, node=node):
             yield value
 
-        # Documents
-        if node.index_template_node.link_documents:
-            queryset = Document.valid.filter(
-                pk__in=node.documents.values('pk')
-            )
-
-            queryset = IndexFilesystem._clean_queryset(
-                queryset=queryset, source_field_name='label',
-                destination_field_name='label_clean'
-            )
-
-            for value in queryset.values_list('label_clean', flat=True):
-                yield value
-
     def release(self, path, fh):
+        index_filesystem_file = self.file_descriptors[fh]
         self.file_descriptors[fh] = None
         del(self.file_descriptors[fh])
+
+        index_filesystem_file.reference_count -= 1
+        if index_filesystem_file.reference_count == 0:
+            index_filesystem_file.close()
+            del(self.files[index_filesystem_file.document_file.pk])
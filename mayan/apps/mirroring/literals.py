@@ -1,7 +1,13 @@
 DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT = 10
+DEFAULT_MIRRORING_FILE_BLOCK_CACHE_SIZE = 64
+DEFAULT_MIRRORING_FILE_BLOCK_SIZE = 131072
+DEFAULT_MIRRORING_FILE_SPOOL_ENABLE = False
 DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT = 10
 
+DIRECTORY_LISTING_CACHE_SIZE = 256
+
 FILE_MODE = DIRECTORY_MODE = 0o555
+FILE_READ_AHEAD_BLOCK_COUNT = 4
 
 MAX_FILE_DESCRIPTOR = 65535
 MIN_FILE_DESCRIPTOR = 0
@@ -4,6 +4,8 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT,
+    DEFAULT_MIRRORING_FILE_BLOCK_CACHE_SIZE, DEFAULT_MIRRORING_FILE_BLOCK_SIZE,
+    DEFAULT_MIRRORING_FILE_SPOOL_ENABLE,
     DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT
 )
 
@@ -14,6 +16,33 @@ setting_document_lookup_cache_timeout = namespace.add_setting(
     global_name='MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT',
     help_text=_('Time in seconds to cache the path lookup to a document.')
 )
+setting_file_block_cache_size = namespace.add_setting(
+    default=DEFAULT_MIRRORING_FILE_BLOCK_CACHE_SIZE,
+    global_name='MIRRORING_FILE_BLOCK_CACHE_SIZE',
+    help_text=_(
+        'Maximum number of blocks of each open document file kept in '
+        'memory.'
+    )
+)
+setting_file_block_size = namespace.add_setting(
+    default=DEFAULT_MIRRORING_FILE_BLOCK_SIZE,
+    global_name='MIRRORING_FILE_BLOCK_SIZE',
+    help_text=_(
+        'Size in bytes of the blocks in which document files are read '
+        'and cached.'
+    )
+)
+setting_file_spool_enable = namespace.add_setting(
+    default=DEFAULT_MIRRORING_FILE_SPOOL_ENABLE,
+    global_name='MIRRORING_FILE_SPOOL_ENABLE',
+    help_text=_(
+        'Copy the content of document files from storages that do not '
+        'support seeking to a local temporary file as they are read. This '
+        'allows random access without reading the file again from the '
+        'start. The content is written unencrypted to the temporary '
+        'directory.'
+    )
+)
 setting_node_lookup_cache_timeout = namespace.add_setting(
     default=DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT,
     global_name='MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT',
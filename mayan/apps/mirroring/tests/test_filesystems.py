@@ -369,3 +369,59 @@ class IndexFilesystemTestCase(
                 index_filesystem.readdir('/level_1', '')
             )[2], self.test_document.label
         )
+
+    def test_document_read_offset(self):
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_NODE_EXPRESSION, link_documents=True
+        )
+
+        self._upload_test_document()
+        index_filesystem = IndexFilesystem(index_slug=self.test_index_template.slug)
+
+        file_handle = index_filesystem.open(
+            path='/{}/{}'.format(TEST_NODE_EXPRESSION, self.test_document.label),
+            flags='rb'
+        )
+
+        with self.test_document.file_latest.open() as file_object:
+            content = file_object.read()
+
+        offset = len(content) // 2
+
+        self.assertEqual(
+            index_filesystem.read(
+                fh=file_handle, offset=offset, path=None, size=100
+            ), content[offset:offset + 100]
+        )
+        self.assertEqual(
+            index_filesystem.read(
+                fh=file_handle, offset=0, path=None, size=100
+            ), content[:100]
+        )
+
+        index_filesystem.release(path=None, fh=file_handle)
+
+    def test_document_getattr_from_directory_listing(self):
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_NODE_EXPRESSION, link_documents=True
+        )
+
+        self._upload_test_document()
+        index_filesystem = IndexFilesystem(index_slug=self.test_index_template.slug)
+
+        list(
+            index_filesystem.readdir(
+                path='/{}'.format(TEST_NODE_EXPRESSION), fh=None
+            )
+        )
+
+        with self.assertNumQueries(0):
+            result = index_filesystem.getattr(
+                path='/{}/{}'.format(
+                    TEST_NODE_EXPRESSION, self.test_document.label
+                )
+            )
+
+        self.assertEqual(result['st_size'], self.test_document.file_latest.size)
@@ -1,14 +1,12 @@
+from io import BytesIO
 import logging
 import os
-import shutil
 
 import sh
 
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import TemporaryFile
-
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
@@ -25,6 +23,46 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
+    def _execute_command(self, input_data, language=None):
+        """
+        Call the tesseract binary with the image data piped to its standard
+        input, without intermediate files.
+        """
+        arguments = ['-', '-']
+
+        keyword_arguments = {
+            '_in': input_data,
+            '_timeout': self.command_timeout
+        }
+
+        if language:
+            keyword_arguments['l'] = language
+
+        environment = os.environ.copy()
+        environment.update(self.environment)
+        keyword_arguments['_env'] = environment
+
+        try:
+            result = self.command_tesseract(
+                *arguments, **keyword_arguments
+            )
+            return force_text(s=result.stdout)
+        except Exception as exception:
+            error_message = (
+                'Exception calling Tesseract with language option: {}; {}'
+            ).format(language, exception)
+
+            if language not in self.languages:
+                error_message = (
+                    '{}\nThe requested OCR language "{}" is not '
+                    'available and needs to be installed.\n'
+                ).format(
+                    error_message, language
+                )
+
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+
     def execute(self, *args, **kwargs):
         """
         Execute the command line binary of tesseract
@@ -34,49 +72,25 @@ class Tesseract(OCRBackendBase):
         if self.command_tesseract:
             image = self.converter.get_page()
 
-            try:
-                temporary_image_file = TemporaryFile()
-                shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
-                temporary_image_file.seek(0)
-
-                arguments = ['-', '-']
-
-                keyword_arguments = {
-                    '_in': temporary_image_file,
-                    '_timeout': self.command_timeout
-                }
-
-                if self.language:
-                    keyword_arguments['l'] = self.language
-
-                environment = os.environ.copy()
-                environment.update(self.environment)
-                keyword_arguments['_env'] = environment
-
-                try:
-                    result = self.command_tesseract(
-                        *arguments, **keyword_arguments
-                    )
-                    return force_text(s=result.stdout)
-                except Exception as exception:
-                    error_message = (
-                        'Exception calling Tesseract with language option: {}; {}'
-                    ).format(self.language, exception)
-
-                    if self.language not in self.languages:
-                        error_message = (
-                            '{}\nThe requested OCR language "{}" is not '
-                            'available and needs to be installed.\n'
-                        ).format(
-                            error_message, self.language
-                        )
-
-                    logger.error(error_message, exc_info=True)
-                    raise OCRError(error_message)
-                else:
-                    return result
-            finally:
-                temporary_image_file.close()
+            return self._execute_command(
+                input_data=image.getvalue(), language=self.language
+            )
+
+    def execute_image(self, image, language=None):
+        """
+        Pipe a decoded image to tesseract using the uncompressed Netpbm
+        format to avoid spending time compressing the image.
+        """
+        if self.command_tesseract:
+            if image.mode not in ('1', 'L', 'RGB'):
+                image = image.convert('RGB')
+
+            image_buffer = BytesIO()
+            image.save(image_buffer, format='PPM')
+
+            return self._execute_command(
+                input_data=image_buffer.getvalue(), language=language
+            )
 
     def initialize(self):
         self.languages = ()
@@ -0,0 +1,107 @@
+import logging
+import os
+import threading
+
+from django.utils.translation import ugettext_lazy as _
+
+from ..classes import OCRBackendBase
+from ..exceptions import OCRError
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+logger = logging.getLogger(name=__name__)
+
+
+class TesseractAPI(OCRBackendBase):
+    """
+    OCR backend using the Tesseract library API by way of the optional
+    tesserocr module. Each worker thread keeps an initialized Tesseract
+    instance per language instead of starting a new tesseract process
+    and loading the language data for each page.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_settings()
+
+        if kwargs.get('auto_initialize', True):
+            self.initialize()
+
+    def _get_api(self, language=None):
+        api_instances = getattr(self._local, 'api_instances', None)
+        if api_instances is None:
+            api_instances = self._local.api_instances = {}
+
+        language = language or self.default_language
+
+        try:
+            return api_instances[language]
+        except KeyError:
+            keyword_arguments = {'lang': language}
+            if self.tessdata_path:
+                keyword_arguments['path'] = self.tessdata_path
+
+            try:
+                api_instance = tesserocr.PyTessBaseAPI(**keyword_arguments)
+            except RuntimeError as exception:
+                error_message = (
+                    'Exception initializing Tesseract with language '
+                    'option: {}; {}'
+                ).format(language, exception)
+
+                if language not in self.languages:
+                    error_message = (
+                        '{}\nThe requested OCR language "{}" is not '
+                        'available and needs to be installed.\n'
+                    ).format(
+                        error_message, language
+                    )
+
+                logger.error(error_message, exc_info=True)
+                raise OCRError(error_message)
+
+            api_instances[language] = api_instance
+            return api_instance
+
+    def execute(self, *args, **kwargs):
+        super().execute(*args, **kwargs)
+
+        if not self.converter.image:
+            self.converter.seek_page(page_number=0)
+
+        return self.execute_image(
+            image=self.converter.image, language=self.language
+        )
+
+    def execute_image(self, image, language=None):
+        api_instance = self._get_api(language=language)
+
+        try:
+            api_instance.SetImage(image)
+            return api_instance.GetUTF8Text()
+        finally:
+            api_instance.Clear()
+
+    def initialize(self):
+        if not tesserocr:
+            raise OCRError(
+                _('The tesserocr Python module is not installed.')
+            )
+
+        # The environment must be set before the library creates its
+        # threads.
+        os.environ.update(self.environment)
+
+        self._local = threading.local()
+        self.languages = tesserocr.get_languages(
+            self.tessdata_path or ''
+        )[1]
+
+        logger.debug('Available languages: %s', ', '.join(self.languages))
+
+    def read_settings(self):
+        self.default_language = self.kwargs.get('default_language', 'eng')
+        self.environment = self.kwargs.get('environment', {})
+        self.tessdata_path = self.kwargs.get('tessdata_path', None)
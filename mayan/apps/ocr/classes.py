@@ -1,3 +1,6 @@
+from io import BytesIO
+import json
+
 from django.utils.module_loading import import_string
 
 from mayan.apps.converter.classes import ConverterBase
@@ -6,11 +9,28 @@ from .settings import setting_ocr_backend, setting_ocr_backend_arguments
 
 
 class OCRBackendBase:
-    @staticmethod
-    def get_instance():
-        return import_string(
-            dotted_path=setting_ocr_backend.value
-        )(**setting_ocr_backend_arguments.value)
+    _instance = None
+    _instance_key = None
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Return the configured backend. The instance is kept for the life
+        of the process to avoid initializing the backend for every page.
+        A new instance is created if the backend settings change.
+        """
+        instance_key = (
+            setting_ocr_backend.value,
+            json.dumps(obj=setting_ocr_backend_arguments.value, sort_keys=True)
+        )
+
+        if OCRBackendBase._instance_key != instance_key:
+            OCRBackendBase._instance = import_string(
+                dotted_path=setting_ocr_backend.value
+            )(**setting_ocr_backend_arguments.value)
+            OCRBackendBase._instance_key = instance_key
+
+        return OCRBackendBase._instance
 
     def __init__(self, *args, **kwargs):
         self.args = args
@@ -28,3 +48,15 @@ class OCRBackendBase:
 
         for transformation in transformations:
             self.converter.transform(transformation=transformation)
+
+    def execute_image(self, image, language=None):
+        """
+        Perform OCR on an already decoded image. Backends able to receive
+        images directly should override this method, the default
+        implementation encodes the image and calls `.execute()`.
+        """
+        image_buffer = BytesIO()
+        image.save(image_buffer, format='PNG')
+        image_buffer.seek(0)
+
+        return self.execute(file_object=image_buffer, language=language)
@@ -49,20 +49,19 @@ class DocumentVersionPageOCRContentManager(models.Manager):
             raise
         else:
             try:
-                cache_filename = document_version_page.generate_image(
-                    _acquire_lock=False, user=user
-                )
+                # Pass the decoded page image directly to the OCR backend
+                # instead of storing it in the cache and encoding it again.
+                image = document_version_page.get_decoded_image(user=user)
 
-                with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
-                    ocr_content = OCRBackendBase.get_instance().execute(
-                        file_object=file_object,
-                        language=document_version_page.document_version.document.language
-                    )
-                    DocumentVersionPageOCRContent.objects.update_or_create(
-                        document_version_page=document_version_page, defaults={
-                            'content': ocr_content
-                        }
-                    )
+                ocr_content = OCRBackendBase.get_instance().execute_image(
+                    image=image,
+                    language=document_version_page.document_version.document.language
+                )
+                DocumentVersionPageOCRContent.objects.update_or_create(
+                    document_version_page=document_version_page, defaults={
+                        'content': ocr_content
+                    }
+                )
             except Exception as exception:
                 logger.error(
                     'OCR error for document version page: %d; %s',
@@ -3,7 +3,8 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_PAGE_IMAGE_BATCH_GENERATE
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -26,3 +27,10 @@ setting_ocr_backend_arguments = namespace.add_setting(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
     global_name='OCR_BACKEND_ARGUMENTS'
 )
+setting_ocr_page_image_batch_generate = namespace.add_setting(
+    default=DEFAULT_OCR_PAGE_IMAGE_BATCH_GENERATE,
+    global_name='OCR_PAGE_IMAGE_BATCH_GENERATE', help_text=_(
+        'Rasterize the pages of each document file in a single pass before '
+        'dispatching the per page OCR tasks of a document version.'
+    )
+)
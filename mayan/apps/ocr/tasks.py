@@ -11,16 +11,23 @@ from mayan.celery import app
 
 from .events import event_ocr_document_version_finish
 from .literals import TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+from .settings import setting_ocr_page_image_batch_generate
 from .signals import signal_post_document_version_ocr
 
 logger = logging.getLogger(name=__name__)
 
 
-@app.task(bind=True, ignore_result=True)
+@app.task(
+    bind=True, default_retry_delay=TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY,
+    ignore_result=True
+)
 def task_document_version_ocr_process(self, document_version_id, user_id=None):
     logger.info(
         'Starting OCR for document version page ID: %s', document_version_id
     )
+    DocumentFilePage = apps.get_model(
+        app_label='documents', model_name='DocumentFilePage'
+    )
     DocumentVersion = apps.get_model(
         app_label='documents', model_name='DocumentVersion'
     )
@@ -29,6 +36,32 @@ def task_document_version_ocr_process(self, document_version_id, user_id=None):
         pk=document_version_id
     )
 
+    if setting_ocr_page_image_batch_generate.value:
+        # Fill the page image cache of every source document file in a
+        # single rasterization pass per file instead of one per page task.
+        document_file_page_ranges = {}
+        for document_version_page in document_version.pages.all():
+            content_object = document_version_page.content_object
+
+            if isinstance(content_object, DocumentFilePage):
+                page_range = document_file_page_ranges.setdefault(
+                    content_object.document_file, [
+                        content_object.page_number,
+                        content_object.page_number
+                    ]
+                )
+                page_range[0] = min(page_range[0], content_object.page_number)
+                page_range[1] = max(page_range[1], content_object.page_number)
+
+        try:
+            for document_file, page_range in document_file_page_ranges.items():
+                document_file.page_images_generate(
+                    page_number_first=page_range[0],
+                    page_number_last=page_range[1]
+                )
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
     try:
         document_version_page_tasks = []
         for document_version_page in document_version.pages.all():
@@ -2,6 +2,10 @@ from django.test import override_settings
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import TEST_DEU_DOCUMENT_PATH
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import OCRBackendBase
+from ..settings import setting_ocr_backend_arguments
 
 from .literals import (
     TEST_DOCUMENT_VERSION_OCR_CONTENT, TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1,
@@ -30,3 +34,21 @@ class GermanOCRSupportTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2 in content
         )
+
+
+class OCRBackendTestCase(BaseTestCase):
+    def test_backend_instance_reuse(self):
+        self.assertEqual(
+            OCRBackendBase.get_instance(), OCRBackendBase.get_instance()
+        )
+
+    def test_backend_instance_setting_change(self):
+        backend = OCRBackendBase.get_instance()
+
+        old_value = setting_ocr_backend_arguments.value
+        setting_ocr_backend_arguments.set(value={'environment': {}})
+
+        try:
+            self.assertNotEqual(OCRBackendBase.get_instance(), backend)
+        finally:
+            setting_ocr_backend_arguments.set(value=old_value)
@@ -1,17 +1,74 @@
+import io
+import struct
+import time
 import zipfile
 
 try:
-    import zlib  # NOQA
+    import zlib
     COMPRESSION = zipfile.ZIP_DEFLATED
 except ImportError:
+    zlib = None
     COMPRESSION = zipfile.ZIP_STORED
 
-from django.core.files.base import ContentFile
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from django.core.files.base import ContentFile, File
 from django.utils.encoding import force_text
 
 from ..classes import BufferedFile, PassthroughStorage
+from ..exceptions import CompressedStorageFileError
 
-from .literals import ZIP_CHUNK_SIZE, ZIP_MEMBER_FILENAME
+from .literals import (
+    COMPRESSION_CHUNKED_FILE_CHUNK_SIZE, COMPRESSION_CHUNKED_FILE_MAGIC,
+    COMPRESSION_CHUNKED_FILE_VERSION, COMPRESSION_CODEC_IDS,
+    COMPRESSION_CODEC_LZ4, COMPRESSION_CODEC_ZLIB, COMPRESSION_CODEC_ZSTD,
+    ZIP_CHUNK_SIZE, ZIP_MEMBER_FILENAME
+)
+
+FRAME_STRUCT = struct.Struct('>I')
+HEADER_STRUCT = struct.Struct('>BBI')
+HEADER_SIZE = len(COMPRESSION_CHUNKED_FILE_MAGIC) + HEADER_STRUCT.size
+INDEX_STRUCT = struct.Struct('>Q')
+TRAILER_STRUCT = struct.Struct('>QQ')
+
+
+def get_codec_functions(codec, level=None):
+    """
+    Return the compression and decompression functions of a codec.
+    """
+    if codec == COMPRESSION_CODEC_ZLIB and zlib:
+        if level is None:
+            level = zlib.Z_DEFAULT_COMPRESSION
+
+        return (
+            lambda data: zlib.compress(data, level), zlib.decompress
+        )
+    elif codec == COMPRESSION_CODEC_ZSTD and zstandard:
+        compressor = zstandard.ZstdCompressor(
+            level=3 if level is None else level
+        )
+        decompressor = zstandard.ZstdDecompressor()
+
+        return compressor.compress, decompressor.decompress
+    elif codec == COMPRESSION_CODEC_LZ4 and lz4:
+        return (
+            lambda data: lz4.frame.compress(
+                data, compression_level=level or 0
+            ), lz4.frame.decompress
+        )
+    else:
+        raise CompressedStorageFileError(
+            'Compression codec "{}" is not supported or its Python module '
+            'is not installed.'.format(codec)
+        )
 
 
 class BufferedZipFile(BufferedFile):
@@ -32,20 +89,30 @@ class BufferedZipFile(BufferedFile):
             name=self.member_name, mode=zip_mode
         )
 
-    def _get_file_object_chunk(self):
-        chunk = self.zip_file_object.read(ZIP_CHUNK_SIZE)
-
-        if chunk:
-            if self.binary_mode:
-                return chunk
-            else:
-                return force_text(s=chunk)
-
     def close(self):
         self.zip_file_object.close()
         self.zip_container_file_object.close()
         self.file_object.close()
 
+    def read(self, size=None):
+        # Read from the member directly instead of accumulating the
+        # inflated data in the buffer stream.
+        if size is None:
+            size = -1
+
+        data = self.zip_file_object.read(size)
+
+        if self.binary_mode:
+            return data
+        else:
+            return force_text(s=data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.zip_file_object.seek(offset, whence)
+
+    def seekable(self):
+        return self.zip_file_object.seekable()
+
     def tell(self):
         return self.zip_file_object.tell()
 
@@ -53,6 +120,405 @@ class BufferedZipFile(BufferedFile):
         return self.zip_file_object.write(data)
 
 
+class CompressedChunkedFile(File):
+    """
+    File made of independently compressed chunks. Each chunk is stored as a
+    frame of its compressed length followed by the compressed data. A zero
+    length frame ends the data and is followed by an index of the frame
+    offsets and a trailer with the offset of the index and the
+    uncompressed size. Seeking only requires decompressing the chunk at
+    the new position.
+    """
+    def __init__(
+        self, file_object, mode, chunk_size=None, codec=None, header=None,
+        level=None, name=None
+    ):
+        self.binary_mode = 'b' in mode
+        self.chunk_size = chunk_size or COMPRESSION_CHUNKED_FILE_CHUNK_SIZE
+        self.codec = codec or COMPRESSION_CODEC_ZLIB
+        self.file_object = file_object
+        self.level = level
+        self.mode = mode
+        self.name = name
+        self.position = 0
+
+        self._chunk_data = None
+        self._chunk_index = None
+        self._closed = False
+        self._frame_end_index = None
+        self._frame_index = None
+        self._frame_offsets = []
+        self._frame_read_count = 0
+        self._write_buffer = bytearray()
+
+        if 'r' in mode:
+            self._header_read(header=header)
+        else:
+            self._header_write()
+
+    @staticmethod
+    def _read_exactly(file_object, size):
+        result = []
+
+        while size:
+            data = file_object.read(size)
+            if not data:
+                break
+
+            result.append(data)
+            size -= len(data)
+
+        return b''.join(result)
+
+    def _frame_read(self):
+        frame_header = self._read_exactly(
+            file_object=self.file_object, size=FRAME_STRUCT.size
+        )
+
+        if len(frame_header) < FRAME_STRUCT.size:
+            raise CompressedStorageFileError(
+                'Compressed storage file is truncated.'
+            )
+
+        frame_size = FRAME_STRUCT.unpack(frame_header)[0]
+
+        if frame_size:
+            data = self._read_exactly(
+                file_object=self.file_object, size=frame_size
+            )
+
+            if len(data) < frame_size:
+                raise CompressedStorageFileError(
+                    'Compressed storage file is truncated.'
+                )
+
+            return data
+
+    def _frame_write(self, data):
+        self._frame_offsets.append(self._file_object_position)
+
+        data = self.compress(bytes(data))
+        self.file_object.write(FRAME_STRUCT.pack(len(data)) + data)
+        self._file_object_position += FRAME_STRUCT.size + len(data)
+
+    def _get_chunk(self, index):
+        if index != self._chunk_index:
+            if self._frame_index is not None:
+                if index >= len(self._frame_index):
+                    return b''
+
+                self.file_object.seek(self._frame_index[index])
+                data = self._frame_read()
+            else:
+                if self._frame_end_index is not None and index >= self._frame_end_index:
+                    return b''
+
+                if index < self._frame_read_count - 1:
+                    raise io.UnsupportedOperation(
+                        'Backward seeks are not supported by the next '
+                        'storage file.'
+                    )
+
+                # Read the frames in order, skipping the preceding ones.
+                while self._frame_read_count <= index:
+                    data = self._frame_read()
+
+                    if data is None:
+                        self._frame_end_index = self._frame_read_count
+                        return b''
+
+                    self._frame_read_count += 1
+
+            self._chunk_data = self.decompress(data)
+            self._chunk_index = index
+
+        return self._chunk_data
+
+    def _header_read(self, header=None):
+        header = (header or b'') + self._read_exactly(
+            file_object=self.file_object,
+            size=HEADER_SIZE - len(header or b'')
+        )
+
+        if len(header) < HEADER_SIZE or not header.startswith(
+            COMPRESSION_CHUNKED_FILE_MAGIC
+        ):
+            raise CompressedStorageFileError(
+                'Invalid compressed storage file header.'
+            )
+
+        version, codec_id, self.chunk_size = HEADER_STRUCT.unpack_from(
+            header, len(COMPRESSION_CHUNKED_FILE_MAGIC)
+        )
+
+        if version != COMPRESSION_CHUNKED_FILE_VERSION:
+            raise CompressedStorageFileError(
+                'Unsupported compressed storage file version: {}'.format(
+                    version
+                )
+            )
+
+        for codec, value in COMPRESSION_CODEC_IDS.items():
+            if value == codec_id:
+                self.codec = codec
+                break
+        else:
+            raise CompressedStorageFileError(
+                'Unknown compression codec identifier: {}'.format(codec_id)
+            )
+
+        self.compress, self.decompress = get_codec_functions(
+            codec=self.codec
+        )
+
+        try:
+            file_object_seekable = self.file_object.seekable()
+        except (AttributeError, ValueError):
+            file_object_seekable = False
+
+        if file_object_seekable:
+            self.file_object.seek(-TRAILER_STRUCT.size, io.SEEK_END)
+            trailer_offset = self.file_object.tell()
+            index_offset, self._size = TRAILER_STRUCT.unpack(
+                self._read_exactly(
+                    file_object=self.file_object, size=TRAILER_STRUCT.size
+                )
+            )
+
+            self.file_object.seek(index_offset)
+            index_data = self._read_exactly(
+                file_object=self.file_object,
+                size=trailer_offset - index_offset
+            )
+            self._frame_index = [
+                value[0] for value in INDEX_STRUCT.iter_unpack(index_data)
+            ]
+        else:
+            self._size = None
+
+    def _header_write(self):
+        self.compress, self.decompress = get_codec_functions(
+            codec=self.codec, level=self.level
+        )
+        header = COMPRESSION_CHUNKED_FILE_MAGIC + HEADER_STRUCT.pack(
+            COMPRESSION_CHUNKED_FILE_VERSION,
+            COMPRESSION_CODEC_IDS[self.codec], self.chunk_size
+        )
+        self.file_object.write(header)
+        self._file_object_position = len(header)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+
+            if 'r' not in self.mode:
+                if self._write_buffer:
+                    self._frame_write(data=self._write_buffer)
+                    self._write_buffer = bytearray()
+
+                self.file_object.write(FRAME_STRUCT.pack(0))
+                index_offset = self._file_object_position + FRAME_STRUCT.size
+
+                self.file_object.write(
+                    b''.join(
+                        INDEX_STRUCT.pack(offset) for offset in self._frame_offsets
+                    )
+                )
+                self.file_object.write(
+                    TRAILER_STRUCT.pack(index_offset, self.position)
+                )
+
+            self.file_object.close()
+
+    def flush(self):
+        return self.file_object.flush()
+
+    def read(self, size=None):
+        if size is None or size < 0:
+            size = None
+
+        result = []
+
+        while size is None or size > 0:
+            index, offset = divmod(self.position, self.chunk_size)
+            data = self._get_chunk(index=index)[offset:]
+
+            if size is not None:
+                data = data[:size]
+                size -= len(data)
+
+            if not data:
+                break
+
+            result.append(data)
+            self.position += len(data)
+
+        data = b''.join(result)
+
+        if self.binary_mode:
+            return data
+        else:
+            return force_text(s=data)
+
+    def readable(self):
+        return 'r' in self.mode
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError('Invalid whence value: {}'.format(whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position: {}'.format(position))
+
+        if 'r' not in self.mode and position != self.position:
+            raise io.UnsupportedOperation(
+                'Compressed files can only be written sequentially.'
+            )
+
+        self.position = position
+        return self.position
+
+    def seekable(self):
+        return 'r' in self.mode
+
+    @property
+    def size(self):
+        if 'r' in self.mode:
+            if self._size is None:
+                raise io.UnsupportedOperation(
+                    'The next storage file does not support seeking; the '
+                    'size of the compressed file is not known.'
+                )
+            return self._size
+        else:
+            return self.position
+
+    def tell(self):
+        return self.position
+
+    def writable(self):
+        return 'r' not in self.mode
+
+    def write(self, data):
+        try:
+            data = data.encode('utf-8')
+        except AttributeError:
+            """Already a byte string"""
+
+        self._write_buffer.extend(data)
+
+        while len(self._write_buffer) >= self.chunk_size:
+            self._frame_write(data=self._write_buffer[:self.chunk_size])
+            del self._write_buffer[:self.chunk_size]
+
+        self.position += len(data)
+        return len(data)
+
+
+class CompressedPassthroughStorage(PassthroughStorage):
+    """
+    Passthrough storage that compresses files in chunks while streaming
+    them. Files saved by the zip compressed storage are still readable.
+    """
+    def __init__(self, *args, **kwargs):
+        self.chunk_size = kwargs.pop(
+            'chunk_size', COMPRESSION_CHUNKED_FILE_CHUNK_SIZE
+        )
+        self.codec = kwargs.pop('codec', COMPRESSION_CODEC_ZLIB)
+        self.level = kwargs.pop('level', None)
+        super().__init__(*args, **kwargs)
+
+        # Fail early if the codec is not available.
+        get_codec_functions(codec=self.codec, level=self.level)
+
+    def open(self, name, mode='rb', _direct=False):
+        next_kwargs = {'name': name}
+
+        if _direct:
+            next_kwargs['mode'] = mode
+
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update({'_direct': _direct})
+
+            return self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+        elif 'r' in mode:
+            next_kwargs['mode'] = 'rb'
+            storage_file = self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+
+            header = CompressedChunkedFile._read_exactly(
+                file_object=storage_file,
+                size=len(COMPRESSION_CHUNKED_FILE_MAGIC)
+            )
+
+            if header == COMPRESSION_CHUNKED_FILE_MAGIC:
+                return CompressedChunkedFile(
+                    file_object=storage_file, header=header, mode=mode
+                )
+            else:
+                storage_file.seek(0)
+
+                return BufferedZipFile(
+                    file_object=storage_file,
+                    member_name=ZIP_MEMBER_FILENAME, mode=mode
+                )
+        else:
+            next_kwargs['mode'] = 'wb'
+            storage_file = self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+
+            return CompressedChunkedFile(
+                chunk_size=self.chunk_size, codec=self.codec,
+                file_object=storage_file, level=self.level, mode=mode
+            )
+
+    def save(self, name, content, max_length=None, _direct=False):
+        next_kwargs = {'max_length': max_length, 'name': name}
+        if _direct:
+            next_kwargs['content'] = content
+
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update({'_direct': _direct})
+
+            return self._call_backend_method(
+                method_name='save', kwargs=next_kwargs
+            )
+        else:
+            if not self._call_backend_method(
+                method_name='exists', kwargs={'name': name}
+            ):
+                name = self._call_backend_method(
+                    method_name='save', kwargs={
+                        'content': ContentFile(content=''), 'name': name
+                    }
+                )
+
+            with self.open(name=name, mode='wb') as file_object:
+                while True:
+                    chunk = content.read(self.chunk_size)
+
+                    if chunk:
+                        file_object.write(chunk)
+                    else:
+                        break
+
+            return name
+
+
 class ZipCompressedPassthroughStorage(PassthroughStorage):
     def open(self, name, mode='rb', _direct=False):
         next_kwargs = {'name': name}
@@ -105,11 +571,31 @@ class ZipCompressedPassthroughStorage(PassthroughStorage):
                     'name': name, 'mode': 'wb'
                 }
             ) as file_object:
+                zip_info = zipfile.ZipInfo(
+                    date_time=time.localtime(time.time())[:6],
+                    filename=ZIP_MEMBER_FILENAME
+                )
+                zip_info.compress_type = COMPRESSION
+                zip_info.create_system = 0
+
                 # From Python: ZipFile requires mode 'r', 'w', 'x', or 'a'
                 with zipfile.ZipFile(file=file_object, mode='w', compression=COMPRESSION) as zip_file_object:
-                    zip_file_object.writestr(ZIP_MEMBER_FILENAME, content.read())
+                    # Stream the content into the member instead of
+                    # reading it into memory.
+                    with zip_file_object.open(
+                        force_zip64=True, mode='w', name=zip_info
+                    ) as zip_member_file_object:
+                        while True:
+                            chunk = content.read(ZIP_CHUNK_SIZE)
+
+                            try:
+                                chunk = chunk.encode('utf-8')
+                            except AttributeError:
+                                """Already a byte string"""
 
-                    for file in zip_file_object.filelist:
-                        file.create_system = 0
+                            if chunk:
+                                zip_member_file_object.write(chunk)
+                            else:
+                                break
 
             return name
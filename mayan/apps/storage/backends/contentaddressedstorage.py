@@ -0,0 +1,295 @@
+import hashlib
+import logging
+
+from django.apps import apps
+from django.core.files.base import File
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from ..classes import PassthroughStorage
+from ..utils import TemporaryFile
+
+from .literals import (
+    CONTENT_ADDRESSED_BLOB_PREFIX, CONTENT_ADDRESSED_CHUNK_SIZE,
+    CONTENT_ADDRESSED_DEFAULT_NAMESPACE
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class ContentAddressedFile(File):
+    """
+    File opened for writing in the content addressed storage. The data is
+    spooled to a temporary file and saved as a blob when closed.
+    """
+    def __init__(self, name, storage):
+        self._storage = storage
+        super().__init__(file=TemporaryFile(), name=name)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.seek(0)
+            self._storage._reference_update(
+                blob=self._storage._blob_save(content=self.file),
+                name=self.name
+            )
+            self.file.close()
+
+    def write(self, data):
+        try:
+            data = data.encode('utf-8')
+        except AttributeError:
+            """Already a byte string"""
+
+        return self.file.write(data)
+
+
+class ContentAddressedPassthroughStorage(PassthroughStorage):
+    """
+    Passthrough storage that saves each unique content only once. Contents
+    are saved as blobs named after their SHA-256 digest, computed while the
+    content is streamed. Saved names are mapped to the blobs, which are
+    reference counted and deleted with their last name. Use a different
+    `namespace` argument for each defined storage using this backend.
+    """
+    def __init__(self, *args, **kwargs):
+        self.namespace = kwargs.pop(
+            'namespace', CONTENT_ADDRESSED_DEFAULT_NAMESPACE
+        )
+        super().__init__(*args, **kwargs)
+
+    def _blob_reference(self, digest, file_object, size):
+        """
+        Return the blob of the digest with its reference count increased.
+        The content is saved to the next storage if the blob is new.
+        """
+        StoredBlob = apps.get_model(
+            app_label='storage', model_name='StoredBlob'
+        )
+
+        with transaction.atomic():
+            blob = StoredBlob.objects.select_for_update().filter(
+                digest=digest, namespace=self.namespace
+            ).first()
+
+            if blob:
+                blob.reference_count = F('reference_count') + 1
+                blob.save(update_fields=('reference_count',))
+                blob.refresh_from_db()
+                return blob
+
+        file_object.seek(0)
+        blob_name = self.next_storage_backend.save(
+            content=File(file=file_object), name=self.get_blob_name(
+                digest=digest
+            )
+        )
+
+        try:
+            with transaction.atomic():
+                return StoredBlob.objects.create(
+                    digest=digest, name=blob_name, namespace=self.namespace,
+                    reference_count=1, size=size
+                )
+        except IntegrityError:
+            # Another process saved the same content first, use its blob.
+            blob = StoredBlob.objects.get(
+                digest=digest, namespace=self.namespace
+            )
+
+            if blob.name != blob_name:
+                self.next_storage_backend.delete(name=blob_name)
+
+            return self._blob_reference(
+                digest=digest, file_object=file_object, size=size
+            )
+
+    def _blob_release(self, blob_id):
+        StoredBlob = apps.get_model(
+            app_label='storage', model_name='StoredBlob'
+        )
+
+        with transaction.atomic():
+            blob = StoredBlob.objects.select_for_update().get(pk=blob_id)
+            blob.reference_count -= 1
+
+            if blob.reference_count:
+                blob.save(update_fields=('reference_count',))
+            else:
+                logger.debug('deleting unreferenced blob: %s', blob.name)
+                blob.delete()
+
+                # Delete the content only once the row deletion is
+                # committed. A rolled back deletion keeps a blob whose
+                # content still exists.
+                blob_name = blob.name
+                transaction.on_commit(
+                    lambda: self.next_storage_backend.delete(name=blob_name)
+                )
+
+    def _blob_save(self, content):
+        """
+        Spool the content to a temporary file while computing its digest
+        and return the blob of the content.
+        """
+        hash_object = hashlib.sha256()
+        size = 0
+
+        with TemporaryFile() as file_object:
+            while True:
+                chunk = content.read(CONTENT_ADDRESSED_CHUNK_SIZE)
+
+                try:
+                    chunk = chunk.encode('utf-8')
+                except AttributeError:
+                    """Already a byte string"""
+
+                if not chunk:
+                    break
+
+                hash_object.update(chunk)
+                file_object.write(chunk)
+                size += len(chunk)
+
+            return self._blob_reference(
+                digest=hash_object.hexdigest(), file_object=file_object,
+                size=size
+            )
+
+    def _get_reference(self, name):
+        StoredBlobReference = apps.get_model(
+            app_label='storage', model_name='StoredBlobReference'
+        )
+
+        try:
+            return StoredBlobReference.objects.select_related('blob').get(
+                name=name, namespace=self.namespace
+            )
+        except StoredBlobReference.DoesNotExist:
+            raise FileNotFoundError(
+                'Name "{}" not found in the content addressed storage '
+                '"{}".'.format(name, self.namespace)
+            )
+
+    def _reference_update(self, blob, name):
+        StoredBlobReference = apps.get_model(
+            app_label='storage', model_name='StoredBlobReference'
+        )
+
+        with transaction.atomic():
+            reference, created = StoredBlobReference.objects.select_for_update().get_or_create(
+                defaults={'blob': blob}, name=name, namespace=self.namespace
+            )
+
+            if not created:
+                blob_id = reference.blob_id
+                reference.blob = blob
+                reference.save(update_fields=('blob',))
+                self._blob_release(blob_id=blob_id)
+
+    def delete(self, name):
+        StoredBlobReference = apps.get_model(
+            app_label='storage', model_name='StoredBlobReference'
+        )
+
+        with transaction.atomic():
+            reference = StoredBlobReference.objects.select_for_update().filter(
+                name=name, namespace=self.namespace
+            ).first()
+
+            if reference:
+                reference.delete()
+                self._blob_release(blob_id=reference.blob_id)
+
+    def exists(self, name):
+        StoredBlobReference = apps.get_model(
+            app_label='storage', model_name='StoredBlobReference'
+        )
+
+        return StoredBlobReference.objects.filter(
+            name=name, namespace=self.namespace
+        ).exists()
+
+    def get_blob_name(self, digest):
+        return '{}/{}/{}/{}'.format(
+            CONTENT_ADDRESSED_BLOB_PREFIX, digest[:2], digest[2:4], digest
+        )
+
+    def get_content_hash(self, name):
+        """
+        Return the SHA-256 digest of the content of a saved name without
+        reading it.
+        """
+        return self._get_reference(name=name).blob.digest
+
+    def import_name(self, name):
+        """
+        Convert a file saved directly in the next storage into a blob
+        reference. The original file is deleted after its content is saved
+        as a blob or matched to an existing one.
+        """
+        if self.exists(name=name):
+            return False
+
+        with self.next_storage_backend.open(name=name, mode='rb') as file_object:
+            blob = self._blob_save(content=file_object)
+
+        self._reference_update(blob=blob, name=name)
+
+        if blob.name != name:
+            self.next_storage_backend.delete(name=name)
+
+        return True
+
+    def open(self, name, mode='rb', _direct=False):
+        next_kwargs = {'mode': mode, 'name': name}
+
+        if _direct:
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update({'_direct': _direct})
+
+            return self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+        elif 'r' in mode:
+            next_kwargs['name'] = self._get_reference(name=name).blob.name
+
+            return self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+        else:
+            return ContentAddressedFile(name=name, storage=self)
+
+    def path(self, name):
+        return self.next_storage_backend.path(
+            name=self._get_reference(name=name).blob.name
+        )
+
+    def save(self, name, content, max_length=None, _direct=False):
+        next_kwargs = {'max_length': max_length, 'name': name}
+        if _direct:
+            next_kwargs['content'] = content
+
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update({'_direct': _direct})
+
+            return self._call_backend_method(
+                method_name='save', kwargs=next_kwargs
+            )
+        else:
+            if name is None:
+                name = content.name
+
+            name = self.get_available_name(name=name, max_length=max_length)
+
+            if hasattr(content, 'seek'):
+                content.seek(0)
+
+            self._reference_update(
+                blob=self._blob_save(content=content), name=name
+            )
+
+            return name
+
+    def size(self, name):
+        return self._get_reference(name=name).blob.size
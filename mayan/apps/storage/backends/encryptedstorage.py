@@ -1,27 +1,49 @@
+import io
+import struct
+
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
-from Crypto.Protocol.KDF import PBKDF2
+from Crypto.Protocol.KDF import HKDF, PBKDF2
+from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.utils.encoding import force_text
 
 from ..classes import BufferedFile, PassthroughStorage
+from ..exceptions import EncryptedFileError
 
 from .literals import (
-    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
-    ENCRYPTION_KEY_SIZE
+    ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE,
+    ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE_MAXIMUM, ENCRYPTION_CHUNKED_FILE_MAGIC,
+    ENCRYPTION_CHUNKED_FILE_SALT_SIZE, ENCRYPTION_CHUNKED_FILE_TAG_SIZE,
+    ENCRYPTION_CHUNKED_FILE_VERSION, ENCRYPTION_FILE_CHUNK_SIZE,
+    ENCRYPTION_KEY_DERIVATION_ITERATIONS, ENCRYPTION_KEY_SIZE
+)
+
+HEADER_STRUCT = struct.Struct('>BI')
+HEADER_SIZE = (
+    len(ENCRYPTION_CHUNKED_FILE_MAGIC) + HEADER_STRUCT.size +
+    ENCRYPTION_CHUNKED_FILE_SALT_SIZE
 )
+NONCE_STRUCT = struct.Struct('>7xI?')
 
 
 class BufferedEncryptedFile(BufferedFile):
+    """
+    Reader and writer of the legacy format. A single AES-CBC stream with
+    each chunk padded separately. Only supports sequential access.
+    """
     def __init__(self, *args, **kwargs):
         self.key = kwargs.pop('key')
+        initial_vector = kwargs.pop('initial_vector', None)
 
         super().__init__(*args, **kwargs)
 
-        self.initial_vector = self.file_object.read(16)
+        self.initial_vector = initial_vector or self.file_object.read(
+            AES.block_size
+        )
         self.cipher = AES.new(
             key=self.key, mode=AES.MODE_CBC, iv=self.initial_vector
         )
@@ -29,7 +51,10 @@ class BufferedEncryptedFile(BufferedFile):
         self.position = 0
 
     def _get_file_object_chunk(self):
-        chunk = self.file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
+        # Each plain text chunk was padded separately, read the padded size.
+        chunk = self.file_object.read(
+            ENCRYPTION_FILE_CHUNK_SIZE + AES.block_size
+        )
 
         if chunk:
             data = unpad(
@@ -83,9 +108,346 @@ class BufferedEncryptedFile(BufferedFile):
         return count
 
 
+class EncryptedChunkedFile(File):
+    """
+    File of independently encrypted and authenticated AES-GCM chunks.
+    The header stores the format version, the plain text chunk size and a
+    random salt used to derive a per file key from the storage key. The
+    nonce of each chunk is its index and a flag marking the final chunk,
+    which detects reordered, truncated, and extended files.
+    Any chunk can be decrypted on its own, which allows seeking without
+    reading the preceding data and keeps memory usage to a single chunk.
+    """
+    def __init__(
+        self, file_object, key, mode, chunk_size=None, header=None,
+        name=None
+    ):
+        self.binary_mode = 'b' in mode
+        self.chunk_size = chunk_size or ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE
+        self.file_object = file_object
+        self.key = key
+        self.mode = mode
+        self.name = name
+        self.position = 0
+
+        self._closed = False
+        self._chunk_data = None
+        self._chunk_index = None
+        self._chunk_final_index = None
+        self._file_object_position = None
+        self._write_buffer = bytearray()
+
+        if 'r' in mode:
+            self._header_read(header=header)
+        else:
+            self._header_write()
+
+    @staticmethod
+    def _read_exactly(file_object, size):
+        result = []
+
+        while size:
+            data = file_object.read(size)
+            if not data:
+                break
+
+            result.append(data)
+            size -= len(data)
+
+        return b''.join(result)
+
+    def _get_chunk(self, index):
+        if index != self._chunk_index:
+            offset = self.header_size + index * self.record_size
+
+            if self._file_object_position != offset:
+                if self._file_object_seekable:
+                    self.file_object.seek(offset)
+                elif self._file_object_position > offset:
+                    raise io.UnsupportedOperation(
+                        'Backward seeks are not supported by the next '
+                        'storage file.'
+                    )
+                else:
+                    # Skip over the data of the preceding chunks.
+                    while self._file_object_position < offset:
+                        data = self.file_object.read(
+                            min(
+                                offset - self._file_object_position,
+                                self.record_size
+                            )
+                        )
+                        if not data:
+                            break
+
+                        self._file_object_position += len(data)
+
+            record = self._read_exactly(
+                file_object=self.file_object, size=self.record_size
+            )
+            self._file_object_position = offset + len(record)
+
+            if not record:
+                if self._chunk_final_index is None or index <= self._chunk_final_index:
+                    raise EncryptedFileError('Encrypted file is truncated.')
+
+                self._chunk_data = b''
+            elif len(record) < ENCRYPTION_CHUNKED_FILE_TAG_SIZE:
+                raise EncryptedFileError('Encrypted file is truncated.')
+            elif self._chunk_final_index is not None:
+                self._chunk_data = self._decrypt_chunk(
+                    final=index == self._chunk_final_index, index=index,
+                    record=record
+                )
+            elif len(record) < self.record_size:
+                self._chunk_data = self._decrypt_chunk(
+                    final=True, index=index, record=record
+                )
+                self._chunk_final_index = index
+            else:
+                # File size is unknown and the record is complete, it
+                # could be the final one.
+                try:
+                    self._chunk_data = self._decrypt_chunk(
+                        final=False, index=index, record=record
+                    )
+                except EncryptedFileError:
+                    self._chunk_data = self._decrypt_chunk(
+                        final=True, index=index, record=record
+                    )
+                    self._chunk_final_index = index
+
+            self._chunk_index = index
+
+        return self._chunk_data
+
+    def _get_cipher(self, final, index):
+        cipher = AES.new(
+            key=self.file_key, mode=AES.MODE_GCM,
+            nonce=NONCE_STRUCT.pack(index, final)
+        )
+        cipher.update(self.header)
+        return cipher
+
+    def _decrypt_chunk(self, final, index, record):
+        cipher = self._get_cipher(final=final, index=index)
+
+        try:
+            return cipher.decrypt_and_verify(
+                ciphertext=record[:-ENCRYPTION_CHUNKED_FILE_TAG_SIZE],
+                received_mac_tag=record[-ENCRYPTION_CHUNKED_FILE_TAG_SIZE:]
+            )
+        except ValueError as exception:
+            raise EncryptedFileError(
+                'Encrypted file chunk {} failed authentication.'.format(
+                    index
+                )
+            ) from exception
+
+    def _encrypt_chunk(self, data, final):
+        cipher = self._get_cipher(final=final, index=self._chunk_index)
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext=bytes(data))
+        self.file_object.write(ciphertext + tag)
+        self._chunk_index += 1
+
+    def _header_initialize(self, salt):
+        self.file_key = HKDF(
+            hashmod=SHA256, key_len=ENCRYPTION_KEY_SIZE, master=self.key,
+            salt=salt
+        )
+        self.header_size = len(self.header)
+        self.record_size = self.chunk_size + ENCRYPTION_CHUNKED_FILE_TAG_SIZE
+
+    def _header_read(self, header=None):
+        header = (header or b'') + self._read_exactly(
+            file_object=self.file_object,
+            size=HEADER_SIZE - len(header or b'')
+        )
+
+        if len(header) < HEADER_SIZE or not header.startswith(
+            ENCRYPTION_CHUNKED_FILE_MAGIC
+        ):
+            raise EncryptedFileError('Invalid encrypted file header.')
+
+        version, self.chunk_size = HEADER_STRUCT.unpack_from(
+            header, len(ENCRYPTION_CHUNKED_FILE_MAGIC)
+        )
+
+        if version != ENCRYPTION_CHUNKED_FILE_VERSION:
+            raise EncryptedFileError(
+                'Unsupported encrypted file version: {}'.format(version)
+            )
+
+        if not 0 < self.chunk_size <= ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE_MAXIMUM:
+            raise EncryptedFileError(
+                'Invalid encrypted file chunk size: {}'.format(
+                    self.chunk_size
+                )
+            )
+
+        self.header = header
+        self._header_initialize(
+            salt=header[-ENCRYPTION_CHUNKED_FILE_SALT_SIZE:]
+        )
+        self._file_object_position = self.header_size
+
+        try:
+            self._file_object_seekable = self.file_object.seekable()
+        except (AttributeError, ValueError):
+            self._file_object_seekable = False
+
+        if self._file_object_seekable:
+            # The layout of the file is known from its size, the final
+            # chunk can be located without reading the file.
+            self.file_object.seek(0, io.SEEK_END)
+            file_object_size = self.file_object.tell()
+            self._file_object_position = file_object_size
+
+            chunk_count = -(
+                -(file_object_size - self.header_size) // self.record_size
+            )
+            self._chunk_final_index = chunk_count - 1
+            self._size = (
+                file_object_size - self.header_size -
+                chunk_count * ENCRYPTION_CHUNKED_FILE_TAG_SIZE
+            )
+
+            if chunk_count < 1 or self._size < 0:
+                raise EncryptedFileError('Encrypted file is truncated.')
+        else:
+            self._size = None
+
+    def _header_write(self):
+        self.header = ENCRYPTION_CHUNKED_FILE_MAGIC + HEADER_STRUCT.pack(
+            ENCRYPTION_CHUNKED_FILE_VERSION, self.chunk_size
+        ) + get_random_bytes(ENCRYPTION_CHUNKED_FILE_SALT_SIZE)
+        self._header_initialize(
+            salt=self.header[-ENCRYPTION_CHUNKED_FILE_SALT_SIZE:]
+        )
+        self.file_object.write(self.header)
+        self._chunk_index = 0
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+
+            if 'r' not in self.mode:
+                # Write the remaining data as the final chunk. Empty files
+                # still have a final chunk to authenticate their length.
+                self._encrypt_chunk(data=self._write_buffer, final=True)
+                self._write_buffer = bytearray()
+
+            self.file_object.close()
+
+    def flush(self):
+        return self.file_object.flush()
+
+    def read(self, size=None):
+        if size is None or size < 0:
+            size = None
+
+        result = []
+
+        while size is None or size > 0:
+            index, offset = divmod(self.position, self.chunk_size)
+
+            if self._chunk_final_index is not None and index > self._chunk_final_index:
+                break
+
+            data = self._get_chunk(index=index)[offset:]
+
+            if size is not None:
+                data = data[:size]
+                size -= len(data)
+
+            if not data:
+                break
+
+            result.append(data)
+            self.position += len(data)
+
+        data = b''.join(result)
+
+        if self.binary_mode:
+            return data
+        else:
+            return force_text(s=data)
+
+    def readable(self):
+        return 'r' in self.mode
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError('Invalid whence value: {}'.format(whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position: {}'.format(position))
+
+        if 'r' not in self.mode and position != self.position:
+            raise io.UnsupportedOperation(
+                'Encrypted files can only be written sequentially.'
+            )
+
+        self.position = position
+        return self.position
+
+    def seekable(self):
+        return 'r' in self.mode
+
+    @property
+    def size(self):
+        if 'r' in self.mode:
+            if self._size is None:
+                raise io.UnsupportedOperation(
+                    'The next storage file does not support seeking; the '
+                    'size of the encrypted file is not known.'
+                )
+            return self._size
+        else:
+            return self.position
+
+    def tell(self):
+        return self.position
+
+    def writable(self):
+        return 'r' not in self.mode
+
+    def write(self, data):
+        try:
+            data = data.encode('utf-8')
+        except AttributeError:
+            """Already a byte string"""
+
+        self._write_buffer.extend(data)
+
+        # Keep at least one byte buffered, the last chunk must be written
+        # by close() with the final flag.
+        while len(self._write_buffer) > self.chunk_size:
+            self._encrypt_chunk(
+                data=self._write_buffer[:self.chunk_size], final=False
+            )
+            del self._write_buffer[:self.chunk_size]
+
+        self.position += len(data)
+        return len(data)
+
+
 class EncryptedPassthroughStorage(PassthroughStorage):
     def __init__(self, *args, **kwargs):
         password = kwargs.pop('password')
+        self.chunk_size = kwargs.pop(
+            'chunk_size', ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE
+        )
         super().__init__(*args, **kwargs)
         self.key = PBKDF2(
             count=ENCRYPTION_KEY_DERIVATION_ITERATIONS,
@@ -107,14 +469,38 @@ class EncryptedPassthroughStorage(PassthroughStorage):
             return self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
+        elif 'r' in mode:
+            next_kwargs['mode'] = 'rb'
+            storage_file = self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+
+            # Files of the legacy format start with the random initial
+            # vector of the CBC cipher instead of the chunked file magic.
+            header = EncryptedChunkedFile._read_exactly(
+                file_object=storage_file,
+                size=len(ENCRYPTION_CHUNKED_FILE_MAGIC)
+            )
+
+            if header == ENCRYPTION_CHUNKED_FILE_MAGIC:
+                return EncryptedChunkedFile(
+                    file_object=storage_file, header=header, key=self.key,
+                    mode=mode
+                )
+            else:
+                return BufferedEncryptedFile(
+                    file_object=storage_file, initial_vector=header + (
+                        storage_file.read(AES.block_size - len(header))
+                    ), key=self.key, mode=mode
+                )
         else:
-            # Mode is always 'rb' when reading the encrypted file
-            next_kwargs['mode'] = 'rb+'
+            next_kwargs['mode'] = 'wb'
             storage_file = self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
-            return BufferedEncryptedFile(
-                file_object=storage_file, key=self.key, mode=mode,
+            return EncryptedChunkedFile(
+                chunk_size=self.chunk_size, file_object=storage_file,
+                key=self.key, mode=mode
             )
 
     def save(self, name, content, max_length=None, _direct=False):
@@ -129,7 +515,6 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                 method_name='save', kwargs=next_kwargs
             )
         else:
-            cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
             if not self._call_backend_method(
                 method_name='exists', kwargs={'name': name}
             ):
@@ -139,28 +524,13 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                     }
                 )
 
-            with self._call_backend_method(
-                method_name='open', kwargs={
-                    'name': name, 'mode': 'wb'
-                }
-            ) as file_object:
-                file_object.write(cipher.iv)
-
+            with self.open(name=name, mode='wb') as file_object:
                 while True:
-                    chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
-
-                    try:
-                        chunk = chunk.encode('utf-8')
-                    except AttributeError:
-                        """Already a byte string"""
+                    chunk = content.read(self.chunk_size)
 
                     if chunk:
-                        chunk = pad(
-                            data_to_pad=chunk, block_size=AES.block_size
-                        )
+                        file_object.write(chunk)
                     else:
                         break
 
-                    file_object.write(cipher.encrypt(chunk))
-
             return name
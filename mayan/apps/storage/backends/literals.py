@@ -1,3 +1,25 @@
+COMPRESSION_CHUNKED_FILE_CHUNK_SIZE = 256 * 1024  # 256K
+COMPRESSION_CHUNKED_FILE_MAGIC = b'\x89MAYCMP\n'
+COMPRESSION_CHUNKED_FILE_VERSION = 1
+COMPRESSION_CODEC_LZ4 = 'lz4'
+COMPRESSION_CODEC_ZLIB = 'zlib'
+COMPRESSION_CODEC_ZSTD = 'zstd'
+COMPRESSION_CODEC_IDS = {
+    COMPRESSION_CODEC_ZLIB: 1,
+    COMPRESSION_CODEC_ZSTD: 2,
+    COMPRESSION_CODEC_LZ4: 3
+}
+
+CONTENT_ADDRESSED_BLOB_PREFIX = 'blobs'
+CONTENT_ADDRESSED_CHUNK_SIZE = 64 * 1024  # 64K
+CONTENT_ADDRESSED_DEFAULT_NAMESPACE = 'default'
+
+ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE = 64 * 1024  # 64K
+ENCRYPTION_CHUNKED_FILE_CHUNK_SIZE_MAXIMUM = 16 * 1024 * 1024  # 16M
+ENCRYPTION_CHUNKED_FILE_MAGIC = b'\x89MAYENC\n'
+ENCRYPTION_CHUNKED_FILE_SALT_SIZE = 16
+ENCRYPTION_CHUNKED_FILE_TAG_SIZE = 16
+ENCRYPTION_CHUNKED_FILE_VERSION = 1
 ENCRYPTION_FILE_CHUNK_SIZE = 64 * 1024  # 64K
 ENCRYPTION_KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_KEY_SIZE = 32
@@ -148,6 +148,10 @@ class DefinedStorageLazy:
     generate_filename = defined_storage_proxy_method(
         method_name='generate_filename'
     )
+
+    def get_storage_instance(self):
+        return DefinedStorage.get(name=self.name).get_storage_instance()
+
     open = defined_storage_proxy_method(method_name='open')
     path = defined_storage_proxy_method(method_name='path')
     save = defined_storage_proxy_method(method_name='save')
@@ -8,3 +8,17 @@ class NoMIMETypeMatch(CompressionFileError):
     """
     There is no decompressor registered for the specified MIME type
     """
+
+
+class EncryptedFileError(Exception):
+    """
+    The encrypted file is corrupted, truncated, or was encrypted with a
+    different key.
+    """
+
+
+class CompressedStorageFileError(Exception):
+    """
+    The compressed storage file is corrupted or uses a codec that is not
+    available.
+    """
@@ -0,0 +1,62 @@
+from django.apps import apps
+from django.core import management
+from django.core.management.base import CommandError
+from django.utils.translation import ugettext_lazy as _
+
+from ...backends.contentaddressedstorage import (
+    ContentAddressedPassthroughStorage
+)
+from ...classes import DefinedStorage
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Convert the existing files of a model into blobs of a content '
+        'addressed storage, in place.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--app', action='store', dest='app_label',
+            help=_('Name of the app to process.'),
+            required=True,
+        )
+        parser.add_argument(
+            '--file_attribute', action='store', default='file',
+            dest='file_attribute',
+            help=_('Name of the model file field.')
+        )
+        parser.add_argument(
+            '--model', action='store', dest='model_name',
+            help=_('Process a specific model.'),
+            required=True,
+        )
+        parser.add_argument(
+            '--storage_name', action='store', dest='defined_storage_name',
+            help=_('Name of the storage to process.'),
+            required=True,
+        )
+
+    def handle(self, *args, **options):
+        model = apps.get_model(
+            app_label=options['app_label'], model_name=options['model_name']
+        )
+
+        storage_instance = DefinedStorage.get(
+            name=options['defined_storage_name']
+        ).get_storage_instance()
+
+        if not isinstance(storage_instance, ContentAddressedPassthroughStorage):
+            raise CommandError(
+                'Storage "%s" does not use the content addressed storage '
+                'backend.' % options['defined_storage_name']
+            )
+
+        count = 0
+        for instance in model.objects.iterator():
+            name = getattr(instance, options['file_attribute']).name
+
+            if name and storage_instance.import_name(name=name):
+                count += 1
+
+        self.stdout.write('Files converted: {}\n'.format(count))
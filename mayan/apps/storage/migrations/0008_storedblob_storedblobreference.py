@@ -0,0 +1,91 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('storage', '0007_auto_20210218_0708'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredBlob',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'namespace', models.CharField(
+                        db_index=True, help_text='Identifier of the content '
+                        'addressed storage that saved the blob.',
+                        max_length=64, verbose_name='Namespace'
+                    )
+                ),
+                (
+                    'digest', models.CharField(
+                        help_text='SHA-256 digest of the content of the '
+                        'blob.', max_length=64, verbose_name='Digest'
+                    )
+                ),
+                (
+                    'name', models.CharField(
+                        help_text='Name of the blob in the next storage.',
+                        max_length=255, verbose_name='Name'
+                    )
+                ),
+                (
+                    'size', models.BigIntegerField(
+                        help_text='Size of the blob in bytes.',
+                        verbose_name='Size'
+                    )
+                ),
+                (
+                    'reference_count', models.PositiveIntegerField(
+                        default=0, help_text='Number of stored names using '
+                        'the blob.', verbose_name='Reference count'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Stored blob',
+                'verbose_name_plural': 'Stored blobs',
+                'unique_together': {('namespace', 'digest')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StoredBlobReference',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'namespace', models.CharField(
+                        max_length=64, verbose_name='Namespace'
+                    )
+                ),
+                (
+                    'name', models.CharField(
+                        max_length=255, verbose_name='Name'
+                    )
+                ),
+                (
+                    'blob', models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='references', to='storage.StoredBlob',
+                        verbose_name='Blob'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Stored blob reference',
+                'verbose_name_plural': 'Stored blob references',
+                'unique_together': {('namespace', 'name')},
+            },
+        ),
+    ]
@@ -101,6 +101,65 @@ class DownloadFile(DatabaseFileModelMixin, ExtraDataModelMixin, models.Model):
         super().save(*args, **kwargs)
 
 
+class StoredBlob(models.Model):
+    """
+    Unique content saved by the content addressed storage. Blobs are
+    named after the digest of their content and deleted when no stored
+    name references them.
+    """
+    namespace = models.CharField(
+        db_index=True, help_text=_(
+            'Identifier of the content addressed storage that saved the '
+            'blob.'
+        ), max_length=64, verbose_name=_('Namespace')
+    )
+    digest = models.CharField(
+        help_text=_('SHA-256 digest of the content of the blob.'),
+        max_length=64, verbose_name=_('Digest')
+    )
+    name = models.CharField(
+        help_text=_('Name of the blob in the next storage.'),
+        max_length=255, verbose_name=_('Name')
+    )
+    size = models.BigIntegerField(
+        help_text=_('Size of the blob in bytes.'), verbose_name=_('Size')
+    )
+    reference_count = models.PositiveIntegerField(
+        default=0, help_text=_('Number of stored names using the blob.'),
+        verbose_name=_('Reference count')
+    )
+
+    class Meta:
+        unique_together = ('namespace', 'digest')
+        verbose_name = _('Stored blob')
+        verbose_name_plural = _('Stored blobs')
+
+    def __str__(self):
+        return self.digest
+
+
+class StoredBlobReference(models.Model):
+    """
+    Map of a name saved in the content addressed storage to its blob.
+    """
+    namespace = models.CharField(
+        max_length=64, verbose_name=_('Namespace')
+    )
+    name = models.CharField(max_length=255, verbose_name=_('Name'))
+    blob = models.ForeignKey(
+        on_delete=models.PROTECT, related_name='references', to=StoredBlob,
+        verbose_name=_('Blob')
+    )
+
+    class Meta:
+        unique_together = ('namespace', 'name')
+        verbose_name = _('Stored blob reference')
+        verbose_name_plural = _('Stored blob references')
+
+    def __str__(self):
+        return self.name
+
+
 class SharedUploadedFile(DatabaseFileModelMixin, models.Model):
     """
     Keep a database link to a stored file. Used to share files between code
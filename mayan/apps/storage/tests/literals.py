@@ -4,7 +4,10 @@ from django.conf import settings
 
 TEST_DOWNLOAD_FILE_CONTENT_FILE_NAME = 'test content name'
 
+TEST_COMPRESSION_CHUNK_SIZE = 100
 TEST_CONTENT = 'testcontent'
+TEST_CONTENT_LARGE = bytes(range(256)) * 4
+TEST_ENCRYPTION_CHUNK_SIZE = 100
 TEST_FILE_NAME = 'test_file'
 
 # Filenames
@@ -1,16 +1,102 @@
 from pathlib import Path
 
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
 from django.core.files.base import ContentFile
+from django.db import connection
 from django.utils.encoding import force_bytes
 
 from mayan.apps.mimetype.api import get_mimetype
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..backends.compressedstorage import ZipCompressedPassthroughStorage
+from ..backends.compressedstorage import (
+    CompressedPassthroughStorage, ZipCompressedPassthroughStorage
+)
+from ..backends.contentaddressedstorage import (
+    ContentAddressedPassthroughStorage
+)
 from ..backends.encryptedstorage import EncryptedPassthroughStorage
+from ..backends.literals import ENCRYPTION_CHUNKED_FILE_MAGIC
+from ..exceptions import CompressedStorageFileError, EncryptedFileError
+from ..models import StoredBlob
+
+from .literals import (
+    TEST_COMPRESSION_CHUNK_SIZE, TEST_CONTENT, TEST_CONTENT_LARGE,
+    TEST_ENCRYPTION_CHUNK_SIZE, TEST_FILE_NAME
+)
+
+
+class ContentAddressedPassthroughStorageTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temporary_directory = mkdtemp()
+        self.storage = ContentAddressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+    def tearDown(self):
+        fs_cleanup(filename=self.temporary_directory)
+        super().tearDown()
+
+    def _save_test_files(self):
+        self.test_file_names = [
+            self.storage.save(
+                name=TEST_FILE_NAME, content=ContentFile(
+                    content=TEST_CONTENT
+                )
+            ) for index in range(2)
+        ]
+
+    def test_file_save_and_load(self):
+        self._save_test_files()
+
+        self.assertNotEqual(self.test_file_names[0], self.test_file_names[1])
+        self.assertEqual(StoredBlob.objects.count(), 1)
+        self.assertEqual(StoredBlob.objects.first().reference_count, 2)
+
+        for test_file_name in self.test_file_names:
+            with self.storage.open(name=test_file_name, mode='r') as file_object:
+                self.assertEqual(file_object.read(), TEST_CONTENT)
 
-from .literals import TEST_CONTENT, TEST_FILE_NAME
+        self.assertEqual(
+            self.storage.size(name=self.test_file_names[0]),
+            len(TEST_CONTENT)
+        )
+
+    def test_file_delete(self):
+        self._save_test_files()
+        blob = StoredBlob.objects.first()
+
+        self.storage.delete(name=self.test_file_names[0])
+
+        self.assertFalse(self.storage.exists(name=self.test_file_names[0]))
+        self.assertTrue(self.storage.exists(name=self.test_file_names[1]))
+        self.assertEqual(StoredBlob.objects.first().reference_count, 1)
+
+        self.storage.delete(name=self.test_file_names[1])
+
+        self.assertEqual(StoredBlob.objects.count(), 0)
+        self.assertTrue(
+            (Path(self.temporary_directory) / blob.name).exists()
+        )
+
+        for savepoint_id, callback in connection.run_on_commit:
+            callback()
+
+        self.assertFalse(
+            (Path(self.temporary_directory) / blob.name).exists()
+        )
+
+    def test_file_write(self):
+        with self.storage.open(name=TEST_FILE_NAME, mode='w') as file_object:
+            file_object.write(TEST_CONTENT)
+
+        with self.storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT)
 
 
 class EncryptedPassthroughStorageTestCase(BaseTestCase):
@@ -53,6 +139,206 @@ class EncryptedPassthroughStorageTestCase(BaseTestCase):
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(999), TEST_CONTENT)
 
+    def test_file_seek(self):
+        storage = EncryptedPassthroughStorage(
+            chunk_size=TEST_ENCRYPTION_CHUNK_SIZE, password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_CONTENT_LARGE
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.size, len(TEST_CONTENT_LARGE))
+
+            file_object.seek(TEST_ENCRYPTION_CHUNK_SIZE + 3)
+            self.assertEqual(
+                file_object.read(TEST_ENCRYPTION_CHUNK_SIZE),
+                TEST_CONTENT_LARGE[
+                    TEST_ENCRYPTION_CHUNK_SIZE + 3:
+                    TEST_ENCRYPTION_CHUNK_SIZE * 2 + 3
+                ]
+            )
+
+            file_object.seek(-5, 2)
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE[-5:])
+
+            file_object.seek(0)
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_file_tampered(self):
+        storage = EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        test_file_name = storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=force_bytes(s=TEST_CONTENT)
+            )
+        )
+
+        path_file = Path(self.temporary_directory) / test_file_name
+        data = bytearray(path_file.read_bytes())
+        data[-1] ^= 1
+        path_file.write_bytes(data)
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            with self.assertRaises(expected_exception=EncryptedFileError):
+                file_object.read()
+
+    def test_file_header_chunk_size_invalid(self):
+        storage = EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        test_file_name = storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=force_bytes(s=TEST_CONTENT)
+            )
+        )
+
+        path_file = Path(self.temporary_directory) / test_file_name
+        data = bytearray(path_file.read_bytes())
+        offset = len(ENCRYPTION_CHUNKED_FILE_MAGIC) + 1
+        data[offset:offset + 4] = bytes(4)
+        path_file.write_bytes(data)
+
+        with self.assertRaises(expected_exception=EncryptedFileError):
+            with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+                file_object.read()
+
+    def test_file_write(self):
+        storage = EncryptedPassthroughStorage(
+            chunk_size=TEST_ENCRYPTION_CHUNK_SIZE, password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='wb') as file_object:
+            file_object.write(TEST_CONTENT_LARGE[:10])
+            file_object.write(TEST_CONTENT_LARGE[10:])
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_legacy_file_load(self):
+        storage = EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        cipher = AES.new(key=storage.key, mode=AES.MODE_CBC)
+        path_file = Path(self.temporary_directory) / TEST_FILE_NAME
+        path_file.write_bytes(
+            cipher.iv + cipher.encrypt(
+                pad(
+                    block_size=AES.block_size,
+                    data_to_pad=force_bytes(s=TEST_CONTENT)
+                )
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT)
+
+
+class CompressedPassthroughStorageTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temporary_directory = mkdtemp()
+
+    def tearDown(self):
+        fs_cleanup(filename=self.temporary_directory)
+        super().tearDown()
+
+    def test_codec_invalid(self):
+        with self.assertRaises(expected_exception=CompressedStorageFileError):
+            CompressedPassthroughStorage(
+                codec='invalid', next_storage_backend_arguments={
+                    'location': self.temporary_directory
+                }
+            )
+
+    def test_file_save_and_load(self):
+        storage = CompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+        test_file_name = storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(content=TEST_CONTENT)
+        )
+
+        path_file = Path(self.temporary_directory) / test_file_name
+
+        with path_file.open(mode='rb') as file_object:
+            self.assertNotEqual(
+                file_object.read(), force_bytes(s=TEST_CONTENT)
+            )
+
+        with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT)
+
+    def test_file_seek(self):
+        storage = CompressedPassthroughStorage(
+            chunk_size=TEST_COMPRESSION_CHUNK_SIZE,
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_CONTENT_LARGE
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.size, len(TEST_CONTENT_LARGE))
+
+            file_object.seek(TEST_COMPRESSION_CHUNK_SIZE * 2 + 3)
+            self.assertEqual(
+                file_object.read(TEST_COMPRESSION_CHUNK_SIZE),
+                TEST_CONTENT_LARGE[
+                    TEST_COMPRESSION_CHUNK_SIZE * 2 + 3:
+                    TEST_COMPRESSION_CHUNK_SIZE * 3 + 3
+                ]
+            )
+
+            file_object.seek(0)
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_zip_file_load(self):
+        ZipCompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        ).save(name=TEST_FILE_NAME, content=ContentFile(content=TEST_CONTENT))
+
+        storage = CompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT)
+
 
 class ZipCompressedPassthroughStorageTestCase(BaseTestCase):
     def setUp(self):
@@ -5,9 +5,57 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.storages import storage_document_files
 from mayan.apps.mimetype.api import get_mimetype
 
+from ..models import StoredBlob
+
 from .mixins import StorageProcessorTestMixin
 
 
+class StorageDeduplicateManagementCommandTestCase(
+    StorageProcessorTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self.document_storage_dotted_path = self.defined_storage.dotted_path
+
+    def tearDown(self):
+        super().tearDown()
+        self.defined_storage.dotted_path = self.document_storage_dotted_path
+
+    def test_storage_deduplicate_command(self):
+        self.defined_storage.dotted_path = 'django.core.files.storage.FileSystemStorage'
+        self.defined_storage.kwargs = {
+            'location': self.document_storage_kwargs['location']
+        }
+
+        self._upload_test_document()
+        self._upload_test_document()
+
+        self.defined_storage.dotted_path = 'mayan.apps.storage.backends.contentaddressedstorage.ContentAddressedPassthroughStorage'
+        self.defined_storage.kwargs = {
+            'next_storage_backend': 'django.core.files.storage.FileSystemStorage',
+            'next_storage_backend_arguments': {
+                'location': self.document_storage_kwargs['location']
+            }
+        }
+
+        management.call_command(
+            app_label='documents', command_name='storage_deduplicate',
+            defined_storage_name=storage_document_files.name,
+            model_name='DocumentFile'
+        )
+
+        self.assertEqual(StoredBlob.objects.count(), 1)
+        self.assertEqual(StoredBlob.objects.first().reference_count, 2)
+
+        for test_document in self.test_documents:
+            self.assertEqual(
+                test_document.file_latest.checksum,
+                test_document.file_latest.checksum_update(save=False)
+            )
+
+
 class StorageProcessManagementCommandTestCase(
     StorageProcessorTestMixin, GenericDocumentTestCase
 ):
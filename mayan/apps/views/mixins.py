@@ -1,3 +1,5 @@
+from calendar import timegm
+
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured
@@ -5,6 +7,8 @@ from django.db.models.query import QuerySet
 from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.utils.translation import ungettext, ugettext_lazy as _
 from django.views.generic.detail import SingleObjectMixin
 
@@ -23,6 +27,46 @@ from .literals import (
 )
 
 
+class ConditionalResponseViewMixin:
+    """
+    Answer conditional requests using an ETag and a last modification
+    date obtained without producing the content of the response.
+    """
+    def get_conditional_etag(self):
+        return None
+
+    def get_conditional_last_modified(self):
+        return None
+
+    def render_conditional_response(self, render_function):
+        etag = self.get_conditional_etag()
+        last_modified = self.get_conditional_last_modified()
+
+        if etag:
+            etag = quote_etag(etag_str=etag)
+
+        if last_modified:
+            last_modified = timegm(last_modified.utctimetuple())
+
+        response = None
+
+        if etag or last_modified:
+            response = get_conditional_response(
+                request=self.request, etag=etag, last_modified=last_modified
+            )
+
+        if response is None:
+            response = render_function()
+
+        if etag and not response.has_header('ETag'):
+            response['ETag'] = etag
+
+        if last_modified and not response.has_header('Last-Modified'):
+            response['Last-Modified'] = http_date(epoch_seconds=last_modified)
+
+        return response
+
+
 class ContentTypeViewMixin:
     """
     This mixin makes it easier for views to retrieve a content type from
@@ -65,7 +109,7 @@ class ExtraDataDeleteViewMixin:
         return HttpResponseRedirect(redirect_to=success_url)
 
 
-class DownloadViewMixin:
+class DownloadViewMixin(ConditionalResponseViewMixin):
     as_attachment = True
 
     def get_as_attachment(self):
@@ -81,10 +125,12 @@ class DownloadViewMixin:
         return None
 
     def render_to_response(self, **response_kwargs):
-        return FileResponse(
-            as_attachment=self.get_as_attachment(),
-            filename=self.get_download_filename(),
-            streaming_content=self.get_download_file_object()
+        return self.render_conditional_response(
+            render_function=lambda: FileResponse(
+                as_attachment=self.get_as_attachment(),
+                filename=self.get_download_filename(),
+                streaming_content=self.get_download_file_object()
+            )
         )
 
 